@@ -0,0 +1,51 @@
+"""
+Batch throughput benchmark:
+writes a directory of synthetic translation units and reports files/sec of
+checker.batch.run_batch for an increasing number of worker processes, or
+with --threads of worker threads (which only scale on a free-threaded
+Python build).
+
+    python -m bench.bench_batch [--files 400] [--functions 20] [--threads]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from bench.bench_dispatch import synthetic_source
+from checker import batch
+from core.rules import misra, cert
+
+
+def main():
+    parser = argparse.ArgumentParser(description="batch throughput benchmark")
+    parser.add_argument("--files", type=int, default=400,
+                        help="Number of synthetic source files")
+    parser.add_argument("--functions", type=int, default=20,
+                        help="Functions per synthetic source file")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1,
+                        help="Largest worker count to measure")
+    parser.add_argument("--threads", action="store_true",
+                        help="Use worker threads sharing one checker instead of processes")
+    args = parser.parse_args()
+
+    rules = misra.RULES + cert.RULES
+    source = synthetic_source(args.functions)
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.files):
+            with open(os.path.join(tmp, f"unit_{i}.c"), "w", encoding="utf-8") as f:
+                f.write(source)
+        paths = batch.expand_inputs([tmp])
+
+        jobs_list = sorted({1, 2, 4, 8, 16, 32, args.max_jobs} & set(range(1, args.max_jobs + 1)))
+        print(f"{'jobs':>4} {'seconds':>8} {'files/sec':>10}")
+        for jobs in jobs_list:
+            start = time.perf_counter()
+            for _ in batch.run_batch(paths, rules, jobs=jobs, threads=args.threads):
+                pass
+            elapsed = time.perf_counter() - start
+            print(f"{jobs:>4} {elapsed:>8.2f} {len(paths) / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
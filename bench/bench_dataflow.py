@@ -0,0 +1,90 @@
+"""
+Dataflow scaling benchmark:
+builds one large function with loops nested `--depth` deep, doubles its
+size a few times, and times building its CFG and checking it with the
+dataflow rules (MEM30C, EXP33C, MEM32C). Near-linear solving shows as a
+roughly constant time per statement.
+
+    python -m bench.bench_dataflow [--statements 2000] [--depth 40] [--steps 4]
+"""
+import argparse
+import time
+
+from pycparser import c_parser
+
+from core.flow import CFG
+from core.rules.cert.exp33c import EXP33C
+from core.rules.cert.mem30c import MEM30C
+from core.rules.cert.mem32c import MEM32C
+
+# a few statements touching several variables, repeated through the body
+STATEMENTS = [
+    "v{i} = malloc(16);",
+    "if (v{i} == 0) return;",
+    "v{i}[0] = n + {i};",
+    "u{j} = u{j} + v{i}[0];",
+    "if (n > {i}) free(v{i}); else v{i} = 0;",
+]
+
+
+def synthetic_function(statements, depth, variables=32):
+    """One function of about `statements` statements inside `depth` nested loops."""
+    lines = [f"void big(int n) {{"]
+    lines += [f"    char *v{i}; int u{i} = 0;" for i in range(variables)]
+    per_level = max(statements // (depth + 1), 1)
+    emitted = 0
+    for level in range(depth + 1):
+        indent = "    " * (level + 1)
+        for k in range(per_level):
+            i, j = (emitted + k) % variables, (emitted + 3 * k) % variables
+            lines.append(indent + STATEMENTS[k % len(STATEMENTS)].format(i=i, j=j))
+        emitted += per_level
+        if level < depth:
+            lines.append(indent + f"for (int k{level} = 0; k{level} < n; k{level}++) {{")
+    for level in reversed(range(depth)):
+        lines.append("    " * (level + 1) + "}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dataflow scaling benchmark")
+    parser.add_argument("--statements", type=int, default=2000,
+                        help="Statements in the smallest function")
+    parser.add_argument("--depth", type=int, default=40,
+                        help="Loop nesting depth")
+    parser.add_argument("--steps", type=int, default=4,
+                        help="Number of times the function size is doubled")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs timed per size, the best one is reported")
+    args = parser.parse_args()
+
+    rules = [MEM30C(), EXP33C(), MEM32C()]
+    print(f"{'statements':>10} {'CFG (ms)':>9} {'rules (ms)':>11} {'us/statement':>13}")
+    for step in range(args.steps + 1):
+        statements = args.statements << step
+        func = c_parser.CParser().parse(synthetic_function(statements, args.depth)).ext[0]
+        build = best_of(args.repeat, lambda: CFG(func))
+
+        def check():
+            for rule in rules:
+                rule.begin_file("bench.c")
+                rule.check_function(func)
+
+        checked = best_of(args.repeat, check)
+        print(f"{statements:>10} {build * 1000:>9.1f} {checked * 1000:>11.1f} "
+              f"{(build + checked) * 1e6 / statements:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
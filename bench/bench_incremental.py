@@ -0,0 +1,75 @@
+"""
+Incremental re-analysis benchmark:
+checks a synthetic unit, then repeatedly edits one function in the middle
+(which also moves every function after it) and re-analyzes it two ways:
+
+- full: whole-unit parse, every rule on every function
+- incremental: chunked parse reusing unchanged chunks, and rules with
+  scope "function" re-run on the edited function only
+
+Checking is reported for all rules and for the function-scoped ones alone,
+since unit-scoped rules still see every function either way.
+
+    python -m bench.bench_incremental [--functions 400] [--repeat 5]
+"""
+import argparse
+import time
+
+from parser.c_parser import CParser
+from checker.checker import Checker
+from core.rules import cert, misra
+from bench.bench_dispatch import synthetic_source, FUNCTION_TEMPLATE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="incremental re-analysis benchmark")
+    parser.add_argument("--functions", type=int, default=400,
+                        help="Number of functions in the synthetic translation unit")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Edits timed, the best one is reported")
+    args = parser.parse_args()
+
+    all_rules = misra.RULES + cert.RULES
+    rule_sets = {
+        "all rules": all_rules,
+        "function-scoped rules": [rule for rule in all_rules if rule.scope == "function"],
+    }
+    source = synthetic_source(args.functions)
+    whole = CParser(mode="recover")
+    chunked = CParser(mode="chunked")
+    checkers = {name: (Checker(rules), Checker(rules, incremental=True))
+                for name, rules in rule_sets.items()}
+    ast = chunked.parse_text(source, "bench.c")
+    for _, incremental in checkers.values():
+        incremental.run(ast, source, "bench.c", chunked.index, chunked.unit_chunks())
+
+    best = {}
+
+    def timed(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best[name] = min(best.get(name, elapsed), elapsed)
+        return result
+
+    edited = FUNCTION_TEMPLATE.format(i=args.functions // 2)
+    for n in range(args.repeat):
+        text = source.replace(edited, edited.replace("int k;", f"int k;\n    total += {n};"))
+        whole_ast = timed(("parse", "full"), lambda: whole.parse_text(text, "bench.c"))
+        chunked_ast = timed(("parse", "incremental"), lambda: chunked.parse_text(text, "bench.c"))
+        for name, (full, incremental) in checkers.items():
+            expected = timed((name, "full"),
+                             lambda: full.run(whole_ast, text, "bench.c", whole.index))
+            got = timed((name, "incremental"),
+                        lambda: incremental.run(chunked_ast, text, "bench.c", chunked.index,
+                                                chunked.unit_chunks()))
+            assert got == expected, "incremental results differ from a full check"
+
+    print(f"{'after editing one function':<30} {'full (ms)':>10} {'incremental (ms)':>17}")
+    for name in ["parse"] + list(rule_sets):
+        print(f"{name:<30} {best[name, 'full'] * 1000:>10.1f} "
+              f"{best[name, 'incremental'] * 1000:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Startup latency benchmark:
+times complete `python cli.py FILE` invocations on a trivial source against
+a bare interpreter start, so the difference is what the checker itself
+costs before and around the first file.
+
+    python -m bench.bench_startup [--runs 10] [FILE]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRIVIAL_SOURCE = "int main(void)\n{\n    return 0;\n}\n"
+
+
+def wall_times(cmd, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="startup latency benchmark")
+    parser.add_argument("file", nargs="?", help="Source to check (default: a trivial one)")
+    parser.add_argument("--runs", type=int, default=10, help="Invocations per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, "trivial.c")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(TRIVIAL_SOURCE)
+        cli = [sys.executable, os.path.join(ROOT, "cli.py"), path]
+        # one untimed run so bytecode caches are written before measuring
+        wall_times(cli, 1)
+        bare = wall_times([sys.executable, "-c", "pass"], args.runs)
+        full = wall_times(cli, args.runs)
+        print(f"{'':<12} {'median':>9} {'min':>9}")
+        for label, times in (("interpreter", bare), ("cli.py", full)):
+            print(f"{label:<12} {statistics.median(times) * 1000:7.1f}ms "
+                  f"{min(times) * 1000:7.1f}ms")
+        print(f"{'checker':<12} "
+              f"{(statistics.median(full) - statistics.median(bare)) * 1000:7.1f}ms")
+        subprocess.run(cli + ["--startup-profile"], cwd=ROOT, stdout=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Benchmark suite:
+generates a synthetic corpus (see bench.corpus) and times every stage of
+checking it on its own: parsing (with preprocessing), the node index, the
+taint summaries, the symbol table, each rule alone (with those shared
+structures already built), the whole rule set through the Checker, and
+writing the findings in each report format. Each stage keeps its best time
+over --repeat runs.
+
+--save writes the timings to a JSON baseline. --baseline compares against
+one made with the same corpus knobs, and exits with status 1 when a stage
+is slower by more than --threshold (0.25 = 25%) and by more than a
+millisecond.
+
+    python -m bench.bench_suite [--files 4] [--functions 50] [--statements 20] ...
+                                [--save FILE] [--baseline FILE] [--threshold 0.25]
+"""
+import argparse
+import io
+import json
+import sys
+import time
+
+from pycparser import c_ast
+
+from bench import corpus
+from checker.checker import Checker
+from core.constants import ConstantEvaluator
+from core.dispatch import Dispatcher
+from core.rule import DispatchRule, ScanRule
+from core.rules import cert, misra
+from core.scan import Scanner
+from core.symbols import SymbolTable
+from core.taint import TaintEngine
+from parser.c_parser import CParser
+from parser.node_index import NodeIndex
+from report.stream_report import REPORT_FORMATS, make_reporter
+
+# slowdowns smaller than this are noise, whatever the ratio
+MIN_DELTA = 0.001
+
+
+class Unit:
+    """One generated translation unit and what the stages build from it."""
+    def __init__(self, filename, code):
+        self.filename = filename
+        self.code = code
+        self.ast = None
+        self.index = None
+        self.taint = None
+        self.symbols = None
+        self.constants = None
+
+    def functions(self):
+        return [ext for ext in self.ast.ext if isinstance(ext, c_ast.FuncDef)]
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def parse(units):
+    for unit in units:
+        unit.ast = CParser().parse_text(unit.code, unit.filename)
+
+
+def build_index(units):
+    for unit in units:
+        unit.index = NodeIndex(unit.ast)
+        unit.index.nodes("FuncDef")
+
+
+def build_taint(units):
+    for unit in units:
+        unit.taint = TaintEngine()
+        for func in unit.functions():
+            unit.taint.function(func).origins(func.body)
+
+
+def build_symbols(units):
+    for unit in units:
+        unit.symbols = SymbolTable(unit.ast)
+        unit.constants = ConstantEvaluator(unit.symbols)
+        for func in unit.functions():
+            unit.symbols.lookup(func.body, func)
+
+
+def run_rule(rule, unit):
+    """Check one unit with one rule, the way the Checker runs it."""
+    rule.taint, rule.symbols, rule.constants = unit.taint, unit.symbols, unit.constants
+    if isinstance(rule, DispatchRule):
+        Dispatcher([rule]).run(unit.ast, unit.filename)
+    elif isinstance(rule, ScanRule):
+        Scanner([rule]).run(unit.code, unit.filename)
+    else:
+        rule.begin_file(unit.filename)
+        if rule.uses_index:
+            rule.check(unit.ast, unit.filename, index=unit.index)
+        else:
+            rule.check(unit.ast, unit.filename)
+    return rule.get_violations()
+
+
+def measure(units, rule_classes, repeat):
+    """{stage: best seconds} for the corpus."""
+    timings = {}
+    timings["parse"] = best_of(repeat, lambda: parse(units))
+    timings["index"] = best_of(repeat, lambda: build_index(units))
+    timings["taint"] = best_of(repeat, lambda: build_taint(units))
+    timings["symbols"] = best_of(repeat, lambda: build_symbols(units))
+    for rule_class in rule_classes:
+        rule = rule_class()
+        timings[f"rule/{rule.id}"] = best_of(
+            repeat, lambda: [run_rule(rule, unit) for unit in units])
+
+    checker = Checker(rule_classes)
+    violations = []
+
+    def check():
+        violations[:] = []
+        for unit in units:
+            violations.extend(checker.run(unit.ast, unit.code, unit.filename, unit.index))
+
+    timings["check"] = best_of(repeat, check)
+    rules = [rule_class() for rule_class in rule_classes]
+    for fmt in REPORT_FORMATS:
+        timings[f"report/{fmt}"] = best_of(
+            repeat, lambda: make_reporter(fmt, rules, io.StringIO()).output(violations))
+    return timings, len(violations)
+
+
+def compare(timings, baseline, threshold):
+    """Print the timings next to the baseline's; return the stages that regressed."""
+    regressed = []
+    print(f"{'stage':<24} {'baseline (ms)':>14} {'now (ms)':>10} {'change':>8}")
+    for stage, seconds in timings.items():
+        before = baseline.get(stage)
+        if before is None:
+            print(f"{stage:<24} {'-':>14} {seconds * 1000:>10.1f} {'new':>8}")
+            continue
+        change = (seconds - before) / before if before else 0.0
+        slower = change > threshold and seconds - before > MIN_DELTA
+        if slower:
+            regressed.append(stage)
+        print(f"{stage:<24} {before * 1000:>14.1f} {seconds * 1000:>10.1f} {change:>+8.0%}"
+              + ("  REGRESSION" if slower else ""))
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark suite")
+    parser.add_argument("--files", type=int, default=4,
+                        help="Number of synthetic translation units")
+    corpus.add_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs timed per stage, the best one is kept")
+    parser.add_argument("--save", metavar="FILE",
+                        help="Write the timings to this JSON baseline")
+    parser.add_argument("--baseline", metavar="FILE",
+                        help="Compare the timings with this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Slowdown of a stage, as a fraction, that counts as a "
+                             "regression (default 0.25)")
+    args = parser.parse_args()
+
+    config = dict(corpus.knobs(args), files=args.files, seed=args.seed)
+    units = [Unit(f"unit_{i}.c", corpus.generate_unit(args.seed + i, **corpus.knobs(args)))
+             for i in range(args.files)]
+    rule_classes = misra.RULES + cert.RULES
+    timings, found = measure(units, rule_classes, args.repeat)
+    lines = sum(unit.code.count("\n") for unit in units)
+    print(f"{args.files} files, {lines} lines, {found} findings")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("corpus") != config:
+            print(f"{args.baseline} was made with a different corpus: {baseline.get('corpus')}",
+                  file=sys.stderr)
+            return 2
+        regressed = compare(timings, baseline["timings"], args.threshold)
+        if regressed:
+            print(f"{len(regressed)} stage(s) slower than {args.baseline} by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressed)}")
+            status = 1
+    else:
+        print(f"{'stage':<24} {'time (ms)':>10}")
+        for stage, seconds in timings.items():
+            print(f"{stage:<24} {seconds * 1000:>10.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"corpus": config, "python": sys.version.split()[0],
+                       "timings": timings}, f, indent=2)
+            f.write("\n")
+        print(f"timings saved to {args.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Trigger pre-filter benchmark:
+checks synthetic translation units (see bench.corpus) with and without
+the pre-filter that skips rules none of whose trigger words occur in a
+unit. Units are generated at density 0, where no statement calls the
+functions the rules look for, and at --density. Parsing is done once up
+front; times are the best of --repeat checks of every unit, per unit.
+
+    python -m bench.bench_triggers [--files 20] [--rules all] [--repeat 3]
+                                   [corpus knobs]
+"""
+import argparse
+import time
+
+from bench import corpus
+from checker.checker import Checker
+from core import rules as registry
+from parser.c_parser import CParser
+
+
+def untriggered(rule_classes):
+    """The same rules, declaring no triggers so that they always run."""
+    return [type(rule.__name__, (rule,), {"triggers": None}) for rule in rule_classes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="trigger pre-filter benchmark")
+    parser.add_argument("--files", type=int, default=20,
+                        help="Translation units per density")
+    parser.add_argument("--rules", default="misra,cert",
+                        help="Rules to check, as for the CLI's --rules (default: the default rules)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timing repetitions, the best one is reported")
+    corpus.add_arguments(parser)
+    parser.set_defaults(functions=20)
+    args = parser.parse_args()
+
+    rule_classes = registry.select(args.rules.split(","))
+    print(f"{len(rule_classes)} rules, "
+          f"{sum(rule.triggers is not None for rule in rule_classes)} declaring triggers")
+    print(f"{'density':>7} {'filter':<6} {'ms/file':>8} {'skipped/file':>12} {'findings':>8}")
+    for density in (0.0, args.density):
+        knobs = dict(corpus.knobs(args), density=density)
+        units = []
+        for i in range(args.files):
+            code = corpus.generate_unit(args.seed + i, **knobs)
+            cparser = CParser()
+            ast = cparser.parse_text(code, f"unit_{i}.c")
+            units.append((f"unit_{i}.c", code, ast, cparser.index, cparser.preprocessed.text))
+        for name, classes in (("on", rule_classes), ("off", untriggered(rule_classes))):
+            checker = Checker(classes)
+            best = None
+            for _ in range(args.repeat):
+                findings = skipped = 0
+                start = time.perf_counter()
+                for filename, code, ast, index, text in units:
+                    with checker.session(filename) as session:
+                        session.run_rules(session.rules, ast, code, index, None, text)
+                    findings += len(session.violations())
+                    skipped += len(session.skipped)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{density:>7.2f} {name:<6} {best * 1000 / len(units):>8.2f} "
+                  f"{skipped / len(units):>12.1f} {findings:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Violation memory benchmark:
+measures the memory a run's findings take as the free-form dicts rules used
+to build and as Violation records, both as built in the checking process
+and as received from -j worker processes (pickled, so nothing is shared
+unless interned).
+
+    python -m bench.bench_violations [--findings 1000000] [--files 1000]
+"""
+import argparse
+import pickle
+import tracemalloc
+
+from core.violation import Violation
+
+RULES = ["ARR30-C", "STR31-C", "MSC33-C", "ENV33-C", "MEM30-C"]
+SEVERITIES = ["HIGH", "MEDIUM", "LOW"]
+
+
+def findings(count, files, as_dicts):
+    """Yield one list of findings per file, shaped like the rules' output."""
+    per_file = max(count // files, 1)
+    for f in range(files):
+        # one path object per file, as the checker passes it to every rule
+        filename = f"src/module_{f // 50}/file_{f}.c"
+        batch = []
+        for i in range(per_file):
+            rule = RULES[i % len(RULES)]
+            severity = SEVERITIES[i % len(SEVERITIES)]
+            description = f"[OOB] buf[{i % 97}] is outside 0..{i % 13}"
+            if as_dicts:
+                batch.append({"file": filename, "line": i + 1, "rule": rule,
+                              "severity": severity, "description": description})
+            else:
+                batch.append(Violation(rule, description, filename, i + 1, 5, severity))
+        yield batch
+
+
+def measure(count, files, as_dicts, pickled):
+    tracemalloc.start()
+    kept = []
+    for batch in findings(count, files, as_dicts):
+        if pickled:
+            batch = pickle.loads(pickle.dumps(batch))
+        kept.extend(batch)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(kept)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="violation memory benchmark")
+    parser.add_argument("--findings", type=int, default=1000000,
+                        help="Number of findings held at once")
+    parser.add_argument("--files", type=int, default=1000,
+                        help="Number of files the findings are spread over")
+    args = parser.parse_args()
+
+    print(f"{'memory per million findings':<32} {'dicts (MB)':>11} {'Violation (MB)':>15}")
+    for name, pickled in (("checked in process", False), ("returned by -j workers", True)):
+        sizes = [measure(args.findings, args.files, as_dicts, pickled) * 1e6 / 2**20
+                 for as_dicts in (True, False)]
+        print(f"{name:<32} {sizes[0]:>11.1f} {sizes[1]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
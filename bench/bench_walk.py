@@ -0,0 +1,111 @@
+"""
+Tree walking benchmark:
+times walking three translation units: an ordinary synthetic one (see
+bench.corpus), a function whose `else if` chain is --depth links long,
+and a function returning one expression of --terms operands. Each is
+walked by a recursive c_ast.NodeVisitor, by core.walk's explicit stack
+(bare and through a Visitor), by the Dispatcher with a hook-based rule,
+and checked by the Checker with every rule. Times are per AST node; a
+walk that runs out of Python stack is reported as such. A unit whose parse
+loses the function it is made of fails the benchmark, rather than timing
+what is left of the tree.
+
+    python -m bench.bench_walk [--depth 10000] [--terms 5000] [--repeat 3]
+"""
+import argparse
+import sys
+import time
+
+from pycparser import c_ast
+
+from bench import corpus
+from checker.checker import Checker
+from core.dispatch import Dispatcher
+from core.rules import cert, misra
+from core.rules.misra.rule_no_goto import RuleNoGoto
+from core.walk import Visitor, iter_nodes
+from parser.c_parser import CParser
+
+
+def else_if_chain(depth):
+    lines = ["int pick(int x)", "{", "    int y = -1;",
+             "    if (x == 0) y = 0;"]
+    lines += [f"    else if (x == {i}) y = {i} * x;" for i in range(1, depth)]
+    lines += ["    return y;", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def long_expression(terms):
+    operands = [f"x{i % 4}" if i % 2 else str(i) for i in range(terms)]
+    return ("int sum(int x0, int x1, int x2, int x3)\n{\n    return "
+            + " + ".join(operands) + ";\n}\n")
+
+
+class _Counter(Visitor):
+    def __init__(self):
+        self.ids = 0
+
+    def visit_ID(self, node):
+        self.ids += 1
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def walkers(code, filename):
+    """[(name, fn)] walking or checking the unit, given its AST."""
+    rules = misra.RULES + cert.RULES
+    checker = Checker(rules)
+    return [
+        ("NodeVisitor (recursive)", lambda ast: c_ast.NodeVisitor().visit(ast)),
+        ("iter_nodes", lambda ast: sum(1 for _ in iter_nodes(ast))),
+        ("Visitor", lambda ast: _Counter().visit(ast)),
+        ("Dispatcher (MISRA 15.1)", lambda ast: Dispatcher([RuleNoGoto()]).run(ast, filename)),
+        ("Checker (all rules)", lambda ast: checker.run(ast, code, filename)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tree walking benchmark")
+    parser.add_argument("--depth", type=int, default=10000,
+                        help="Links of the `else if` chain")
+    parser.add_argument("--terms", type=int, default=5000,
+                        help="Operands of the long expression")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timing repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    # (name, source, the function the parse must produce, None for any)
+    units = [("corpus", corpus.generate_unit(0), None),
+             (f"else-if x{args.depth}", else_if_chain(args.depth), "pick"),
+             (f"expression x{args.terms}", long_expression(args.terms), "sum")]
+    for name, code, function in units:
+        cparser = CParser()
+        ast = cparser.parse_text(code, f"{name}.c")
+        functions = [ext.decl.name for ext in (ast.ext if ast is not None else ())
+                     if isinstance(ext, c_ast.FuncDef)]
+        missing = not functions if function is None else function not in functions
+        if missing:
+            problems = "; ".join(d["message"] for d in cparser.diagnostics) or "no diagnostics"
+            sys.exit(f"{name}: the parse lost {function or 'every function'}() ({problems})")
+        nodes = sum(1 for _ in iter_nodes(ast))
+        print(f"\n{name}: {nodes} nodes")
+        print(f"{'walk':<24} {'time (ms)':>10} {'us/node':>8}")
+        for walker, fn in walkers(code, f"{name}.c"):
+            try:
+                seconds = best_of(args.repeat, lambda: fn(ast))
+            except RecursionError:
+                print(f"{walker:<24} {'RecursionError':>19}")
+                continue
+            print(f"{walker:<24} {seconds * 1000:>10.1f} {seconds * 1e6 / nodes:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Synthetic C corpus:
+a deterministic generator of translation units for the benchmarks. The
+knobs set the number of functions, the statements per function, how deep
+control statements and expressions nest, and how often a statement is one
+of the calls the rules look for (TRIGGERS). The same seed and knobs always
+give the same source.
+
+    python -m bench.corpus OUTDIR [--files 10] [--functions 50] [--statements 20]
+                                  [--depth 3] [--expr-depth 3] [--density 0.1]
+"""
+import argparse
+import os
+import random
+
+# statements calling the functions the rules check, by callee
+TRIGGERS = {
+    "system": "system(argv[1]);",
+    "free": "free(p); p = malloc(32);",
+    "strcpy": "strcpy(buf, argv[0]);",
+    "pthread_create": "pthread_create(&thread, 0, worker, &v0);",
+    "srand": "srand(v1);",
+}
+
+VARIABLES = ("v0", "v1", "v2", "v3", "argc")
+OPERATORS = ("+", "-", "*", "&", "|", "^", "<<", "%")
+
+PROLOGUE = """\
+void *worker(void *arg)
+{
+    return arg;
+}
+"""
+
+FUNCTION_HEAD = """
+int func_{index}(int argc, char *argv[])
+{{
+    int v0 = argc, v1 = 1, v2 = 2, v3 = 3;
+    char buf[32];
+    char *p = malloc(32);
+    pthread_t thread;
+"""
+
+FUNCTION_TAIL = """\
+    free(p);
+    return v0 + v1 + v2 + v3;
+}
+"""
+
+
+class _Generator:
+    def __init__(self, seed, expr_depth, density):
+        self.rng = random.Random(seed)
+        self.expr_depth = expr_depth
+        self.density = density
+        self.loops = 0
+
+    def expression(self, depth):
+        rng = self.rng
+        if depth == 0 or rng.random() < 0.25:
+            if rng.random() < 0.3:
+                return str(rng.randrange(1, 100))
+            return rng.choice(VARIABLES)
+        left, right = self.expression(depth - 1), self.expression(depth - 1)
+        if rng.random() < 0.1:
+            return f"({left} > {right} ? {left} : {right})"
+        return f"({left} {rng.choice(OPERATORS)} {right})"
+
+    def block(self, budget, depth, indent):
+        """Lines of about `budget` statements nested at most `depth` deep."""
+        lines = []
+        pad = "    " * indent
+        while budget > 0:
+            rng = self.rng
+            budget -= 1
+            if rng.random() < self.density:
+                lines.append(pad + TRIGGERS[rng.choice(sorted(TRIGGERS))])
+                continue
+            if depth > 0 and budget > 1 and rng.random() < 0.3:
+                inner = rng.randrange(1, min(budget, 8) + 1)
+                budget -= inner
+                lines.extend(self.control(inner, depth, indent))
+                continue
+            target = rng.choice(VARIABLES[:4])
+            lines.append(f"{pad}{target} = {self.expression(self.expr_depth)};")
+        return lines
+
+    def control(self, budget, depth, indent):
+        rng = self.rng
+        pad = "    " * indent
+        kind = rng.choice(("if", "for", "while"))
+        cond = self.expression(min(self.expr_depth, 2))
+        body = self.block(budget, depth - 1, indent + 1)
+        if kind == "if":
+            lines = [f"{pad}if ({cond} > {rng.randrange(100)}) {{"] + body
+            if rng.random() < 0.5:
+                lines += [f"{pad}}} else {{", f"{pad}    v3 = v3 + 1;"]
+            return lines + [f"{pad}}}"]
+        counter = f"i{self.loops}"
+        self.loops += 1
+        if kind == "for":
+            return [f"{pad}for (int {counter} = 0; {counter} < {cond}; {counter}++) {{"] \
+                + body + [f"{pad}}}"]
+        return [f"{pad}while (v2 < {cond}) {{", f"{pad}    v2 = v2 + 1;"] + body + [f"{pad}}}"]
+
+
+def generate_unit(seed=0, functions=50, statements=20, depth=3, expr_depth=3, density=0.1):
+    """The source of one synthetic translation unit."""
+    generator = _Generator(seed, expr_depth, density)
+    parts = [PROLOGUE]
+    for index in range(functions):
+        generator.loops = 0
+        body = generator.block(statements, depth, 1)
+        parts.append(FUNCTION_HEAD.format(index=index) + "\n".join(body) + "\n" + FUNCTION_TAIL)
+    return "".join(parts)
+
+
+def add_arguments(parser):
+    """The generator's knobs, for the command lines of the benchmarks using it."""
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the generator")
+    parser.add_argument("--functions", type=int, default=50,
+                        help="Functions per translation unit")
+    parser.add_argument("--statements", type=int, default=20,
+                        help="Statements per function")
+    parser.add_argument("--depth", type=int, default=3,
+                        help="Deepest nesting of if/for/while statements")
+    parser.add_argument("--expr-depth", type=int, default=3,
+                        help="Deepest nesting of binary expressions")
+    parser.add_argument("--density", type=float, default=0.1,
+                        help="Share of statements that call one of " + ", ".join(TRIGGERS))
+
+
+def knobs(args):
+    """The generator's knobs from parsed arguments, as generate_unit() keywords."""
+    return {"functions": args.functions, "statements": args.statements, "depth": args.depth,
+            "expr_depth": args.expr_depth, "density": args.density}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="synthetic C corpus generator")
+    parser.add_argument("outdir", help="Directory to write the translation units to")
+    parser.add_argument("--files", type=int, default=10,
+                        help="Number of translation units")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    os.makedirs(args.outdir, exist_ok=True)
+    for i in range(args.files):
+        path = os.path.join(args.outdir, f"unit_{i}.c")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(generate_unit(args.seed + i, **knobs(args)))
+    print(f"wrote {args.files} files to {args.outdir}")
+
+
+if __name__ == "__main__":
+    main()
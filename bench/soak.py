@@ -0,0 +1,82 @@
+"""
+Soak test:
+checks --files synthetic translation units (see bench.corpus), each one
+different, with a single Checker and CParser, the way a long-lived batch
+worker does, and samples the resident set size as it goes. The rules stay
+warm from file to file, reset in between, so once the first files have
+grown the interpreter's pools and the rules' dispatchers the RSS should
+stay flat. Exits with status 1 if it grew by more than --limit MB after
+the --warmup files.
+
+    python -m bench.soak [--files 10000] [--warmup 1000] [--limit 8]
+                         [--samples 20] [corpus knobs]
+"""
+import argparse
+import gc
+import os
+import resource
+import sys
+import time
+
+from bench import corpus
+from checker.checker import Checker
+from core.rules import misra, cert
+from parser.c_parser import CParser
+
+
+def rss():
+    """The resident set size of the process, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # no procfs: the peak is the best there is (KB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS soak test of a warm checker")
+    parser.add_argument("--files", type=int, default=10000,
+                        help="Number of translation units to check")
+    parser.add_argument("--warmup", type=int, default=1000,
+                        help="Files checked before the baseline RSS is taken")
+    parser.add_argument("--limit", type=float, default=8.0,
+                        help="Largest RSS growth after the warm-up, in MB")
+    parser.add_argument("--samples", type=int, default=20,
+                        help="RSS samples to print over the run")
+    corpus.add_arguments(parser)
+    parser.set_defaults(functions=4, statements=10)
+    args = parser.parse_args()
+    if not 0 < args.warmup < args.files:
+        parser.error("--warmup must be between 0 and --files")
+
+    checker = Checker(misra.RULES + cert.RULES)
+    cparser = CParser()
+    every = max(1, args.files // args.samples)
+    baseline = None
+    findings = 0
+    start = time.perf_counter()
+    print(f"{'files':>7} {'RSS (MB)':>9} {'growth':>7} {'files/s':>8}")
+    for i in range(1, args.files + 1):
+        code = corpus.generate_unit(args.seed + i, **corpus.knobs(args))
+        findings += len(checker.check_file(f"soak_{i}.c", cparser, code))
+        if i == args.warmup or i % every == 0 or i == args.files:
+            gc.collect()
+            now = rss()
+            if i == args.warmup:
+                baseline = now
+            growth = "-" if baseline is None else f"{(now - baseline) / 2**20:+.1f}"
+            rate = i / (time.perf_counter() - start)
+            print(f"{i:>7} {now / 2**20:>9.1f} {growth:>7} {rate:>8.0f}")
+
+    growth = (rss() - baseline) / 2**20
+    print(f"\n{args.files} files, {findings} findings, "
+          f"RSS growth after warm-up {growth:+.1f} MB")
+    if growth > args.limit:
+        print(f"FAIL: RSS grew by more than {args.limit} MB", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Batch checking:
+expands directory / glob / @filelist inputs into source files and checks
+them across a process pool whose workers each keep one warm CParser and
+one Checker for their whole lifetime, or across a thread pool sharing one
+Checker, where every thread keeps its own warm CParser.
+"""
+import glob
+import os
+import threading
+from pathlib import Path
+
+from parser.c_parser import CParser
+from parser.preprocessor import Preprocessor
+from checker.checker import Checker, read_error
+
+SOURCE_SUFFIXES = (".c",)
+
+# per-process state, created once by _init_worker
+_checker = None
+_profile = None
+# how to build a parser, and the parser of each thread (see _worker_parser)
+_parser_options = None
+_local = threading.local()
+
+
+def expand_inputs(inputs, unmatched=None):
+    """
+    Turn files, directories, glob patterns and @filelist entries into a list
+    of paths. Glob patterns matching no file are appended to `unmatched`
+    when given (a watched pattern may match files later).
+    """
+    paths = []
+    seen = set()
+
+    def add(path):
+        if path not in seen:
+            seen.add(path)
+            paths.append(path)
+
+    def expand(item):
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(SOURCE_SUFFIXES):
+                        add(str(Path(root, name)))
+        elif glob.has_magic(item):
+            matches = [match for match in sorted(glob.glob(item, recursive=True))
+                       if os.path.isfile(match)]
+            if not matches and unmatched is not None:
+                unmatched.append(item)
+            for match in matches:
+                add(str(Path(match)))
+        else:
+            add(str(Path(item)))
+
+    for item in inputs:
+        if item.startswith("@"):
+            with open(item[1:], encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        expand(line)
+        else:
+            expand(item)
+    return paths
+
+
+def _init_worker(rule_classes, cache_path=None, cache_max_bytes=None, ast_cache_dir=None,
+                 include_dirs=(), defines=None, parse_mode="recover", profile=False):
+    global _checker, _profile, _parser_options
+    # the caches (and the process pool in run_batch) are imported only by the
+    # runs that use them, keeping a plain single-file run cheap to start
+    cache = ast_cache = None
+    if cache_path:
+        from checker.cache import ResultCache, DEFAULT_MAX_BYTES
+        cache = ResultCache(cache_path, cache_max_bytes or DEFAULT_MAX_BYTES)
+    if ast_cache_dir:
+        from parser.ast_cache import ASTCache
+        ast_cache = ASTCache(ast_cache_dir)
+    if profile:
+        from checker.profiling import Profile
+        _profile = Profile()
+    _parser_options = (ast_cache, tuple(include_dirs), defines, parse_mode)
+    _local.parser = None
+    _checker = Checker(rule_classes, cache=cache, profile=_profile)
+
+
+def _worker_parser():
+    """This thread's warm parser, built on its first file."""
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        ast_cache, include_dirs, defines, parse_mode = _parser_options
+        parser = _local.parser = CParser(ast_cache=ast_cache,
+                                         preprocessor=Preprocessor(include_dirs, defines),
+                                         mode=parse_mode, profile=_profile)
+    return parser
+
+
+def check_path(path):
+    """
+    Check one file with this thread's warm parser and the process's checker.
+    Returns (path, violations, diagnostics, cache hits, cache misses,
+    profile records). A file that cannot be read gets an error diagnostic,
+    so the rest of the batch is still checked.
+    """
+    try:
+        session = _checker.check(path, _worker_parser())
+    except OSError as exc:
+        violations, diagnostics, hits, misses = [], [read_error(path, exc)], 0, 0
+    else:
+        violations, diagnostics = session.violations(), session.diagnostics
+        hits, misses = session.hits, session.misses
+    records = _profile.drain() if _profile is not None else []
+    return path, violations, diagnostics, hits, misses, records
+
+
+def run_batch(paths, rule_classes, jobs=1, cache_path=None,
+              cache_max_bytes=None, ast_cache_dir=None, stats=None,
+              include_dirs=(), defines=None, parse_mode="recover", profile=None,
+              threads=False):
+    """
+    Yield (path, violations, diagnostics) for every path, in input order.
+    `cache_max_bytes` defaults to checker.cache.DEFAULT_MAX_BYTES;
+    `include_dirs` and `defines` ({name: value}) configure the preprocessor
+    and `parse_mode` the parser (see parser.c_parser.PARSE_MODES).
+    Cache hit/miss counts are added to `stats` when given, and the
+    workers' profile records to `profile` (a checker.profiling.Profile).
+    With `threads`, the `jobs` workers are threads of this process, which
+    only run in parallel on a free-threaded Python build. Such a run
+    cannot be profiled: timings and memory peaks would mix the threads.
+    """
+    if threads and profile is not None:
+        raise ValueError("a threaded batch run cannot be profiled")
+    initargs = (rule_classes, cache_path, cache_max_bytes, ast_cache_dir,
+                tuple(include_dirs), defines, parse_mode, profile is not None)
+    if jobs == 1 or len(paths) <= 1:
+        _init_worker(*initargs)
+        results = map(check_path, paths)
+        pool = None
+    elif threads:
+        from concurrent.futures import ThreadPoolExecutor
+        _init_worker(*initargs)
+        pool = ThreadPoolExecutor(max_workers=jobs)
+        results = pool.map(check_path, paths)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(paths) // (jobs * 8))
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=initargs)
+        results = pool.map(check_path, paths, chunksize=chunksize)
+    try:
+        for path, violations, diagnostics, hits, misses, records in results:
+            if stats is not None:
+                stats["hits"] = stats.get("hits", 0) + hits
+                stats["misses"] = stats.get("misses", 0) + misses
+            if profile is not None:
+                profile.records.extend(records)
+            yield path, violations, diagnostics
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if (pool is None or threads) and _checker.cache is not None:
+            _checker.cache.close()
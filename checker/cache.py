@@ -0,0 +1,283 @@
+"""
+Result cache:
+persists the violations each rule produced for a given source so that
+unchanged (file, rule) pairs are not re-checked on the next run.
+
+Entries are keyed by a hash of (source text, preprocessed text,
+preprocessing options, rule id, rule version); rules checked function by
+function also keep one entry per (function, rule), see checker.incremental. They live in a SQLite file
+together with a (path, preprocessing options) -> (mtime, size, inode,
+header stamps, digest) table. That table lets a file skip reading,
+preprocessing and hashing entirely when neither it nor any header it
+included changed; other -I / -D options may pick other headers and give
+another digest, so they get a row of their own. The store is capped in
+size, rows of both tables counting, and evicts least recently used rows
+first.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from core.violation import Violation
+
+# bump when the cached payload, key layout or schema changes
+CACHE_FORMAT = 6
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# how many stored entries between two size checks
+_EVICT_INTERVAL = 256
+
+# keys per SELECT ... IN (...) query (older SQLite builds allow 999 parameters)
+_QUERY_BATCH = 500
+
+
+class _Diagnostics:
+    """Stands in for a rule to store a unit's parse diagnostics next to its results."""
+    id = "diagnostics"
+    version = 1
+
+
+class ResultCache:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        # absolute: a daemon changes directory to each client's
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._touched = {}
+        self._touched_files = {}
+        self._stored = 0
+        # the connection is shared by the threads checking files, one at a time
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_FORMAT:
+            self.conn.executescript("""
+                DROP TABLE IF EXISTS results;
+                DROP TABLE IF EXISTS files;
+            """)
+            self.conn.execute(f"PRAGMA user_version = {CACHE_FORMAT}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_last_used ON results(last_used);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT NOT NULL,
+                options TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                deps TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                row_size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (path, options)
+            );
+            CREATE INDEX IF NOT EXISTS files_last_used ON files(last_used);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def digest(code, preprocessed_text):
+        """Digest of a unit: its source (for text rules) and its preprocessed form."""
+        h = hashlib.sha256(code.encode("utf-8"))
+        h.update(b"\0")
+        h.update(preprocessed_text.encode("utf-8"))
+        return h.hexdigest()
+
+    def cached_digest(self, filename, options):
+        """
+        Return (digest, stamp, deps) for a file on disk preprocessed with
+        `options` (the parser's options_key()). The digest is the one
+        recorded last time with those options, or None if the file or one
+        of its headers changed since; deps are the recorded headers as
+        (path, mtime_ns, size). Pass `stamp` to record_digest() after
+        recomputing the digest.
+        """
+        st = os.stat(filename)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        path = os.path.abspath(filename)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT mtime_ns, size, inode, deps, digest FROM files "
+                "WHERE path = ? AND options = ?",
+                (path, options)).fetchone()
+        if row is None or tuple(row[:3]) != stamp:
+            return None, stamp, []
+        deps = json.loads(row[3])
+        for path, mtime_ns, size in deps:
+            try:
+                dep = os.stat(path)
+            except OSError:
+                return None, stamp, []
+            if (dep.st_mtime_ns, dep.st_size) != (mtime_ns, size):
+                return None, stamp, []
+        with self._lock:
+            self._touched_files[(path, options)] = time.time()
+        return row[4], stamp, deps
+
+    def record_digest(self, filename, options, stamp, digest, deps):
+        """Remember a file's digest under `options` with the stamps of it and its headers."""
+        path = os.path.abspath(filename)
+        deps = json.dumps(deps)
+        # what the row weighs against the size cap, roughly
+        row_size = len(path) + len(options) + len(deps) + len(digest) + 24
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files "
+                "(path, options, mtime_ns, size, inode, deps, digest, row_size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, options, *stamp, deps, digest, row_size, time.time()))
+            self.conn.commit()
+            self._stored += 1
+
+    @staticmethod
+    def _key(digest, options, rule):
+        text = f"{CACHE_FORMAT}\0{digest}\0{options}\0{rule.id}\0{rule.version}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def lookup(self, digest, options, rules):
+        """Return {rule: violations} for the rules whose results are cached."""
+        found = {}
+        keys = {self._key(digest, options, rule): rule for rule in rules}
+        if not keys:
+            return found
+        placeholders = ",".join("?" * len(keys))
+        now = time.time()
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT key, data FROM results WHERE key IN ({placeholders})",
+                tuple(keys)).fetchall()
+            for key, _ in rows:
+                self._touched[key] = now
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+        for key, data in rows:
+            found[keys[key]] = [Violation.from_dict(v) for v in json.loads(data)]
+        return found
+
+    def lookup_diagnostics(self, digest, options):
+        """Return the parse diagnostics stored for a source, or None."""
+        key = self._key(digest, options, _Diagnostics)
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+        return json.loads(row[0])
+
+    def store(self, digest, options, results, diagnostics=None):
+        """
+        Queue {rule: violations} for one source, and its parse diagnostics
+        when given; written on the next commit().
+        """
+        now = time.time()
+        rows = []
+        items = [(rule, [v.to_dict() for v in violations]) for rule, violations in results.items()]
+        if diagnostics is not None:
+            items.append((_Diagnostics, diagnostics))
+        for rule, data in items:
+            data = json.dumps(data, ensure_ascii=False)
+            rows.append((self._key(digest, options, rule), data, len(data), now))
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (key, data, size, last_used) VALUES (?, ?, ?, ?)",
+                rows)
+            self._stored += len(rows)
+
+    def lookup_functions(self, pairs):
+        """
+        Return {(function key, rule): data} for the pairs with stored
+        per-function results (see checker.incremental).
+        """
+        found = {}
+        keys = {self._key(key, "function", rule): (key, rule) for key, rule in pairs}
+        now = time.time()
+        pending = list(keys)
+        for start in range(0, len(pending), _QUERY_BATCH):
+            batch = pending[start:start + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self.conn.execute(
+                    f"SELECT key, data FROM results WHERE key IN ({placeholders})",
+                    batch).fetchall()
+                for key, _ in rows:
+                    self._touched[key] = now
+            for key, data in rows:
+                found[keys[key]] = json.loads(data)
+        return found
+
+    def store_functions(self, results):
+        """Queue {(function key, rule): data}; written on the next commit()."""
+        now = time.time()
+        rows = []
+        for (key, rule), value in results.items():
+            data = json.dumps(value, ensure_ascii=False)
+            rows.append((self._key(key, "function", rule), data, len(data), now))
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (key, data, size, last_used) VALUES (?, ?, ?, ?)",
+                rows)
+            self._stored += len(rows)
+
+    def commit(self):
+        with self._lock:
+            if self._touched:
+                self.conn.executemany(
+                    "UPDATE results SET last_used = ? WHERE key = ?",
+                    [(when, key) for key, when in self._touched.items()])
+                self._touched.clear()
+            if self._touched_files:
+                self.conn.executemany(
+                    "UPDATE files SET last_used = ? WHERE path = ? AND options = ?",
+                    [(when, path, options)
+                     for (path, options), when in self._touched_files.items()])
+                self._touched_files.clear()
+            self.conn.commit()
+            if self._stored >= _EVICT_INTERVAL:
+                self._stored = 0
+                self.evict()
+
+    def evict(self):
+        """
+        Drop least recently used rows, results and file digests alike, until
+        the store is below 90% of the cap.
+        """
+        with self._lock:
+            total = self.conn.execute(
+                "SELECT (SELECT COALESCE(SUM(size), 0) FROM results)"
+                " + (SELECT COALESCE(SUM(row_size), 0) FROM files)").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            excess = total - int(self.max_bytes * 0.9)
+            results, files = [], []
+            rows = self.conn.execute(
+                "SELECT key, NULL, size, last_used FROM results"
+                " UNION ALL SELECT path, options, row_size, last_used FROM files"
+                " ORDER BY last_used")
+            for key, options, size, _ in rows:
+                if options is None:
+                    results.append((key,))
+                else:
+                    files.append((key, options))
+                excess -= size
+                if excess <= 0:
+                    break
+            self.conn.executemany("DELETE FROM results WHERE key = ?", results)
+            self.conn.executemany("DELETE FROM files WHERE path = ? AND options = ?", files)
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.commit()
+            self.evict()
+            self.conn.close()
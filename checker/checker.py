@@ -1,36 +1,133 @@
-from parser import c_parser
-from core.rule import Rule
+import threading
+
+from checker.incremental import FunctionResults
+from checker.session import AnalysisSession, RuleSet
+
+
+def read_error(path, exc):
+    """The diagnostic for a source that could not be read (an OSError)."""
+    return {"file": path, "line": None, "column": None, "severity": "error",
+            "message": f"cannot read: {exc.strerror or exc}"}
+
 
 class Checker:
-    def __init__(self, rules):
-        self.rules = [rule() for rule in rules]
-
-    def run(self, ast, code=None, filename="<unknown>"):
-        results = []
-        if ast is None:
-            return results
-
-        tainted_vars = c_parser.last_parser.tainted_vars if hasattr(c_parser, 'last_parser') else None
-
-
-        for rule in self.rules:
-            used = False
-            # if hasattr(rule, "analyze") and code:
-            #     try:
-            #         rule.analyze(code, filename, tainted_vars=tainted_vars)
-            #     except TypeError:
-            #         rule.analyze(code, filename)
-            if hasattr(rule, "check") and ast:
-                if rule.__class__.check is not Rule.check:
-                    try:
-                        rule.check(ast, filename, tainted_vars=tainted_vars)
-                    except TypeError:
-                        rule.check(ast, filename)
-                    used = True
-            if not used and hasattr(rule, "analyze") and code is not None:
-                try:
-                    rule.analyze(code, filename, tainted_vars=tainted_vars)
-                except TypeError:
-                    rule.analyze(code, filename)
-            results.extend(rule.get_violations())
-        return results
\ No newline at end of file
+    def __init__(self, rules, cache=None, incremental=None, profile=None):
+        """
+        `incremental` keeps the findings of scope="function" rules per
+        function and re-checks only changed functions; it defaults to on
+        when a result cache is given (which then also persists them).
+        With a checker.profiling.Profile, every rule runs on its own and its
+        cost is recorded there (function findings are then not reused).
+
+        A Checker keeps nothing about the files it checks: each check runs
+        in its own AnalysisSession (see checker.session), so several threads
+        can check files with one Checker at once, each with its own CParser.
+        The rule objects are reused from file to file, reset in between.
+        """
+        self.rule_classes = list(rules)
+        self.cache = cache
+        if incremental is None:
+            incremental = cache is not None
+        self.functions = FunctionResults(cache) if incremental else None
+        self.profile = profile
+        # RuleSets no session is using, reset and ready for the next ones;
+        # there are as many sets as sessions ever ran at once
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def session(self, filename="<unknown>"):
+        """A new AnalysisSession for checking `filename`; close() it when done."""
+        return AnalysisSession(self, filename)
+
+    def acquire_rules(self):
+        """A RuleSet for a session: an idle one, or a new one if all are in use."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return RuleSet(self.rule_classes)
+
+    def release_rules(self, rule_set):
+        """Reset the rules a session is done with and keep them for the next one."""
+        rule_set.reset()
+        with self._lock:
+            self._idle.append(rule_set)
+
+    def check(self, filename, parser, code=None):
+        """
+        Parse and check one file; return its (closed) AnalysisSession,
+        holding the violations, diagnostics and included headers. With a
+        result cache, rules whose results for this exact unit are stored
+        are not re-run; when neither the file nor its headers changed, it is
+        not even read, and the file is not parsed at all when every rule hits.
+        """
+        with self.session(filename) as session:
+            self._check(session, parser, code)
+        return session
+
+    def _check(self, session, parser, code):
+        filename = session.filename
+        rules = session.rules
+        digest = None
+        cached = {}
+        diagnostics = None
+        preprocessed = None
+        deps = []
+        if self.cache is not None:
+            options = parser.options_key()
+            stamp = None
+            if code is None:
+                digest, stamp, deps = self.cache.cached_digest(filename, options)
+            if digest is None:
+                if code is None:
+                    code = self._read(filename)
+                with parser.stage(filename, "preprocess"):
+                    preprocessed = parser.preprocess(code, filename)
+                deps = preprocessed.deps
+                digest = self.cache.digest(code, preprocessed.text)
+                if stamp is not None:
+                    self.cache.record_digest(filename, options, stamp, digest, preprocessed.deps)
+            cached = self.cache.lookup(digest, options, rules)
+            session.hits, session.misses = len(cached), len(rules) - len(cached)
+            session.results.update(cached)
+            if len(cached) == len(rules):
+                diagnostics = self.cache.lookup_diagnostics(digest, options)
+
+        pending = [rule for rule in rules if rule not in cached]
+        if pending or diagnostics is None:
+            if code is None:
+                code = self._read(filename)
+            ast = parser.parse_text(code, filename, preprocessed)
+            diagnostics = parser.diagnostics
+            if parser.preprocessed is not None:
+                deps = parser.preprocessed.deps
+            chunks = None
+            if self.functions is not None and any(r.scope == "function" for r in pending):
+                chunks = parser.unit_chunks()
+            text = parser.preprocessed.text if parser.preprocessed is not None else None
+            fresh = session.run_rules(pending, ast, code, parser.index, chunks, text)
+            if self.cache is not None and ast is not None:
+                self.cache.store(digest, options, fresh, diagnostics)
+        session.diagnostics = list(diagnostics)
+        session.deps = list(deps)
+        if self.cache is not None:
+            self.cache.commit()
+
+    def check_file(self, filename, parser, code=None):
+        """check() one file and return just its violations."""
+        return self.check(filename, parser, code).violations()
+
+    @staticmethod
+    def _read(filename):
+        with open(filename, encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    def run(self, ast, code=None, filename="<unknown>", index=None, chunks=None, text=None):
+        """
+        Check a parsed unit. Pass the parser's unit_chunks() as `chunks` to
+        let scope="function" rules skip unchanged functions, and the text
+        it parsed (parser.preprocessed.text) as `text` to skip the rules
+        whose triggers do not occur in it.
+        """
+        with self.session(filename) as session:
+            session.run_rules(session.rules, ast, code, index, chunks, text)
+        return session.violations()
@@ -0,0 +1,111 @@
+"""
+Daemon client:
+sends check and watch requests to a running daemon (cli.py --serve) and
+prints the results the way cli.py does. It imports no parser or rule
+code, so a request costs little more than the interpreter startup.
+
+    python -m checker.client [--socket PATH] [--format console|json] [--watch] inputs...
+    python -m checker.client --shutdown
+
+Messages are JSON objects, one per line in both directions (see
+checker.daemon for the requests the daemon understands).
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+
+from core.violation import Violation
+from report.console_report import print_diagnostics
+from report.stream_report import make_reporter, write_file_result
+
+
+def default_socket():
+    """Per-user socket path shared by the daemon and its clients."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, f"c_analyzer-{os.getuid()}.sock")
+
+
+def send(sock, message):
+    sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def messages(sock):
+    """Yield the messages received on a blocking socket until it closes."""
+    buffer = b""
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return
+        buffer += data
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            yield json.loads(line)
+
+
+def connect(path=None):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path or default_socket())
+    return sock
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="c_analyzer daemon client")
+    parser.add_argument("inputs", nargs="*",
+                        help="C source files, directories, glob patterns or @filelist files")
+    parser.add_argument("--socket", metavar="PATH", help="Daemon socket (default: per-user path)")
+    parser.add_argument("--format", choices=["console", "json", "jsonl"], default="console",
+                        help="Output format")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep printing results whenever a watched file changes")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.shutdown:
+        parser.error("no inputs given")
+
+    try:
+        sock = connect(args.socket)
+    except OSError as exc:
+        print(f"cannot reach the daemon at {args.socket or default_socket()}: {exc.strerror} "
+              "(start it with: python cli.py --serve)", file=sys.stderr)
+        return 2
+
+    if args.shutdown:
+        send(sock, {"op": "shutdown"})
+    else:
+        send(sock, {"op": "watch" if args.watch else "check",
+                    "cwd": os.getcwd(), "inputs": args.inputs})
+    try:
+        for message in messages(sock):
+            if message["op"] == "error":
+                print(f"daemon: {message['message']}", file=sys.stderr)
+                return 1
+            if message["op"] != "results":
+                break
+            results = message["results"]
+            for result in results:
+                if "violations" in result:
+                    result["violations"] = [Violation.from_dict(v) for v in result["violations"]]
+            for result in results:
+                print_diagnostics(result.get("diagnostics", ()))
+            if args.watch:
+                # one report per file, so it is clear which file changed
+                for result in results:
+                    write_file_result(result, args.format)
+                sys.stdout.flush()
+            else:
+                reporter = make_reporter(args.format)
+                for result in results:
+                    reporter.write(result["violations"])
+                reporter.close()
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
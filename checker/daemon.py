@@ -0,0 +1,183 @@
+"""
+Daemon:
+serves checks from one warm parser and checker (checker.watch.Analyzer)
+over a local Unix socket, so editor hooks and scripts pay neither the
+interpreter startup nor the parser setup on every run.
+
+Requests and replies are JSON objects, one per line:
+
+    {"op": "check", "cwd": DIR, "inputs": [...]}  -> one "results" reply
+    {"op": "watch", "cwd": DIR, "inputs": [...]}  -> "results" now, then again
+                                                     whenever watched files change
+    {"op": "shutdown"}                             -> "bye"; the daemon exits
+
+A "results" reply is {"op": "results", "results": [...]} with one
+{"file", "violations", "diagnostics"} entry per checked file ({"file",
+"removed": true} for a watched file that disappeared); failures are
+answered with {"op": "error", "message": ...}, and so is a request that
+is not an object of this shape. The daemon works in the client's "cwd"
+while serving it, so files are named in the results as the client named
+them, just as cli.py would; the paths it was started with (its socket,
+the caches and include directories) are made absolute beforehand.
+"""
+import json
+import os
+import selectors
+import socket
+
+from checker.batch import expand_inputs
+from checker.client import default_socket, send
+from checker.watch import Watcher, DEFAULT_INTERVAL
+
+
+class _Client:
+    __slots__ = ("sock", "buffer", "cwd", "watcher")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = b""
+        self.cwd = None
+        self.watcher = None
+
+
+class Daemon:
+    def __init__(self, analyzer, socket_path=None, interval=DEFAULT_INTERVAL):
+        self.analyzer = analyzer
+        self.socket_path = os.path.abspath(socket_path or default_socket())
+        self.interval = interval
+        self._selector = None
+        self._running = False
+
+    def _listen(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                # left behind by a daemon that did not shut down cleanly
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"a daemon is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+        sock.bind(self.socket_path)
+        # the daemon reads files with its user's rights; keep other users out
+        os.chmod(self.socket_path, 0o600)
+        sock.listen()
+        sock.setblocking(False)
+        return sock
+
+    def serve(self):
+        """Handle clients until a shutdown request."""
+        listener = self._listen()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(listener, selectors.EVENT_READ)
+        self._running = True
+        try:
+            while self._running:
+                watching = any(key.data is not None and key.data.watcher is not None
+                               for key in self._selector.get_map().values())
+                for key, _ in self._selector.select(self.interval if watching else None):
+                    if key.data is None:
+                        conn, _ = listener.accept()
+                        conn.setblocking(False)
+                        self._selector.register(conn, selectors.EVENT_READ, _Client(conn))
+                    else:
+                        self._receive(key.data)
+                self._poll_watchers()
+        finally:
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()
+            self._selector.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _receive(self, client):
+        try:
+            data = client.sock.recv(65536)
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        client.buffer += data
+        while b"\n" in client.buffer and self._running:
+            line, client.buffer = client.buffer.split(b"\n", 1)
+            try:
+                self._handle(client, self._request(line))
+            except Exception as exc:  # one bad request must not end the daemon
+                self._reply(client, {"op": "error", "message": str(exc) or repr(exc)})
+
+    @staticmethod
+    def _request(line):
+        """The request on `line`; ValueError if it is not one the daemon can serve."""
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("a request must be a JSON object")
+        op = message.get("op")
+        if op in ("check", "watch"):
+            if not isinstance(message.get("cwd"), str):
+                raise ValueError(f"a {op!r} request needs a \"cwd\" string")
+            inputs = message.get("inputs")
+            if not isinstance(inputs, list) or not all(isinstance(item, str) for item in inputs):
+                raise ValueError(f"a {op!r} request needs \"inputs\", a list of strings")
+        return message
+
+    def _handle(self, client, message):
+        op = message.get("op")
+        if op == "check":
+            os.chdir(message["cwd"])
+            paths = expand_inputs(message["inputs"])
+            self._reply(client, {"op": "results",
+                                 "results": self._encode(self.analyzer.check(paths))})
+        elif op == "watch":
+            client.cwd = message["cwd"]
+            client.watcher = Watcher(message["inputs"], self.interval)
+            self._poll(client, initial=True)
+        elif op == "shutdown":
+            self._reply(client, {"op": "bye"})
+            self._running = False
+        else:
+            self._reply(client, {"op": "error", "message": f"unknown op {op!r}"})
+
+    def _poll_watchers(self):
+        for key in list(self._selector.get_map().values()):
+            client = key.data
+            if client is not None and client.watcher is not None:
+                try:
+                    self._poll(client)
+                except Exception as exc:
+                    # e.g. the client's directory is gone: stop watching for it
+                    client.watcher = None
+                    self._reply(client, {"op": "error", "message": str(exc) or repr(exc)})
+
+    def _poll(self, client, initial=False):
+        os.chdir(client.cwd)
+        changed, removed = client.watcher.poll()
+        if changed or removed or initial:
+            results = [{"file": path, "removed": True} for path in removed]
+            results.extend(self._encode(self.analyzer.check(changed, client.watcher)))
+            self._reply(client, {"op": "results", "results": results})
+
+    @staticmethod
+    def _encode(results):
+        return [dict(result, violations=[v.to_dict() for v in result["violations"]])
+                for result in results]
+
+    def _reply(self, client, message):
+        client.sock.setblocking(True)
+        try:
+            send(client.sock, message)
+        except OSError:
+            self._drop(client)
+        else:
+            client.sock.setblocking(False)
+
+    def _drop(self, client):
+        try:
+            self._selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+        client.watcher = None
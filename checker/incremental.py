@@ -0,0 +1,161 @@
+"""
+Function-level incremental checking:
+keeps the findings of rules with scope "function" per FuncDef so that,
+after an edit, only the functions that changed are checked again.
+
+A function is identified by its preprocessed text (the parser chunk
+holding it, see parser.chunks) together with the file-scope declarations
+of the names it uses: the same text with the same typedefs and globals in
+scope parses to the same AST, up to line numbers. Hashing the text is
+much cheaper than hashing the AST, and editing a global re-checks exactly
+the functions that refer to it. Findings are stored with the function's
+first line and shifted when it moved.
+"""
+import bisect
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+from pycparser import c_ast
+
+from core.violation import Violation
+
+# per-function results kept in memory by one FunctionResults
+_MEMO_SIZE = 65536
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+def _digest(node):
+    """Hash of a subtree's node types, attributes and shape (coordinates left out)."""
+    parts = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        parts.append(node.__class__.__name__)
+        for attr in node.attr_names:
+            parts.append(repr(getattr(node, attr)))
+        children = node.children()
+        parts.append(",".join(name for name, _ in children))
+        stack.extend(child for _, child in reversed(children))
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _declared_names(node):
+    """Names a file-scope declaration introduces: its own, a tag, enumerators."""
+    names = []
+    if getattr(node, "name", None):
+        names.append(node.name)
+    ty = getattr(node, "type", None)
+    if isinstance(ty, (c_ast.Struct, c_ast.Union, c_ast.Enum)) and ty.name:
+        names.append(ty.name)
+    if isinstance(ty, c_ast.Enum) and ty.values is not None:
+        names.extend(e.name for e in ty.values.enumerators)
+    return names
+
+
+def function_keys(ast, filename, chunks):
+    """
+    One entry per node of ast.ext: (key, first line) for FuncDefs whose
+    results can be kept, None for everything else. `chunks` are the
+    unit's top-level chunks (parser.chunks.split_chunks).
+    """
+    # chunk start lines per file, to find the chunk holding each function
+    by_file = {}
+    for chunk in chunks:
+        by_file.setdefault(chunk.file, []).append(chunk)
+    starts = {}
+    for file, file_chunks in by_file.items():
+        file_chunks.sort(key=lambda chunk: chunk.line)
+        starts[file] = [chunk.line for chunk in file_chunks]
+
+    keys = []
+    # file-scope declarations by declared name, as (position, node)
+    declared = {}
+    decl_digests = {}
+    for pos, node in enumerate(ast.ext):
+        coord = node.coord
+        if not isinstance(node, c_ast.FuncDef) or coord is None or coord.file not in starts:
+            for name in _declared_names(node):
+                declared.setdefault(name, []).append((pos, node))
+            keys.append(None)
+            continue
+        i = bisect.bisect_right(starts[coord.file], coord.line) - 1
+        if i < 0:
+            keys.append(None)
+            continue
+        chunk = by_file[coord.file][i]
+        # same text and same declarations in scope give the same AST
+        parts = [filename, coord.file, f"{coord.line - chunk.line}:{coord.column}", chunk.text]
+        context = set()
+        for name in set(_IDENTIFIER_RE.findall(chunk.text)):
+            for decl_pos, decl in declared.get(name, ()):
+                context.add(decl_pos)
+        for decl_pos in sorted(context):
+            if decl_pos not in decl_digests:
+                decl_digests[decl_pos] = _digest(ast.ext[decl_pos])
+            parts.append(decl_digests[decl_pos])
+        key = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+        keys.append((key, coord.line))
+    return keys
+
+
+def shift_violations(violations, delta, filename):
+    """`violations` with those in `filename` moved `delta` lines."""
+    if not delta:
+        return list(violations)
+    return [v.moved(delta) if v.file == filename else v for v in violations]
+
+
+class FunctionResults:
+    """
+    Per-function findings: an in-memory LRU, backed by the result cache
+    (checker.cache.ResultCache) when one is given.
+    """
+    def __init__(self, cache=None, max_entries=_MEMO_SIZE):
+        self.cache = cache
+        self.max_entries = max_entries
+        # (function key, rule id, rule version) -> (first line, violations)
+        self._memo = OrderedDict()
+        # sessions on several threads share the memo
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _memo_key(key, rule):
+        return key, rule.id, rule.version
+
+    def lookup(self, keys, rules):
+        """Return {(function key, rule): (first line, violations)} for the stored pairs."""
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                for rule in rules:
+                    entry = self._memo.get(self._memo_key(key, rule))
+                    if entry is None:
+                        missing.append((key, rule))
+                    else:
+                        self._memo.move_to_end(self._memo_key(key, rule))
+                        found[key, rule] = entry
+        if missing and self.cache is not None:
+            for (key, rule), data in self.cache.lookup_functions(missing).items():
+                entry = found[key, rule] = (
+                    data["line"], [Violation.from_dict(v) for v in data["violations"]])
+                self._remember(key, rule, entry)
+        return found
+
+    def store(self, results):
+        """Keep {(function key, rule): (first line, violations)}."""
+        for (key, rule), entry in results.items():
+            self._remember(key, rule, entry)
+        if self.cache is not None and results:
+            self.cache.store_functions(
+                {pair: {"line": line, "violations": [v.to_dict() for v in violations]}
+                 for pair, (line, violations) in results.items()})
+
+    def _remember(self, key, rule, entry):
+        with self._lock:
+            self._memo[self._memo_key(key, rule)] = entry
+            if len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
@@ -0,0 +1,306 @@
+"""
+Language server:
+speaks the Language Server Protocol over stdin/stdout (cli.py --lsp) so
+editors show findings inline while the user types. Open documents are
+kept in memory and checked as they are, saved or not, with one warm
+parser and checker: chunked parsing re-parses only the declarations an
+edit touched and rules with scope "function" re-check only the functions
+that changed, so a keystroke in a big file stays cheap.
+
+Edits are debounced; an analysis is abandoned (between parsing and
+checking, and before publishing) as soon as a newer version of its
+document arrives. A reader thread only receives messages; documents and
+analyses are handled on the main thread.
+"""
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+from core.violation import Severity
+
+# seconds of quiet after an edit before the document is checked
+DEFAULT_DEBOUNCE = 0.2
+
+# LSP DiagnosticSeverity by violation / diagnostic severity
+_SEVERITIES = {Severity.HIGH: 1, Severity.MEDIUM: 2, Severity.LOW: 3, "error": 1, "warning": 2}
+
+# JSON-RPC error codes
+_METHOD_NOT_FOUND = -32601
+_INVALID_REQUEST = -32600
+_INVALID_PARAMS = -32602
+_PARSE_ERROR = -32700
+
+
+class MessageError(ValueError):
+    """A message whose header or body could not be decoded; it is skipped."""
+
+
+class MessageReader:
+    """
+    Reads Content-Length framed JSON-RPC messages from a file descriptor.
+    It reads with os.read rather than through a buffered file, whose lock
+    a reader thread still blocked at exit would hold during shutdown.
+    """
+    def __init__(self, fd):
+        self.fd = fd
+        self._buffer = b""
+
+    def read(self):
+        """
+        Return the next message, or None at end of input. Raises
+        MessageError for a message that cannot be decoded, after skipping
+        it, so that reading on returns the ones after it.
+        """
+        while True:
+            end = self._buffer.find(b"\r\n\r\n")
+            if end >= 0:
+                length = self._length(self._buffer[:end])
+                if length is None:
+                    self._buffer = self._buffer[end + 4:]
+                    raise MessageError("invalid message header")
+                if len(self._buffer) >= end + 4 + length:
+                    body = self._buffer[end + 4:end + 4 + length]
+                    self._buffer = self._buffer[end + 4 + length:]
+                    try:
+                        return json.loads(body.decode("utf-8"))
+                    except ValueError as exc:
+                        raise MessageError(f"invalid message body: {exc}") from None
+            data = os.read(self.fd, 65536)
+            if not data:
+                return None
+            self._buffer += data
+
+    @staticmethod
+    def _length(header):
+        """The Content-Length of a message header, None if it has no valid one."""
+        try:
+            for line in header.decode("ascii").split("\r\n"):
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+                    return length if length >= 0 else None
+        except ValueError:
+            pass
+        return None
+
+
+def write_message(stream, message):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri):
+    parsed = urlparse(uri)
+    return unquote(parsed.path) if parsed.scheme == "file" else uri
+
+
+def _utf16_column(text, column):
+    """LSP counts columns in UTF-16 code units; `column` counts characters."""
+    prefix = text[:column]
+    if prefix.isascii():
+        return column
+    return len(prefix.encode("utf-16-le")) // 2
+
+
+def _range(lines, line, column=None):
+    """Range from a 1-based line and column to the end of that line."""
+    row = max(line - 1, 0) if isinstance(line, int) else 0
+    text = lines[row] if row < len(lines) else ""
+    if isinstance(column, int) and column:
+        start = column - 1
+    else:
+        start = len(text) - len(text.lstrip())
+    return {"start": {"line": row, "character": _utf16_column(text, start)},
+            "end": {"line": row, "character": _utf16_column(text, len(text))}}
+
+
+def to_diagnostics(violations, diagnostics, filename, text):
+    """LSP diagnostics for the findings in `filename` (not in its headers)."""
+    lines = text.splitlines()
+    published = []
+    for d in diagnostics:
+        if d["file"] != filename:
+            continue
+        published.append({"range": _range(lines, d["line"], d["column"]),
+                          "severity": _SEVERITIES.get(d["severity"], 2),
+                          "source": "c_analyzer", "message": d["message"]})
+    for violation in violations:
+        if violation.file not in (filename, None):
+            continue
+        published.append({
+            "range": _range(lines, violation.line, violation.column),
+            "severity": _SEVERITIES.get(violation.severity, 2),
+            "source": "c_analyzer",
+            "code": violation.rule,
+            "message": violation.description,
+        })
+    return published
+
+
+class _Document:
+    __slots__ = ("path", "version", "text", "due")
+
+    def __init__(self, path, version, text):
+        self.path = path
+        self.version = version
+        self.text = text
+        # monotonic time the document should be checked at, None when up to date
+        self.due = None
+
+
+class Server:
+    def __init__(self, analyzer, debounce=DEFAULT_DEBOUNCE, stdin=None, stdout=None):
+        self.parser = analyzer.parser
+        self.checker = analyzer.checker
+        self.debounce = debounce
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+        self.documents = {}
+        self._inbox = queue.Queue()
+        self._shutdown = False
+        self._exit = False
+
+    def _read(self):
+        reader = MessageReader(self.stdin.fileno())
+        try:
+            while True:
+                try:
+                    message = reader.read()
+                except MessageError as exc:
+                    # answered by the main thread, which owns stdout
+                    message = exc
+                if message is None:
+                    return
+                self._inbox.put(message)
+        finally:
+            # end of input, or the reader failed: either way serve() stops
+            self._inbox.put(None)
+
+    def serve(self):
+        """Handle messages until the client sends "exit" or closes stdin."""
+        threading.Thread(target=self._read, daemon=True).start()
+        while not self._exit:
+            due = [doc.due for doc in self.documents.values() if doc.due is not None]
+            timeout = max(min(due) - time.monotonic(), 0) if due else None
+            try:
+                self._dispatch(self._inbox.get(timeout=timeout))
+            except queue.Empty:
+                pass
+            self._drain()
+            now = time.monotonic()
+            for uri, doc in list(self.documents.items()):
+                if doc.due is not None and doc.due <= now and not self._exit:
+                    self._analyze(uri, doc)
+        return 0 if self._shutdown else 1
+
+    def _drain(self):
+        """Handle every message already received, without waiting."""
+        while not self._exit:
+            try:
+                self._dispatch(self._inbox.get_nowait())
+            except queue.Empty:
+                return
+
+    def _dispatch(self, message):
+        if message is None:
+            self._exit = True
+            return
+        if isinstance(message, MessageError):
+            self._error(_PARSE_ERROR, str(message))
+            return
+        if not isinstance(message, dict):
+            self._error(_INVALID_REQUEST, "a message must be a JSON object")
+            return
+        method = message.get("method")
+        params = message.get("params") or {}
+        if "id" in message and method is None:
+            return  # a response to something we never ask
+        try:
+            self._handle(message, method, params)
+        except (KeyError, TypeError, AttributeError) as exc:
+            # params missing a field or of the wrong type: a notification
+            # is dropped, a request answered with an error
+            if "id" in message:
+                self._respond(message, error={"code": _INVALID_PARAMS,
+                                              "message": f"invalid params for {method!r}: {exc!r}"})
+
+    def _handle(self, message, method, params):
+        if method == "initialize":
+            self._respond(message, {
+                "capabilities": {"textDocumentSync": {"openClose": True, "change": 1}},
+                "serverInfo": {"name": "c_analyzer"},
+            })
+        elif method == "shutdown":
+            self._shutdown = True
+            self._respond(message, None)
+        elif method == "exit":
+            self._exit = True
+        elif method == "textDocument/didOpen":
+            item = params["textDocument"]
+            doc = self.documents[item["uri"]] = _Document(
+                uri_to_path(item["uri"]), item.get("version"), item["text"])
+            doc.due = time.monotonic()
+        elif method == "textDocument/didChange":
+            doc = self.documents.get(params["textDocument"]["uri"])
+            changes = params["contentChanges"]
+            if doc is not None and changes:
+                # full document sync: the last change holds the whole text
+                doc.text = changes[-1]["text"]
+                doc.version = params["textDocument"].get("version")
+                doc.due = time.monotonic() + self.debounce
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            if self.documents.pop(uri, None) is not None:
+                self._publish(uri, None, [])
+        elif "id" in message:
+            self._respond(message, error={"code": _METHOD_NOT_FOUND,
+                                          "message": f"unsupported method {method!r}"})
+
+    def _stale(self, uri, doc, version):
+        return self.documents.get(uri) is not doc or doc.version != version
+
+    def _analyze(self, uri, doc):
+        version, text = doc.version, doc.text
+        doc.due = None
+        try:
+            ast = self.parser.parse_text(text, doc.path)
+            diagnostics = list(self.parser.diagnostics)
+            self._drain()
+            if self._stale(uri, doc, version):
+                return
+            preprocessed = self.parser.preprocessed
+            violations = self.checker.run(ast, text, doc.path, self.parser.index,
+                                          self.parser.unit_chunks(),
+                                          preprocessed.text if preprocessed is not None else None)
+        except Exception as exc:  # keep serving the other documents
+            print(f"c_analyzer: checking {doc.path} failed: {exc!r}", file=sys.stderr)
+            return
+        self._drain()
+        if not self._stale(uri, doc, version):
+            self._publish(uri, version, to_diagnostics(violations, diagnostics, doc.path, text))
+
+    def _publish(self, uri, version, diagnostics):
+        params = {"uri": uri, "diagnostics": diagnostics}
+        if version is not None:
+            params["version"] = version
+        write_message(self.stdout, {"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics",
+                                    "params": params})
+
+    def _error(self, code, message):
+        """Answer a message that could not be read as a request: with a null id."""
+        self._respond({"id": None}, error={"code": code, "message": message})
+
+    def _respond(self, request, result=None, error=None):
+        if self._shutdown and request.get("method") != "shutdown" and error is None:
+            error = {"code": _INVALID_REQUEST, "message": "server is shutting down"}
+        response = {"jsonrpc": "2.0", "id": request["id"]}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        write_message(self.stdout, response)
@@ -0,0 +1,133 @@
+"""
+Profiling:
+where the time of a run goes. With a Profile attached, the parser records
+each unit's preprocessing and parsing, and the Checker records the shared
+structures it builds (node index, taint summaries, symbol table) and every
+rule, run one at a time so its cost is its own. Each record holds the wall
+time, the nodes the rule was handed, the findings and the peak memory
+allocated while it ran (through tracemalloc, which slows the run down).
+
+summary() aggregates the records per stage and rule, dump() writes them
+all as JSON for tracking over time.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class ProfileRecord:
+    """The cost of one stage or rule on one file."""
+    __slots__ = ("file", "name", "kind", "seconds", "nodes", "violations", "memory")
+
+    def __init__(self, file, name, kind, seconds=0.0, nodes=None, violations=None, memory=None):
+        self.file = file
+        self.name = name
+        # "stage" or "rule"
+        self.kind = kind
+        self.seconds = seconds
+        # AST nodes handed to the rule, None when it reads the source text
+        self.nodes = nodes
+        self.violations = violations
+        # peak bytes allocated above what was allocated when it started
+        self.memory = memory
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data.get(name) for name in cls.__slots__})
+
+
+class Profile:
+    def __init__(self, memory=True):
+        self.records = []
+        self.memory = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def measure(self, file, name, kind="rule"):
+        """Record the block as `name` on `file`; set nodes/violations on the yielded record."""
+        record = ProfileRecord(file, name, kind)
+        if self.memory:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if self.memory:
+                record.memory = max(0, tracemalloc.get_traced_memory()[1] - base)
+            self.records.append(record)
+
+    def drain(self):
+        """The records so far, leaving none (for sending a worker's records back)."""
+        records, self.records = self.records, []
+        return records
+
+    def totals(self):
+        """
+        [(name, kind, files, seconds, nodes, violations, peak memory)] per
+        stage and rule, slowest first.
+        """
+        rows = {}
+        for record in self.records:
+            row = rows.get(record.name)
+            if row is None:
+                row = rows[record.name] = [record.name, record.kind, 0, 0.0, None, None, None]
+            row[2] += 1
+            row[3] += record.seconds
+            if record.nodes is not None:
+                row[4] = (row[4] or 0) + record.nodes
+            if record.violations is not None:
+                row[5] = (row[5] or 0) + record.violations
+            if record.memory is not None:
+                row[6] = max(row[6] or 0, record.memory)
+        return sorted((tuple(row) for row in rows.values()), key=lambda row: -row[3])
+
+    def file_totals(self):
+        """[(file, seconds)] over every stage and rule, slowest first."""
+        seconds = {}
+        for record in self.records:
+            seconds[record.file] = seconds.get(record.file, 0.0) + record.seconds
+        return sorted(seconds.items(), key=lambda item: -item[1])
+
+    def summary(self, stream=None, files=10):
+        """Print the totals per stage and rule, then the `files` slowest files."""
+        stream = stream or sys.stderr
+        rows = self.totals()
+        if not rows:
+            print("profile: nothing was parsed or checked (every result came from the cache)",
+                  file=stream)
+            return
+        total = sum(row[3] for row in rows) or 1.0
+        width = max(len("stage/rule"), *(len(row[0]) for row in rows))
+        print(f"{'stage/rule':<{width}} {'kind':<5} {'files':>5} {'time (ms)':>10} {'share':>6} "
+              f"{'nodes':>9} {'findings':>8} {'peak mem (KB)':>13}", file=stream)
+        for name, kind, count, seconds, nodes, violations, memory in rows:
+            print(f"{name:<{width}} {kind:<5} {count:>5} {seconds * 1000:>10.1f} "
+                  f"{seconds / total:>6.1%} {_cell(nodes):>9} {_cell(violations):>8} "
+                  f"{_cell(memory, 1024):>13}", file=stream)
+        slowest = self.file_totals()[:files]
+        if len(slowest) > 1:
+            width = max(len(path) for path, _ in slowest)
+            print(f"\n{'slowest files':<{width}} {'time (ms)':>10}", file=stream)
+            for path, seconds in slowest:
+                print(f"{path:<{width}} {seconds * 1000:>10.1f}", file=stream)
+
+    def dump(self, path):
+        """Write every record, and the totals, to a JSON file."""
+        fields = ("name", "kind", "files", "seconds", "nodes", "violations", "memory")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0],
+                       "totals": [dict(zip(fields, row)) for row in self.totals()],
+                       "records": [record.to_dict() for record in self.records]}, f, indent=2)
+            f.write("\n")
+
+
+def _cell(value, unit=1):
+    return "-" if value is None else f"{value // unit}"
@@ -0,0 +1,301 @@
+"""
+Analysis sessions:
+everything the check of one translation unit holds. A session borrows a
+RuleSet from the Checker, one instance of each of its rules, and hands it
+back reset when it is closed, so whatever state a rule keeps while it
+checks a file lives and dies with that file's session, along with the
+unit's AST, node index and the taint summaries, symbol table and folded
+constants the rules share. Rule objects stay warm for the next file, yet
+nothing about the file is left on the Checker or in module globals: any
+number of sessions can run at once, one per thread, against the same
+Checker, each with a RuleSet of its own.
+"""
+import re
+
+from pycparser import c_ast
+
+from parser.node_index import NodeIndex
+from core.dispatch import Dispatcher, rule_hooks
+from core.scan import Scanner
+from core.rule import DispatchRule, ScanRule
+from core.constants import ConstantEvaluator
+from core.symbols import SymbolTable
+from core.taint import TaintEngine
+from checker.incremental import function_keys, shift_violations
+
+# what a trigger word can be: a C identifier or keyword
+_WORD = re.compile(r"[A-Za-z_]\w*")
+
+
+class RuleSet:
+    """
+    One instance of each of a checker's rules, in order, with how each
+    is run (Rule.entry(), resolved once for the set) and the dispatchers
+    and scanners driving them. Used by one session at a time.
+    """
+    def __init__(self, rule_classes):
+        self.rules = [rule() for rule in rule_classes]
+        self.entries = {rule: rule.entry() for rule in self.rules}
+        # hook-based AST rules share a single walk of the file; one
+        # dispatcher per distinct subset of them (the subset shrinks when
+        # some results come from the cache), likewise for text rules
+        self.dispatchers = {}
+        self.scanners = {}
+
+    def reset(self):
+        for rule in self.rules:
+            rule.reset()
+
+
+class AnalysisSession:
+    def __init__(self, checker, filename="<unknown>"):
+        self.checker = checker
+        self.filename = filename
+        self._rule_set = checker.acquire_rules()
+        # the checker's rules, in order, this session's until it is closed
+        self.rules = self._rule_set.rules
+        self.code = None
+        self.ast = None
+        self.index = None
+        # parser.chunks.Chunks of the unit, for scope="function" rules
+        self.chunks = None
+        # shared by the rules that use them, built on first use
+        self.taint = None
+        self.symbols = None
+        self.constants = None
+        # rule -> its violations, cached or fresh
+        self.results = {}
+        # preprocessor and parser diagnostics, and (path, mtime_ns, size)
+        # of the headers the unit included
+        self.diagnostics = []
+        self.deps = []
+        # rules whose results came from / were missing in the result cache
+        self.hits = 0
+        self.misses = 0
+        # rules not run because none of their triggers occur in the unit
+        self.skipped = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Hand the rules back to the checker, reset, and let go of the unit.
+        The results, diagnostics and deps stay readable.
+        """
+        if self._rule_set is not None:
+            self.checker.release_rules(self._rule_set)
+            self._rule_set = None
+        self.code = self.ast = self.index = self.chunks = None
+        self.taint = self.symbols = self.constants = None
+
+    def violations(self):
+        """The findings of every rule, in rule order."""
+        results = []
+        for rule in self.rules:
+            results.extend(self.results.get(rule, ()))
+        return results
+
+    def run_rules(self, rules, ast, code, index=None, chunks=None, text=None):
+        """
+        Run `rules` (of self.rules) on the parsed unit; return {rule:
+        violations} in rule order. `text` is the preprocessed source the
+        AST was parsed from: AST rules none of whose triggers occur in it
+        are skipped, as are text rules none of whose triggers occur in
+        `code`.
+        """
+        self.ast, self.code, self.chunks = ast, code, chunks
+        fresh = {}
+        if ast is None:
+            return fresh
+        if index is None or index.ast is not ast:
+            index = NodeIndex(ast)
+        self.index = index
+        order = rules
+        self.skipped = self._untriggered(rules, code, text)
+        if self.skipped:
+            fresh = {rule: [] for rule in self.skipped}
+            rules = [rule for rule in rules if rule not in fresh]
+
+        # taint summaries are shared by the rules that use them, and built
+        # function by function as those rules ask
+        if any(rule.uses_taint for rule in rules):
+            self.taint = TaintEngine()
+            for rule in rules:
+                if rule.uses_taint:
+                    rule.taint = self.taint
+        # and so are the symbol table, resolved function by function too,
+        # and the constants folded with it
+        if any(rule.uses_symbols for rule in rules):
+            self.symbols = SymbolTable(ast)
+            self.constants = ConstantEvaluator(self.symbols)
+            for rule in rules:
+                if rule.uses_symbols:
+                    rule.symbols = self.symbols
+                    rule.constants = self.constants
+
+        if self.checker.profile is not None:
+            fresh.update(self._run_profiled(rules))
+            fresh = {rule: fresh[rule] for rule in order}
+            self.results.update(fresh)
+            return fresh
+
+        by_function = []
+        if self.checker.functions is not None and chunks is not None:
+            by_function = [rule for rule in rules if rule.scope == "function"]
+        if by_function:
+            fresh.update(self._run_by_function(by_function, rules))
+        else:
+            self._dispatcher_for(rules).run(ast, self.filename)
+        self._scanner_for(rules).run(code, self.filename)
+
+        for rule in rules:
+            if rule in fresh:
+                continue
+            if not isinstance(rule, (DispatchRule, ScanRule)):
+                self._run_rule(rule)
+            fresh[rule] = list(rule.get_violations())
+        fresh = {rule: fresh[rule] for rule in order}
+        self.results.update(fresh)
+        return fresh
+
+    def _untriggered(self, rules, code, text):
+        """
+        The rules with triggers none of which occurs in what they read: the
+        preprocessed text for AST rules, the source for text rules. Each is
+        scanned once for the words in it, whatever the number of triggers.
+        """
+        words = {}
+        for rule in rules:
+            if rule.triggers is not None:
+                words.setdefault(rule.reads, set()).update(rule.triggers)
+        present = {}
+        for reads, source in (("ast", text), ("text", code)):
+            if reads in words and source is not None:
+                present[reads] = words[reads].intersection(_WORD.findall(source))
+        return [rule for rule in rules
+                if rule.reads in present and rule.triggers is not None
+                and present[rule.reads].isdisjoint(rule.triggers)]
+
+    def _run_profiled(self, rules):
+        """
+        run_rules() one rule at a time, recording in the checker's profile
+        the cost of each rule and, before them, of building the structures
+        they share.
+        """
+        profile = self.checker.profile
+        filename, index = self.filename, self.index
+        with profile.measure(filename, "index", "stage"):
+            nodes = index.size()
+        functions = index.nodes("FuncDef")
+        if self.taint is not None:
+            with profile.measure(filename, "taint", "stage"):
+                for func in functions:
+                    self.taint.function(func).origins(func.body)
+        if self.symbols is not None:
+            with profile.measure(filename, "symbols", "stage"):
+                for func in functions:
+                    self.symbols.lookup(func.body, func)
+
+        fresh = {}
+        for rule in rules:
+            with profile.measure(filename, rule.id) as record:
+                if isinstance(rule, DispatchRule):
+                    self._dispatcher_for([rule]).run(self.ast, filename)
+                elif isinstance(rule, ScanRule):
+                    self._scanner_for([rule]).run(self.code, filename)
+                else:
+                    self._run_rule(rule)
+            fresh[rule] = list(rule.get_violations())
+            record.violations = len(fresh[rule])
+            if isinstance(rule, DispatchRule):
+                record.nodes = self._hooked_nodes(rule, index)
+            elif not isinstance(rule, ScanRule):
+                # rules checking the tree themselves are handed all of it
+                record.nodes = nodes
+        return fresh
+
+    @staticmethod
+    def _hooked_nodes(rule, index):
+        """The nodes a dispatch rule has an enter or leave hook for."""
+        enter, leave = rule_hooks(rule)
+        return sum(len(index.nodes(node_type)) for node_type in enter.keys() | leave.keys())
+
+    def _run_by_function(self, by_function, rules):
+        """
+        Walk the unit one top-level node at a time, skipping the functions
+        whose findings for every rule in `by_function` are stored. Other
+        dispatch rules in `rules` still see every node. Returns {rule:
+        violations} for `by_function`.
+        """
+        ast, filename, functions = self.ast, self.filename, self.checker.functions
+        walk_all = self._dispatcher_for(rules)
+        walk_unit = self._dispatcher_for([rule for rule in rules if rule.scope != "function"])
+        checked = [rule for rule in by_function if not isinstance(rule, DispatchRule)]
+        keys = function_keys(ast, filename, self.chunks)
+        stored = functions.lookup({key for key, _ in filter(None, keys)}, by_function)
+
+        walk_all.begin(filename)
+        for rule in checked:
+            rule.begin_file(filename)
+        found = {rule: [] for rule in by_function}
+        new = {}
+        for node, key in zip(ast.ext, keys):
+            if key is not None and all((key[0], rule) in stored for rule in by_function):
+                walk_unit.walk(node)
+                for rule in by_function:
+                    line, violations = stored[key[0], rule]
+                    found[rule].extend(shift_violations(violations, key[1] - line,
+                                                        node.coord.file))
+                continue
+            marks = {rule: len(rule.get_violations()) for rule in by_function}
+            walk_all.walk(node)
+            if isinstance(node, c_ast.FuncDef):
+                for rule in checked:
+                    rule.check_function(node)
+            for rule in by_function:
+                violations = rule.get_violations()[marks[rule]:]
+                found[rule].extend(violations)
+                if key is not None:
+                    new[key[0], rule] = (key[1], violations)
+        marks = {rule: len(rule.get_violations()) for rule in by_function}
+        walk_all.end()
+        for rule in checked:
+            rule.end_file()
+        for rule in by_function:
+            found[rule].extend(rule.get_violations()[marks[rule]:])
+        functions.store(new)
+        return found
+
+    def _dispatcher_for(self, rules):
+        dispatched = tuple(rule for rule in rules if isinstance(rule, DispatchRule))
+        key = tuple(id(rule) for rule in dispatched)
+        dispatchers = self._rule_set.dispatchers
+        if key not in dispatchers:
+            dispatchers[key] = Dispatcher(dispatched)
+        return dispatchers[key]
+
+    def _scanner_for(self, rules):
+        scanned = tuple(rule for rule in rules if isinstance(rule, ScanRule))
+        key = tuple(id(rule) for rule in scanned)
+        scanners = self._rule_set.scanners
+        if key not in scanners:
+            scanners[key] = Scanner(scanned)
+        return scanners[key]
+
+    def _run_rule(self, rule):
+        """Run a rule implementing check() or analyze() on the unit."""
+        ast, code, filename = self.ast, self.code, self.filename
+        rule.begin_file(filename)
+        if self._rule_set.entries[rule] == "check":
+            if ast is not None:
+                if rule.uses_index:
+                    rule.check(ast, filename, index=self.index)
+                else:
+                    rule.check(ast, filename)
+        elif code is not None:
+            rule.analyze(code, filename)
+        rule.end_file()
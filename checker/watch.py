@@ -0,0 +1,134 @@
+"""
+Watching:
+polls the sources named by a set of inputs (files, directories, globs,
+@filelists as in checker.batch.expand_inputs) and the user headers they
+include, reporting which sources need checking again, and an Analyzer that keeps
+one parser and checker warm to re-check them.
+
+Polling is a stat() per source and header per interval; the inputs are
+expanded again only when a watched directory changed or every few
+seconds (for globs and @filelists), so a poll stays cheap on large trees.
+"""
+import os
+import time
+
+from checker.batch import expand_inputs
+from checker.checker import read_error
+
+# seconds between two polls
+DEFAULT_INTERVAL = 0.05
+
+# seconds between two full expansions of the inputs
+_RESCAN_INTERVAL = 2.0
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class Watcher:
+    def __init__(self, inputs, interval=DEFAULT_INTERVAL):
+        self.inputs = list(inputs)
+        self.interval = interval
+        # source path -> stamp when it was last reported
+        self._sources = {}
+        # header path -> [(mtime_ns, size) when last preprocessed, sources including it]
+        self._headers = {}
+        # source path -> headers it included
+        self._includes = {}
+        # directory -> stamp, to notice added and removed files
+        self._dirs = {}
+        self._scanned = None
+
+    def record(self, path, deps):
+        """Remember the headers, as (path, mtime_ns, size), a checked source included."""
+        for header in self._includes.pop(path, ()):
+            self._headers[header][1].discard(path)
+        self._includes[path] = [header for header, _, _ in deps]
+        for header, mtime_ns, size in deps:
+            entry = self._headers.setdefault(header, [None, set()])
+            entry[0] = (mtime_ns, size)
+            entry[1].add(path)
+
+    def _expand(self):
+        self._scanned = time.monotonic()
+        self._dirs = {}
+        for item in self.inputs:
+            if not item.startswith("@") and os.path.isdir(item):
+                for root, _, _ in os.walk(item):
+                    self._dirs[root] = _stamp(root)
+        return expand_inputs(self.inputs)
+
+    def poll(self):
+        """
+        Return (changed, removed): sources that are new, were modified or
+        include a modified header, and sources that disappeared. The first
+        poll reports every source as changed.
+        """
+        rescan = (self._scanned is None
+                  or time.monotonic() - self._scanned >= _RESCAN_INTERVAL
+                  or any(_stamp(d) != stamp for d, stamp in self._dirs.items()))
+        paths = self._expand() if rescan else list(self._sources)
+
+        changed = []
+        removed = []
+        for path in paths:
+            stamp = _stamp(path)
+            if stamp is None:
+                if path in self._sources:
+                    removed.append(path)
+            elif self._sources.get(path) != stamp:
+                self._sources[path] = stamp
+                changed.append(path)
+        if rescan:
+            current = set(paths)
+            removed.extend(p for p in self._sources if p not in current)
+        for path in removed:
+            del self._sources[path]
+
+        for header, entry in self._headers.items():
+            stamp = _stamp(header)
+            if (stamp and stamp[:2]) != entry[0]:
+                entry[0] = stamp and stamp[:2]
+                changed.extend(p for p in sorted(entry[1])
+                               if p in self._sources and p not in changed)
+        return changed, removed
+
+    def wait(self):
+        """Block until a poll finds something; return its (changed, removed)."""
+        while True:
+            changed, removed = self.poll()
+            if changed or removed:
+                return changed, removed
+            time.sleep(self.interval)
+
+
+class Analyzer:
+    """One warm parser and checker re-checking files for watchers and the daemon."""
+    def __init__(self, parser, checker):
+        self.parser = parser
+        self.checker = checker
+
+    def check(self, paths, watcher=None):
+        """
+        Check `paths`, returning one {"file", "violations", "diagnostics"}
+        dict per path; the headers each one included are recorded on `watcher`.
+        """
+        results = []
+        for path in paths:
+            try:
+                session = self.checker.check(path, self.parser)
+            except OSError as exc:
+                # deleted or unreadable between the poll and the check
+                results.append({"file": path, "violations": [],
+                                "diagnostics": [read_error(path, exc)]})
+                continue
+            if watcher is not None:
+                watcher.record(path, session.deps)
+            results.append({"file": path, "violations": session.violations(),
+                            "diagnostics": session.diagnostics})
+        return results
@@ -1,48 +1,248 @@
+import time
+_START = time.perf_counter()
+
 import argparse
-from pathlib import Path                     
-from parser import c_parser
-from parser.c_parser import CParser
-from checker import checker
-from report import console_report, json_report
-from core.rules import misra, cert
+import os
+import sys
+from checker import batch
+from checker.checker import Checker, read_error
+from parser.c_parser import CParser, PARSE_MODES
+from parser.preprocessor import Preprocessor
+from report.console_report import print_diagnostics
+from report.stream_report import REPORT_FORMATS, make_reporter, write_file_result
+from core import rules
+
+_IMPORTED = time.perf_counter()
+
+
+def profile_first_file(path, rule_classes, preprocessor, parse_mode, timings):
+    """
+    Check one file in-process, appending the time of each startup stage to
+    `timings`. Returns its violations and diagnostics.
+    """
+    start = time.perf_counter()
+    parser = CParser(preprocessor=preprocessor, mode=parse_mode)
+    checker = Checker(rule_classes)
+    timings.append(("parser/checker setup", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        code = f.read()
+    ast = parser.parse_text(code, path)
+    timings.append(("first parse", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    text = parser.preprocessed.text if parser.preprocessed is not None else None
+    violations = checker.run(ast, code, path, parser.index, text=text)
+    timings.append(("first check", time.perf_counter() - start))
+    return violations, parser.diagnostics
+
+
+def warm_analyzer(rule_classes, preprocessor, parse_mode, cache_path=None,
+                  cache_max_bytes=None, ast_cache_dir=None):
+    """One resident parser and checker for --watch, --serve and --lsp."""
+    from checker.watch import Analyzer
+    cache = ast_cache = None
+    if cache_path:
+        from checker.cache import ResultCache
+        cache = ResultCache(cache_path, cache_max_bytes)
+    if ast_cache_dir:
+        from parser.ast_cache import ASTCache
+        ast_cache = ASTCache(ast_cache_dir)
+    parser = CParser(ast_cache=ast_cache, preprocessor=preprocessor, mode=parse_mode)
+    checker = Checker(rule_classes, cache=cache, incremental=True)
+    return Analyzer(parser, checker)
+
+
+def watch(analyzer, inputs, interval, fmt):
+    """Re-check the inputs whenever one of their sources or headers changes."""
+    from checker.watch import Watcher
+    watcher = Watcher(inputs, interval)
+    try:
+        while True:
+            changed, removed = watcher.wait()
+            start = time.perf_counter()
+            for path in removed:
+                write_file_result({"file": path, "removed": True}, fmt)
+            for result in analyzer.check(changed, watcher):
+                print_diagnostics(result["diagnostics"])
+                write_file_result(result, fmt)
+            sys.stdout.flush()
+            if changed:
+                print(f"checked {len(changed)} file(s) in "
+                      f"{(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+
+
+def print_timings(timings):
+    width = max(len(stage) for stage, _ in timings)
+    for stage, seconds in timings:
+        print(f"{stage:<{width}} {seconds * 1000:8.1f} ms", file=sys.stderr)
+    print(f"{'total':<{width}} {(time.perf_counter() - _START) * 1000:8.1f} ms"
+          " (excluding interpreter startup)", file=sys.stderr)
 
 
 def main():
     parser = argparse.ArgumentParser(description="c_analyzer")
-    parser.add_argument("file", help="Path to the C source file")
+    parser.add_argument("files", nargs="*",
+                        help="C source files, directories, glob patterns or @filelist")
     parser.add_argument("--misra", action="store_true",
                         help="Enable MISRA rule-set checking")
     parser.add_argument("--cert", action="store_true",
                         help="Enable CERT rule-set checking")
-    parser.add_argument("--format", choices=["console", "json"], default="console",
-                        help="Output format (console | json), default is console")
+    parser.add_argument("--rules", action="append", default=[], metavar="LIST",
+                        help="Check these rules (comma-separated): IDs such as MEM30-C, "
+                             "patterns such as 'MEM3*', a rule set (misra, cert: its "
+                             "default rules) or all; adds to --misra/--cert")
+    parser.add_argument("--exclude-rules", action="append", default=[], metavar="LIST",
+                        help="Do not check these rules (comma-separated, as for --rules; "
+                             "a rule set excludes all of its rules)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="console",
+                        help="Output format (console | json | jsonl | sarif), default is "
+                             "console; every format is written while files are checked")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Worker processes for multi-file runs (0 = one per CPU), default is 1")
+    parser.add_argument("--threads", action="store_true",
+                        help="Make the -j workers threads of one process sharing a checker "
+                             "instead of processes (they only run in parallel on a "
+                             "free-threaded Python build)")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="Reuse per-rule results for unchanged files from this cache database")
+    parser.add_argument("--cache-size", type=int, default=256, metavar="MB",
+                        help="Cache size cap in megabytes, default is 256")
+    parser.add_argument("--ast-cache", metavar="DIR",
+                        help="Reuse parsed ASTs of unchanged sources from this directory")
+    parser.add_argument("-I", dest="include_dirs", action="append", default=[], metavar="DIR",
+                        help="Add a directory to the #include search path")
+    parser.add_argument("-D", dest="defines", action="append", default=[],
+                        metavar="NAME[=VALUE]", help="Predefine a macro (VALUE defaults to 1)")
+    parser.add_argument("--parse-mode", choices=PARSE_MODES,
+                        help="strict: a parse error skips the whole file; recover: re-parse "
+                             "a failing file declaration by declaration, skipping only the "
+                             "bad ones; chunked: always parse declaration by declaration "
+                             "(default: chunked with --watch/--serve/--lsp, recover otherwise)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-check sources (or the sources including "
+                             "a header) as soon as they change")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a daemon that checks files for python -m checker.client "
+                             "with a warm parser and checker")
+    parser.add_argument("--lsp", action="store_true",
+                        help="Run a Language Server Protocol server on stdin/stdout that "
+                             "checks the documents open in an editor as they are edited")
+    parser.add_argument("--socket", metavar="PATH",
+                        help="Daemon socket for --serve (default: per-user path)")
+    parser.add_argument("--poll-interval", type=int, default=50, metavar="MS",
+                        help="How often --watch and --serve look for changed files, "
+                             "default is 50")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print how long imports, parser setup and the first file's "
+                             "parse and check take (the first file bypasses the caches)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Run every rule on its own and print, per stage and rule, the "
+                             "time, nodes visited, findings and peak memory (tracking memory "
+                             "slows the run down)")
+    parser.add_argument("--profile-out", metavar="FILE",
+                        help="With --profile, also write every per-file record to this JSON file")
     args = parser.parse_args()
+    if not args.files and not (args.serve or args.lsp):
+        parser.error("no input files given")
+    resident = args.watch or args.serve or args.lsp
+    if args.profile_out:
+        args.profile = True
+    if args.profile and resident:
+        parser.error("--profile measures a batch run, not --watch, --serve or --lsp")
+    if args.profile and args.threads:
+        parser.error("--profile times rules one at a time; it cannot be combined with --threads")
+    if args.watch and args.format == "sarif":
+        parser.error("--format sarif describes a finished run; use jsonl with --watch")
+    if args.parse_mode is None:
+        # chunked parsing lets an edit re-parse just the declarations it touched
+        args.parse_mode = "chunked" if resident else "recover"
+    timings = [("imports", _IMPORTED - _START)]
 
+    names = [name for value in args.rules for name in value.split(",") if name.strip()]
+    names += [rule_set for rule_set in rules.RULE_SETS if getattr(args, rule_set)]
+    excluded = [name for value in args.exclude_rules for name in value.split(",") if name.strip()]
 
-    if not args.misra and not args.cert:
-        args.misra = True
-        args.cert = True
+    start = time.perf_counter()
+    try:
+        selected_rules = rules.select(names, excluded)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not selected_rules:
+        parser.error("every selected rule is excluded")
+    timings.append(("rule imports", time.perf_counter() - start))
 
-    src_path = Path(args.file)
-    with src_path.open(encoding="utf-8") as f:
-        code = f.read()
-    #_parser = c_parser.CParser()
-    c_ast = CParser().parse_text(code)
-    #tainted_vars_set = _parser.get_tainted_vars()
-
-    selected_rules = []
-    if args.misra:
-        selected_rules += misra.RULES
-    if args.cert:
-        selected_rules += cert.RULES
-
-    c_checker = checker.Checker(selected_rules)
-    violations = c_checker.run(c_ast, code=code, filename=str(src_path))
-
-    reporter = (console_report.ConsoleReporter()
-                if args.format == "console"
-                else json_report.JSONReporter())
-    reporter.output(violations)
+    defines = dict(d.split("=", 1) if "=" in d else (d, "1") for d in args.defines)
+    if resident:
+        analyzer = warm_analyzer(selected_rules, Preprocessor(args.include_dirs, defines),
+                                 args.parse_mode, args.cache, args.cache_size * 1024 * 1024,
+                                 args.ast_cache)
+        interval = args.poll_interval / 1000
+        if args.lsp:
+            from checker.lsp import Server
+            sys.exit(Server(analyzer).serve())
+        if args.serve:
+            from checker.daemon import Daemon
+            daemon = Daemon(analyzer, args.socket, interval)
+            print(f"listening on {daemon.socket_path}", file=sys.stderr)
+            try:
+                daemon.serve()
+            except KeyboardInterrupt:
+                pass
+        else:
+            watch(analyzer, args.files, interval, args.format)
+        return
+
+    unmatched = []
+    try:
+        paths = batch.expand_inputs(args.files, unmatched)
+    except OSError as exc:
+        parser.error(f"cannot read file list: {exc}")
+    if unmatched:
+        parser.error(f"no files match {', '.join(map(repr, unmatched))}")
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache_stats = {}
+    reporter = make_reporter(args.format, [rule() for rule in selected_rules])
+    profile = None
+    if args.profile:
+        from checker.profiling import Profile
+        profile = Profile()
+    if args.startup_profile and paths:
+        try:
+            file_violations, diagnostics = profile_first_file(
+                paths[0], selected_rules, Preprocessor(args.include_dirs, defines),
+                args.parse_mode, timings)
+        except OSError as exc:
+            file_violations, diagnostics = [], [read_error(paths[0], exc)]
+        print_diagnostics(diagnostics)
+        reporter.write(file_violations)
+        paths = paths[1:]
+    results = batch.run_batch(paths, selected_rules, jobs=jobs,
+                              cache_path=args.cache,
+                              cache_max_bytes=args.cache_size * 1024 * 1024,
+                              ast_cache_dir=args.ast_cache,
+                              stats=cache_stats,
+                              include_dirs=args.include_dirs,
+                              defines=defines,
+                              parse_mode=args.parse_mode,
+                              profile=profile,
+                              threads=args.threads)
+    for _path, file_violations, diagnostics in results:
+        print_diagnostics(diagnostics)
+        reporter.write(file_violations)
+    reporter.close()
+    if args.cache:
+        print(f"cache: {cache_stats.get('hits', 0)} hits, {cache_stats.get('misses', 0)} misses",
+              file=sys.stderr)
+    if args.startup_profile:
+        print_timings(timings)
+    if profile is not None:
+        profile.summary()
+        if args.profile_out:
+            profile.dump(args.profile_out)
 
 
 if __name__ == "__main__":
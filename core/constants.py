@@ -0,0 +1,378 @@
+"""
+Constant folding:
+the integer value of constant expressions, for rules that check sizes,
+subscripts and arguments.
+
+One ConstantEvaluator is shared by the rules of a run that set
+`uses_symbols`, next to the unit's SymbolTable it resolves names with. It
+folds integer and character literals, arithmetic, bitwise, comparison and
+logical operators, casts, enumeration constants, `const` variables with a
+constant initializer, and sizeof of types, variables and string literals
+(with the type sizes and alignments of an LP64 target; structs and unions
+are laid out member by member, bit-fields are not folded). The value of every node asked
+about is memoized, so asking again about a subscript or an array size is a
+dict lookup.
+"""
+from pycparser import c_ast
+
+from core.walk import walk
+
+POINTER_SIZE = 8
+# sizes of the basic types, without "int" and signedness
+_SIZES = {"char": 1, "short": 2, "int": 4, "long": 8, "long long": 8, "float": 4,
+          "double": 8, "long double": 16, "_Bool": 1, "void": 1}
+_FLOATING = frozenset({"float", "double"})
+_SIGNEDNESS = frozenset({"signed", "unsigned"})
+
+_ESCAPES = {"n": 10, "t": 9, "r": 13, "a": 7, "b": 8, "f": 12, "v": 11, "e": 27,
+            "\\": 92, "'": 39, '"': 34, "?": 63}
+
+# marks a node being folded, so a self-referencing constant ends as None
+_PENDING = object()
+
+
+def int_literal(text):
+    """The value of a C integer literal (0x1F, 017, 10UL, ...), else None."""
+    text = text.rstrip("uUlL")
+    try:
+        if len(text) > 1 and text[0] == "0" and text[1] not in "xXbB":
+            return int(text, 8)
+        return int(text, 0)
+    except ValueError:
+        return None
+
+
+def _unescape(body):
+    """The character codes of the inside of a char or string literal."""
+    codes = []
+    i, n = 0, len(body)
+    while i < n:
+        if body[i] != "\\" or i + 1 == n:
+            codes.append(ord(body[i]))
+            i += 1
+            continue
+        c = body[i + 1]
+        if c in "xX":
+            j = i + 2
+            while j < n and body[j] in "0123456789abcdefABCDEF":
+                j += 1
+            codes.append(int(body[i + 2:j] or "0", 16))
+            i = j
+        elif c in "01234567":
+            j = i + 1
+            while j < n and j < i + 4 and body[j] in "01234567":
+                j += 1
+            codes.append(int(body[i + 1:j], 8))
+            i = j
+        else:
+            codes.append(_ESCAPES.get(c, ord(c)))
+            i += 2
+    return codes
+
+
+def char_literal(text):
+    """The value of a character literal ('a', '\\n', L'x', ...), else None."""
+    body = text[text.index("'") + 1:text.rindex("'")] if text.count("'") >= 2 else ""
+    codes = _unescape(body)
+    return codes[0] if len(codes) == 1 else None
+
+
+def string_length(text):
+    """Characters in a string literal, without the terminating NUL."""
+    body = text[text.index('"') + 1:text.rindex('"')] if text.count('"') >= 2 else ""
+    return len(_unescape(body))
+
+
+def _divide(left, right):
+    """C division: the quotient is truncated towards zero."""
+    quotient = abs(left) // abs(right)
+    return -quotient if (left < 0) != (right < 0) else quotient
+
+
+_BINARY = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: _divide(a, b) if b else None,
+    "%": lambda a, b: a - b * _divide(a, b) if b else None,
+    "<<": lambda a, b: a << b if 0 <= b < 64 else None,
+    ">>": lambda a, b: a >> b if 0 <= b < 64 else None,
+    "&": lambda a, b: a & b,
+    "|": lambda a, b: a | b,
+    "^": lambda a, b: a ^ b,
+    "<": lambda a, b: int(a < b),
+    "<=": lambda a, b: int(a <= b),
+    ">": lambda a, b: int(a > b),
+    ">=": lambda a, b: int(a >= b),
+    "==": lambda a, b: int(a == b),
+    "!=": lambda a, b: int(a != b),
+}
+
+_UNARY = {
+    "-": lambda a: -a,
+    "+": lambda a: a,
+    "~": lambda a: ~a,
+    "!": lambda a: int(not a),
+}
+
+
+class ConstantEvaluator:
+    def __init__(self, symbols):
+        self.symbols = symbols
+        # id(node) -> value (None when it does not fold)
+        self._memo = {}
+        # id(Struct or Union) -> (size, alignment), None when unknown
+        self._layouts = {}
+
+    def value(self, expr, func=None):
+        """
+        The integer value of `expr`, or None when it is not a constant this
+        evaluator folds. `func` is the FuncDef containing the expression,
+        None at file scope.
+        """
+        if expr is None:
+            return None
+        memo = self._memo
+        found = memo.get(id(expr))
+        if found is None and id(expr) not in memo:
+            # fold the operands first, deepest first, so that folding a
+            # long chain of operators only ever looks one level down
+            def operands(node):
+                if id(node) in memo:
+                    return ()
+                kind = type(node)
+                if kind is c_ast.BinaryOp:
+                    return (node.left, node.right)
+                if kind is c_ast.UnaryOp:
+                    return () if node.op == "sizeof" else (node.expr,)
+                if kind is c_ast.Cast:
+                    return (node.expr,)
+                if kind is c_ast.TernaryOp:
+                    return (node.cond, node.iftrue, node.iffalse)
+                return ()
+
+            def fold(node):
+                if id(node) not in memo:
+                    memo[id(node)] = _PENDING
+                    memo[id(node)] = self._fold(node, func)
+
+            walk(expr, operands, fold)
+            found = memo[id(expr)]
+        return None if found is _PENDING else found
+
+    def length(self, symbol):
+        """The number of elements of an array variable, None if unknown or not an array."""
+        array = symbol.resolved
+        if not isinstance(array, c_ast.ArrayDecl):
+            return None
+        if array.dim is not None:
+            return self.value(array.dim, symbol.function)
+        init = getattr(symbol.decl, "init", None)
+        if isinstance(init, c_ast.InitList):
+            return len(init.exprs)
+        if isinstance(init, c_ast.Constant) and init.type == "string":
+            return string_length(init.value) + 1
+        return None
+
+    def size_of(self, type_node, func=None):
+        """The size in bytes of a type (a Typename or a declared type), None if unknown."""
+        layout = self._layout(type_node, func)
+        return layout[0] if layout is not None else None
+
+    def _layout(self, type_node, func):
+        """(size, alignment) in bytes of a type, None if unknown."""
+        kind = type(type_node)
+        if kind is c_ast.Typename or kind is c_ast.TypeDecl:
+            return self._layout(type_node.type, func)
+        if kind is c_ast.PtrDecl:
+            return POINTER_SIZE, POINTER_SIZE
+        if kind is c_ast.ArrayDecl:
+            count = self.value(type_node.dim, func)
+            element = self._layout(type_node.type, func)
+            if count is None or element is None:
+                return None
+            return count * element[0], element[1]
+        if kind is c_ast.Enum:
+            return _SIZES["int"], _SIZES["int"]
+        if kind is c_ast.IdentifierType:
+            typedef = self._typedef(type_node.names)
+            if typedef is not None:
+                return self._layout(typedef.type, typedef.function)
+            size = self._basic_size(type_node.names)
+            return (size, size) if size is not None else None
+        if kind is c_ast.Struct or kind is c_ast.Union:
+            return self._aggregate(type_node, func)
+        # functions
+        return None
+
+    def _aggregate(self, node, func):
+        """(size, alignment) of a struct or union, looking its members up by tag if needed."""
+        if node.decls is None:
+            if not node.name:
+                return None
+            node = self.symbols.tag("struct" if type(node) is c_ast.Struct else "union",
+                                    node.name)
+            if node is None:
+                return None
+            func = None
+        layouts = self._layouts
+        if id(node) in layouts:
+            found = layouts[id(node)]
+            return None if found is _PENDING else found
+        layouts[id(node)] = _PENDING
+        union = type(node) is c_ast.Union
+        size, alignment = 0, 1
+        for member in node.decls:
+            if member.bitsize is not None:
+                size = None
+                break
+            if isinstance(member.type, c_ast.ArrayDecl) and member.type.dim is None:
+                # a flexible array member adds no size, only its alignment
+                layout = self._layout(member.type.type, func)
+                layout = (0, layout[1]) if layout is not None else None
+            else:
+                layout = self._layout(member.type, func)
+            if layout is None:
+                size = None
+                break
+            alignment = max(alignment, layout[1])
+            if union:
+                size = max(size, layout[0])
+            else:
+                size = -(-size // layout[1]) * layout[1] + layout[0]
+        if size is not None:
+            # padded to a multiple of the alignment, as in an array of them
+            found = layouts[id(node)] = -(-size // alignment) * alignment, alignment
+        else:
+            found = layouts[id(node)] = None
+        return found
+
+    def _fold(self, expr, func):
+        kind = type(expr)
+        if kind is c_ast.Constant:
+            if expr.type == "char":
+                return char_literal(expr.value)
+            if expr.type.endswith("int"):
+                return int_literal(expr.value)
+            return None
+        if kind is c_ast.ID:
+            return self._symbol_value(self.symbols.lookup(expr, func))
+        if kind is c_ast.BinaryOp:
+            left = self.value(expr.left, func)
+            if expr.op in ("&&", "||"):
+                if left is not None and bool(left) == (expr.op == "||"):
+                    return int(bool(left))
+                right = self.value(expr.right, func)
+                return int(bool(right)) if left is not None and right is not None else None
+            right = self.value(expr.right, func)
+            if left is None or right is None or expr.op not in _BINARY:
+                return None
+            return _BINARY[expr.op](left, right)
+        if kind is c_ast.UnaryOp:
+            if expr.op == "sizeof":
+                return self._sizeof(expr.expr, func)
+            operand = self.value(expr.expr, func)
+            if operand is None or expr.op not in _UNARY:
+                return None
+            return _UNARY[expr.op](operand)
+        if kind is c_ast.TernaryOp:
+            cond = self.value(expr.cond, func)
+            if cond is None:
+                return None
+            return self.value(expr.iftrue if cond else expr.iffalse, func)
+        if kind is c_ast.Cast:
+            return self._convert(self.value(expr.expr, func), expr.to_type.type)
+        return None
+
+    def _symbol_value(self, symbol):
+        if symbol is None:
+            return None
+        if isinstance(symbol.decl, c_ast.Enumerator):
+            return self._enumerator(symbol)
+        # a const scalar with a constant initializer
+        declared = symbol.resolved
+        if symbol.is_variable and isinstance(declared, c_ast.TypeDecl) \
+                and "const" in (declared.quals or ()) \
+                and not isinstance(symbol.decl.init, (type(None), c_ast.InitList)):
+            return self._convert(self.value(symbol.decl.init, symbol.function), declared)
+        return None
+
+    def _enumerator(self, symbol):
+        """Values of all the constants of the enum, each one more than the last by default."""
+        decl = symbol.decl
+        if id(decl) not in self._memo:
+            enumerators = symbol.type.values.enumerators
+            for enumerator in enumerators:
+                self._memo[id(enumerator)] = _PENDING
+            following = 0
+            for enumerator in enumerators:
+                if enumerator.value is not None:
+                    current = self.value(enumerator.value, symbol.function)
+                else:
+                    current = following
+                self._memo[id(enumerator)] = current
+                following = current + 1 if current is not None else None
+        found = self._memo[id(decl)]
+        return None if found is _PENDING else found
+
+    def _sizeof(self, operand, func):
+        """sizeof of a type name or an expression."""
+        kind = type(operand)
+        if kind is c_ast.Typename:
+            return self.size_of(operand, func)
+        if kind is c_ast.Constant and operand.type == "string":
+            return string_length(operand.value) + 1
+        if kind is c_ast.ID:
+            symbol = self.symbols.lookup(operand, func)
+            if symbol is None or not symbol.is_variable:
+                return None
+            if isinstance(symbol.resolved, c_ast.ArrayDecl) and symbol.resolved.dim is None:
+                count = self.length(symbol)
+                element = self.size_of(symbol.resolved.type, symbol.function)
+                return count * element if count is not None and element is not None else None
+            return self.size_of(symbol.resolved, symbol.function)
+        if (kind is c_ast.ArrayRef and isinstance(operand.name, c_ast.ID)) or \
+                (kind is c_ast.UnaryOp and operand.op == "*" and isinstance(operand.expr, c_ast.ID)):
+            # an element of an array, or what a pointer points to
+            symbol = self.symbols.lookup(operand.name if kind is c_ast.ArrayRef else operand.expr, func)
+            if symbol is not None and isinstance(symbol.resolved, (c_ast.ArrayDecl, c_ast.PtrDecl)):
+                return self.size_of(symbol.resolved.type, symbol.function)
+            return None
+        return None
+
+    def _typedef(self, names):
+        if len(names) == 1 and names[0] not in _SIZES:
+            return self.symbols.typedef(names[0])
+        return None
+
+    @staticmethod
+    def _basic_size(names):
+        names = [name for name in names if name not in _SIGNEDNESS]
+        key = " ".join(name for name in names if name != "int") or "int"
+        return _SIZES.get(key)
+
+    def _convert(self, value, type_node):
+        """`value` converted to an integer type; None for pointer and floating targets."""
+        if value is None or not isinstance(type_node, c_ast.TypeDecl):
+            return None
+        base = type_node.type
+        if isinstance(base, c_ast.Enum):
+            return value
+        if not isinstance(base, c_ast.IdentifierType):
+            return None
+        typedef = self._typedef(base.names)
+        if typedef is not None:
+            return self._convert(value, typedef.type)
+        if _FLOATING.intersection(base.names) or "void" in base.names:
+            return None
+        if "_Bool" in base.names:
+            return int(value != 0)
+        size = self._basic_size(base.names)
+        if size is None:
+            # an unknown type name: leave the value alone
+            return value
+        bits = size * 8
+        value &= (1 << bits) - 1
+        if "unsigned" not in base.names and value >> (bits - 1):
+            value -= 1 << bits
+        return value
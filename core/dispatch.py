@@ -0,0 +1,99 @@
+"""
+Single-pass rule dispatch:
+walks a pycparser AST once and hands every node to the enter_<NodeType> /
+leave_<NodeType> hooks of all participating rules, instead of letting each
+rule start its own NodeVisitor walk.
+"""
+from core.walk import LEAVES
+
+
+def rule_hooks(rule):
+    """Return ({node type: enter hook}, {node type: leave hook}) defined by a rule."""
+    enter, leave = {}, {}
+    for attr in dir(type(rule)):
+        if attr.startswith("enter_"):
+            enter[attr[len("enter_"):]] = getattr(rule, attr)
+        elif attr.startswith("leave_"):
+            leave[attr[len("leave_"):]] = getattr(rule, attr)
+    return enter, leave
+
+
+class Dispatcher:
+    """
+    Drives any number of hook-based rules over one AST walk.
+
+    enter_<NodeType>(node) runs before the node's children are visited and
+    leave_<NodeType>(node) after, so rules that need scoping (e.g. saving
+    per-function state on FuncDef) push in the enter hook and pop in the
+    leave hook.
+    """
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._enter = {}
+        self._leave = {}
+        for rule in self.rules:
+            enter, leave = rule_hooks(rule)
+            for node_type, hook in enter.items():
+                self._enter.setdefault(node_type, []).append(hook)
+            for node_type, hook in leave.items():
+                self._leave.setdefault(node_type, []).append(hook)
+        # node class -> (enter hooks, leave hooks, has no children)
+        self._hooks = {}
+
+    def run(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin(filename, tainted_vars)
+        if ast is not None:
+            self.walk(ast)
+        self.end()
+
+    def begin(self, filename="<unknown>", tainted_vars=None):
+        for rule in self.rules:
+            rule.begin_file(filename, tainted_vars)
+
+    def walk(self, node):
+        """Walk one subtree; a unit may be walked in pieces between begin() and end()."""
+        if self.rules:
+            self._walk(node)
+
+    def end(self):
+        for rule in self.rules:
+            rule.end_file()
+
+    def _walk(self, root):
+        # an explicit stack of child iterators (see core.walk), so deep trees
+        # do not hit the recursion limit; a node whose leave hooks are due
+        # sits under its children's iterator as a (node, hooks) pair
+        hooks = self._hooks
+        stack = [iter((root,))]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            for node in stack[-1]:
+                cls = node.__class__
+                found = hooks.get(cls)
+                if found is None:
+                    found = self._hooks_for(cls)
+                enter, leave, leaf = found
+                if enter:
+                    for hook in enter:
+                        hook(node)
+                if leaf:
+                    if leave:
+                        for hook in leave:
+                            hook(node)
+                    continue
+                if leave:
+                    push((node, leave))
+                push(iter(node))
+                break
+            else:
+                pop()
+                if stack and stack[-1].__class__ is tuple:
+                    node, leave = pop()
+                    for hook in leave:
+                        hook(node)
+
+    def _hooks_for(self, cls):
+        found = self._hooks[cls] = (self._enter.get(cls.__name__), self._leave.get(cls.__name__),
+                                    cls in LEAVES)
+        return found
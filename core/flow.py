@@ -0,0 +1,425 @@
+"""
+Control flow and dataflow:
+a control-flow graph of basic blocks for a FuncDef, and a worklist solver
+for bit-vector dataflow problems over it.
+
+Blocks hold the "items" a function evaluates in order: simple statements
+(expressions, declarations, return values) and branch conditions. The
+operands of && and || get blocks of their own, so a condition like
+`p && *p` is seen as two branches. A call to a function that does not
+return (exit, abort, ...) ends its block.
+
+A Dataflow problem describes each item by the bits it sets (gen) and
+clears (kill) in a state that is a Python int used as a bitset over
+interned IDs (variables, allocation sites, ...); a branch condition can
+add its own gen/kill on either outgoing edge. The solver visits blocks in
+reverse postorder from a priority worklist, so it settles in a few passes
+even with deeply nested loops.
+
+function_cfg(func) builds a function's graph once and keeps it as long as
+the FuncDef lives, so every rule that asks gets the same one.
+"""
+import heapq
+import weakref
+
+from pycparser import c_ast
+
+# calls after which control never continues
+NORETURN_FUNCS = frozenset({"exit", "_Exit", "quick_exit", "abort", "longjmp",
+                            "siglongjmp", "__builtin_unreachable"})
+
+_cfgs = weakref.WeakKeyDictionary()
+
+
+def function_cfg(func):
+    """The CFG of a FuncDef, built on first use."""
+    cfg = _cfgs.get(func)
+    if cfg is None:
+        cfg = _cfgs[func] = CFG(func)
+    return cfg
+
+
+def by_position(violation):
+    """Sort key putting a function's findings back in source order."""
+    return (violation.line or 0, violation.column or 0)
+
+
+class Block:
+    __slots__ = ("index", "items", "succs", "preds")
+
+    def __init__(self, index):
+        self.index = index
+        self.items = []
+        # (block, condition, taken): condition is the branch condition the
+        # edge depends on and taken whether it holds there; both None when
+        # the edge is unconditional
+        self.succs = []
+        self.preds = []
+
+    def __repr__(self):
+        return f"<Block {self.index}: {len(self.items)} items>"
+
+
+class CFG:
+    """
+    Basic blocks of one function. `entry` starts the body, every return
+    (and the end of the body) leads to `exit`, and `order` lists the
+    blocks reachable from the entry in reverse postorder.
+    """
+    def __init__(self, func):
+        # weak, or the graph cached under the FuncDef would keep it alive
+        self._func = weakref.ref(func)
+        self.blocks = []
+        self.entry = self._block()
+        self.exit = self._block()
+        # targets of break / continue, innermost last
+        self._breaks = []
+        self._continues = []
+        # [block, has default] of the enclosing switch statements, innermost last
+        self._switches = []
+        self._labels = {}
+        end = self._statement(func.body, self.entry)
+        if end is not None:
+            self._link(end, self.exit)
+        self.order = self._reverse_postorder()
+        del self._breaks, self._continues, self._switches, self._labels
+
+    @property
+    def func(self):
+        """The FuncDef, while it lives."""
+        return self._func()
+
+    def _block(self):
+        block = Block(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    @staticmethod
+    def _link(source, target, cond=None, taken=None):
+        source.succs.append((target, cond, taken))
+        target.preds.append((source, cond, taken))
+
+    def _label(self, name):
+        block = self._labels.get(name)
+        if block is None:
+            block = self._labels[name] = self._block()
+        return block
+
+    def _statement(self, node, cur):
+        """
+        Add a statement after block `cur` and return the block control
+        continues in, or None when it never falls through.
+        """
+        if node is None:
+            return cur
+        if cur is None:
+            # unreachable code still gets a block, without predecessors
+            cur = self._block()
+        kind = type(node)
+        if kind is c_ast.Compound:
+            for item in node.block_items or ():
+                cur = self._statement(item, cur)
+            return cur
+        if kind is c_ast.If:
+            # an `else if` chain is followed in a loop, not by recursion, so
+            # a chain of any length builds (the joins are made innermost first)
+            then_ends = []
+            while True:
+                then_block, else_block = self._block(), self._block()
+                self._branch(node.cond, cur, then_block, else_block)
+                then_ends.append(self._statement(node.iftrue, then_block))
+                if type(node.iffalse) is not c_ast.If:
+                    break
+                node, cur = node.iffalse, else_block
+            end = self._statement(node.iffalse, else_block)
+            for then_end in reversed(then_ends):
+                end = self._join(then_end, end)
+            return end
+        if kind is c_ast.While:
+            head, body, after = self._block(), self._block(), self._block()
+            self._link(cur, head)
+            self._branch(node.cond, head, body, after)
+            self._loop(node.stmt, body, head, after)
+            return after
+        if kind is c_ast.DoWhile:
+            body, test, after = self._block(), self._block(), self._block()
+            self._link(cur, body)
+            self._loop(node.stmt, body, test, after)
+            self._branch(node.cond, test, body, after)
+            return after
+        if kind is c_ast.For:
+            if node.init is not None:
+                self._items(node.init, cur)
+            head, body, step, after = self._block(), self._block(), self._block(), self._block()
+            self._link(cur, head)
+            if node.cond is not None:
+                self._branch(node.cond, head, body, after)
+            else:
+                self._link(head, body)
+            self._loop(node.stmt, body, step, after)
+            if node.next is not None:
+                step.items.append(node.next)
+            self._link(step, head)
+            return after
+        if kind is c_ast.Switch:
+            cur.items.append(node.cond)
+            after = self._block()
+            self._switches.append([cur, False])
+            self._breaks.append(after)
+            end = self._statement(node.stmt, None)
+            self._breaks.pop()
+            _, has_default = self._switches.pop()
+            if end is not None:
+                self._link(end, after)
+            if not has_default:
+                self._link(cur, after)
+            return after
+        if kind is c_ast.Case or kind is c_ast.Default:
+            block = self._block()
+            if self._switches:
+                switch = self._switches[-1]
+                self._link(switch[0], block)
+                if kind is c_ast.Default:
+                    switch[1] = True
+            if cur.items or cur.preds:
+                self._link(cur, block)  # falls through from the case above
+            for stmt in node.stmts or ():
+                block = self._statement(stmt, block)
+            return block
+        if kind is c_ast.Break:
+            if self._breaks:
+                self._link(cur, self._breaks[-1])
+            return None
+        if kind is c_ast.Continue:
+            if self._continues:
+                self._link(cur, self._continues[-1])
+            return None
+        if kind is c_ast.Return:
+            if node.expr is not None:
+                cur.items.append(node.expr)
+            self._link(cur, self.exit)
+            return None
+        if kind is c_ast.Goto:
+            self._link(cur, self._label(node.name))
+            return None
+        if kind is c_ast.Label:
+            block = self._label(node.name)
+            self._link(cur, block)
+            return self._statement(node.stmt, block)
+        if kind is c_ast.EmptyStatement or kind is c_ast.Pragma:
+            return cur
+        self._items(node, cur)
+        if kind is c_ast.FuncCall and isinstance(node.name, c_ast.ID) \
+                and node.name.name in NORETURN_FUNCS:
+            return None
+        return cur
+
+    @staticmethod
+    def _items(node, block):
+        if isinstance(node, c_ast.DeclList):
+            block.items.extend(node.decls)
+        else:
+            block.items.append(node)
+
+    def _loop(self, stmt, body, step, after):
+        """The body of a loop: `continue` goes to `step`, `break` to `after`."""
+        self._breaks.append(after)
+        self._continues.append(step)
+        end = self._statement(stmt, body)
+        self._continues.pop()
+        self._breaks.pop()
+        if end is not None:
+            self._link(end, step)
+
+    def _join(self, *ends):
+        ends = [end for end in ends if end is not None]
+        if not ends:
+            return None
+        join = self._block()
+        for end in ends:
+            self._link(end, join)
+        return join
+
+    def _branch(self, cond, cur, if_true, if_false):
+        """Evaluate `cond` in `cur` and go on to `if_true` or `if_false`."""
+        # operands still to branch on, the next one last: long && / ||
+        # chains are handled without recursion
+        pending = [(cond, cur, if_true, if_false)]
+        while pending:
+            cond, cur, if_true, if_false = pending.pop()
+            if isinstance(cond, c_ast.BinaryOp) and cond.op in ("&&", "||"):
+                rest = self._block()
+                pending.append((cond.right, rest, if_true, if_false))
+                if cond.op == "&&":
+                    pending.append((cond.left, cur, rest, if_false))
+                else:
+                    pending.append((cond.left, cur, if_true, rest))
+                continue
+            cur.items.append(cond)
+            self._link(cur, if_true, cond, True)
+            self._link(cur, if_false, cond, False)
+
+    def _reverse_postorder(self):
+        order = []
+        seen = {self.entry.index}
+        stack = [(self.entry, iter(self.entry.succs))]
+        while stack:
+            block, succs = stack[-1]
+            for succ, _, _ in succs:
+                if succ.index not in seen:
+                    seen.add(succ.index)
+                    stack.append((succ, iter(succ.succs)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+        order.reverse()
+        return order
+
+
+class Dataflow:
+    """
+    A bit-vector dataflow problem over one CFG.
+
+    Subclasses define transfer(item) -> (gen, kill) for every item, and
+    may define branch(cond, taken) -> (gen, kill) for the edges leaving a
+    branch condition. `may` problems join paths with union (a fact holds
+    if it holds on some path), the others with intersection (on all
+    paths). `forward` problems flow from the entry, backward ones from the
+    exit. bit(key) interns a key and returns its bit.
+    """
+    may = True
+    forward = True
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.ids = {}
+        self._effects = None
+        self._in = None
+
+    def bit(self, key):
+        index = self.ids.get(key)
+        if index is None:
+            index = self.ids[key] = len(self.ids)
+        return 1 << index
+
+    def transfer(self, item):
+        return 0, 0
+
+    def branch(self, cond, taken):
+        return 0, 0
+
+    def boundary(self):
+        """State at the entry (the exit, for backward problems)."""
+        return 0
+
+    def solve(self):
+        """Compute the state at the start of every reachable block, in flow order."""
+        cfg = self.cfg
+        blocks = cfg.order if self.forward else self._backward_order()
+        # gen / kill of every item, and of every block as a whole
+        self._effects = {}
+        summary = {}
+        for block in blocks:
+            effects = [self.transfer(item) for item in block.items]
+            self._effects[block.index] = effects
+            gen = kill = 0
+            for item_gen, item_kill in (effects if self.forward else reversed(effects)):
+                gen = item_gen | (gen & ~item_kill)
+                kill |= item_kill
+            summary[block.index] = (gen, kill)
+        # gen / kill of the branch edges
+        edges = {}
+        for block in blocks:
+            for succ, cond, taken in block.succs:
+                if cond is not None:
+                    edges[block.index, succ.index, taken] = self.branch(cond, taken)
+        universe = (1 << len(self.ids)) - 1
+        start = cfg.entry if self.forward else cfg.exit
+        rank = {block.index: i for i, block in enumerate(blocks)}
+        sources = {}
+        for block in blocks:
+            if self.forward:
+                links = [(pred.index, (pred.index, block.index, taken))
+                         for pred, _, taken in block.preds if pred.index in rank]
+            else:
+                links = [(succ.index, (block.index, succ.index, taken))
+                         for succ, _, taken in block.succs if succ.index in rank]
+            sources[block.index] = links
+        out = {block.index: 0 if self.may else universe for block in blocks}
+        state_in = {}
+        heap = list(range(len(blocks)))
+        queued = [True] * len(blocks)
+        targets = {block.index: [] for block in blocks}
+        for block in blocks:
+            for source, _ in sources[block.index]:
+                targets[source].append(rank[block.index])
+        while heap:
+            i = heapq.heappop(heap)
+            queued[i] = False
+            block = blocks[i]
+            if block is start:
+                state = self.boundary()
+            else:
+                state = None
+                for source, edge in sources[block.index]:
+                    value = out[source]
+                    effect = edges.get(edge)
+                    if effect is not None:
+                        value = effect[0] | (value & ~effect[1])
+                    if state is None:
+                        state = value
+                    elif self.may:
+                        state |= value
+                    else:
+                        state &= value
+                if state is None:
+                    state = 0
+            state_in[block.index] = state
+            gen, kill = summary[block.index]
+            state = gen | (state & ~kill)
+            if state != out[block.index]:
+                out[block.index] = state
+                for j in targets[block.index]:
+                    if not queued[j]:
+                        queued[j] = True
+                        heapq.heappush(heap, j)
+        self._in = state_in
+        return state_in
+
+    def _backward_order(self):
+        reachable = self.cfg.order
+        if self.cfg.exit not in reachable:
+            return list(reversed(reachable))
+        # reverse postorder of the reversed graph, from the exit
+        order = []
+        seen = {self.cfg.exit.index}
+        allowed = {block.index for block in reachable}
+        stack = [(self.cfg.exit, iter(self.cfg.exit.preds))]
+        while stack:
+            block, preds = stack[-1]
+            for pred, _, _ in preds:
+                if pred.index not in seen and pred.index in allowed:
+                    seen.add(pred.index)
+                    stack.append((pred, iter(pred.preds)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+        order.reverse()
+        return order + [block for block in reversed(reachable) if block.index not in seen]
+
+    def states(self):
+        """
+        Yield (item, state) for the items of the reachable blocks, with the
+        state just before the item in flow order (solving first if needed).
+        """
+        if self._in is None:
+            self.solve()
+        for block in (self.cfg.order if self.forward else self._backward_order()):
+            state = self._in[block.index]
+            effects = self._effects[block.index]
+            pairs = zip(block.items, effects)
+            for item, (gen, kill) in (pairs if self.forward else reversed(list(pairs))):
+                yield item, state
+                state = gen | (state & ~kill)
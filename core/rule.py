@@ -1,24 +1,170 @@
+import inspect
+
+from core.dispatch import Dispatcher
+from core.constants import ConstantEvaluator
+from core.scan import Scanner
+from core.symbols import SymbolTable
+from core.taint import TaintEngine
+from core.violation import Violation
+
+
 class Rule:
+    # the ID findings are reported under, also the name core.rules registers
+    # the rule by
+    id = ""
+    # bump whenever a rule's findings change, so cached results are recomputed
+    version = 1
+    # what the rule reads of a unit: "ast" rules implement check(ast,
+    # filename), "text" rules analyze(code, filename); DispatchRule and
+    # ScanRule subclasses are driven by hooks instead
+    reads = "ast"
+    # rules that look nodes up in the shared NodeIndex get it passed to check()
+    uses_index = False
+    # rules that ask whether values are tainted get the run's shared
+    # core.taint.TaintEngine in self.taint
+    uses_taint = False
+    # rules that resolve identifiers to their declarations get the unit's
+    # shared core.symbols.SymbolTable in self.symbols, and the
+    # core.constants.ConstantEvaluator that folds expressions with it in
+    # self.constants
+    uses_symbols = False
+    # "unit": findings may depend on the whole translation unit.
+    # "function": findings inside a function depend only on that function and
+    # the file-scope declarations before it, so the Checker re-runs the rule
+    # on changed functions only (see checker.incremental). Such rules are
+    # DispatchRules, or implement check_function().
+    scope = "unit"
+    # words (callee names, or keywords) of which a unit must contain at
+    # least one for the rule to find anything in it: the Checker skips the
+    # rule on units containing none of them. None: the rule always runs.
+    triggers = None
+
     def __init__(self):
-        self.id = ""
         self.name = ""
         self.description = ""
         self._violations = []
+        self.filename = None
+        self.taint = None
+        self.symbols = None
+        self.constants = None
 
     def analyze(self, code: str, filename: str):
         #raise NotImplementedError("Subclasses must implement analyze()")
         return NotImplementedError
 
     def report_violation(self, filename, lineno, message):
-        self._violations.append({
-            "file": filename,
-            "line": lineno,
-            "rule": self.id,
-            "description": message
-        })
+        self._violations.append(Violation(self.id, message, filename, lineno))
+
+    def report(self, coord, description, severity=None, extra=None):
+        """Record a finding at a node's coord (see Violation.at)."""
+        self._violations.append(Violation.at(self.id, description, coord, self.filename,
+                                             severity, extra))
 
     def get_violations(self):
         return self._violations
-    
-    def check(self, ast, filename: str, tainted_vars=None):
-        raise NotImplementedError
\ No newline at end of file
+
+    # Lifecycle: the Checker keeps rule objects warm across files. Each file
+    # is checked between begin_file() and end_file(), and once its findings
+    # are collected the Checker calls reset(), so nothing of the file (its
+    # findings, shared structures or tracking state) outlives its check.
+
+    def begin_file(self, filename, tainted_vars=None):
+        """
+        Reset per-file state before the rule sees a new translation unit,
+        keeping the shared structures already handed to it for that unit.
+        """
+        shared = self.taint, self.symbols, self.constants
+        self.reset()
+        self.taint, self.symbols, self.constants = shared
+        self.filename = filename
+
+    def end_file(self):
+        """The unit seen since begin_file() is done; its findings are complete."""
+        pass
+
+    def reset(self):
+        """
+        Forget everything about the files seen so far, shared structures
+        included. Rules keeping state of their own while they check a file
+        clear it here too, after calling super().reset().
+        """
+        self._violations = []
+        self.filename = None
+        self.taint = None
+        self.symbols = None
+        self.constants = None
+
+    def check(self, ast, filename: str, tainted_vars=None, index=None):
+        raise NotImplementedError
+
+    @classmethod
+    def entry(cls):
+        """
+        How the Checker runs the rule, from what it declares: "dispatch",
+        "scan", "check" (passed the NodeIndex as `index` with uses_index)
+        or "analyze". Raises TypeError when the rule does not implement
+        the entry point its declarations call for.
+        """
+        if issubclass(cls, DispatchRule):
+            return "dispatch"
+        if issubclass(cls, ScanRule):
+            return "scan"
+        if cls.reads == "text":
+            if cls.analyze is Rule.analyze:
+                raise TypeError(f"{cls.__name__} reads text but does not implement analyze()")
+            return "analyze"
+        if cls.reads != "ast":
+            raise TypeError(f"{cls.__name__} reads {cls.reads!r}, not 'ast' or 'text'")
+        if cls.check is Rule.check:
+            raise TypeError(f"{cls.__name__} reads the AST but does not implement check()")
+        if cls.uses_index and "index" not in inspect.signature(cls.check).parameters:
+            raise TypeError(f"{cls.__name__} uses the node index but its check() takes no `index`")
+        return "check"
+
+    def unit_symbols(self, ast):
+        """
+        The SymbolTable of `ast` (and self.constants with it): the run's
+        shared one, or a new one when the rule is checked alone.
+        """
+        if self.symbols is None or self.symbols.ast is not ast:
+            self.symbols = SymbolTable(ast)
+            self.constants = ConstantEvaluator(self.symbols)
+        return self.symbols
+
+    def check_function(self, func):
+        """Check one FuncDef between begin_file() and end_file() (scope "function")."""
+        raise NotImplementedError
+
+
+class DispatchRule(Rule):
+    """
+    AST rule driven by the single-pass Dispatcher.
+    Subclasses define enter_<NodeType>/leave_<NodeType> hooks instead of
+    walking the tree themselves; check() is kept for running one rule alone.
+    """
+    def check(self, ast, filename: str = "<unknown>", tainted_vars=None):
+        if self.uses_taint:
+            self.taint = TaintEngine()
+        if self.uses_symbols:
+            self.unit_symbols(ast)
+        Dispatcher([self]).run(ast, filename, tainted_vars)
+        return self._violations
+
+
+class ScanRule(Rule):
+    """
+    Text rule driven by the single-pass Scanner.
+    Subclasses map names to regular expressions in `patterns` and handle
+    the matches outside comments and literals in on_match() instead of
+    searching the source themselves; analyze() is kept for running one
+    rule alone.
+    """
+    reads = "text"
+    patterns = {}
+
+    def on_match(self, name, lineno, line):
+        raise NotImplementedError
+
+    def analyze(self, code, filename: str = "<unknown>", tainted_vars=None):
+        Scanner([self]).run(code, filename, tainted_vars)
+        return self._violations
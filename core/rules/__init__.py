@@ -0,0 +1,102 @@
+"""
+Rule registry:
+every rule of the analyzer by ID, with the rule set it belongs to and
+whether it runs when no rules are named. A rule's module is imported only
+when the rule is selected, so a run checking a few rules never loads the
+others.
+
+select() takes names of rules as given to --rules and --exclude-rules:
+an ID ("MEM30-C", in any case), a shell-style pattern over IDs ("MEM3*"),
+a rule set ("misra", "cert": the rules of that set run by default, or
+all of them when excluded) or "all" (every registered rule).
+"""
+import fnmatch
+import importlib
+
+RULE_SETS = ("misra", "cert")
+
+# (ID, rule set, module in core.rules.<rule set>, class, run by default)
+_REGISTRY = [
+    ("MISRA 15.1", "misra", "rule_no_goto", "RuleNoGoto", True),
+    ("MSC24-C", "cert", "msc24c", "MSC24C", True),
+    ("MSC33-C", "cert", "msc33c", "MSC33C", True),
+    ("ENV33-C", "cert", "env33c", "ENV33C", True),
+    ("FIO30-C", "cert", "fio30c", "FIO30C", True),
+    ("MSC32-C", "cert", "msc32c", "MSC32C", True),
+    ("MEM30-C", "cert", "mem30c", "MEM30C", True),
+    ("STR31-C", "cert", "str31c", "STR31C", True),
+    ("ARR30-C", "cert", "arr30c", "ARR30C", True),
+    ("EXP33-C", "cert", "exp33c", "EXP33C", False),
+    ("MEM32-C", "cert", "mem32c", "MEM32C", False),
+    ("MEM34-C", "cert", "mem34c", "MEM34C", False),
+    ("MEM35-C", "cert", "mem35c", "MEM35C", False),
+    ("EXP34-C", "cert", "exp34c", "EXP34C", False),
+    ("INT30-C", "cert", "int30c", "INT30C", False),
+    ("INT31-C", "cert", "int31c", "INT31C", False),
+    ("SIG30-C", "cert", "sig30c", "SIG30C", False),
+    ("SIG31-C", "cert", "sig31c", "SIG31C", False),
+    ("CON33-C", "cert", "con33c", "CON33C", False),
+    ("CON34-C", "cert", "con34c", "CON34C", False),
+    ("FIO45-C", "cert", "fio45c", "FIO45C", False),
+    ("STR32-C", "cert", "str32c", "STR32C", False),
+]
+
+# ID -> rule class, for the rules loaded so far
+_loaded = {}
+
+
+def rule_ids(rule_set=None, default=None):
+    """
+    Registered IDs in registry order, only those of `rule_set` if given,
+    and only those run by default (or not) if `default` is given.
+    """
+    return [rule_id for rule_id, in_set, _, _, on in _REGISTRY
+            if (rule_set is None or in_set == rule_set) and (default is None or on == default)]
+
+
+def load(rule_id):
+    """The class of a registered rule, importing its module the first time."""
+    rule = _loaded.get(rule_id)
+    if rule is None:
+        for registered, rule_set, module, cls, _ in _REGISTRY:
+            if registered == rule_id:
+                break
+        else:
+            raise KeyError(f"no rule {rule_id!r} is registered")
+        rule = getattr(importlib.import_module(f"{__name__}.{rule_set}.{module}"), cls)
+        if rule.id != rule_id:
+            raise ImportError(f"{rule.__name__} declares ID {rule.id!r}, "
+                              f"but is registered as {rule_id!r}")
+        # fails here, once, rather than on every file checked
+        rule.entry()
+        _loaded[rule_id] = rule
+    return rule
+
+
+def _matching(name, whole_sets=False):
+    """The IDs a name given to select() stands for."""
+    key = name.strip().lower()
+    if key == "all":
+        return rule_ids()
+    if key in RULE_SETS:
+        return rule_ids(key, default=None if whole_sets else True)
+    return [rule_id for rule_id in rule_ids() if fnmatch.fnmatchcase(rule_id.lower(), key)]
+
+
+def select(names=(), exclude=()):
+    """
+    The classes of the rules `names` stand for (every rule run by default
+    when there are none), less those `exclude` stands for, in registry
+    order; a rule set excluded drops all of its rules. Raises ValueError
+    for a name that matches no rule.
+    """
+    chosen, dropped = set(), set()
+    for found, given, whole_sets in ((chosen, names or RULE_SETS, False),
+                                     (dropped, exclude, True)):
+        for name in given:
+            ids = _matching(name, whole_sets)
+            if not ids:
+                raise ValueError(f"no rule matches {name!r} (known rules: "
+                                 f"{', '.join(rule_ids())})")
+            found.update(ids)
+    return [load(rule_id) for rule_id in rule_ids() if rule_id in chosen - dropped]
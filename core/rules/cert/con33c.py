@@ -1,21 +1,24 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
+from parser.node_index import NodeIndex
+
+class CON33C(Rule):
+    id = "CON33-C"
+    uses_index = True
+
+    _unsafe_funcs = frozenset({"strtok", "asctime", "ctime", "gmtime", "localtime", "rand",
+                               "strerror", "getenv"})
+    triggers = _unsafe_funcs
 
-class CON33C(Rule, c_ast.NodeVisitor):
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "CON33-C"
         self.name = "Avoid race conditions when using library functions"
         self._violations = []
-        self._unsafe_funcs = {"strtok", "asctime", "ctime", "gmtime", "localtime", "rand", "strerror", "getenv"}
 
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID):
-            func = node.name.name
-            if func in self._unsafe_funcs:
-                self._violations.append({
-                    "rule": self.id,
-                    "message": f"Use of non-thread-safe function '{func}' (line {node.coord.line})"
-                })
-        self.generic_visit(node)
+    def check(self, ast, filename="<unknown>", tainted_vars=None, index=None):
+        self.begin_file(filename, tainted_vars)
+        index = index or NodeIndex(ast)
+        for node in index.calls_to(self._unsafe_funcs):
+            self.report(node.coord, f"Use of non-thread-safe function '{node.name.name}' (line {node.coord.line})")
+        return self._violations
@@ -1,109 +1,221 @@
+from core.flow import Dataflow, by_position, function_cfg
 from core.rule import Rule
+from core.walk import walk
 from pycparser import c_ast
-from pycparser.c_ast import NodeVisitor, ID
 
-class EXP33C(Rule, NodeVisitor):
+
+class _Uninitialized(Dataflow):
+    """
+    Local variables that are uninitialized on some path (`may`) or on
+    every path (not `may`) to a point.
+    """
+    def __init__(self, cfg, events, may):
+        super().__init__(cfg)
+        self.events = events
+        self.may = may
+
+    def transfer(self, item):
+        gen = kill = 0
+        for event, symbol, _ in self.events(item):
+            if event == "declare":
+                bit = self.bit(symbol)
+                gen |= bit
+                kill &= ~bit
+            elif event == "init":
+                bit = self.bit(symbol)
+                kill |= bit
+                gen &= ~bit
+        return gen, kill
+
+
+class EXP33C(Rule):
+    id = "EXP33-C"
+    version = 4
+    scope = "function"
+    uses_symbols = True
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "EXP33-C"
         self.name = "Do not read uninitialized memory"
         self.description = "Flags any use of variables or memory that have not been initialized before use."
-        self._initialized_vars = set()
-        self._declared_vars = set()
-        self._global_vars = set()
-        self._param_vars = set()
-
-    def analyze(self, ast, filename="<unknown>"):
-        if ast is None:
-            return []
-        self._initialized_vars.clear()
-        self._declared_vars.clear()
-        self._global_vars.clear()
-        self._param_vars.clear()
-        self.filename = filename
-        self.visit(ast)
+        # id(item) -> the item's events, shared by both problems
+        self._events = {}
+        self._function = None
+        # adds to the events of the item being walked
+        self._emit = None
+
+    def reset(self):
+        super().reset()
+        self._events = {}
+        self._function = None
+        self._emit = None
+
+    def check(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin_file(filename, tainted_vars)
+        self.unit_symbols(ast)
+        if ast is not None:
+            for ext in ast.ext:
+                if isinstance(ext, c_ast.FuncDef):
+                    self.check_function(ext)
         return self._violations
 
-    def visit_Decl(self, node):
-        if isinstance(node.type, c_ast.TypeDecl) and not self._in_function():
-            self._global_vars.add(node.name)
-            if node.init is not None or 'static' in (node.storage or []):
-                self._initialized_vars.add(node.name)
-            else:
-                self._initialized_vars.add(node.name)
-        if isinstance(node.type, c_ast.TypeDecl) and self._in_function():
-            self._declared_vars.add(node.name)
-            if node.init is not None:
-                self.visit(node.init)
-                self._initialized_vars.add(node.name)
-        if node.init:
-            self.visit(node.init)
-
-    def visit_FuncDef(self, node):
-        prev_declared = self._declared_vars.copy()
-        prev_initialized = self._initialized_vars.copy()
-        prev_params = self._param_vars.copy()
-        # Clear local tracking
-        self._declared_vars = set()
-        self._initialized_vars = set()
-        self._param_vars = set()
-        if node.decl.type.args:
-            for param in node.decl.type.args.params:
-                if isinstance(param, c_ast.Decl):
-                    self._param_vars.add(param.name)
-                    self._declared_vars.add(param.name)
-                    self._initialized_vars.add(param.name)
-        self.visit(node.body)
-        self._declared_vars = prev_declared
-        self._initialized_vars = prev_initialized
-        self._param_vars = prev_params
-
-    def visit_Assignment(self, node):
-        if node.op != '=':
-            self.visit(node.lvalue)
-        self.visit(node.rvalue)
-        if isinstance(node.lvalue, c_ast.ID):
-            var_name = node.lvalue.name
-            self._declared_vars.add(var_name)
-            self._initialized_vars.add(var_name)
+    def check_function(self, func):
+        cfg = function_cfg(func)
+        self._events = {}
+        self._function = func
+        possibly = _Uninitialized(cfg, self.events, may=True)
+        surely = _Uninitialized(cfg, self.events, may=False)
+        surely.solve()
+        surely_states = dict((id(item), state) for item, state in surely.states())
+        found = len(self._violations)
+        for item, state in possibly.states():
+            sure = surely_states[id(item)]
+            for event, symbol, node in self.events(item):
+                bit = possibly.ids.get(symbol)
+                if bit is None:
+                    continue
+                if event == "declare":
+                    state |= 1 << bit
+                    sure |= 1 << surely.ids[symbol]
+                elif event == "init":
+                    state &= ~(1 << bit)
+                    sure &= ~(1 << surely.ids[symbol])
+                elif state >> bit & 1:
+                    certain = sure >> surely.ids[symbol] & 1
+                    self._report_use(node, event, symbol.name, certain)
+        self._violations[found:] = sorted(self._violations[found:], key=by_position)
+        self._events = {}
+        self._function = None
+
+    def _report_use(self, node, event, name, certain):
+        maybe = "" if certain else "possibly "
+        if event == "deref":
+            description = f"Dereference of {maybe}uninitialized pointer '{name}'"
         else:
-            pass
-
-    def visit_ID(self, node):
-        name = node.name
-        if name in self._declared_vars or name in self._param_vars or name in self._global_vars:
-            if name not in self._initialized_vars:
-                self._report(node.coord, "HIGH", f"Use of uninitialized variable '{name}'")
-
-    def visit_UnaryOp(self, node):
-        if node.op == '*':
-            if isinstance(node.expr, c_ast.ID):
-                ptr = node.expr.name
-                if ptr not in self._initialized_vars:
-                    self._report(node.coord, "HIGH",
-                                 f"Dereference of uninitialized pointer '{ptr}'")
-        elif node.op in ('++', '--'):
-            if isinstance(node.expr, c_ast.ID):
-                var = node.expr.name
-                if var not in self._initialized_vars:
-                    self._report(node.coord, "HIGH",
-                                 f"Use of uninitialized variable '{var}'")
-                self._initialized_vars.add(var)
-        self.generic_visit(node)
-
-    def visit_BinaryOp(self, node):
-        self.generic_visit(node)
-
-    def visit_FuncCall(self, node):
-        self.generic_visit(node)
-    def _in_function(self):
-        return len(self._param_vars) > 0 or len(self._declared_vars) > 0
-
-    def _report(self, coord, severity, description):
-        self._violations.append({
-            "file": self.filename,
-            "line": coord.line if coord else 0,
-            "rule": "EXP33-C",
-            "severity": severity,
-            "description": description
-        })
+            description = f"Use of {maybe}uninitialized variable '{name}'"
+        self.report(node.coord, description, "HIGH" if certain else "MEDIUM")
+
+    def events(self, item):
+        """
+        What one item does to local variables, in evaluation order:
+        ("declare", symbol, decl) for a declaration without initializer,
+        ("init", symbol, node) when a variable gets a value, and ("read" or
+        "deref", symbol, node) for each use of one. Names that resolve to
+        no declaration have no events.
+        """
+        events = self._events.get(id(item))
+        if events is None:
+            events = self._events[id(item)] = []
+
+            def add(step):
+                # (event, the ID or Decl naming the variable, node)
+                event, ref, node = step
+                symbol = self.symbols.lookup(ref, self._function)
+                if symbol is not None and (event != "declare" or self._is_tracked(symbol)):
+                    events.append((event, symbol, node))
+
+            self._emit = add
+            walk(item, self._steps, act=add)
+        return events
+
+    def _steps(self, node):
+        """
+        Emit the events of `node` that come before its operands, and return
+        the operands and later events in evaluation order (None for all its
+        children).
+        """
+        kind = type(node)
+        if kind is c_ast.ID:
+            self._emit(("read", node, node))
+            return ()
+        if kind is c_ast.BinaryOp:
+            return (node.left, node.right)
+        if kind is c_ast.Constant:
+            return ()
+        if kind is c_ast.Decl:
+            if node.init is not None:
+                return (node.init, ("init", node, node))
+            self._emit(("declare", node, node))
+            return ()
+        if kind is c_ast.Assignment:
+            return [node.rvalue] + self._assign(node.lvalue, node.op != "=")
+        if kind is c_ast.UnaryOp:
+            if node.op == "sizeof":
+                return ()
+            if node.op == "&":
+                # the address may be used to store a value (scanf("%d", &x), ...)
+                return self._assign(node.expr, False)
+            if node.op in ("++", "--", "p++", "p--"):
+                return self._assign(node.expr, True)
+            if node.op == "*" and isinstance(node.expr, c_ast.ID):
+                self._emit(("deref", node.expr, node))
+                return ()
+        if kind is c_ast.StructRef:
+            return (node.name,)
+        if kind is c_ast.FuncCall:
+            if node.args is None:
+                return ()
+            steps = []
+            for arg in node.args.exprs:
+                # a member handed to a call may be a buffer it fills
+                # (strcpy(s.name, src), fgets(s.line, n, f), ...)
+                if isinstance(arg, c_ast.StructRef) and self._member_root(arg) is not None:
+                    steps += self._assign(arg, False)
+                else:
+                    steps.append(arg)
+            return steps
+        if kind is c_ast.Typename or kind is c_ast.Compound:
+            return ()
+        return None
+
+    @classmethod
+    def _assign(cls, lvalue, reads):
+        """
+        The steps of a store to `lvalue`; `reads` when the old value is used
+        too (x += 1, x++).
+        """
+        if isinstance(lvalue, c_ast.ID):
+            steps = [("read", lvalue, lvalue)] if reads else []
+            steps.append(("init", lvalue, lvalue))
+            return steps
+        root = cls._member_root(lvalue)
+        if root is not None:
+            # a store to a member, or to an element of one (s.a = ...,
+            # s.buf[i] = ...): the struct is treated as initialized, the
+            # subscripts on the way are read
+            steps = []
+            node = lvalue
+            while node is not root:
+                if isinstance(node, c_ast.ArrayRef):
+                    steps.append(node.subscript)
+                node = node.name
+            steps.reverse()
+            steps.append(("init", root, lvalue))
+            return steps
+        # p[i] = ..., *p = ..., p->f = ...: the pointer itself is read
+        return [lvalue]
+
+    @staticmethod
+    def _member_root(node):
+        """
+        The ID of the variable `node` is a member of, or an element of a
+        member of, through `.` only (s.a, s.a.b[i]); None for anything
+        else, such as p->a or a plain a[i].
+        """
+        member = False
+        while True:
+            if isinstance(node, c_ast.ArrayRef):
+                node = node.name
+            elif isinstance(node, c_ast.StructRef) and node.type == ".":
+                member = True
+                node = node.name
+            else:
+                break
+        return node if member and isinstance(node, c_ast.ID) else None
+
+    @staticmethod
+    def _is_tracked(symbol):
+        """Automatic scalars, structs and pointers; arrays and statics are not tracked."""
+        if symbol.scope != "block" or not symbol.is_automatic:
+            return False
+        return isinstance(symbol.resolved, (c_ast.TypeDecl, c_ast.PtrDecl))
@@ -1,25 +1,39 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
-class FIO45C(Rule, c_ast.NodeVisitor):
+from parser.node_index import NodeIndex
+class FIO45C(Rule):
+    id = "FIO45-C"
+    uses_index = True
+
+    _check_funcs = frozenset({"access", "stat", "lstat", "fstat"})
+    _open_funcs = frozenset({"open", "fopen"})
+    # a file is reported where it is opened
+    triggers = _open_funcs
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "FIO45-C"
         self.name = "Avoid TOCTOU race conditions while accessing files"
         self._violations = []
         self._checked_files = set()
 
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID):
+    def reset(self):
+        super().reset()
+        self._checked_files = set()
+
+    def check(self, ast, filename="<unknown>", tainted_vars=None, index=None):
+        self.begin_file(filename, tainted_vars)
+        index = index or NodeIndex(ast)
+        for node in index.calls_to(self._check_funcs | self._open_funcs):
             func = node.name.name
-            if func in {"access", "stat", "lstat", "fstat"}:
+            if func in self._check_funcs:
                 if node.args and len(node.args.exprs) > 0:
                     arg = node.args.exprs[0]
                     if isinstance(arg, c_ast.Constant) and arg.type == 'string':
                         self._checked_files.add(arg.value)
                     elif isinstance(arg, c_ast.ID):
                         self._checked_files.add(arg.name)
-            if func in {"open", "fopen"}:
+            if func in self._open_funcs:
                 if node.args and len(node.args.exprs) > 0:
                     arg = node.args.exprs[0]
                     file_id = None
@@ -28,8 +42,5 @@ class FIO45C(Rule, c_ast.NodeVisitor):
                     elif isinstance(arg, c_ast.ID):
                         file_id = arg.name
                     if file_id and file_id in self._checked_files:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"TOCTOU risk: {func} on previously checked file '{file_id}' (line {node.coord.line})"
-                        })
-        self.generic_visit(node)
+                        self.report(node.coord, f"TOCTOU risk: {func} on previously checked file '{file_id}' (line {node.coord.line})")
+        return self._violations
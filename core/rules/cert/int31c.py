@@ -1,56 +1,62 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
+from core.symbols import type_names
+from core.walk import Visitor
+
+class INT31C(Rule, Visitor):
+    id = "INT31-C"
+    version = 2
+    uses_symbols = True
+
+    _widths = {"char": 8, "short": 16, "int": 32, "long": 32, "long long": 64}
 
-class INT31C(Rule, c_ast.NodeVisitor):
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "INT31-C"
         self.name = "Ensure integer conversions do not lose or misinterpret data"
         self._violations = []
-        self._int_types = {}
-
-    def visit_Decl(self, node):
-        if isinstance(node.type, c_ast.TypeDecl) and isinstance(node.type.type, c_ast.IdentifierType):
-            type_names = node.type.type.names
-            widths = {"char": 8, "short": 16, "int": 32, "long": 32, "long long": 64}
-            signed = True
-            width = None
-            for t in type_names:
-                if t in ["unsigned", "_Bool"]:
-                    signed = False
-                if t in widths:
-                    width = widths[t]
-            if width:
-                self._int_types[node.name] = {"width": width, "signed": signed}
-        self.generic_visit(node)
+        self._function = None
+
+    def reset(self):
+        super().reset()
+        self._function = None
+
+    def check(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin_file(filename, tainted_vars)
+        self.unit_symbols(ast)
+        self.visit(ast)
+        return self._violations
+
+    def visit_FuncDef(self, node):
+        self._function = node
+
+    def leave_FuncDef(self, node):
+        self._function = None
+
+    def _int_type(self, type_node):
+        """(width, signed) of an integer type, else None."""
+        signed = True
+        width = None
+        for t in type_names(type_node):
+            if t in ["unsigned", "_Bool"]:
+                signed = False
+            if t in self._widths:
+                width = self._widths[t]
+        return (width, signed) if width else None
 
     def visit_Cast(self, node):
-        if isinstance(node.to_type.type, c_ast.IdentifierType):
-            target_names = node.to_type.type.names
-            target_signed = True
-            target_width = None
-            widths = {"char": 8, "short": 16, "int": 32, "long": 32, "long long": 64}
-            for t in target_names:
-                if t == "unsigned":
-                    target_signed = False
-                if t in widths:
-                    target_width = widths[t]
-            src_signed = None
-            src_width = None
-            if isinstance(node.expr, c_ast.ID) and node.expr.name in self._int_types:
-                src_info = self._int_types[node.expr.name]
-                src_signed, src_width = src_info["signed"], src_info["width"]
-            if src_width and target_width:
-                if target_width < src_width or target_signed != src_signed:
-                    self._report(node)
-        self.generic_visit(node)
+        target = self._int_type(node.to_type)
+        source = None
+        if isinstance(node.expr, c_ast.ID):
+            symbol = self.symbols.lookup(node.expr, self._function)
+            if symbol is not None and symbol.is_variable:
+                source = self._int_type(symbol.resolved)
+        if source and target:
+            if target[0] < source[0] or target[1] != source[1]:
+                self._report(node)
 
     def _report(self, node):
-        self._violations.append({
-            "rule": self.id,
-            "message": f"Potential dangerous conversion at line {node.coord.line}"
-        })
+        self.report(node.coord, f"Potential dangerous conversion at line {node.coord.line}")
 
     def analyze(self, code, filename="<unknown>", tainted_vars=None):
         return
@@ -1,120 +1,161 @@
 from pycparser import c_ast
+from core.flow import Dataflow, by_position, function_cfg
 from core.rule import Rule
-
-
-class MEM30C(Rule, c_ast.NodeVisitor):
-    _alloc_funcs = {"malloc", "calloc", "realloc"}
+from core.walk import walk
+
+
+# messages for the uses of a freed pointer
+_USES = {
+    "use": "using freed pointer '{}'",
+    "deref": "dereferencing freed pointer '{}'",
+    "index": "indexing freed pointer '{}'",
+    "field": "accessing field of freed pointer '{}'",
+}
+
+
+class _Freed(Dataflow):
+    """Pointers that may have been freed (and not reassigned since)."""
+    may = True
+
+    def __init__(self, cfg, rule):
+        super().__init__(cfg)
+        self.rule = rule
+        # id(item) -> the item's events
+        self.events = {}
+
+    def transfer(self, item):
+        gen = kill = 0
+        events = self.events[id(item)] = self.rule.events(item)
+        for event, name, _ in events:
+            if event == "free":
+                bit = self.bit(name)
+                gen |= bit
+                kill &= ~bit
+            elif event == "define":
+                bit = self.bit(name)
+                kill |= bit
+                gen &= ~bit
+        return gen, kill
+
+
+class MEM30C(Rule):
+    id = "MEM30-C"
     _free_funcs  = {"free"}
     _realloc     = "realloc"
+    version = 2
+    scope = "function"
+    # nothing is freed without one of them
+    triggers = frozenset(_free_funcs | {_realloc})
 
     def __init__(self):
         super().__init__()
-        self.id   = "MEM30-C"
         self.name = "Do not access freed memory"
-        # per-function tracking
-        self._freed = set()
+        # appends to the events of the item being walked
+        self._emit = None
+
+    def reset(self):
+        super().reset()
+        self._emit = None
 
     def check(self, ast, filename="<unknown>", tainted_vars=None):
-        self._violations = []
-        self.filename = filename
+        self.begin_file(filename, tainted_vars)
         for ext in ast.ext:
             if isinstance(ext, c_ast.FuncDef):
-                self._freed.clear()
-                self.visit(ext.body)
+                self.check_function(ext)
         return self._violations
 
-    def _report(self, coord, label, msg):
-        self._violations.append({
-            "file": self.filename,
-            "line": coord.line if coord else 0,
-            "rule": self.id,
-            "severity": "HIGH",
-            "description": f"[{label}] {msg}"
-        })
-
-    def _mark_freed(self, var_name, coord):
-        if var_name in self._freed:
-            self._report(coord, "DOUBLE-FREE",
-                         f"pointer '{var_name}' freed more than once")
-        self._freed.add(var_name)
-
-    def visit_FuncCall(self, node):
-        fname = node.name.name if isinstance(node.name, c_ast.ID) else None
-
-        if node.args:
-            for arg in node.args.exprs:
-                self.visit(arg)
-
-        if fname in self._free_funcs and node.args and len(node.args.exprs) == 1:
-            arg = node.args.exprs[0]
-            if isinstance(arg, c_ast.ID):
-                self._mark_freed(arg.name, node.coord)
-            return
-
-        if fname == self._realloc and node.args and len(node.args.exprs) >= 2:
-            ptr   = node.args.exprs[0]
-            sizee = node.args.exprs[1]
-            if (isinstance(sizee, c_ast.Constant) and
-                    sizee.type == "int" and sizee.value == "0"):
-                if isinstance(ptr, c_ast.ID):
-                    self._mark_freed(ptr.name, node.coord)
-
-    def visit_Assignment(self, node):
-        self.visit(node.rvalue)
+    def check_function(self, func):
+        freed = _Freed(function_cfg(func), self)
+        found = len(self._violations)
+        for item, state in freed.states():
+            for event, name, node in freed.events[id(item)]:
+                bit = freed.ids.get(name)
+                is_freed = bit is not None and state >> bit & 1
+                if event == "free":
+                    if is_freed:
+                        self._report(node.coord, "DOUBLE-FREE",
+                                     f"pointer '{name}' freed more than once")
+                    state |= 1 << freed.ids[name]
+                elif event == "define":
+                    if bit is not None:
+                        state &= ~(1 << bit)
+                elif is_freed:
+                    self._report(node.coord, "USE-AFTER-FREE", _USES[event].format(name))
+        # blocks come in flow order; report in source order
+        self._violations[found:] = sorted(self._violations[found:], key=by_position)
 
-        if isinstance(node.lvalue, c_ast.ID):
-            lhs = node.lvalue.name
-            if isinstance(node.rvalue, c_ast.ID) and node.rvalue.name in self._freed:
-                self._freed.add(lhs)
-                return
-            if self._is_allocator_call(node.rvalue) or self._is_null(node.rvalue):
-                self._freed.discard(lhs)
-                return
-        self.visit(node.lvalue)
-
-    def visit_ID(self, node):
-        if node.name in self._freed:
-            self._report(node.coord, "USE-AFTER-FREE",
-                         f"using freed pointer '{node.name}'")
-
-    def visit_UnaryOp(self, node):
-        if node.op == '*' and isinstance(node.expr, c_ast.ID):
-            if node.expr.name in self._freed:
-                self._report(node.coord, "USE-AFTER-FREE",
-                             f"dereferencing freed pointer '{node.expr.name}'")
-        self.generic_visit(node)
-
-    def visit_BinaryOp(self, node):
-        self.visit(node.left)
-        self.visit(node.right)
-
-    def visit_Cast(self, node):
-        self.visit(node.expr)
-
-    def visit_ArrayRef(self, node):
-        if isinstance(node.name, c_ast.ID) and node.name.name in self._freed:
-            self._report(node.coord, "USE-AFTER-FREE",
-                         f"indexing freed pointer '{node.name.name}'")
-        self.generic_visit(node)
-
-    def visit_StructRef(self, node):
-        if node.type == '->' and isinstance(node.name, c_ast.ID):
-            if node.name.name in self._freed:
-                self._report(node.coord, "USE-AFTER-FREE",
-                             f"accessing field of freed pointer '{node.name.name}'")
-        self.generic_visit(node)
-
-    def _is_null(self, expr):
-        return (isinstance(expr, c_ast.Constant) and expr.type == "int" and expr.value == "0") or \
-               (isinstance(expr, c_ast.ID) and expr.name == "NULL")
-
-    def _is_allocator_call(self, expr):
-        if isinstance(expr, c_ast.FuncCall):
-            if isinstance(expr.name, c_ast.ID) and expr.name.name in self._alloc_funcs:
-                # size arg == 0 for realloc counted as free, we treat >0 as alloc
-                if expr.name.name == "realloc" and expr.args and len(expr.args.exprs) >= 2:
-                    size_arg = expr.args.exprs[1]
-                    if isinstance(size_arg, c_ast.Constant) and size_arg.value == "0":
-                        return False
-                return True
-        return False
+    def _report(self, coord, label, msg):
+        self.report(coord, f"[{label}] {msg}", "HIGH")
+
+    def events(self, item):
+        """
+        What one item does to pointers, in evaluation order: ("free", name,
+        call), ("define", name, node) when a pointer gets a new value, and
+        (kind of use, name, node) for each use of one (see _USES).
+        """
+        events = []
+        self._emit = events.append
+        walk(item, self._steps, act=self._emit)
+        return events
+
+    def _steps(self, node):
+        """
+        Emit the events of `node` that come before its operands, and return
+        the operands and later events in evaluation order (None for all its
+        children).
+        """
+        kind = type(node)
+        if kind is c_ast.ID:
+            self._emit(("use", node.name, node))
+            return ()
+        if kind is c_ast.BinaryOp:
+            return (node.left, node.right)
+        if kind is c_ast.Constant:
+            return ()
+        if kind is c_ast.Decl:
+            steps = [] if node.init is None else [node.init]
+            if node.name:
+                steps.append(("define", node.name, node))
+            return steps
+        if kind is c_ast.FuncCall:
+            fname = node.name.name if isinstance(node.name, c_ast.ID) else None
+            args = node.args.exprs if node.args else []
+            if fname in self._free_funcs and len(args) == 1 and isinstance(args[0], c_ast.ID):
+                self._emit(("free", args[0].name, node))
+                return ()
+            steps = list(args)
+            if fname == self._realloc and len(args) >= 2 and isinstance(args[0], c_ast.ID):
+                size = args[1]
+                if isinstance(size, c_ast.Constant) and size.type == "int" and size.value == "0":
+                    steps.append(("free", args[0].name, node))
+            return steps
+        if kind is c_ast.Assignment:
+            steps = [node.rvalue]
+            if isinstance(node.lvalue, c_ast.ID):
+                if node.op != "=":
+                    steps.append(node.lvalue)
+                steps.append(("define", node.lvalue.name, node))
+            else:
+                steps.append(node.lvalue)
+            return steps
+        if kind is c_ast.UnaryOp and isinstance(node.expr, c_ast.ID):
+            if node.op == "*":
+                self._emit(("deref", node.expr.name, node))
+                return ()
+            if node.op == "&":
+                # whoever gets the address may store a new pointer there
+                self._emit(("define", node.expr.name, node))
+                return ()
+            if node.op == "sizeof":
+                return ()
+        if kind is c_ast.ArrayRef and isinstance(node.name, c_ast.ID):
+            self._emit(("index", node.name.name, node))
+            return (node.subscript,)
+        if kind is c_ast.StructRef:
+            if node.type == "->" and isinstance(node.name, c_ast.ID):
+                self._emit(("field", node.name.name, node))
+                return ()
+            return (node.name,)
+        if kind is c_ast.Typename or kind is c_ast.Compound:
+            return ()
+        return None
@@ -1,53 +1,222 @@
-import re
 from pycparser import c_ast
+from core.flow import Dataflow, by_position, function_cfg
 from core.rule import Rule
-from core.rules.cert.sig31c import NodeCollector
+from core.walk import walk
+
+
+def _is_null(expr):
+    return (isinstance(expr, c_ast.Constant) and expr.value == "0") or \
+           (isinstance(expr, c_ast.ID) and expr.name == "NULL") or \
+           (isinstance(expr, c_ast.Cast) and _is_null(expr.expr))
+
+
+def _pointer(expr):
+    """The name of the pointer variable `expr` is, or is assigned to (`p = ...`)."""
+    if isinstance(expr, c_ast.Assignment) and expr.op == "=":
+        expr = expr.lvalue
+    return expr.name if isinstance(expr, c_ast.ID) else None
+
+
+def null_test(cond):
+    """
+    (name, value when it is NULL) for a condition that tests a pointer
+    variable against NULL (`p`, `!p`, `p == NULL`, `NULL != p`, ...), else None.
+    The pointer may be assigned in the test itself: `(p = malloc(n)) == NULL`.
+    """
+    name = _pointer(cond)
+    if name is not None:
+        return name, False
+    if isinstance(cond, c_ast.UnaryOp) and cond.op == "!":
+        test = null_test(cond.expr)
+        return (test[0], not test[1]) if test else None
+    if isinstance(cond, c_ast.BinaryOp) and cond.op in ("==", "!="):
+        for ptr, other in ((cond.left, cond.right), (cond.right, cond.left)):
+            name = _pointer(ptr)
+            if name is not None and _is_null(other):
+                return name, cond.op == "=="
+    return None
+
+
+class _Unchecked(Dataflow):
+    """Allocations whose result may not have been tested against NULL yet."""
+    may = True
+
+    def __init__(self, cfg, rule):
+        super().__init__(cfg)
+        self.rule = rule
+        # pointer name -> bits of its allocation sites
+        self.sites = {}
+        # bit index -> allocating function
+        self.origin = {}
+        for block in cfg.order:
+            for item in block.items:
+                for event, name, node in rule.events(item):
+                    if event == "alloc":
+                        bit = self.bit(id(node))
+                        self.sites[name] = self.sites.get(name, 0) | bit
+                        self.origin[bit.bit_length() - 1] = node.name.name
+
+    def transfer(self, item):
+        gen = kill = 0
+        for event, name, node in self.rule.events(item):
+            if event == "alloc":
+                bit = self.bit(id(node))
+                kill |= self.sites[name]
+                gen = (gen & ~self.sites[name]) | bit
+            elif event in ("define", "check"):
+                sites = self.sites.get(name, 0)
+                kill |= sites
+                gen &= ~sites
+        return gen, kill
+
+    def branch(self, cond, taken):
+        test = null_test(cond)
+        if test is not None and test[1] != taken:
+            # on this edge the pointer is known not to be NULL
+            return 0, self.sites.get(test[0], 0)
+        return 0, 0
+
+
+class MEM32C(Rule):
+    id = "MEM32-C"
+    version = 3
+    scope = "function"
+
+    _alloc_funcs = {"malloc", "calloc", "realloc"}
+    triggers = frozenset(_alloc_funcs)
+    # functions that accept a NULL pointer
+    _null_safe_funcs = {"free", "realloc"}
 
-class MEM32C(Rule, c_ast.NodeVisitor):
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "MEM32-C"
         self.name = "Detect and handle memory allocation errors"
         self._violations = []
-        self._alloc_ptrs = {}
-
-    def visit_Assignment(self, node):
-        if node.op == '=' and isinstance(node.rvalue, c_ast.FuncCall):
-            func_name = node.rvalue.name.name if isinstance(node.rvalue.name, c_ast.ID) else ""
-            if func_name in {"malloc", "calloc", "realloc"}:
-                if isinstance(node.lvalue, c_ast.ID):
-                    var_name = node.lvalue.name
-                    self._alloc_ptrs[var_name] = {"checked": False, "line": node.coord.line}
-        self.generic_visit(node)
-
-    def visit_If(self, node):
-        cond_ids = []
-        node.cond.visit(NodeCollector(c_ast.ID, cond_ids))
-        for identifier in cond_ids:
-            var = identifier.name
-            if var in self._alloc_ptrs:
-                self._alloc_ptrs[var]["checked"] = True
-        self.generic_visit(node)
-
-    def visit_UnaryOp(self, node):
-        if node.op == '*' and isinstance(node.expr, c_ast.ID):
-            var = node.expr.name
-            if var in self._alloc_ptrs and not self._alloc_ptrs[var]["checked"]:
-                self._violations.append({
-                    "rule": self.id,
-                    "message": f"Pointer '{var}' from malloc at line {self._alloc_ptrs[var]['line']} used without null-check (line {node.coord.line})"
-                })
-        self.generic_visit(node)
-
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID):
-            func = node.name.name
-            for arg in node.args.exprs if node.args else []:
+        # id(item) -> the item's events
+        self._events = {}
+        # appends to the events of the item being walked
+        self._emit = None
+
+    def reset(self):
+        super().reset()
+        self._events = {}
+        self._emit = None
+
+    def check(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin_file(filename, tainted_vars)
+        if ast is not None:
+            for ext in ast.ext:
+                if isinstance(ext, c_ast.FuncDef):
+                    self.check_function(ext)
+        return self._violations
+
+    def check_function(self, func):
+        self._events = {}
+        unchecked = _Unchecked(function_cfg(func), self)
+        found = len(self._violations)
+        for item, state in unchecked.states():
+            for event, name, node in self.events(item):
+                sites = unchecked.sites.get(name, 0)
+                if event == "alloc":
+                    state = (state & ~sites) | unchecked.bit(id(node))
+                elif event in ("define", "check"):
+                    state &= ~sites
+                elif state & sites:
+                    alloc = unchecked.origin[(state & sites).bit_length() - 1]
+                    if event == "use":
+                        what = "used"
+                    else:
+                        what = f"passed to {node.name.name}()"
+                    # no line numbers in the text: findings are moved when
+                    # an unchanged function shifts (see checker.incremental)
+                    self.report(node.coord, f"Pointer '{name}' from {alloc}() {what} "
+                                            f"without null-check")
+        self._violations[found:] = sorted(self._violations[found:], key=by_position)
+        self._events = {}
+
+    def events(self, item):
+        """
+        What one item does to pointers, in evaluation order: ("alloc",
+        name, call) when an allocation is stored in a pointer, ("define",
+        name, node) for any other store, ("check", name, node) for a test
+        against NULL outside a branch condition (assert(p), p && ...), and
+        ("use", name, node) or ("call", name, call) when the pointer is
+        dereferenced or passed to a function.
+        """
+        events = self._events.get(id(item))
+        if events is None:
+            events = self._events[id(item)] = []
+            self._emit = events.append
+            walk(item, self._steps, act=self._emit)
+        return events
+
+    def _allocation(self, expr):
+        while isinstance(expr, c_ast.Cast):
+            expr = expr.expr
+        if isinstance(expr, c_ast.FuncCall) and isinstance(expr.name, c_ast.ID) \
+                and expr.name.name in self._alloc_funcs:
+            return expr
+        return None
+
+    def _store(self, name, value, node):
+        call = self._allocation(value) if value is not None else None
+        if call is not None:
+            return ("alloc", name, call)
+        return ("define", name, node)
+
+    def _steps(self, node):
+        """
+        Emit the events of `node` that come before its operands, and return
+        the operands and later events in evaluation order (None for all its
+        children).
+        """
+        kind = type(node)
+        if kind is c_ast.ID or kind is c_ast.Constant:
+            return ()
+        if kind is c_ast.BinaryOp:
+            if node.op in ("&&", "||"):
+                # a test on the left guards the right operand
+                test = null_test(node.left)
+                if test is not None:
+                    return (node.left, ("check", test[0], node.left), node.right)
+            return (node.left, node.right)
+        if kind is c_ast.Decl:
+            steps = [] if node.init is None else [node.init]
+            if node.name:
+                steps.append(self._store(node.name, node.init, node))
+            return steps
+        if kind is c_ast.Assignment:
+            if isinstance(node.lvalue, c_ast.ID):
+                return (node.rvalue, self._store(node.lvalue.name,
+                                                 node.rvalue if node.op == "=" else None, node))
+            return (node.rvalue, node.lvalue)
+        if kind is c_ast.UnaryOp:
+            if node.op == "*" and isinstance(node.expr, c_ast.ID):
+                self._emit(("use", node.expr.name, node))
+                return ()
+            if node.op == "&" and isinstance(node.expr, c_ast.ID):
+                self._emit(("define", node.expr.name, node))
+                return ()
+            if node.op == "sizeof":
+                return ()
+        if kind is c_ast.ArrayRef and isinstance(node.name, c_ast.ID):
+            self._emit(("use", node.name.name, node))
+            return (node.subscript,)
+        if kind is c_ast.StructRef and node.type == "->" and isinstance(node.name, c_ast.ID):
+            self._emit(("use", node.name.name, node))
+            return ()
+        if kind is c_ast.FuncCall:
+            fname = node.name.name if isinstance(node.name, c_ast.ID) else None
+            args = node.args.exprs if node.args else []
+            steps = []
+            for arg in args:
                 if isinstance(arg, c_ast.ID):
-                    var = arg.name
-                    if var in self._alloc_ptrs and not self._alloc_ptrs[var]["checked"] and func not in {"free"}:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"Pointer '{var}' from malloc at line {self._alloc_ptrs[var]['line']} passed to {func}() without null-check (line {node.coord.line})"
-                        })
-        self.generic_visit(node)
+                    if fname is not None and fname not in self._null_safe_funcs:
+                        steps.append(("call", arg.name, node))
+                else:
+                    steps.append(arg)
+            if fname == "assert" and args and null_test(args[0]) is not None:
+                steps.append(("check", null_test(args[0])[0], node))
+            return steps
+        if kind is c_ast.Typename or kind is c_ast.Compound:
+            return ()
+        return None
@@ -1,59 +1,70 @@
 from core.rule import Rule
 from pycparser import c_ast
-from pycparser.c_ast import NodeVisitor, ID, Constant, UnaryOp, BinaryOp
+from core.walk import Visitor
+
+class MEM34C(Rule, Visitor):
+    id = "MEM34-C"
+    version = 2
+    uses_symbols = True
+    triggers = frozenset({"free"})
 
-class MEM34C(Rule, NodeVisitor):
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "MEM34-C"
         self.name = "Only free dynamically allocated memory"
         self.description = "Detects calls to free() with pointers that were not allocated via malloc/calloc/realloc, or that are not the start of an allocated block."
+        # Symbol -> "dynamic", "offset", "static" or "unknown"
+        self._ptr_origin = {}
+        self._function = None
+
+    def reset(self):
+        super().reset()
         self._ptr_origin = {}
-        self._param_ptrs = set()
+        self._function = None
 
-    def analyze(self, ast, filename="<unknown>"):
+    def check(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin_file(filename, tainted_vars)
         if ast is None:
             return []
-        self._ptr_origin.clear()
-        self._param_ptrs.clear()
-        self.filename = filename
+        self.unit_symbols(ast)
         self.visit(ast)
         return self._violations
 
     def visit_FuncDef(self, node):
-        prev_param_ptrs = self._param_ptrs.copy()
-        self._param_ptrs.clear()
-        if node.decl.type.args:
-            for param in node.decl.type.args.params:
-                if isinstance(param, c_ast.Decl) and isinstance(param.type, (c_ast.PtrDecl, c_ast.ArrayDecl)):
-                    self._param_ptrs.add(param.name)
+        self._function = node
         self.visit(node.body)
-        self._param_ptrs = prev_param_ptrs
+        self._function = None
+        return ()
+
+    def _symbol(self, node):
+        return self.symbols.lookup(node, self._function)
+
+    def _origin(self, expr):
+        return self._ptr_origin.get(self._symbol(expr), "unknown")
 
     def visit_Decl(self, node):
-        if isinstance(node.type, c_ast.PtrDecl):
-            name = node.name
-            if name not in self._ptr_origin:
-                self._ptr_origin[name] = "unknown"
+        symbol = self._symbol(node)
+        if isinstance(node.type, c_ast.PtrDecl) and symbol is not None:
+            if symbol not in self._ptr_origin:
+                self._ptr_origin[symbol] = "unknown"
             if node.init:
                 self.visit(node.init)
                 origin = self._infer_origin_from_expr(node.init)
                 if origin:
-                    self._ptr_origin[name] = origin
-        if isinstance(node.type, c_ast.ArrayDecl):
-            if not self._in_function():
-                self._ptr_origin[node.name] = "static"
+                    self._ptr_origin[symbol] = origin
+        if isinstance(node.type, c_ast.ArrayDecl) and symbol is not None:
+            if symbol.scope == "file":
+                self._ptr_origin[symbol] = "static"
         if node.init:
             self.visit(node.init)
-        self.generic_visit(node)
 
     def visit_Assignment(self, node):
         if isinstance(node.lvalue, c_ast.ID):
-            dest = node.lvalue.name
+            dest = self._symbol(node.lvalue)
             origin = self._infer_origin_from_expr(node.rvalue)
-            if origin:
+            if origin and dest is not None:
                 self._ptr_origin[dest] = origin
-            self.generic_visit(node)
+            return None
+        return ()
 
     def visit_FuncCall(self, node):
         func_name = node.name.name if isinstance(node.name, c_ast.ID) else None
@@ -61,22 +72,23 @@ class MEM34C(Rule, NodeVisitor):
             arg = node.args.exprs[0] if node.args and node.args.exprs else None
             if arg:
                 if self._is_null_pointer(arg):
-                    return
+                    return ()
                 if not isinstance(arg, c_ast.ID):
                     self._report(node.coord, "HIGH", "free() called with invalid expression (not a malloc-allocated pointer)")
-                    return
+                    return ()
                 ptr_name = arg.name
-                if ptr_name in self._param_ptrs and ptr_name not in self._ptr_origin:
-                    return
-                origin = self._ptr_origin.get(ptr_name, "unknown")
+                symbol = self._symbol(arg)
+                if self._is_param_ptr(symbol) and symbol not in self._ptr_origin:
+                    return ()
+                origin = self._ptr_origin.get(symbol, "unknown")
                 if origin != "dynamic":
                     self._report(node.coord, "HIGH",
                                  f"free() called on pointer '{ptr_name}' which is not a heap allocation (origin: {origin})")
-            return
+            return ()
         # if node.args:
         #     for expr in node.args.exprs:
         #         self.visit(expr)
-        self.generic_visit(node)
+        return None
 
     def _infer_origin_from_expr(self, expr):
         if expr is None:
@@ -90,17 +102,16 @@ class MEM34C(Rule, NodeVisitor):
         if isinstance(expr, c_ast.Constant) and expr.type == 'string':
             return "static"
         if isinstance(expr, c_ast.ID):
-            src_name = expr.name
-            return self._ptr_origin.get(src_name, "unknown")
+            return self._origin(expr)
         if isinstance(expr, c_ast.BinaryOp) and expr.op in ('+', '-'):
             base_origin = None
             if isinstance(expr.left, c_ast.ID) and isinstance(expr.right, c_ast.Constant):
-                base_origin = self._ptr_origin.get(expr.left.name, "unknown")
+                base_origin = self._origin(expr.left)
             elif isinstance(expr.left, c_ast.Constant) and isinstance(expr.right, c_ast.ID):
-                base_origin = self._ptr_origin.get(expr.right.name, "unknown")
+                base_origin = self._origin(expr.right)
             elif isinstance(expr.left, c_ast.ID) and isinstance(expr.right, c_ast.ID):
-                base_origin_left = self._ptr_origin.get(expr.left.name, "unknown")
-                base_origin_right = self._ptr_origin.get(expr.right.name, "unknown")
+                base_origin_left = self._origin(expr.left)
+                base_origin_right = self._origin(expr.right)
                 base_origin = base_origin_left if base_origin_left != "unknown" else base_origin_right
             else:
                 base_origin = "unknown"
@@ -114,14 +125,10 @@ class MEM34C(Rule, NodeVisitor):
         return (isinstance(expr, c_ast.Constant) and expr.type == 'int' and expr.value == '0') or \
                (isinstance(expr, c_ast.ID) and expr.name == "NULL")
 
-    def _in_function(self):
-        return len(self._param_ptrs) > 0
+    @staticmethod
+    def _is_param_ptr(symbol):
+        return symbol is not None and symbol.scope == "param" \
+            and isinstance(symbol.resolved, (c_ast.PtrDecl, c_ast.ArrayDecl))
 
     def _report(self, coord, severity, description):
-        self._violations.append({
-            "file": self.filename,
-            "line": coord.line if coord else 0,
-            "rule": "MEM34-C",
-            "severity": severity,
-            "description": description
-        })
+        self.report(coord, description, severity)
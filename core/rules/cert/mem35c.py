@@ -1,22 +1,30 @@
 import re
-from rule import Rule
+from core.rule import Rule
 from pycparser import c_ast
-class MEM35C(Rule, c_ast.NodeVisitor):
+from parser.node_index import NodeIndex
+class MEM35C(Rule):
+    id = "MEM35-C"
+    uses_index = True
+
+    _alloc_funcs = frozenset({"malloc", "calloc"})
+    triggers = _alloc_funcs
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "MEM35-C"
         self.name = "Allocate sufficient memory for an object"
         self._violations = []
         self._ptr_vars = set()
 
-    def visit_Decl(self, node):
-        if isinstance(node.type, c_ast.PtrDecl):
-            if hasattr(node, 'name'):
-                self._ptr_vars.add(node.name)
-        self.generic_visit(node)
+    def reset(self):
+        super().reset()
+        self._ptr_vars = set()
 
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID) and node.name.name in {"malloc", "calloc"}:
+    def check(self, ast, filename="<unknown>", tainted_vars=None, index=None):
+        self.begin_file(filename, tainted_vars)
+        index = index or NodeIndex(ast)
+        self._ptr_vars = {decl.name for decl in index.nodes("Decl")
+                          if isinstance(decl.type, c_ast.PtrDecl)}
+        for node in index.calls_to(self._alloc_funcs):
             for arg in node.args.exprs if node.args else []:
                 if isinstance(arg, c_ast.UnaryOp) and arg.op == 'sizeof':
                     inner = arg.expr
@@ -27,8 +35,5 @@ class MEM35C(Rule, c_ast.NodeVisitor):
                     if isinstance(inner, c_ast.Typename) and isinstance(inner.type, c_ast.PtrDecl):
                         issue = True
                     if issue:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"Suspicious sizeof usage in {node.name.name} at line {node.coord.line} (check allocation size)"
-                        })
-        self.generic_visit(node)
+                        self.report(node.coord, f"Suspicious sizeof usage in {node.name.name} at line {node.coord.line} (check allocation size)")
+        return self._violations
@@ -1,14 +1,16 @@
-import re
-from core.rule import Rule
-from pycparser.c_ast import NodeVisitor, ID
+from core.rule import ScanRule
+
+class MSC24C(ScanRule):
+    id = "MSC24-C"
+    # comments and string literals are no longer reported
+    version = 2
+    patterns = {"gets": r'\bgets\s*\('}
+    triggers = frozenset({"gets"})
 
-class MSC24C(Rule):
     def __init__(self):
         super().__init__()
-        self.id = "MSC24-C"
         self.name = "Forbit using deprecated function"
         self.description = "Do not call deprecated functions gets()"
-        self.pattern = re.compile(r'\bgets\s*\(')
 
     # def check(self, ast):
     #     issues = []
@@ -30,11 +32,12 @@ class MSC24C(Rule):
     #     visitor.visit(ast)
     #     issues.extend(visitor.issues)
     #     return issues
-    def analyze(self, code: str, filename: str):
-        for lineno, line in enumerate(code.splitlines(), start=1):
-            if self.pattern.search(line):
-                self.report_violation(
-                    filename,
-                    lineno,
-                    f"unsafe function call: {line.strip()}"
-                )
+    def on_match(self, name, lineno, line):
+        # one finding per line
+        if self._violations and self._violations[-1].line == lineno:
+            return
+        self.report_violation(
+            self.filename,
+            lineno,
+            f"unsafe function call: {line.strip()}"
+        )
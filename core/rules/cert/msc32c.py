@@ -1,14 +1,21 @@
 from pycparser import c_ast
 from core.rule import Rule
+from core.walk import walk
 
 class MSC32C(Rule):
+    id = "MSC32-C"
+    version = 3
+    scope = "function"
+    uses_symbols = True
+
+    _rand_funcs = frozenset({"rand", "random"})
+    _seed_funcs = frozenset({"srand", "srandom"})
+    triggers = _rand_funcs | _seed_funcs
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "MSC32-C"
         self.name = "Properly seed pseudorandom number generators"
         self._violations = []
-        self._rand_funcs = {"rand", "random"}
-        self._seed_funcs = {"srand", "srandom"}
         self._severity_map = {
             "UNSEEDED": "HIGH",
             "CONST-SEED": "HIGH",
@@ -17,80 +24,49 @@ class MSC32C(Rule):
         }
         self.state_rand = 0
         self.state_random = 0
+        self._function = None
+
+    def reset(self):
+        super().reset()
+        self.state_rand = 0
+        self.state_random = 0
+        self._function = None
 
     def analyze(self, code: str, filename: str = "<unknown>", tainted_vars=None):
         return
 
     def check(self, ast, filename: str = "<unknown>", tainted_vars=None):
         """Run the MSC32-C analysis on the AST of a single C file."""
-        self._violations.clear()
+        self.begin_file(filename, tainted_vars)
+        self.unit_symbols(ast)
         for ext in ast.ext:
             if isinstance(ext, c_ast.FuncDef):
-                self.state_rand = 0
-                self.state_random = 0
-                self._analyze_block(ext.body)
+                self.check_function(ext)
         return self._violations
 
+    def check_function(self, func):
+        self.state_rand = 0
+        self.state_random = 0
+        self._function = func
+        self._analyze_block(func.body)
+        self._function = None
+
     def _report(self, coord, category, message):
         severity = self._severity_map.get(category, "LOW")
-        location = str(coord) if coord else "<unknown>:?"
-        self._violations.append({
-            "rule": self.id,
-            "category": category,
-            "location": location,
-            "severity": severity,
-            "description": message
-        })
+        self.report(coord, message, severity, {"category": category})
 
     def _merge_flag(self, flag1, flag2):
         if flag1 == flag2:
             return flag1
         return 2
 
-    def _evaluate_constant_expr(self, expr):
-        if isinstance(expr, c_ast.Constant):
-            if expr.type in ("int", "char"):
-                val_str = expr.value
-                if expr.type == "char":
-                    val_str = str(ord(val_str.strip("'\"")[0])) if len(val_str.strip("'\"")) == 1 else val_str
-                try:
-                    return int(val_str, 0)
-                except ValueError:
-                    return None
-        elif isinstance(expr, c_ast.BinaryOp):
-            left_val = self._evaluate_constant_expr(expr.left)
-            right_val = self._evaluate_constant_expr(expr.right)
-            if left_val is not None and right_val is not None:
-                try:
-                    if expr.op == '+': return left_val + right_val
-                    if expr.op == '-': return left_val - right_val
-                    if expr.op == '*': return left_val * right_val
-                    if expr.op == '/': return left_val // right_val if right_val != 0 else None
-                    if expr.op == '%': return left_val % right_val if right_val != 0 else None
-                    if expr.op == '<<': return left_val << right_val
-                    if expr.op == '>>': return left_val >> right_val
-                    if expr.op == '^': return left_val ^ right_val
-                    if expr.op == '|': return left_val | right_val
-                    if expr.op == '&': return left_val & right_val
-                except Exception:
-                    return None
-        elif isinstance(expr, c_ast.UnaryOp):
-            val = self._evaluate_constant_expr(expr.expr)
-            if val is not None:
-                return +val if expr.op == '+' else -val if expr.op == '-' else None
-        elif isinstance(expr, c_ast.Cast):
-            return self._evaluate_constant_expr(expr.expr)
-        return None
-
     def _classify_seed_expr(self, expr):
         has_const = False
         has_time = False
         has_pid = False
 
-        def traverse(node):
+        def flags(node):
             nonlocal has_const, has_time, has_pid
-            if node is None:
-                return
             if isinstance(node, c_ast.Constant):
                 if node.type in ("int", "char"):
                     has_const = True
@@ -101,29 +77,23 @@ class MSC32C(Rule):
                         has_time = True
                     elif name == "getpid":
                         has_pid = True
-                if node.args:
-                    for arg in node.args.exprs:
-                        traverse(arg)
+                return node.args.exprs if node.args else ()
             elif isinstance(node, c_ast.ID):
-                return
+                return ()
             elif isinstance(node, c_ast.BinaryOp):
-                traverse(node.left)
-                traverse(node.right)
-            elif isinstance(node, c_ast.UnaryOp):
-                traverse(node.expr)
-            elif isinstance(node, c_ast.Cast):
-                traverse(node.expr)
+                return (node.left, node.right)
+            elif isinstance(node, (c_ast.UnaryOp, c_ast.Cast)):
+                return (node.expr,)
             elif isinstance(node, c_ast.ExprList):
-                for child in node.exprs:
-                    traverse(child)
-            else:
-                for _, child in node.children():
-                    traverse(child)
+                return node.exprs
+            return None
 
-        traverse(expr)
-        if has_const and not (has_time or has_pid):
-            val = self._evaluate_constant_expr(expr)
-            return "CONST-SEED" if val is not None else "CONST-SEED"
+        if expr is not None:
+            walk(expr, flags)
+        # literals, or names that fold to a constant (enums, const variables)
+        if has_const and not (has_time or has_pid) or \
+                self.constants.value(expr, self._function) is not None:
+            return "CONST-SEED"
         if has_time and has_pid:
             return "MEDIUM-ENTROPY"
         if has_time or has_pid:
@@ -147,34 +117,7 @@ class MSC32C(Rule):
                 self._analyze_expression(node.expr)
             return "return"
         elif isinstance(node, c_ast.If):
-            prev_rand, prev_random = self.state_rand, self.state_random
-            if node.cond:
-                self._analyze_expression(node.cond)
-            cond_state_rand, cond_state_random = self.state_rand, self.state_random
-
-            self.state_rand, self.state_random = cond_state_rand, cond_state_random
-            returned_then = False
-            if node.iftrue:
-                returned_then = self._analyze_block(node.iftrue) if isinstance(node.iftrue, c_ast.Compound) \
-                                else (self._analyze_statement(node.iftrue) == "return")
-            state_then_rand, state_then_random = self.state_rand, self.state_random
-
-            self.state_rand, self.state_random = cond_state_rand, cond_state_random
-            returned_else = False
-            if node.iffalse:
-                returned_else = self._analyze_block(node.iffalse) if isinstance(node.iffalse, c_ast.Compound) \
-                                else (self._analyze_statement(node.iffalse) == "return")
-            state_else_rand, state_else_random = self.state_rand, self.state_random
-
-            if returned_then and returned_else:
-                return "return"
-            elif returned_then and not returned_else:
-                self.state_rand, self.state_random = state_else_rand, state_else_random
-            elif returned_else and not returned_then:
-                self.state_rand, self.state_random = state_then_rand, state_then_random
-            else:
-                self.state_rand = self._merge_flag(state_then_rand, state_else_rand)
-                self.state_random = self._merge_flag(state_then_random, state_else_random)
+            return self._analyze_if(node)
         elif isinstance(node, c_ast.For) or isinstance(node, c_ast.While) or isinstance(node, c_ast.DoWhile):
             entry_rand, entry_random = self.state_rand, self.state_random
             if isinstance(node, c_ast.For):
@@ -256,45 +199,82 @@ class MSC32C(Rule):
                 self._analyze_expression(node.expr)
         return None
 
+    def _analyze_if(self, node):
+        """An if statement, with its `else if` chain followed in a loop rather than recursion."""
+        # (state after the then branch, whether it returned) for each if of the chain
+        branches = []
+        while True:
+            if node.cond:
+                self._analyze_expression(node.cond)
+            cond_state_rand, cond_state_random = self.state_rand, self.state_random
+            returned_then = False
+            if node.iftrue:
+                returned_then = self._analyze_branch(node.iftrue)
+            branches.append((self.state_rand, self.state_random, returned_then))
+            self.state_rand, self.state_random = cond_state_rand, cond_state_random
+            if not isinstance(node.iffalse, c_ast.If):
+                break
+            node = node.iffalse
+        returned_else = False
+        if node.iffalse:
+            returned_else = self._analyze_branch(node.iffalse)
+
+        # merge each then branch with what follows its else, innermost first
+        for state_then_rand, state_then_random, returned_then in reversed(branches):
+            if returned_then and returned_else:
+                continue
+            if returned_else:
+                self.state_rand, self.state_random = state_then_rand, state_then_random
+            elif not returned_then:
+                self.state_rand = self._merge_flag(state_then_rand, self.state_rand)
+                self.state_random = self._merge_flag(state_then_random, self.state_random)
+            returned_else = False
+        return "return" if returned_else else None
+
+    def _analyze_branch(self, stmt):
+        if isinstance(stmt, c_ast.Compound):
+            return self._analyze_block(stmt)
+        return self._analyze_statement(stmt) == "return"
+
     def _analyze_expression(self, expr):
-        if expr is None:
-            return
-        if isinstance(expr, c_ast.FuncCall):
-            func_name = expr.name.name if isinstance(expr.name, c_ast.ID) else None
+        if expr is not None:
+            walk(expr, self._operands, act=self._analyze_call)
 
-            if expr.args:
-                for arg in expr.args.exprs:
-                    self._analyze_expression(arg)
-            if func_name in self._seed_funcs:
-                category = None
-                if expr.args and len(expr.args.exprs) > 0:
-                    category = self._classify_seed_expr(expr.args.exprs[0])
-                if category == "CONST-SEED":
-                    self._report(expr.coord, "CONST-SEED", f"Using a fixed constant seed in {func_name}()")
-                elif category == "LOW-ENTROPY":
-                    self._report(expr.coord, "LOW-ENTROPY", f"Seeding PRNG with low entropy source in {func_name}()")
-                elif category == "MEDIUM-ENTROPY":
-                    self._report(expr.coord, "MEDIUM-ENTROPY", f"Seeding PRNG with medium entropy sources in {func_name}()")
+    @staticmethod
+    def _operands(expr):
+        kind = type(expr)
+        if kind is c_ast.BinaryOp:
+            return (expr.left, expr.right)
+        # a call is analyzed once its arguments are
+        if kind is c_ast.FuncCall:
+            return (*(expr.args.exprs if expr.args else ()), ("call", expr))
+        if kind is c_ast.UnaryOp or kind is c_ast.Cast:
+            return (expr.expr,)
+        if kind is c_ast.ArrayRef:
+            return (expr.subscript,)
+        if kind is c_ast.TernaryOp:
+            return (expr.cond, expr.iftrue, expr.iffalse)
+        return ()
 
-                if func_name == "srand":
-                    self.state_rand = 1
-                elif func_name == "srandom":
-                    self.state_random = 1
-            elif func_name in self._rand_funcs:
-                if (func_name == "rand" and self.state_rand != 1) or (func_name == "random" and self.state_random != 1):
-                    self._report(expr.coord, "UNSEEDED",
-                                 f"Use of {func_name}() before PRNG is properly seeded")
+    def _analyze_call(self, step):
+        _, expr = step
+        func_name = expr.name.name if isinstance(expr.name, c_ast.ID) else None
+        if func_name in self._seed_funcs:
+            category = None
+            if expr.args and len(expr.args.exprs) > 0:
+                category = self._classify_seed_expr(expr.args.exprs[0])
+            if category == "CONST-SEED":
+                self._report(expr.coord, "CONST-SEED", f"Using a fixed constant seed in {func_name}()")
+            elif category == "LOW-ENTROPY":
+                self._report(expr.coord, "LOW-ENTROPY", f"Seeding PRNG with low entropy source in {func_name}()")
+            elif category == "MEDIUM-ENTROPY":
+                self._report(expr.coord, "MEDIUM-ENTROPY", f"Seeding PRNG with medium entropy sources in {func_name}()")
 
-        elif isinstance(expr, c_ast.BinaryOp):
-            self._analyze_expression(expr.left)
-            self._analyze_expression(expr.right)
-        elif isinstance(expr, c_ast.UnaryOp):
-            self._analyze_expression(expr.expr)
-        elif isinstance(expr, c_ast.Cast):
-            self._analyze_expression(expr.expr)
-        elif isinstance(expr, c_ast.ArrayRef):
-            self._analyze_expression(expr.subscript)
-        elif isinstance(expr, c_ast.TernaryOp):
-            self._analyze_expression(expr.cond)
-            self._analyze_expression(expr.iftrue)
-            self._analyze_expression(expr.iffalse)
+            if func_name == "srand":
+                self.state_rand = 1
+            elif func_name == "srandom":
+                self.state_random = 1
+        elif func_name in self._rand_funcs:
+            if (func_name == "rand" and self.state_rand != 1) or (func_name == "random" and self.state_random != 1):
+                self._report(expr.coord, "UNSEEDED",
+                             f"Use of {func_name}() before PRNG is properly seeded")
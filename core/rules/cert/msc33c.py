@@ -1,24 +1,28 @@
-import re
-from core.rule import Rule
+from core.rule import ScanRule
+
+_BANNED_FUNCS = ["gets", "strcpy", "strcat", "sprintf", "scanf"]
+
+class MSC33C(ScanRule):
+    id = "MSC33-C"
+    # comments and string literals are no longer reported
+    version = 2
+    patterns = {"unsafe_call": r'\b(?:' + '|'.join(_BANNED_FUNCS) + r')\s*\('}
+    triggers = frozenset(_BANNED_FUNCS)
 
-class MSC33C(Rule):
     def __init__(self):
         super().__init__()
-        self.id = "MSC33-C"
         self.name = "Prohibit Use of Unsafe Functions"
         self.description = (
             "Detect and prohibit use of unsafe library functions "
             "(e.g., strcpy, strcat, sprintf, gets, scanf, etc.)"
         )
-        self._banned_funcs = ["gets", "strcpy", "strcat", "sprintf", "scanf"]
-        pattern_str = r'\b(?:' + '|'.join(self._banned_funcs) + r')\s*\('
-        self._pattern = re.compile(pattern_str)
 
-    def analyze(self, code: str, filename: str):
-        for lineno, line in enumerate(code.splitlines(), start=1):
-            if self._pattern.search(line):
-                self.report_violation(
-                    filename, lineno,
-                    f"Unsafe function call: {line.strip()}"
-                )
+    def on_match(self, name, lineno, line):
+        # one finding per line
+        if self._violations and self._violations[-1].line == lineno:
+            return
+        self.report_violation(
+            self.filename, lineno,
+            f"Unsafe function call: {line.strip()}"
+        )
 
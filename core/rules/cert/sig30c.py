@@ -1,34 +1,29 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
+from core.rules.cert.sig31c import SIGNAL_INSTALLERS, registered_handlers
+from parser.node_index import NodeIndex
+
+class SIG30C(Rule):
+    id = "SIG30-C"
+    uses_index = True
+    # only the code of installed handlers is checked
+    triggers = SIGNAL_INSTALLERS
 
-class SIG30C(Rule, c_ast.NodeVisitor):
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "SIG30-C"
         self.name = "Call only async-safe functions within signal handlers"
         self._violations = []
-        self._handler_funcs = set()
         self._allowed_funcs = {"abort", "_Exit", "quick_exit", "signal"}
 
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID) and node.name.name in {"signal", "sigaction"}:
-            if node.args and len(node.args.exprs) >= 2:
-                handler = node.args.exprs[1]
-                if isinstance(handler, c_ast.ID):
-                    self._handler_funcs.add(handler.name)
-        self.generic_visit(node)
-
-    def visit_FuncDef(self, node):
-        func_name = node.decl.name
-        self.generic_visit(node.body)
-        if func_name in self._handler_funcs:
-            for subnode in node.body.block_items or []:
+    def check(self, ast, filename="<unknown>", tainted_vars=None, index=None):
+        self.begin_file(filename, tainted_vars)
+        index = index or NodeIndex(ast)
+        for func in registered_handlers(index):
+            func_name = func.decl.name
+            for subnode in func.body.block_items or []:
                 if isinstance(subnode, c_ast.FuncCall):
                     call_name = subnode.name.name if isinstance(subnode.name, c_ast.ID) else ""
                     if call_name and call_name not in self._allowed_funcs:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"Illegal call to '{call_name}' in signal handler '{func_name}' (line {subnode.coord.line})"
-                        })
-
+                        self.report(subnode.coord, f"Illegal call to '{call_name}' in signal handler '{func_name}' (line {subnode.coord.line})")
+        return self._violations
@@ -1,52 +1,59 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
-class SIG31C(Rule, c_ast.NodeVisitor):
+from core.symbols import type_names
+from core.walk import iter_nodes
+from parser.node_index import NodeIndex
+
+# functions installing signal handlers
+SIGNAL_INSTALLERS = frozenset({"signal", "sigaction"})
+
+
+def registered_handlers(index):
+    """FuncDefs installed through signal()/sigaction() anywhere in the unit, in definition order."""
+    handlers = []
+    for call in index.calls_to(SIGNAL_INSTALLERS):
+        if call.args and len(call.args.exprs) >= 2:
+            handler = call.args.exprs[1]
+            if isinstance(handler, c_ast.ID):
+                func = index.function(handler.name)
+                if func is not None and func not in handlers:
+                    handlers.append(func)
+    handlers.sort(key=index.position)
+    return handlers
+
+class SIG31C(Rule):
+    id = "SIG31-C"
+    version = 2
+    uses_index = True
+    uses_symbols = True
+    # only the code of installed handlers is checked
+    triggers = SIGNAL_INSTALLERS
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "SIG31-C"
         self.name = "Do not access shared objects in signal handlers"
         self._violations = []
-        self._handler_funcs = set()
-        self._global_vars = set()
         self._atomic_types = {"sig_atomic_t"}
 
-    def visit_Decl(self, node):
-        if isinstance(node.type, c_ast.TypeDecl):
-            if getattr(node, 'func_decl', False) is False:
-                self._global_vars.add(node.name)
-        self.generic_visit(node)
-
-    def visit_FuncCall(self, node):
-        if isinstance(node.name, c_ast.ID) and node.name.name in {"signal", "sigaction"}:
-            if node.args and len(node.args.exprs) >= 2:
-                handler = node.args.exprs[1]
-                if isinstance(handler, c_ast.ID):
-                    self._handler_funcs.add(handler.name)
-        self.generic_visit(node)
-
-    def visit_FuncDef(self, node):
-        func_name = node.decl.name
-        if func_name in self._handler_funcs:
-            for subnode in node.body.block_items or []:
-                ids = []
-                subnode.visit(NodeCollector(c_ast.ID, ids))
+    def check(self, ast, filename="<unknown>", tainted_vars=None, index=None):
+        self.begin_file(filename, tainted_vars)
+        index = index or NodeIndex(ast)
+        symbols = self.unit_symbols(ast)
+        for func in registered_handlers(index):
+            func_name = func.decl.name
+            for subnode in func.body.block_items or []:
+                ids = [node for node in iter_nodes(subnode) if isinstance(node, c_ast.ID)]
                 for identifier in ids:
                     var_name = identifier.name
-                    if var_name in self._global_vars:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"Access to shared variable '{var_name}' in signal handler '{func_name}' (line {identifier.coord.line})"
-                        })
-        self.generic_visit(node)
+                    if self._is_shared(symbols.lookup(identifier, func)):
+                        self.report(identifier.coord, f"Access to shared variable '{var_name}' in signal handler '{func_name}' (line {identifier.coord.line})")
+        return self._violations
 
-class NodeCollector(c_ast.NodeVisitor):
-    def __init__(self, node_type, collection):
-        self.node_type = node_type
-        self.collection = collection
-    def visit(self, node):
-        if isinstance(node, self.node_type):
-            self.collection.append(node)
-        # continue traversal
-        for _, child in node.children():
-            self.visit(child)
+    def _is_shared(self, symbol):
+        """A file-scope object that is not a sig_atomic_t."""
+        if symbol is None or symbol.scope != "file" or not symbol.is_variable:
+            return False
+        if not isinstance(symbol.type, (c_ast.TypeDecl, c_ast.PtrDecl)):
+            return False
+        return not self._atomic_types.intersection(type_names(symbol.type))
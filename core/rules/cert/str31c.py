@@ -1,38 +1,45 @@
 import re
 from pycparser import c_ast
-from core.rule import Rule
+from core.constants import string_length
+from core.rule import DispatchRule
 
 
-class STR31C(Rule, c_ast.NodeVisitor):
+class STR31C(DispatchRule):
+    id = "STR31-C"
+    version = 5
+    scope = "function"
+    uses_taint = True
+    uses_symbols = True
 
     _copy_funcs = {"strcpy", "strcat", "memcpy"}
+    # copies bounded only by the length of the source
+    _unbounded_copy_funcs = {"strcpy", "strcat"}
     _sprintf_funcs = {"sprintf"}
     _scanf_funcs = {"scanf", "fscanf", "sscanf"}
     _gets_funcs = {"gets"}
 
     def __init__(self):
         super().__init__()
-        self.id = "STR31-C"
         self.name = "Sufficient storage for strings"
-        self._arrays = {}
+        self._function = None
+        self._summary = None
         self.filename = "<stdin>"
 
-    def check(self, ast, filename="<unknown>", tainted_vars=None):
-        self._violations = []
-        self._arrays.clear()
-        self.filename = filename
-        self.visit(ast)
-        return self._violations
-
-    def _report(self, coord, msg):
-        line = coord.line if coord else 0
-        self._violations.append({
-            "file": self.filename,
-            "line": line,
-            "rule": self.id,
-            "severity": "HIGH",
-            "description": "[STRING-BOUNDS][OVERFLOW] " + msg
-        })
+    def reset(self):
+        super().reset()
+        self._function = None
+        self._summary = None
+
+    def enter_FuncDef(self, node):
+        self._function = node
+        self._summary = self.taint.function(node)
+
+    def leave_FuncDef(self, node):
+        self._function = None
+        self._summary = None
+
+    def _report(self, coord, msg, extra=None):
+        self.report(coord, "[STRING-BOUNDS][OVERFLOW] " + msg, "HIGH", extra)
 
     @staticmethod
     def _is_char_array(ty):
@@ -40,36 +47,35 @@ class STR31C(Rule, c_ast.NodeVisitor):
                isinstance(ty.type, c_ast.IdentifierType) and \
                ty.type.names == ["char"]
 
-    @staticmethod
-    def _const_int(expr):
-        if isinstance(expr, c_ast.Constant) and expr.type == "int":
-            try:
-                return int(expr.value, 0)
-            except ValueError:
-                return None
-        return None
-
-    def visit_Decl(self, node):
+    def _buffer_size(self, expr):
+        """The constant size of the char array `expr` names (or declares), else None."""
+        if not isinstance(expr, (c_ast.ID, c_ast.Decl)):
+            return None
+        symbol = self.symbols.lookup(expr, self._function)
+        if symbol is None or not symbol.is_variable:
+            return None
+        array = symbol.resolved
+        if not isinstance(array, c_ast.ArrayDecl) or not self._is_char_array(array.type):
+            return None
+        return self.constants.length(symbol)
+
+    def enter_Decl(self, node):
         # char buf[N];
         if isinstance(node.type, c_ast.ArrayDecl):
-            arr = node.type
-            if self._is_char_array(arr.type):
-                sz = self._const_int(arr.dim)
+            if node.name:
+                sz = self._buffer_size(node)
                 if sz is not None:
-                    self._arrays[node.name] = sz
                     # overflow in literal initialiser?
                     if isinstance(node.init, c_ast.Constant) and node.init.type == "string":
-                        lit_len = len(node.init.value.strip('"'))
+                        lit_len = string_length(node.init.value)
                         if sz <= lit_len:
                             self._report(node.coord,
                                          f"{node.name}[{sz}] initialised with "
                                          f'\"{node.init.value.strip()}\" (length {lit_len})')
-        self.generic_visit(node)
 
-    def visit_FuncCall(self, node):
+    def enter_FuncCall(self, node):
         fname = node.name.name if isinstance(node.name, c_ast.ID) else None
         if not fname:
-            self.generic_visit(node)
             return
 
         args = node.args.exprs if node.args else []
@@ -84,27 +90,35 @@ class STR31C(Rule, c_ast.NodeVisitor):
 
         if fname in self._copy_funcs and len(args) >= 2:
             dest, src = args[0], args[1]
-            if isinstance(dest, c_ast.ID) and dest.name in self._arrays \
+            size = self._buffer_size(dest)
+            if size is not None \
                     and isinstance(src, c_ast.Constant) and src.type == "string":
-                size   = self._arrays[dest.name]
-                litlen = len(src.value.strip('"'))
+                litlen = string_length(src.value)
                 if litlen >= size:
                     self._report(node.coord,
                                  f"{fname} writes {litlen+1} bytes into "
                                  f"{dest.name}[{size}]")
-            self.generic_visit(node)
+            elif fname in self._unbounded_copy_funcs and self._summary is not None \
+                    and size is not None:
+                # the length of untrusted input is whatever the attacker chose
+                sources = self._summary.origins(src)[0]
+                if sources:
+                    self._report(node.coord,
+                                 f"{fname} copies untrusted input into "
+                                 f"{dest.name}[{size}]",
+                                 {"tainted_sources": sorted(sources)})
             return
 
         if fname in self._sprintf_funcs and len(args) >= 2:
             dest, fmt = args[0], args[1]
-            if isinstance(dest, c_ast.ID) and dest.name in self._arrays \
+            size = self._buffer_size(dest)
+            if size is not None \
                     and isinstance(fmt, c_ast.Constant) and fmt.type == "string":
                 unsafe = self._fmt_has_unsafe_s(fmt.value.strip('"'))
                 if unsafe:
                     self._report(node.coord,
-                                 f"sprintf into {dest.name}[{self._arrays[dest.name]}] "
+                                 f"sprintf into {dest.name}[{size}] "
                                  "with unchecked \"%s\" conversion")
-            self.generic_visit(node)
             return
 
         if fname in self._scanf_funcs and len(args) >= 2:
@@ -118,22 +132,20 @@ class STR31C(Rule, c_ast.NodeVisitor):
                         break
                     dest = args[arg_i]
                     arg_i += 1
+                    size = self._buffer_size(dest)
                     if conv is None:
-                        if isinstance(dest, c_ast.ID) and dest.name in self._arrays:
+                        if size is not None:
                             self._report(node.coord,
                                          f"{fname} writes unbounded string into "
-                                         f"{dest.name}[{self._arrays[dest.name]}]")
+                                         f"{dest.name}[{size}]")
                     else:
-                        if isinstance(dest, c_ast.ID) and dest.name in self._arrays:
-                            if conv >= self._arrays[dest.name]:
+                        if size is not None:
+                            if conv >= size:
                                 self._report(node.coord,
                                              f"{fname} may write {conv+1} bytes into "
-                                             f"{dest.name}[{self._arrays[dest.name]}]")
-            self.generic_visit(node)
+                                             f"{dest.name}[{size}]")
             return
 
-        self.generic_visit(node)
-
     @staticmethod
     def _fmt_has_unsafe_s(fmt):
         """Return True if the printf-style format has any %s with *no* precision."""
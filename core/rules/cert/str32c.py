@@ -1,14 +1,27 @@
 import re
 from pycparser import c_ast
 from core.rule import Rule
-class STR32C(Rule, c_ast.NodeVisitor):
+from core.walk import Visitor
+class STR32C(Rule, Visitor):
+    id = "STR32-C"
+    # buffers are taken to be unterminated after a strncpy() into them
+    triggers = frozenset({"strncpy"})
+
     def __init__(self):
         super().__init__()
-        self.id = self.rule_id = "STR32-C"
         self.name = "Do not pass non-null-terminated sequence to string functions"
         self._violations = []
         self._non_terminated_buffers = set()
 
+    def reset(self):
+        super().reset()
+        self._non_terminated_buffers = set()
+
+    def check(self, ast, filename="<unknown>", tainted_vars=None):
+        self.begin_file(filename, tainted_vars)
+        self.visit(ast)
+        return self._violations
+
     def visit_FuncCall(self, node):
         if isinstance(node.name, c_ast.ID):
             func = node.name.name
@@ -23,8 +36,4 @@ class STR32C(Rule, c_ast.NodeVisitor):
             if func in string_funcs:
                 for arg in node.args.exprs if node.args else []:
                     if isinstance(arg, c_ast.ID) and arg.name in self._non_terminated_buffers:
-                        self._violations.append({
-                            "rule": self.id,
-                            "message": f"Possible use of non-null-terminated buffer '{arg.name}' in {func}() (line {node.coord.line})"
-                        })
-        self.generic_visit(node)
+                        self.report(node.coord, f"Possible use of non-null-terminated buffer '{arg.name}' in {func}() (line {node.coord.line})")
@@ -1,8 +1,16 @@
 """
 MISRA Rules
+
+RULES lists the rules of this set that run by default (see the registry
+in core.rules); their modules are imported the first time RULES is read,
+so runs that do not select this rule set never load them.
 """
-from . import rule_no_goto
 
-RULES = [
-    rule_no_goto.RuleNoGoto
-]
+
+def __getattr__(name):
+    if name == "RULES":
+        from core.rules import select
+        rules = select([__name__.rsplit(".", 1)[1]])
+        globals()["RULES"] = rules
+        return rules
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
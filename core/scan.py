@@ -0,0 +1,61 @@
+"""
+Single-pass text scanning:
+runs the patterns of all text rules as one combined regular expression over
+a unit's source, instead of letting each rule split the source into lines
+and search every line itself. Comments and string and character literals
+are matched first and skipped, so a pattern never fires inside them.
+"""
+import re
+
+# comments and literals, unterminated ones running to the end of the text / line
+_SKIP = (r'//[^\n]*'
+         r'|/\*[\s\S]*?(?:\*/|\Z)'
+         r'|"(?:\\[\s\S]|[^"\\\n])*"?'
+         r"|'(?:\\[\s\S]|[^'\\\n])*'?")
+
+
+class Scanner:
+    """
+    Drives any number of pattern-based rules over one scan of the source.
+
+    Each rule maps names to regular expressions in `patterns`; wherever one
+    of them matches, the rule's on_match(name, lineno, line) is called with
+    the 1-based line number and the text of that line. When patterns of
+    several rules match at the same place, each of those rules gets it.
+    """
+    def __init__(self, rules):
+        self.rules = list(rules)
+        # (compiled pattern, name, rule), to find the owners of a match
+        self._owners = []
+        for rule in self.rules:
+            for name, pattern in rule.patterns.items():
+                self._owners.append((re.compile(pattern), name, rule))
+        self._regex = None
+        if self._owners:
+            alternatives = "|".join(f"(?:{p.pattern})" for p, _, _ in self._owners)
+            self._regex = re.compile(f"{_SKIP}|({alternatives})")
+
+    def run(self, code, filename="<unknown>", tainted_vars=None):
+        for rule in self.rules:
+            rule.begin_file(filename, tainted_vars)
+        if code and self._regex is not None:
+            self.scan(code)
+        for rule in self.rules:
+            rule.end_file()
+
+    def scan(self, code):
+        lineno = 1
+        counted = 0
+        for m in self._regex.finditer(code):
+            if m.lastindex is None:
+                continue  # a comment or literal
+            start = m.start()
+            # matches come in order, so count the newlines since the last one
+            lineno += code.count("\n", counted, start)
+            counted = start
+            line_start = code.rfind("\n", 0, start) + 1
+            line_end = code.find("\n", start)
+            line = code[line_start:line_end if line_end >= 0 else len(code)]
+            for pattern, name, rule in self._owners:
+                if pattern.match(code, start):
+                    rule.on_match(name, lineno, line)
@@ -0,0 +1,241 @@
+"""
+Symbol table:
+the declaration every identifier of a translation unit refers to.
+
+One SymbolTable is built per parsed unit and shared by all rules of a run
+that set `uses_symbols`. The file-scope declarations are collected on the
+first query, in one pass over the top-level nodes; the identifiers of a
+function are resolved the first time a rule asks about that function, in
+one walk that follows C's block scoping, so a local that shadows a global
+(or a variable of an enclosing block) resolves to its own declaration.
+After that every lookup is a dict access.
+
+A function sees the file-scope declarations before it, not those after.
+"""
+from pycparser import c_ast
+
+from core.walk import Visitor
+
+
+def type_names(node):
+    """The specifiers (["unsigned", "int"], ...) of a plain (non-derived) type, else ()."""
+    if isinstance(node, c_ast.Typename):
+        node = node.type
+    if isinstance(node, c_ast.TypeDecl) and isinstance(node.type, c_ast.IdentifierType):
+        return node.type.names
+    return ()
+
+
+class Symbol:
+    """
+    One declared name. `decl` is the declaring node (a Decl, a Typedef or
+    an Enumerator), `type` its declared type (the Enum, for an enumeration
+    constant) and `resolved` the same with a typedef name at the top
+    replaced by the typedef's type, `storage` the set of storage class
+    specifiers, `scope` one of "file", "param" and "block", and `function`
+    the FuncDef the name is local to.
+    """
+    __slots__ = ("name", "decl", "type", "resolved", "storage", "scope", "function",
+                 "position")
+
+    def __init__(self, name, decl, type, resolved, storage, scope, function, position):
+        self.name = name
+        self.decl = decl
+        self.type = type
+        self.resolved = resolved
+        self.storage = storage
+        self.scope = scope
+        self.function = function
+        # index of the top-level node that declares (or contains) it
+        self.position = position
+
+    @property
+    def is_function(self):
+        return isinstance(self.type, c_ast.FuncDecl)
+
+    @property
+    def is_typedef(self):
+        return "typedef" in self.storage
+
+    @property
+    def is_variable(self):
+        return isinstance(self.decl, c_ast.Decl) and not self.is_function
+
+    @property
+    def is_automatic(self):
+        """A parameter or a local variable without static/extern storage."""
+        return self.scope != "file" and self.is_variable \
+            and not self.storage & {"static", "extern"}
+
+    def __repr__(self):
+        return f"<Symbol {self.name} ({self.scope})>"
+
+
+class SymbolTable(Visitor):
+    def __init__(self, ast):
+        self.ast = ast
+        self._built = False
+        # name -> file-scope Symbols of that name, in declaration order
+        self._globals = {}
+        # id(FuncDef) -> its index among the top-level nodes
+        self._positions = {}
+        # id(ID or declaring node) -> Symbol
+        self._symbols = {}
+        # ("struct" or "union", tag) -> the file-scope definition
+        self._tags = {}
+        # ids of the FuncDefs whose identifiers are resolved
+        self._walked = set()
+        # state of the walk in progress
+        self._scopes = []
+        self._function = None
+        self._position = 0
+
+    def lookup(self, node, func=None):
+        """
+        The Symbol an ID refers to, or that a Decl, Typedef or Enumerator
+        declares; None for undeclared names and for IDs that are not
+        variable references (struct fields, designators). `func` is the
+        FuncDef containing the node, None for a node at file scope.
+        """
+        if not self._built:
+            self._build()
+        if func is not None and id(func) not in self._walked:
+            self._walk_function(func)
+        return self._symbols.get(id(node))
+
+    def typedef(self, name):
+        """The last file-scope typedef named `name`, or None."""
+        if not self._built:
+            self._build()
+        for symbol in reversed(self._globals.get(name, ())):
+            if symbol.is_typedef:
+                return symbol
+        return None
+
+    def tag(self, kind, name):
+        """
+        The last file-scope definition (the Struct or Union node with its
+        members) of `kind` "struct" or "union" named `name`, or None.
+        """
+        if not self._built:
+            self._build()
+        return self._tags.get((kind, name))
+
+    def _build(self):
+        self._built = True
+        if self.ast is None:
+            return
+        for position, ext in enumerate(self.ast.ext):
+            self._position = position
+            if isinstance(ext, c_ast.FuncDef):
+                self._positions[id(ext)] = position
+                self._declare(ext.decl.name, ext.decl, ext.decl.type, ext.decl.storage)
+            elif isinstance(ext, (c_ast.Decl, c_ast.Typedef)):
+                self.visit(ext)
+
+    def _walk_function(self, func):
+        self._walked.add(id(func))
+        self._function = func
+        self._position = self._positions.get(id(func), len(self._positions))
+        self._scopes = [{}]
+        args = getattr(func.decl.type, "args", None)
+        for param in (args.params if args else ()):
+            if isinstance(param, c_ast.Decl) and param.name:
+                self.visit(param)
+        self.visit(func.body)
+        self._scopes = []
+        self._function = None
+
+    def _find(self, name):
+        for scope in reversed(self._scopes):
+            symbol = scope.get(name)
+            if symbol is not None:
+                return symbol
+        for symbol in reversed(self._globals.get(name, ())):
+            if symbol.position <= self._position:
+                return symbol
+        return None
+
+    def _declare(self, name, node, type, storage):
+        resolved = type
+        for type_name in type_names(type):
+            typedef = self._find(type_name)
+            if typedef is not None and typedef.is_typedef:
+                resolved = typedef.resolved
+                break
+        if not self._scopes:
+            scope = "file"
+        elif self._function is not None and len(self._scopes) == 1:
+            scope = "param"
+        else:
+            scope = "block"
+        symbol = Symbol(name, node, type, resolved, frozenset(storage or ()), scope,
+                        self._function, self._position)
+        if self._scopes:
+            self._scopes[-1][name] = symbol
+        else:
+            self._globals.setdefault(name, []).append(symbol)
+        self._symbols[id(node)] = symbol
+
+    # the walk (core.walk.Visitor): visit_ hooks run before a node's
+    # children, leave_ hooks after them
+
+    def visit_ID(self, node):
+        symbol = self._find(node.name)
+        if symbol is not None:
+            self._symbols[id(node)] = symbol
+
+    def visit_Decl(self, node):
+        self._visit_type(node.type)
+        if node.name:
+            self._declare(node.name, node, node.type, node.storage)
+        return (node.init,) if type(node) is c_ast.Decl and node.init is not None else ()
+
+    visit_Typedef = visit_Decl
+
+    def visit_StructRef(self, node):
+        # the field name is not a variable
+        return (node.name,)
+
+    def visit_NamedInitializer(self, node):
+        return (node.expr,)
+
+    def visit_Typename(self, node):
+        self._visit_type(node.type)
+        return ()
+
+    def visit_Compound(self, node):
+        self._scopes.append({})
+
+    visit_For = visit_Compound
+
+    def leave_Compound(self, node):
+        self._scopes.pop()
+
+    leave_For = leave_Compound
+
+    def _visit_type(self, node):
+        """
+        Array sizes and enumeration constants of a declared type, and the
+        struct and union definitions of file-scope ones.
+        """
+        while True:
+            kind = type(node)
+            if kind is c_ast.ArrayDecl:
+                if node.dim is not None:
+                    self.visit(node.dim)
+            elif kind is c_ast.Enum:
+                for enumerator in (node.values.enumerators if node.values else ()):
+                    if enumerator.value is not None:
+                        self.visit(enumerator.value)
+                    self._declare(enumerator.name, enumerator, node, ())
+                return
+            elif kind is c_ast.Struct or kind is c_ast.Union:
+                if node.name and node.decls is not None and not self._scopes:
+                    self._tags["struct" if kind is c_ast.Struct else "union", node.name] = node
+                return
+            elif kind is not c_ast.PtrDecl and kind is not c_ast.TypeDecl:
+                # prototypes' parameters, struct members and plain types
+                # declare no ordinary identifiers
+                return
+            node = node.type
@@ -0,0 +1,253 @@
+"""
+Taint analysis:
+which values in a function may carry untrusted input, and where that input
+comes from. Function parameters, argv[...] and getenv() are the sources;
+taint flows through expressions, assignments and initializers, and through
+the library calls that copy one buffer into another (sprintf, strcpy, ...).
+
+One TaintEngine is shared by all rules of a run that set `uses_taint`. It
+builds a function's TaintSummary the first time a rule asks about an
+expression in that function, and memoizes the answer for every expression
+node, so sink rules looking at the same arguments never re-walk them.
+
+The analysis follows source order: an expression sees the assignments that
+complete before it (loop bodies are not iterated), and every name resolves
+to the declaration in scope at that point, so the taint of a variable does
+not leak into a sibling block or into another function.
+"""
+from pycparser import c_ast
+
+from core.walk import Visitor
+
+# functions returning untrusted data; the source is labelled env(NAME)
+SOURCE_FUNCS = frozenset({"getenv"})
+
+# functions that copy their source arguments into a destination buffer:
+# name -> (destination argument, slice of the source arguments)
+PROPAGATORS = {
+    "sprintf": (0, slice(1, None)), "vsprintf": (0, slice(1, None)),
+    "snprintf": (0, slice(2, None)), "vsnprintf": (0, slice(2, None)),
+    "swprintf": (0, slice(2, None)),
+    "strcpy": (0, slice(1, 2)), "strncpy": (0, slice(1, 2)),
+    "strcat": (0, slice(1, 2)), "strncat": (0, slice(1, 2)),
+    "memcpy": (0, slice(1, 2)), "memmove": (0, slice(1, 2)),
+}
+
+# origins of an expression that carries no taint
+CLEAN = (frozenset(), {})
+
+# nodes that open a scope for the declarations inside them
+_SCOPES = (c_ast.Compound, c_ast.For)
+
+
+class _Var:
+    """One declared (or, for globals, referenced) variable of a function."""
+    __slots__ = ("name", "param", "origins")
+
+    def __init__(self, name, param=False):
+        self.name = name
+        self.param = param
+        # origins of reading the variable at the current point of the walk
+        self.origins = CLEAN
+
+    def taint(self, sources):
+        sources = self.origins[0] | sources
+        self.origins = (sources, {} if self.param else {self.name: sources})
+
+
+def _callee(call):
+    return call.name.name if isinstance(call.name, c_ast.ID) else None
+
+
+def _env_label(call):
+    args = call.args.exprs if call.args else []
+    name = "<unknown>"
+    if args and isinstance(args[0], c_ast.Constant):
+        name = args[0].value.strip('"')
+    return f"env({name})"
+
+
+class TaintSummary(Visitor):
+    """
+    Taint of the expressions of one FuncDef. On the first query the function
+    is walked once, and the origins of every expression are computed as the
+    walk leaves it, from those of its operands.
+    """
+    def __init__(self, func):
+        self.func = func
+        self._built = False
+        # id(node) -> origins, for the tainted expressions only
+        self._memo = {}
+        self._scopes = None
+
+    def is_tainted(self, expr):
+        return bool(self.origins(expr)[0])
+
+    def origins(self, expr):
+        """
+        (sources, {variable: sources}) of an expression: the sources its value
+        may come from (parameter names, "argv", "env(NAME)"), and the tainted
+        local variables it reads, each with the sources of its taint. An
+        expression outside the function is CLEAN. Do not modify the result.
+        """
+        if not self._built:
+            self._build()
+        return self._memo.get(id(expr), CLEAN)
+
+    def _build(self):
+        self._built = True
+        params = {}
+        args = getattr(self.func.decl.type, "args", None)
+        for param in (args.params if args else ()):
+            # prototype parameters are Decls, K&R ones IDs
+            if isinstance(param, (c_ast.Decl, c_ast.ID)) and param.name:
+                var = params[param.name] = _Var(param.name, param=True)
+                var.taint(frozenset({param.name}))
+        self._scopes = [params]
+        self.visit(self.func.body)
+        self._scopes = None
+
+    def _lookup(self, name):
+        for scope in reversed(self._scopes):
+            var = scope.get(name)
+            if var is not None:
+                return var
+        # a global (or undeclared) name, tracked for the rest of the function
+        var = self._scopes[0][name] = _Var(name)
+        return var
+
+    # the walk (core.walk.Visitor): visit_ hooks run before a node's
+    # operands, leave_ hooks after them
+
+    def visit_ID(self, node):
+        found = self._lookup(node.name).origins
+        if found[0]:
+            self._memo[id(node)] = found
+
+    def visit_Typename(self, node):
+        return ()
+
+    visit_Typedef = visit_Typename
+
+    def visit_Decl(self, node):
+        # the declared type (struct fields, prototypes) holds no values
+        return () if node.init is None else (node.init,)
+
+    def leave_Decl(self, node):
+        if node.name and not isinstance(node.type, c_ast.FuncDecl):
+            var = self._scopes[-1][node.name] = _Var(node.name)
+            if node.init is not None:
+                self._taint(var, node.init)
+
+    def visit_Compound(self, node):
+        self._scopes.append({})
+
+    visit_For = visit_Compound
+
+    def leave_Compound(self, node):
+        self._scopes.pop()
+
+    leave_For = leave_Compound
+
+    def visit_StructRef(self, node):
+        # the field name is not a variable
+        return (node.name,)
+
+    # any expression carries the taint of its operands, and a few have
+    # their own: the leave_ hooks store the origins of the tainted ones
+
+    def leave_FuncCall(self, node):
+        callee = _callee(node)
+        if callee in SOURCE_FUNCS:
+            self._memo[id(node)] = (frozenset({_env_label(node)}), {})
+        elif callee in PROPAGATORS:
+            dest, sources = PROPAGATORS[callee]
+            args = node.args.exprs if node.args else []
+            if dest < len(args):
+                for arg in args[sources]:
+                    self._taint(self._target(args[dest]), arg)
+
+    def leave_ArrayRef(self, node):
+        found = self._memo.get(id(node.name))
+        if found is None and isinstance(node.name, c_ast.ID) and node.name.name == "argv":
+            found = (frozenset({"argv"}), {})
+        if found is not None:
+            self._memo[id(node)] = found
+
+    def leave_StructRef(self, node):
+        found = self._memo.get(id(node.name))
+        if found is not None:
+            self._memo[id(node)] = found
+
+    def leave_UnaryOp(self, node):
+        found = self._memo.get(id(node.expr))
+        if found is not None and node.op != "sizeof":
+            self._memo[id(node)] = found
+
+    def leave_Cast(self, node):
+        found = self._memo.get(id(node.expr))
+        if found is not None:
+            self._memo[id(node)] = found
+
+    def leave_Assignment(self, node):
+        found = self._memo.get(id(node.rvalue))
+        if found is not None:
+            self._memo[id(node)] = found
+            self._taint(self._target(node.lvalue), node.rvalue)
+
+    def leave_BinaryOp(self, node):
+        self._merge(node, (node.left, node.right))
+
+    def leave_TernaryOp(self, node):
+        self._merge(node, (node.iftrue, node.iffalse))
+
+    def leave_ExprList(self, node):
+        self._merge(node, node.exprs)
+
+    leave_InitList = leave_ExprList
+
+    def leave_CompoundLiteral(self, node):
+        self._merge(node, (node.init,))
+
+    def leave_NamedInitializer(self, node):
+        self._merge(node, (node.expr,))
+
+    def _merge(self, node, operands):
+        memo = self._memo
+        found = [memo[id(operand)] for operand in operands if id(operand) in memo]
+        if not found:
+            return
+        if len(found) == 1:
+            memo[id(node)] = found[0]
+            return
+        sources, variables = set(), {}
+        for operand_sources, operand_variables in found:
+            sources |= operand_sources
+            variables.update(operand_variables)
+        memo[id(node)] = (frozenset(sources), variables)
+
+    def _target(self, lvalue):
+        """The variable an assignment to `lvalue` writes into, if any."""
+        while isinstance(lvalue, (c_ast.ArrayRef, c_ast.StructRef)):
+            lvalue = lvalue.name
+        if isinstance(lvalue, c_ast.ID):
+            return self._lookup(lvalue.name)
+        return None
+
+    def _taint(self, var, expr):
+        sources = self._memo.get(id(expr), CLEAN)[0]
+        if var is not None and sources:
+            var.taint(sources)
+
+
+class TaintEngine:
+    """Taint summaries of the functions of one unit, each built on first use."""
+    def __init__(self):
+        self._summaries = {}
+
+    def function(self, func):
+        """The TaintSummary of a FuncDef."""
+        summary = self._summaries.get(id(func))
+        if summary is None:
+            summary = self._summaries[id(func)] = TaintSummary(func)
+        return summary
@@ -0,0 +1,93 @@
+"""
+Violation records:
+one compact, typed record per finding, shared by every rule and reporter.
+Records keep their fields in slots rather than a per-instance dict, and
+intern the strings that repeat across findings (rule IDs, file paths), so a
+run with millions of findings stores each of those once. Fields that only
+some rules produce (recommendations, taint sources, ...) go to `extra`.
+"""
+import enum
+import sys
+
+
+class Severity(str, enum.Enum):
+    HIGH = "HIGH"
+    MEDIUM = "MEDIUM"
+    LOW = "LOW"
+
+    def __str__(self):
+        return self.value
+
+
+def _intern(text):
+    return sys.intern(text) if type(text) is str else text
+
+
+class Violation:
+    __slots__ = ("rule", "file", "line", "column", "severity", "description", "extra")
+
+    def __init__(self, rule, description, file=None, line=None, column=None,
+                 severity=None, extra=None):
+        self.rule = _intern(rule)
+        self.file = _intern(file)
+        self.line = line
+        self.column = column
+        self.severity = Severity(severity) if severity is not None else None
+        self.description = description
+        # rule-specific fields, None when there are none
+        self.extra = extra or None
+
+    @classmethod
+    def at(cls, rule, description, coord, filename=None, severity=None, extra=None):
+        """
+        A finding at a pycparser coord: the file and line of the node, which
+        may lie in an included header, else `filename` with line 0.
+        """
+        if coord is None:
+            return cls(rule, description, filename, 0, None, severity, extra)
+        return cls(rule, description, coord.file or filename, coord.line,
+                   coord.column or None, severity, extra)
+
+    def moved(self, delta):
+        """A copy `delta` lines further down."""
+        line = self.line + delta if self.line else self.line
+        return Violation(self.rule, self.description, self.file, line, self.column,
+                         self.severity, self.extra)
+
+    def to_dict(self):
+        """The record as a plain dict (the JSON reports' and caches' format)."""
+        data = {"file": self.file, "line": self.line}
+        if self.column is not None:
+            data["column"] = self.column
+        data["rule"] = self.rule
+        if self.severity is not None:
+            data["severity"] = self.severity.value
+        data["description"] = self.description
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {key: value for key, value in data.items() if key not in _FIELDS}
+        return cls(data["rule"], data["description"], data.get("file"), data.get("line"),
+                   data.get("column"), data.get("severity"), extra)
+
+    def __reduce__(self):
+        # through __init__, so records coming back from worker processes are interned too
+        return (Violation, (self.rule, self.description, self.file, self.line, self.column,
+                            self.severity, self.extra))
+
+    def __eq__(self, other):
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        where = f"{self.file}:{self.line}" + (f":{self.column}" if self.column else "")
+        return f"Violation({self.rule!r}, {where}, {self.description!r})"
+
+
+_FIELDS = frozenset(Violation.__slots__) - {"extra"}
@@ -0,0 +1,134 @@
+"""
+Tree walking:
+depth-first traversals of pycparser ASTs driven by an explicit stack
+instead of Python recursion, for the rules and analyses that would
+otherwise use c_ast.NodeVisitor or recurse over `for child in node`.
+
+Long `else if` chains and expressions of thousands of terms make trees
+thousands of levels deep; a recursive walk of them raises RecursionError
+and loses the whole file. A stack walk has no depth limit, and costs no
+Python call per node beyond the hooks themselves.
+"""
+from pycparser import c_ast
+from pycparser.c_ast import Node
+
+# node classes that never have children
+LEAVES = frozenset(
+    cls for cls in vars(c_ast).values()
+    if isinstance(cls, type) and issubclass(cls, Node) and cls is not Node
+    and not [slot for slot in cls.__slots__
+             if slot not in cls.attr_names and slot not in ("coord", "__weakref__")])
+
+
+def walk(root, enter, leave=None, act=None):
+    """
+    Walk the tree under `root` (included) depth first.
+
+    enter(node) runs before the node's children. It returns None to walk
+    all of them, or a sequence of the steps to take instead, in order:
+    nodes are walked in turn, and tuples are handed to act(step) once the
+    steps before them are done, e.g. an event to record between two
+    operands. leave(node), if given, runs after the node's steps.
+    """
+    # a stack of iterators over the steps still to take at each level,
+    # each under the node to leave once it is exhausted (with a leave hook)
+    stack = [iter((root,))]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        for item in stack[-1]:
+            if item.__class__ is tuple:
+                act(item)
+                continue
+            steps = enter(item)
+            if steps is None:
+                if item.__class__ in LEAVES:
+                    if leave is not None:
+                        leave(item)
+                    continue
+                steps = item
+            elif not steps:
+                if leave is not None:
+                    leave(item)
+                continue
+            if leave is not None:
+                push(item)
+            push(iter(steps))
+            break
+        else:
+            pop()
+            if leave is not None and stack:
+                leave(pop())
+
+
+def iter_nodes(root):
+    """Every node under `root` (included), in pre-order."""
+    stack = [iter((root,))]
+    push = stack.append
+    while stack:
+        for node in stack[-1]:
+            yield node
+            if node.__class__ not in LEAVES:
+                push(iter(node))
+                break
+        else:
+            stack.pop()
+
+
+class Visitor:
+    """
+    Stack-driven stand-in for c_ast.NodeVisitor. visit(node) walks the
+    subtree, calling visit_<NodeType>(node) before a node's children and
+    leave_<NodeType>(node) after them; nodes without hooks cost no call.
+    A visit_ method returns None to walk all the children, or the steps to
+    take instead as for walk(), with act(step) receiving the tuples among
+    them; the hooks never call generic_visit().
+    """
+    # visitor class -> {node class: (enter hook, leave hook, has no children)}
+    _tables = {}
+
+    def visit(self, root):
+        if root is None:
+            return
+        hooks = Visitor._tables.get(self.__class__)
+        if hooks is None:
+            hooks = Visitor._tables[self.__class__] = {}
+        stack = [iter((root,))]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            for node in stack[-1]:
+                cls = node.__class__
+                found = hooks.get(cls)
+                if found is None:
+                    if cls is tuple:
+                        self.act(node)
+                        continue
+                    found = hooks[cls] = (getattr(self.__class__, "visit_" + cls.__name__, None),
+                                          getattr(self.__class__, "leave_" + cls.__name__, None),
+                                          cls in LEAVES)
+                enter, leave, leaf = found
+                steps = enter(self, node) if enter is not None else None
+                if steps is None:
+                    if leaf:
+                        if leave is not None:
+                            leave(self, node)
+                        continue
+                    steps = node
+                elif not steps:
+                    if leave is not None:
+                        leave(self, node)
+                    continue
+                if leave is not None:
+                    push((node, leave))
+                push(iter(steps))
+                break
+            else:
+                pop()
+                if stack and stack[-1].__class__ is tuple:
+                    node, leave = pop()
+                    leave(self, node)
+
+    def act(self, step):
+        """A tuple among the steps returned by a visit_ method was reached."""
+        raise TypeError(f"{type(self).__name__} got a step it does not handle: {step!r}")
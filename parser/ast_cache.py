@@ -0,0 +1,97 @@
+"""
+AST cache:
+stores parsed translation units on disk keyed by the hash of the
+preprocessed text and parse mode, together with the diagnostics of the
+parse.
+
+Every top-level node is pickled and compressed on its own. On load the
+declarations are restored right away, while FuncDefs stay serialized until
+something reads them from FileAST.ext, so runs that never look inside a
+function body never pay for deserializing it.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from collections.abc import Sequence
+
+import pycparser
+from pycparser import c_ast
+
+# bump when the on-disk layout changes
+AST_CACHE_FORMAT = 3
+
+
+class LazyExtList(Sequence):
+    """FileAST.ext replacement that unpickles FuncDefs on first access."""
+    def __init__(self, items):
+        # each item is either a materialized node or the compressed pickle of one
+        self._items = items
+
+    def _load(self, i):
+        item = self._items[i]
+        if isinstance(item, bytes):
+            item = self._items[i] = pickle.loads(zlib.decompress(item))
+        return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._load(j) for j in range(*i.indices(len(self._items)))]
+        if i < 0:
+            i += len(self._items)
+        return self._load(i)
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self._load(i)
+
+    def loaded(self):
+        """Number of FuncDefs deserialized so far."""
+        return sum(1 for item in self._items if isinstance(item, c_ast.FuncDef))
+
+
+class ASTCache:
+    def __init__(self, directory):
+        # absolute: a daemon changes directory to each client's
+        self.directory = os.path.abspath(directory)
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(text, mode=""):
+        header = f"{AST_CACHE_FORMAT}\0{pycparser.__version__}\0{mode}\0"
+        return hashlib.sha256((header + text).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".ast")
+
+    def load(self, key):
+        """Return (ast, diagnostics) for a cached unit, or None."""
+        try:
+            with open(self._path(key), "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        items = []
+        for is_func, blob in payload["ext"]:
+            items.append(blob if is_func else pickle.loads(zlib.decompress(blob)))
+        return c_ast.FileAST(LazyExtList(items), payload["coord"]), payload["diagnostics"]
+
+    def store(self, key, ast, diagnostics=()):
+        try:
+            ext = [(isinstance(node, c_ast.FuncDef),
+                    zlib.compress(pickle.dumps(node, pickle.HIGHEST_PROTOCOL)))
+                   for node in ast.ext]
+        except RecursionError:
+            # too deeply nested to pickle; this unit is simply parsed every time
+            return
+        payload = {"ext": ext, "coord": ast.coord, "diagnostics": list(diagnostics)}
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
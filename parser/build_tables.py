@@ -0,0 +1,44 @@
+"""
+Regenerates the lexer/LALR tables shipped in parser/tables for the
+installed pycparser, so that building a parser only imports them instead
+of rebuilding the grammar automaton (or relying on the copies inside the
+pycparser install, which some packagers strip).
+
+    python -m parser.build_tables
+"""
+import os
+import py_compile
+
+import pycparser
+from pycparser import c_parser
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+
+_HEADER = '''"""
+Lexer/LALR tables generated by `python -m parser.build_tables`; do not edit.
+They are only used with the pycparser version below.
+"""
+PYCPARSER_VERSION = "{version}"
+'''
+
+
+def main():
+    os.makedirs(TABLES_DIR, exist_ok=True)
+    for name in ("lextab.py", "yacctab.py"):
+        path = os.path.join(TABLES_DIR, name)
+        if os.path.exists(path):
+            os.remove(path)
+    with open(os.path.join(TABLES_DIR, "__init__.py"), "w", encoding="utf-8") as f:
+        f.write(_HEADER.format(version=pycparser.__version__))
+    # with no importable table modules PLY builds the tables and writes them out
+    c_parser.CParser(lex_optimize=True, lextab="parser.tables.lextab",
+                     yacc_optimize=True, yacctab="parser.tables.yacctab",
+                     yacc_debug=False, taboutputdir=TABLES_DIR)
+    # byte-compile now so the first real run does not pay for compiling 200 KB of tables
+    for name in ("__init__.py", "lextab.py", "yacctab.py"):
+        py_compile.compile(os.path.join(TABLES_DIR, name), doraise=True)
+    print(f"wrote tables for pycparser {pycparser.__version__} to {TABLES_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,305 @@
+import re
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+
+import pycparser
 from pycparser import c_parser, c_ast
-from parser.taint_analyzer import TaintAnalyzer
+from parser.node_index import NodeIndex
+from parser.preprocessor import Preprocessor, typedef_names
+from parser.chunks import split_chunks
+
+PARSE_MODES = ("strict", "recover", "chunked")
+
+# chunk parses kept by a CParser in chunked mode
+_CHUNK_MEMO_SIZE = 8192
+
+# pycparser errors read "file:line[:column]: message"
+_ERROR_RE = re.compile(r"(.*?):(\d+)(?::(\d+))?: (.*)", re.DOTALL)
+
+# a parse pycparser's recursion gives up on (an `else if` chain thousands
+# of links long, ...) is run again on a thread with this much stack and
+# Python recursion allowed
+DEEP_STACK_SIZE = 512 * 1024 * 1024
+DEEP_RECURSION_LIMIT = 400000
+# deep parses run one at a time: the recursion limit is process-wide
+_deep_lock = threading.Lock()
+
+# pycparser parsers are reusable across inputs and expensive to build, but
+# keep the state of the parse in progress, so every CParser of a thread
+# shares that thread's one (see shared_pycparser)
+_shared = threading.local()
+
+
+def _table_options():
+    """Use the tables shipped in parser/tables when they match the installed pycparser."""
+    try:
+        from parser import tables
+    except ImportError:
+        return {}
+    if tables.PYCPARSER_VERSION != pycparser.__version__:
+        return {}
+    return {"lex_optimize": True, "lextab": "parser.tables.lextab",
+            "yacc_optimize": True, "yacctab": "parser.tables.yacctab"}
+
+
+class _PycParser(c_parser.CParser):
+    """pycparser parser that also treats typedef names declared elsewhere as types."""
+    # set before each parse: the fake libc's typedef names, plus in chunked
+    # parsing the ones declared by earlier chunks
+    builtin_typedefs = frozenset()
+
+    def _is_type_in_scope(self, name):
+        for scope in reversed(self._scope_stack):
+            # a declaration in any open scope shadows the builtin names
+            if name in scope:
+                return scope[name]
+        return name in self.builtin_typedefs
+
+
+def shared_pycparser():
+    """Return this thread's pycparser parser, building it on first use."""
+    parser = getattr(_shared, "parser", None)
+    if parser is None:
+        parser = _shared.parser = _PycParser(**_table_options())
+    return parser
+
+
+def _deep_call(fn, *args):
+    """fn(*args) on a thread with a DEEP_STACK_SIZE stack, under DEEP_RECURSION_LIMIT."""
+    outcome = []
+
+    def run():
+        try:
+            outcome.append((True, fn(*args)))
+        except BaseException as exc:
+            outcome.append((False, exc))
+
+    with _deep_lock:
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, DEEP_RECURSION_LIMIT))
+        try:
+            size = threading.stack_size(DEEP_STACK_SIZE)
+        except (ValueError, RuntimeError):
+            # no such stack here: the raised limit alone may do
+            size = None
+        try:
+            thread = threading.Thread(target=run, name="deep-parse")
+            thread.start()
+            thread.join()
+        finally:
+            if size is not None:
+                threading.stack_size(size)
+            sys.setrecursionlimit(limit)
+    ok, value = outcome[0]
+    if not ok:
+        raise value
+    return value
+
+
+def _diagnostic(exc, filename, line, note=None):
+    """Turn a parse exception into a diagnostic dict."""
+    m = _ERROR_RE.match(str(exc)) if isinstance(exc, c_parser.ParseError) else None
+    if m:
+        filename, line = m.group(1), int(m.group(2))
+        column = int(m.group(3)) if m.group(3) else None
+        message = m.group(4)
+    else:
+        column = None
+        message = f"{type(exc).__name__}: {exc}"
+    if note:
+        message = f"{message} ({note})"
+    return {"file": filename, "line": line, "column": column,
+            "severity": "error", "message": message}
+
+
+def _shift_lines(entry, delta, filename):
+    """Move a memoized chunk's nodes (and diagnostics) `delta` lines within `filename`."""
+    entry[0] += delta
+    seen = set()
+    stack = list(entry[1])
+    while stack:
+        node = stack.pop()
+        coord = node.coord
+        # nodes may share one Coord object, so shift each only once; line 0
+        # is pycparser's "no position" (e.g. empty parameter lists)
+        if (coord is not None and coord.line and coord.file == filename
+                and id(coord) not in seen):
+            seen.add(id(coord))
+            coord.line += delta
+        stack.extend(node)
+    for d in entry[3]:
+        if d["file"] == filename and d["line"] is not None:
+            d["line"] += delta
 
-last_parser = None
 
 class CParser:
-    def __init__(self):
-        self.parser = c_parser.CParser()
-        self.tainted_vars = set()
+    """
+    Preprocesses and parses units one at a time, keeping what it learnt
+    about the last one (diagnostics, node index, chunks). A CParser belongs
+    to the thread that created it; threads checking files at once each
+    need their own.
+    """
+    def __init__(self, ast_cache=None, preprocessor=None, mode="recover", profile=None):
+        if mode not in PARSE_MODES:
+            raise ValueError(f"unknown parse mode {mode!r} (expected one of {', '.join(PARSE_MODES)})")
+        self.parser = shared_pycparser()
+        self.index = None
         self.checker = None
+        # optional parser.ast_cache.ASTCache
+        self.ast_cache = ast_cache
+        # header expansions are memoized on the preprocessor, so keep one per process
+        self.preprocessor = preprocessor or Preprocessor()
+        # parser.preprocessor.Preprocessed of the last parsed unit
+        self.preprocessed = None
+        # strict: a parse error drops the unit; recover: on a parse error the
+        # unit is re-parsed chunk by chunk; chunked: always parse by chunks
+        self.mode = mode
+        # problems found while preprocessing and parsing the last unit, as
+        # dicts with file, line, column (or None), severity and message
+        self.diagnostics = []
+        # chunked mode: (file, text, typedef names in scope) ->
+        # [first line, nodes, typedef names declared, diagnostics]
+        self._chunk_memo = OrderedDict()
+        # name and parser.chunks.Chunks of the last unit, split on demand
+        self._unit_name = None
+        self._unit_chunks = None
+        # optional checker.profiling.Profile recording preprocessing and parsing
+        self.profile = profile
+
+    def options_key(self):
+        """Describes the preprocessing and parsing applied (part of result cache keys)."""
+        return f"{self.preprocessor.options_key()}:{self.mode}"
+
+    def preprocess(self, code: str, filename: str = "<unknown>"):
+        return self.preprocessor.run(code, filename)
+
+    def _parse(self, text: str, filename: str, builtin_typedefs=frozenset()):
+        key = None
+        if self.ast_cache is not None:
+            key = self.ast_cache.key(text, self.mode)
+            cached = self.ast_cache.load(key)
+            if cached is not None:
+                ast, diagnostics = cached
+                self.diagnostics.extend(diagnostics)
+                return ast
+        known = len(self.diagnostics)
+        if self.mode == "chunked":
+            ast = self._parse_chunks(text, filename, builtin_typedefs, memo=True)
+        else:
+            try:
+                ast = self._pycparse(text, filename, builtin_typedefs)
+            except Exception as exc:
+                if self.mode == "strict":
+                    self._diagnose(exc, filename)
+                    return None
+                ast = self._parse_chunks(text, filename, builtin_typedefs, memo=False)
+        if key is not None:
+            self.ast_cache.store(key, ast, self.diagnostics[known:])
+        return ast
 
-    def _strip_directives(self, text: str) -> str:
-        return "\n".join(line for line in text.splitlines()
-                         if not line.lstrip().startswith('#'))
-    
-    def parse_text(self, code: str):
+    def _pycparse(self, text, filename, builtin_typedefs):
+        """
+        pycparser's AST of `text`. A recursive-descent pycparser runs out
+        of Python stack on deeply nested code; such a parse is retried
+        with a deep stack rather than reported.
+        """
+        self.parser.builtin_typedefs = builtin_typedefs
         try:
-            clean = self._strip_directives(code)
-            ast = self.parser.parse(clean)
-            if ast is not None:
-                analyzer = TaintAnalyzer()
-                analyzer.visit(ast)
-                self.tainted_vars = analyzer._taint_vars
-            global last_parser
-            last_parser = self
-            return ast
+            return self.parser.parse(text, filename)
+        except RecursionError:
+            return _deep_call(self.parser.parse, text, filename)
+
+    def _parse_chunks(self, text, filename, builtin_typedefs, memo):
+        """
+        Parse top-level declarations one by one (see parser.chunks); a chunk
+        pycparser rejects is reported and skipped. Typedef names declared by
+        earlier chunks are passed on as builtin names. With `memo`, chunks
+        whose text and typedef context are unchanged since an earlier parse
+        are reused instead of re-parsed.
+        """
+        typedefs = set(builtin_typedefs)
+        ext = []
+        used = set()
+        self._unit_chunks = split_chunks(text, filename)
+        for chunk in self._unit_chunks:
+            key = (chunk.file, chunk.text, frozenset(typedefs))
+            # a unit repeating a chunk gets distinct nodes for each copy
+            entry = self._chunk_memo.get(key) if memo and key not in used else None
+            if entry is not None:
+                self._chunk_memo.move_to_end(key)
+                if entry[0] != chunk.line:
+                    _shift_lines(entry, chunk.line - entry[0], chunk.file)
+            else:
+                entry = [chunk.line, [], frozenset(), []]
+                try:
+                    entry[1] = self._pycparse(chunk.source(), filename, key[2]).ext
+                    entry[2] = frozenset(node.name for node in entry[1]
+                                         if isinstance(node, c_ast.Typedef))
+                except Exception as exc:
+                    entry[2] = typedef_names(chunk.text.split("\n"))
+                    entry[3].append(_diagnostic(exc, chunk.file, chunk.line,
+                                                "declaration skipped"))
+                if memo:
+                    self._chunk_memo[key] = entry
+                    if len(self._chunk_memo) > _CHUNK_MEMO_SIZE:
+                        self._chunk_memo.popitem(last=False)
+            used.add(key)
+            ext.extend(entry[1])
+            typedefs.update(entry[2])
+            self.diagnostics.extend(dict(d) for d in entry[3])
+        return c_ast.FileAST(ext)
+
+    def stage(self, filename, name):
+        """Context measuring a stage of `filename` in self.profile, if there is one."""
+        if self.profile is None:
+            return nullcontext()
+        return self.profile.measure(filename, name, "stage")
+
+    def _diagnose(self, exc, filename):
+        self.diagnostics.append(_diagnostic(exc, filename, None))
+
+    def _parse_unit(self, code, filename, preprocessed):
+        if preprocessed is None:
+            with self.stage(filename, "preprocess"):
+                preprocessed = self.preprocess(code, filename)
+        self.preprocessed = preprocessed
+        self._unit_name = filename
+        self._unit_chunks = None
+        self.diagnostics.extend(preprocessed.diagnostics)
+        with self.stage(filename, "parse"):
+            ast = self._parse(preprocessed.text, filename, preprocessed.builtin_typedefs)
+        self.index = NodeIndex(ast)
+        return ast
+
+    def unit_chunks(self):
+        """Top-level chunks (parser.chunks.Chunk) of the last parsed unit."""
+        if self._unit_chunks is None and self.preprocessed is not None:
+            self._unit_chunks = split_chunks(self.preprocessed.text, self._unit_name)
+        return self._unit_chunks
+
+    def parse_text(self, code: str, filename: str = "<unknown>", preprocessed=None):
+        """
+        Preprocess and parse code; pass `preprocessed` when it was already run.
+        Problems are left in self.diagnostics; returns None when the unit
+        could not be parsed at all.
+        """
+        self.diagnostics = []
+        self.preprocessed = None
+        try:
+            return self._parse_unit(code, filename, preprocessed)
         except Exception as exc:
-            print(f"[CParser] parse_text() failed: {exc}")
+            self._diagnose(exc, filename)
             return None
-        
+
     def parse_file(self, filename: str):
+        self.diagnostics = []
+        self.preprocessed = None
         try:
             with open(filename, 'r', encoding='utf-8') as f:
                 code = f.read()
-            code = self._strip_directives(code)
-            ast = self.parser.parse(code)
-            if ast is not None:
-                analyzer = TaintAnalyzer()
-                analyzer.visit(ast)
-                self.tainted_vars = analyzer._taint_vars
-            global last_parser
-            last_parser = self
-            return ast
-        except Exception as e:
-            print(f"Parsing C File Error: {e}")
+            return self._parse_unit(code, filename, None)
+        except Exception as exc:
+            self._diagnose(exc, filename)
             return None
-        
-    def get_tainted_vars(self):
-        return self.checker._taint_vars if self.checker else set()
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Chunking:
+splits a preprocessed translation unit into top-level declarations so they
+can be parsed one by one. A construct pycparser rejects then only costs
+its own chunk, and a re-parse after an edit can reuse every chunk whose
+text did not change.
+
+A chunk ends at a line whose last token closes a top-level declaration:
+a `;` outside any braces or parentheses, or the `}` closing a function
+body. Several declarations on one line stay in one chunk, so chunk
+boundaries never fall mid-line and columns are unaffected.
+"""
+import re
+
+_LINE_MARKER_RE = re.compile(r'#\s*(?:line\s+)?(\d+)(?:\s+"((?:\\.|[^"\\])*)")?')
+
+# literals (skipped whole) and the punctuation that matters for nesting
+_TOKEN_RE = re.compile(r'''"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|[{}();]''')
+
+
+class Chunk:
+    __slots__ = ("file", "line", "text")
+
+    def __init__(self, file, line, text):
+        # position of the chunk's first line
+        self.file = file
+        self.line = line
+        # source lines of the chunk, possibly with line markers inside
+        self.text = text
+
+    def source(self):
+        """Text for pycparser: the chunk behind a marker restoring its position."""
+        return f'# {self.line} "{self.file}"\n{self.text}'
+
+
+def split_chunks(text, filename):
+    """Split preprocessed text into a list of Chunks."""
+    chunks = []
+    file, line = filename, 1
+    # position and lines of the chunk being collected, None between chunks
+    start = None
+    lines = []
+    depth = 0
+    # brace depth at which the current function body opened
+    body_depth = None
+    # last character of the previous source line
+    prev = None
+    for raw in text.split("\n"):
+        stripped = raw.lstrip()
+        if stripped.startswith("#"):
+            m = _LINE_MARKER_RE.match(stripped)
+            if start is not None:
+                lines.append(raw)
+            if m:
+                line = int(m.group(1))
+                if m.group(2) is not None:
+                    file = m.group(2)
+                continue
+            line += 1
+            continue
+
+        stripped = stripped.rstrip()
+        if not stripped:
+            if start is not None:
+                lines.append(raw)
+            line += 1
+            continue
+        if start is None:
+            start = (file, line)
+        # end of the last declaration-closing token on the line
+        closed_at = None
+        for m in _TOKEN_RE.finditer(raw):
+            tok = m.group()
+            if tok == "{":
+                if depth == 0:
+                    before = raw[:m.start()].rstrip()
+                    if (before[-1] if before else prev) == ")":
+                        body_depth = 0
+                depth += 1
+            elif tok == "(":
+                depth += 1
+            elif tok == ")" or tok == "}":
+                depth = max(depth - 1, 0)
+                if tok == "}" and depth == 0 and body_depth == 0:
+                    body_depth = None
+                    closed_at = m.end()
+            elif tok == ";" and depth == 0:
+                closed_at = m.end()
+        prev = stripped[-1]
+        closed = closed_at is not None and not raw[closed_at:].strip()
+        if start is not None:
+            lines.append(raw)
+            if closed:
+                chunks.append(Chunk(start[0], start[1], "\n".join(lines)))
+                start = None
+                lines = []
+                prev = None
+        line += 1
+    if start is not None:
+        chunks.append(Chunk(start[0], start[1], "\n".join(lines)))
+    return chunks
@@ -0,0 +1,27 @@
+/*
+ * Compiler extensions pycparser cannot parse, erased or rewritten into
+ * plain C. Names the checker rules match on (NULL, errno, stdin, assert,
+ * SIG_IGN, ...) are deliberately left undefined so they stay identifiers.
+ */
+#ifndef _FAKE_DEFINES_H
+#define _FAKE_DEFINES_H
+
+#define __attribute__(x)
+#define __attribute(x)
+#define __declspec(x)
+#define __extension__
+#define __asm__(x)
+#define __asm(x)
+#define __inline__ inline
+#define __inline inline
+#define __restrict__ restrict
+#define __restrict restrict
+#define __volatile__ volatile
+#define __const const
+#define __signed__ signed
+#define __thread _Thread_local
+#define __builtin_expect(e, c) (e)
+#define __builtin_offsetof(t, m) offsetof(t, m)
+#define __typeof__(x) int
+
+#endif
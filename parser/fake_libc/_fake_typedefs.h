@@ -0,0 +1,138 @@
+/*
+ * Every libc typedef the bundled headers provide. The real definitions do
+ * not matter to the rules, only that the names parse as types: the
+ * preprocessor hands the parser these names instead of the declarations.
+ */
+#ifndef _FAKE_TYPEDEFS_H
+#define _FAKE_TYPEDEFS_H
+
+typedef int size_t;
+typedef int ssize_t;
+typedef int rsize_t;
+typedef int errno_t;
+typedef int ptrdiff_t;
+typedef int max_align_t;
+typedef int wchar_t;
+typedef int wint_t;
+typedef int wctype_t;
+typedef int wctrans_t;
+typedef int mbstate_t;
+typedef int char16_t;
+typedef int char32_t;
+
+typedef int int8_t;
+typedef int uint8_t;
+typedef int int16_t;
+typedef int uint16_t;
+typedef int int32_t;
+typedef int uint32_t;
+typedef int int64_t;
+typedef int uint64_t;
+typedef int int_least8_t;
+typedef int uint_least8_t;
+typedef int int_least16_t;
+typedef int uint_least16_t;
+typedef int int_least32_t;
+typedef int uint_least32_t;
+typedef int int_least64_t;
+typedef int uint_least64_t;
+typedef int int_fast8_t;
+typedef int uint_fast8_t;
+typedef int int_fast16_t;
+typedef int uint_fast16_t;
+typedef int int_fast32_t;
+typedef int uint_fast32_t;
+typedef int int_fast64_t;
+typedef int uint_fast64_t;
+typedef int intptr_t;
+typedef int uintptr_t;
+typedef int intmax_t;
+typedef int uintmax_t;
+typedef int float_t;
+typedef int double_t;
+
+typedef int off_t;
+typedef int off64_t;
+typedef int pid_t;
+typedef int uid_t;
+typedef int gid_t;
+typedef int mode_t;
+typedef int dev_t;
+typedef int ino_t;
+typedef int nlink_t;
+typedef int blksize_t;
+typedef int blkcnt_t;
+typedef int fsblkcnt_t;
+typedef int fsfilcnt_t;
+typedef int id_t;
+typedef int key_t;
+typedef int useconds_t;
+typedef int suseconds_t;
+typedef int time_t;
+typedef int clock_t;
+typedef int clockid_t;
+typedef int timer_t;
+typedef int locale_t;
+typedef int socklen_t;
+typedef int sa_family_t;
+typedef int in_addr_t;
+typedef int in_port_t;
+typedef int nfds_t;
+typedef int fd_set;
+
+typedef int FILE;
+typedef int fpos_t;
+typedef int DIR;
+typedef int div_t;
+typedef int ldiv_t;
+typedef int lldiv_t;
+typedef int jmp_buf;
+typedef int sigjmp_buf;
+typedef int sig_atomic_t;
+typedef int sigset_t;
+typedef int siginfo_t;
+typedef int regex_t;
+typedef int regmatch_t;
+typedef int regoff_t;
+typedef int __builtin_va_list;
+typedef int va_list;
+
+typedef int pthread_t;
+typedef int pthread_attr_t;
+typedef int pthread_mutex_t;
+typedef int pthread_mutexattr_t;
+typedef int pthread_cond_t;
+typedef int pthread_condattr_t;
+typedef int pthread_key_t;
+typedef int pthread_once_t;
+typedef int pthread_rwlock_t;
+typedef int pthread_rwlockattr_t;
+typedef int pthread_spinlock_t;
+typedef int pthread_barrier_t;
+typedef int pthread_barrierattr_t;
+typedef int thrd_t;
+typedef int thrd_start_t;
+typedef int mtx_t;
+typedef int cnd_t;
+typedef int tss_t;
+typedef int tss_dtor_t;
+typedef int once_flag;
+
+typedef int atomic_flag;
+typedef int atomic_bool;
+typedef int atomic_char;
+typedef int atomic_schar;
+typedef int atomic_uchar;
+typedef int atomic_short;
+typedef int atomic_ushort;
+typedef int atomic_int;
+typedef int atomic_uint;
+typedef int atomic_long;
+typedef int atomic_ulong;
+typedef int atomic_llong;
+typedef int atomic_ullong;
+typedef int atomic_size_t;
+typedef int atomic_intptr_t;
+typedef int atomic_uintptr_t;
+
+#endif
@@ -0,0 +1,14 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+#define O_RDONLY 0
+#define O_WRONLY 1
+#define O_RDWR 2
+#define O_CREAT 0100
+#define O_EXCL 0200
+#define O_NOCTTY 0400
+#define O_TRUNC 01000
+#define O_APPEND 02000
+#define O_NONBLOCK 04000
+#define O_NOFOLLOW 0400000
+#define O_CLOEXEC 02000000
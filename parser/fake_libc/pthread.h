@@ -0,0 +1,7 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+#define PTHREAD_MUTEX_INITIALIZER {0}
+#define PTHREAD_COND_INITIALIZER {0}
+#define PTHREAD_RWLOCK_INITIALIZER {0}
+#define PTHREAD_ONCE_INIT 0
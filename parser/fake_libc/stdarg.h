@@ -0,0 +1,4 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+#define va_arg(ap, type) (*(type *)(ap))
@@ -0,0 +1,7 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+typedef _Bool bool;
+#define true 1
+#define false 0
+#define __bool_true_false_are_defined 1
@@ -0,0 +1,11 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+#define BUFSIZ 8192
+#define FILENAME_MAX 4096
+#define FOPEN_MAX 16
+#define L_tmpnam 20
+#define TMP_MAX 238328
+#define SEEK_SET 0
+#define SEEK_CUR 1
+#define SEEK_END 2
@@ -0,0 +1,7 @@
+#include "_fake_defines.h"
+#include "_fake_typedefs.h"
+
+#define EXIT_SUCCESS 0
+#define EXIT_FAILURE 1
+#define RAND_MAX 2147483647
+#define MB_CUR_MAX 1
@@ -0,0 +1,85 @@
+"""
+Per-translation-unit node index shared by all rules:
+nodes by type, call sites by callee name, parent pointers, the enclosing
+function of every node and its pre-order position.
+"""
+from pycparser import c_ast
+
+
+class NodeIndex:
+    def __init__(self, ast):
+        self.ast = ast
+        self._built = False
+
+    def _build(self):
+        self._by_type = {}
+        self._calls = {}
+        self._functions = {}
+        self._parent = {}
+        self._enclosing = {}
+        self._position = {}
+        if self.ast is not None:
+            # explicit stack, children pushed reversed to keep pre-order
+            stack = [(self.ast, None, None)]
+            while stack:
+                node, parent, func = stack.pop()
+                self._position[node] = len(self._position)
+                self._parent[node] = parent
+                self._enclosing[node] = func
+                node_type = node.__class__.__name__
+                self._by_type.setdefault(node_type, []).append(node)
+                if node_type == "FuncDef":
+                    self._functions[node.decl.name] = node
+                    func = node
+                elif node_type == "FuncCall" and isinstance(node.name, c_ast.ID):
+                    self._calls.setdefault(node.name.name, []).append(node)
+                stack.extend((child, node, func) for child in reversed(list(node)))
+        self._built = True
+
+    def nodes(self, node_type):
+        """All nodes of the given c_ast class name, in source order."""
+        if not self._built:
+            self._build()
+        return self._by_type.get(node_type, [])
+
+    def calls(self, name):
+        """Call sites whose callee is the identifier `name`, in source order."""
+        if not self._built:
+            self._build()
+        return self._calls.get(name, [])
+
+    def calls_to(self, names):
+        """Call sites of any of `names`, merged back into source order."""
+        if not self._built:
+            self._build()
+        found = [call for name in names for call in self._calls.get(name, ())]
+        found.sort(key=self._position.__getitem__)
+        return found
+
+    def function(self, name):
+        """FuncDef with the given name, or None if it is not defined in this unit."""
+        if not self._built:
+            self._build()
+        return self._functions.get(name)
+
+    def parent(self, node):
+        if not self._built:
+            self._build()
+        return self._parent.get(node)
+
+    def enclosing_function(self, node):
+        """Innermost FuncDef containing `node` (None at file scope)."""
+        if not self._built:
+            self._build()
+        return self._enclosing.get(node)
+
+    def size(self):
+        """Number of nodes in the unit."""
+        if not self._built:
+            self._build()
+        return len(self._position)
+
+    def position(self, node):
+        if not self._built:
+            self._build()
+        return self._position[node]
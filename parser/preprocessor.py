@@ -0,0 +1,831 @@
+"""
+Preprocessor:
+a pure-Python C preprocessor run before pycparser. It expands object- and
+function-like macros, evaluates conditionals and splices #included headers
+into the unit. <...> headers not found on the include path resolve against
+the fake libc in parser/fake_libc, which only provides typedefs and a few
+constants. Fake-libc typedefs are not passed on as text: their names are
+reported as builtin typedefs for the parser to treat as type names, which
+spares reparsing them in every unit.
+
+Every header's expansion is memoized per (path, file stamp, macro state at
+the point of inclusion). The memo entry also holds the macros the header
+leaves defined and the typedef names it declares. A header that thousands
+of units include under the same configuration is processed once per
+process.
+
+The output keeps the source's numbering. Each source line becomes one
+output line, and spliced-in headers are wrapped in `# N "file"` line markers,
+which pycparser folds into node coordinates.
+"""
+import os
+import re
+from collections import OrderedDict
+
+# bump when the output for a given input changes (part of cache keys)
+PREPROCESSOR_VERSION = 1
+
+FAKE_LIBC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_libc")
+
+# seen by every unit even without an #include: sample code and snippets
+# routinely use size_t, FILE or pthread_t without including anything
+IMPLICIT_INCLUDES = ("_fake_defines.h", "_fake_typedefs.h")
+
+PREDEFINED = {
+    "__STDC__": "1",
+    "__STDC_VERSION__": "201112L",
+    "__STDC_HOSTED__": "1",
+}
+
+MAX_INCLUDE_DEPTH = 200
+
+# memoized header expansions kept per Preprocessor
+_MEMO_SIZE = 4096
+
+# how many following lines a function-like macro call may span
+_MAX_CALL_LINES = 64
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>[ \t\f\v\r]+)
+  | (?P<str>(?:u8|[LuU])?"(?:\\.|[^"\\\n])*"?)
+  | (?P<chr>(?:u8|[LuU])?'(?:\\.|[^'\\\n])*'?)
+  | (?P<id>[A-Za-z_$][\w$]*)
+  | (?P<num>\.?\d(?:[eEpP][+-]|[\w.])*)
+  | (?P<punct>\.\.\.|<<=|>>=|->|\+\+|--|<<|>>|<=|>=|==|!=|&&|\|\||[-+*/%&^|]=|\#\#
+              |[][(){}.&*+\-~!/%<>^|?:;=,\#])
+  | (?P<other>.)
+""", re.X)
+
+_COMMENT_RE = re.compile(
+    r"""//[^\n]*|/\*.*?\*/|/\*.*|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'""", re.S)
+
+_IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+
+_TYPEDEF_RE = re.compile(r"\btypedef\b([^;]*);")
+
+_INT_SUFFIX_RE = re.compile(r"[uUlL]+$")
+
+_CHAR_ESCAPES = {"n": 10, "t": 9, "r": 13, "0": 0, "a": 7, "b": 8, "f": 12, "v": 11,
+                 "\\": 92, "'": 39, '"': 34, "?": 63}
+
+
+class Token:
+    __slots__ = ("kind", "text", "space", "hide")
+
+    def __init__(self, kind, text, space=False, hide=frozenset()):
+        self.kind = kind
+        self.text = text
+        # preceded by whitespace in the source
+        self.space = space
+        # names of the macros whose expansion produced this token
+        self.hide = hide
+
+
+def tokenize(text):
+    tokens = []
+    space = False
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "ws":
+            space = True
+            continue
+        tokens.append(Token(kind, m.group(), space))
+        space = False
+    return tokens
+
+
+class Macro:
+    __slots__ = ("name", "params", "variadic", "body", "_key", "_hash")
+
+    def __init__(self, name, params, variadic, body):
+        self.name = name
+        # tuple of parameter names, None for object-like macros
+        self.params = params
+        self.variadic = variadic
+        self.body = body
+        self._key = (name, params, variadic,
+                     tuple((t.kind, t.text, t.space) for t in body))
+        self._hash = hash(self._key)
+
+    def __eq__(self, other):
+        return isinstance(other, Macro) and self._key == other._key
+
+    def __hash__(self):
+        return self._hash
+
+
+class Preprocessed:
+    """Result of Preprocessor.run() for one translation unit."""
+    def __init__(self, text, deps, typedefs, builtin_typedefs, diagnostics):
+        # source handed to pycparser
+        self.text = text
+        # (path, mtime_ns, size) of every user header the unit included
+        self.deps = deps
+        # typedef names declared by the included user headers (present in text)
+        self.typedefs = typedefs
+        # typedef names from the fake libc (absent from text, known to the parser)
+        self.builtin_typedefs = builtin_typedefs
+        # dicts with file, line, column (None), severity and message
+        self.diagnostics = diagnostics
+
+
+class _Header:
+    """Memoized expansion of one header under one macro state."""
+    __slots__ = ("lines", "macros", "once", "deps", "typedefs", "builtin_typedefs")
+
+    def __init__(self, lines, macros, once, deps, typedefs, builtin_typedefs):
+        self.lines = lines
+        # name -> Macro (or None when #undef'd) for every macro it changed
+        self.macros = macros
+        self.once = once
+        self.deps = deps
+        self.typedefs = typedefs
+        self.builtin_typedefs = builtin_typedefs
+
+
+class _Unit:
+    """Mutable state while preprocessing one translation unit."""
+    def __init__(self, macros):
+        self.macros = macros
+        self.once = set()
+        self.deps = []
+        self.typedefs = set()
+        self.builtin_typedefs = set()
+        self.diagnostics = []
+        self.depth = 0
+
+
+class Preprocessor:
+    def __init__(self, include_dirs=(), defines=None, implicit_includes=IMPLICIT_INCLUDES):
+        self.include_dirs = [os.path.abspath(d) for d in include_dirs]
+        self.defines = dict(PREDEFINED)
+        self.defines.update(defines or {})
+        self.implicit_includes = tuple(implicit_includes)
+        self._predefined = {}
+        for name, value in self.defines.items():
+            macro = self._parse_define(tokenize(f"{name} {value}"))
+            if macro is not None:
+                self._predefined[macro.name] = macro
+        self._memo = OrderedDict()
+        self._options_key = None
+
+    def options_key(self):
+        """Describes everything besides the source that shapes the output."""
+        if self._options_key is None:
+            import hashlib
+            h = hashlib.sha256()
+            for root, dirs, files in os.walk(FAKE_LIBC_DIR):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    h.update(os.path.relpath(path, FAKE_LIBC_DIR).encode("utf-8"))
+                    with open(path, "rb") as f:
+                        h.update(f.read())
+            defines = ",".join(f"{k}={v}" for k, v in sorted(self.defines.items()))
+            self._options_key = (f"cpp{PREPROCESSOR_VERSION}:{h.hexdigest()[:16]}:"
+                                 f"I={os.pathsep.join(self.include_dirs)}:D={defines}:"
+                                 f"implicit={','.join(self.implicit_includes)}")
+        return self._options_key
+
+    def run(self, text, filename="<unknown>"):
+        unit = _Unit(dict(self._predefined))
+        out = []
+        for name in self.implicit_includes:
+            self._include(unit, os.path.join(FAKE_LIBC_DIR, name), out, filename, 1)
+        self._process(unit, filename, text, out)
+        return Preprocessed("\n".join(out) + "\n", unit.deps, unit.typedefs,
+                            unit.builtin_typedefs, unit.diagnostics)
+
+    # -- source lines ------------------------------------------------------
+
+    @staticmethod
+    def _logical_lines(text):
+        """
+        Split text into (line, first physical line number, physical line count)
+        after joining backslash continuations and blanking out comments.
+        """
+        physical = text.replace("\r\n", "\n").split("\n")
+        lines = []
+        i = 0
+        while i < len(physical):
+            start = i
+            parts = [physical[i]]
+            while parts[-1].endswith("\\") and i + 1 < len(physical):
+                parts[-1] = parts[-1][:-1]
+                i += 1
+                parts.append(physical[i])
+            lines.append(["".join(parts), start + 1, i - start + 1])
+            i += 1
+        if "/" not in text:
+            return lines
+
+        def blank(m):
+            s = m.group()
+            if s.startswith("/*"):
+                return " " + "\n" * s.count("\n")
+            return " " if s.startswith("//") else s
+
+        stripped = _COMMENT_RE.sub(blank, "\n".join(line[0] for line in lines)).split("\n")
+        for line, clean in zip(lines, stripped):
+            line[0] = clean
+        return lines
+
+    def _process(self, unit, path, text, out):
+        macros = unit.macros
+        lines = self._logical_lines(text)
+        # one [parent active, some branch taken] entry per open conditional
+        conds = []
+        active = True
+        i = 0
+        while i < len(lines):
+            line, lineno, span = lines[i]
+            i += 1
+            stripped = line.lstrip()
+            if stripped.startswith("#"):
+                tokens = tokenize(stripped)[1:]
+                directive = tokens[0].text if tokens else ""
+                args = tokens[1:]
+                if directive in ("if", "ifdef", "ifndef"):
+                    if not active:
+                        conds.append([False, True])
+                    else:
+                        if directive == "if":
+                            value = self._condition(unit, args, path, lineno)
+                        else:
+                            value = bool(args) and args[0].text in macros
+                            if directive == "ifndef":
+                                value = not value
+                        conds.append([True, value])
+                        active = value
+                elif directive in ("elif", "else", "endif"):
+                    if not conds:
+                        self._diagnose(unit, path, lineno, f"#{directive} without #if")
+                    elif directive == "endif":
+                        active = conds.pop()[0]
+                    elif directive == "else":
+                        active = conds[-1][0] and not conds[-1][1]
+                        conds[-1][1] = True
+                    elif conds[-1][0] and not conds[-1][1]:
+                        active = self._condition(unit, args, path, lineno)
+                        conds[-1][1] = active
+                    else:
+                        active = False
+                elif not active:
+                    pass
+                elif directive == "define":
+                    macro = self._parse_define(args)
+                    if macro is None:
+                        self._diagnose(unit, path, lineno, "malformed #define")
+                    else:
+                        macros[macro.name] = macro
+                elif directive == "undef":
+                    if args:
+                        macros.pop(args[0].text, None)
+                elif directive in ("include", "include_next"):
+                    if self._include_directive(unit, args, path, lineno, span, out):
+                        continue
+                elif directive == "pragma":
+                    if args and args[0].text == "once":
+                        unit.once.add(path)
+                elif directive == "line":
+                    # the source renumbers itself; pass it on to pycparser
+                    out.append(stripped)
+                    out.extend([""] * (span - 1))
+                    continue
+                elif directive in ("error", "warning"):
+                    self._diagnose(unit, path, lineno,
+                                   f"#{directive} {' '.join(t.text for t in args)}",
+                                   "error" if directive == "error" else "warning")
+                out.extend([""] * span)
+                continue
+
+            if not active:
+                out.extend([""] * span)
+                continue
+            if not any(word in macros or word in ("__LINE__", "__FILE__")
+                       for word in _IDENT_RE.findall(line)):
+                out.append(line)
+                out.extend([""] * (span - 1))
+                continue
+
+            tokens = tokenize(line)
+            # a function-like macro call may continue on the following lines
+            joined = 0
+            while (joined < _MAX_CALL_LINES and i < len(lines)
+                   and not lines[i][0].lstrip().startswith("#")
+                   and self._open_call(tokens, macros)):
+                more = tokenize(lines[i][0])
+                if more:
+                    more[0].space = True
+                tokens.extend(more)
+                span += lines[i][2]
+                i += 1
+                joined += 1
+            expanded = self._expand(unit, tokens, path, lineno)
+            indent = line[:len(line) - len(line.lstrip())]
+            out.append(indent + self._render(expanded))
+            out.extend([""] * (span - 1))
+
+        if conds:
+            self._diagnose(unit, path, len(lines), "unterminated #if")
+
+    @staticmethod
+    def _open_call(tokens, macros):
+        depth = 0
+        calls = False
+        for t in tokens:
+            if t.text == "(":
+                depth += 1
+            elif t.text == ")":
+                depth -= 1
+            elif t.kind == "id":
+                macro = macros.get(t.text)
+                if macro is not None and macro.params is not None:
+                    calls = True
+        return calls and depth > 0
+
+    @staticmethod
+    def _render(tokens):
+        parts = []
+        prev = None
+        for t in tokens:
+            if prev is not None and (
+                    t.space
+                    or (prev.kind in ("id", "num") and t.kind in ("id", "num"))
+                    or (prev.kind == "punct" and t.kind == "punct")):
+                parts.append(" ")
+            parts.append(t.text)
+            prev = t
+        return "".join(parts)
+
+    @staticmethod
+    def _diagnose(unit, path, line, message, severity="warning"):
+        unit.diagnostics.append({"file": path, "line": line, "column": None,
+                                 "severity": severity, "message": message})
+
+    # -- #define -----------------------------------------------------------
+
+    @staticmethod
+    def _parse_define(tokens):
+        if not tokens or tokens[0].kind != "id":
+            return None
+        name = tokens[0].text
+        if len(tokens) > 1 and tokens[1].text == "(" and not tokens[1].space:
+            params = []
+            variadic = False
+            i = 2
+            while i < len(tokens) and tokens[i].text != ")":
+                t = tokens[i]
+                if t.text == "...":
+                    params.append("__VA_ARGS__")
+                    variadic = True
+                elif t.kind == "id":
+                    if i + 1 < len(tokens) and tokens[i + 1].text == "...":
+                        # GNU named variadic parameter: args...
+                        variadic = True
+                        i += 1
+                    params.append(t.text)
+                elif t.text != ",":
+                    return None
+                i += 1
+            if i >= len(tokens):
+                return None
+            body = tokens[i + 1:]
+            return Macro(name, tuple(params), variadic, tuple(body))
+        return Macro(name, None, False, tuple(tokens[1:]))
+
+    # -- #include ----------------------------------------------------------
+
+    def _include_directive(self, unit, args, path, lineno, span, out):
+        """Splice in an #include; returns False when nothing was included."""
+        if args and args[0].kind not in ("str", "punct"):
+            args = self._expand(unit, args, path, lineno)
+        if not args:
+            self._diagnose(unit, path, lineno, "malformed #include")
+            return False
+        if args[0].kind == "str":
+            name, quoted = args[0].text[1:-1], True
+        elif args[0].text == "<":
+            texts = []
+            for t in args[1:]:
+                if t.text == ">":
+                    break
+                texts.append((" " if t.space and texts else "") + t.text)
+            name, quoted = "".join(texts), False
+        else:
+            self._diagnose(unit, path, lineno, "malformed #include")
+            return False
+
+        found = self._resolve(name, quoted, path)
+        if found is None:
+            self._diagnose(unit, path, lineno, f"header not found: {name}")
+            return False
+        if unit.depth >= MAX_INCLUDE_DEPTH:
+            self._diagnose(unit, path, lineno, f"#include nested too deeply: {name}", "error")
+            return False
+        self._include(unit, found, out, path, lineno + span)
+        return True
+
+    def _resolve(self, name, quoted, includer):
+        if os.path.isabs(name):
+            return name if os.path.isfile(name) else None
+        dirs = list(self.include_dirs)
+        if quoted:
+            dirs.insert(0, os.path.dirname(os.path.abspath(includer)))
+        dirs.append(FAKE_LIBC_DIR)
+        for directory in dirs:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                return os.path.normpath(candidate)
+        return None
+
+    def _include(self, unit, path, out, includer, resume_line):
+        """Append the expansion of header `path`, then resume `includer` at resume_line."""
+        if path in unit.once:
+            out.append(_line_marker(resume_line, includer))
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._diagnose(unit, includer, resume_line - 1, f"cannot read header: {path}")
+            return
+        key = (path, st.st_mtime_ns, st.st_size,
+               frozenset(unit.macros.items()), frozenset(unit.once))
+        header = self._memo.get(key)
+        if header is None:
+            header = self._expand_header(unit, path, st)
+            self._memo[key] = header
+            if len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+            for name, macro in header.macros.items():
+                if macro is None:
+                    unit.macros.pop(name, None)
+                else:
+                    unit.macros[name] = macro
+            unit.once |= header.once
+            unit.deps.extend(header.deps)
+        unit.typedefs |= header.typedefs
+        unit.builtin_typedefs |= header.builtin_typedefs
+        # the marker also keeps units that differ only in which fake headers
+        # they include (and so in their builtin typedefs) from sharing a text
+        out.append(_line_marker(1, path))
+        out.extend(header.lines)
+        out.append(_line_marker(resume_line, includer))
+
+    def _expand_header(self, unit, path, st):
+        before = dict(unit.macros)
+        once_before = set(unit.once)
+        deps_start = len(unit.deps)
+        fake = path.startswith(FAKE_LIBC_DIR + os.sep)
+        if not fake:
+            unit.deps.append((path, st.st_mtime_ns, st.st_size))
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        lines = []
+        outer_builtins = unit.builtin_typedefs
+        unit.builtin_typedefs = set()
+        unit.depth += 1
+        try:
+            self._process(unit, path, text, lines)
+        finally:
+            unit.depth -= 1
+            builtins = unit.builtin_typedefs
+            unit.builtin_typedefs = outer_builtins | builtins
+        changed = {name: macro for name, macro in unit.macros.items()
+                   if before.get(name) is not macro}
+        changed.update((name, None) for name in before if name not in unit.macros)
+        typedefs = typedef_names(lines)
+        if fake:
+            builtins |= typedefs
+            unit.builtin_typedefs |= typedefs
+            lines, typedefs = [], frozenset()
+        return _Header(lines, changed, unit.once - once_before,
+                       unit.deps[deps_start:], typedefs, frozenset(builtins))
+
+    # -- macro expansion ---------------------------------------------------
+
+    def _expand(self, unit, tokens, path, lineno):
+        """Fully macro-expand tokens (hide sets stop recursive expansion)."""
+        macros = unit.macros
+        out = []
+        # reversed, so the next token is pending[-1]
+        pending = list(reversed(tokens))
+        while pending:
+            t = pending.pop()
+            if t.kind != "id" or t.text in t.hide:
+                out.append(t)
+                continue
+            name = t.text
+            if name == "__LINE__":
+                out.append(Token("num", str(lineno), t.space))
+                continue
+            if name == "__FILE__":
+                out.append(Token("str", '"' + path.replace("\\", "\\\\") + '"', t.space))
+                continue
+            macro = macros.get(name)
+            if macro is None:
+                out.append(t)
+                continue
+            if macro.params is None:
+                body = self._substitute(unit, macro, None, t.hide | {name}, t.space,
+                                        path, lineno)
+                pending.extend(reversed(body))
+                continue
+            if not pending or pending[-1].text != "(":
+                out.append(t)
+                continue
+            collected = self._collect_args(pending, macro)
+            if collected is None:
+                out.append(t)
+                continue
+            args, rparen = collected
+            body = self._substitute(unit, macro, args, (t.hide & rparen.hide) | {name},
+                                    t.space, path, lineno)
+            pending.extend(reversed(body))
+        return out
+
+    @staticmethod
+    def _collect_args(pending, macro):
+        """
+        Pop `( args )` off the pending stack. Returns (args, closing paren),
+        or None with the stack untouched when the call is incomplete or has
+        the wrong number of arguments.
+        """
+        taken = [pending.pop()]
+        args = [[]]
+        depth = 0
+        while pending:
+            t = pending.pop()
+            taken.append(t)
+            if t.text == "(":
+                depth += 1
+            elif t.text == ")":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif t.text == "," and depth == 0 and not (
+                    macro.variadic and len(args) == len(macro.params)):
+                args.append([])
+                continue
+            args[-1].append(t)
+        else:
+            pending.extend(reversed(taken))
+            return None
+        params = macro.params
+        if len(params) == 0 and args == [[]]:
+            args = []
+        elif macro.variadic and len(args) == len(params) - 1:
+            args.append([])
+        if len(args) != len(params):
+            pending.extend(reversed(taken))
+            return None
+        return args, taken[-1]
+
+    def _substitute(self, unit, macro, args, hide, space, path, lineno):
+        body = macro.body
+        index = {name: i for i, name in enumerate(macro.params or ())}
+        expanded_args = {}
+        result = []
+        i = 0
+        while i < len(body):
+            b = body[i]
+            if (b.text == "#" and b.kind == "punct" and macro.params is not None
+                    and i + 1 < len(body) and body[i + 1].text in index):
+                arg = args[index[body[i + 1].text]]
+                result.append(Token("str", _stringify(arg), b.space))
+                i += 2
+                continue
+            if b.text == "##" and b.kind == "punct" and result and i + 1 < len(body):
+                nxt = body[i + 1]
+                if nxt.kind == "id" and nxt.text in index:
+                    right = [Token(t.kind, t.text, t.space, t.hide)
+                             for t in args[index[nxt.text]]]
+                    if (not right and macro.variadic and nxt.text == macro.params[-1]
+                            and result[-1].text == ","):
+                        # GNU: , ## __VA_ARGS__ drops the comma when there are no varargs
+                        result.pop()
+                else:
+                    right = [Token(nxt.kind, nxt.text, nxt.space)]
+                if right:
+                    result[-1:] = _paste(result[-1], right[0]) + right[1:]
+                i += 2
+                continue
+            if b.kind == "id" and b.text in index:
+                n = index[b.text]
+                if i + 1 < len(body) and body[i + 1].text == "##":
+                    tokens = args[n]
+                else:
+                    if n not in expanded_args:
+                        expanded_args[n] = self._expand(unit, args[n], path, lineno)
+                    tokens = expanded_args[n]
+                copies = [Token(t.kind, t.text, t.space, t.hide) for t in tokens]
+                if copies:
+                    copies[0].space = b.space
+                result.extend(copies)
+                i += 1
+                continue
+            result.append(Token(b.kind, b.text, b.space))
+            i += 1
+        for t in result:
+            t.hide = t.hide | hide
+        if result:
+            result[0].space = space
+        return result
+
+    # -- #if ---------------------------------------------------------------
+
+    def _condition(self, unit, tokens, path, lineno):
+        resolved = []
+        i = 0
+        while i < len(tokens):
+            t = tokens[i]
+            if t.kind == "id" and t.text == "defined":
+                if i + 1 < len(tokens) and tokens[i + 1].text == "(":
+                    name = tokens[i + 2].text if i + 2 < len(tokens) else ""
+                    i += 4
+                else:
+                    name = tokens[i + 1].text if i + 1 < len(tokens) else ""
+                    i += 2
+                resolved.append(Token("num", "1" if name in unit.macros else "0", True))
+                continue
+            resolved.append(t)
+            i += 1
+        expanded = self._expand(unit, resolved, path, lineno)
+        try:
+            return _ConditionParser(expanded).parse() != 0
+        except (ValueError, IndexError):
+            self._diagnose(unit, path, lineno,
+                           "cannot evaluate #if " + self._render(tokens))
+            return False
+
+
+def _line_marker(line, filename):
+    # pycparser takes the name verbatim (no escape processing)
+    return f'# {line} "{filename.replace(chr(92), "/")}"'
+
+
+def _stringify(tokens):
+    parts = []
+    for t in tokens:
+        text = t.text
+        if t.kind in ("str", "chr"):
+            text = text.replace("\\", "\\\\").replace('"', '\\"')
+        parts.append((" " if t.space and parts else "") + text)
+    return '"' + "".join(parts) + '"'
+
+
+def _paste(left, right):
+    tokens = tokenize(left.text + right.text)
+    if len(tokens) != 1:
+        # not a valid token; keep both sides rather than fail the unit
+        return [Token(left.kind, left.text, left.space, left.hide),
+                Token(right.kind, right.text, False, right.hide)]
+    t = tokens[0]
+    t.space = left.space
+    t.hide = left.hide
+    return [t]
+
+
+def typedef_names(lines):
+    """Typedef names declared by preprocessed lines (top-level typedefs only)."""
+    text = "\n".join(line for line in lines if not line.startswith("#"))
+    if "typedef" not in text:
+        return frozenset()
+    previous = None
+    while previous != text:
+        previous = text
+        text = re.sub(r"\{[^{}]*\}", " ", text)
+    names = set()
+    for m in _TYPEDEF_RE.finditer(text):
+        depth = 0
+        start = 0
+        declarators = []
+        decl = m.group(1)
+        for pos, ch in enumerate(decl):
+            if ch in "([":
+                depth += 1
+            elif ch in ")]":
+                depth -= 1
+            elif ch == "," and depth == 0:
+                declarators.append(decl[start:pos])
+                start = pos + 1
+        declarators.append(decl[start:])
+        for d in declarators:
+            pointer = re.search(r"\(\s*\*\s*([A-Za-z_]\w*)", d)
+            if pointer:
+                names.add(pointer.group(1))
+                continue
+            ids = _IDENT_RE.findall(re.sub(r"\[[^\]]*\]", "", d))
+            if ids:
+                names.add(ids[-1])
+    return frozenset(names)
+
+
+def _int_value(text):
+    text = _INT_SUFFIX_RE.sub("", text)
+    lower = text.lower()
+    if lower.startswith("0x"):
+        return int(text[2:], 16)
+    if lower.startswith("0b"):
+        return int(text[2:], 2)
+    if len(text) > 1 and text.startswith("0"):
+        return int(text, 8)
+    return int(text)
+
+
+def _char_value(text):
+    body = text[text.index("'") + 1:-1]
+    if body.startswith("\\"):
+        esc = body[1:]
+        if esc[:1] == "x":
+            return int(esc[1:], 16)
+        if esc[:1].isdigit():
+            return int(esc, 8)
+        return _CHAR_ESCAPES.get(esc, ord(esc[:1] or "\0"))
+    return ord(body[0]) if body else 0
+
+
+def _div(a, b):
+    return 0 if b == 0 else int(a / b)
+
+
+def _mod(a, b):
+    return 0 if b == 0 else a - b * int(a / b)
+
+
+_BINARY = {
+    "*": (10, lambda a, b: a * b), "/": (10, _div), "%": (10, _mod),
+    "+": (9, lambda a, b: a + b), "-": (9, lambda a, b: a - b),
+    "<<": (8, lambda a, b: a << b if b >= 0 else 0), ">>": (8, lambda a, b: a >> b if b >= 0 else 0),
+    "<": (7, lambda a, b: int(a < b)), ">": (7, lambda a, b: int(a > b)),
+    "<=": (7, lambda a, b: int(a <= b)), ">=": (7, lambda a, b: int(a >= b)),
+    "==": (6, lambda a, b: int(a == b)), "!=": (6, lambda a, b: int(a != b)),
+    "&": (5, lambda a, b: a & b), "^": (4, lambda a, b: a ^ b), "|": (3, lambda a, b: a | b),
+    "&&": (2, lambda a, b: int(bool(a) and bool(b))),
+    "||": (1, lambda a, b: int(bool(a) or bool(b))),
+}
+
+
+class _ConditionParser:
+    """Evaluates a macro-expanded #if expression; unknown identifiers are 0."""
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        value = self._ternary()
+        if self.pos != len(self.tokens):
+            raise ValueError("trailing tokens")
+        return value
+
+    def _peek(self):
+        return self.tokens[self.pos].text if self.pos < len(self.tokens) else None
+
+    def _expect(self, text):
+        if self._peek() != text:
+            raise ValueError(f"expected {text}")
+        self.pos += 1
+
+    def _ternary(self):
+        cond = self._binary(1)
+        if self._peek() == "?":
+            self.pos += 1
+            a = self._ternary()
+            self._expect(":")
+            b = self._ternary()
+            return a if cond else b
+        return cond
+
+    def _binary(self, min_prec):
+        left = self._unary()
+        while True:
+            op = _BINARY.get(self._peek())
+            if op is None or op[0] < min_prec:
+                return left
+            self.pos += 1
+            left = op[1](left, self._binary(op[0] + 1))
+
+    def _unary(self):
+        t = self.tokens[self.pos]
+        self.pos += 1
+        if t.text == "-":
+            return -self._unary()
+        if t.text == "+":
+            return self._unary()
+        if t.text == "!":
+            return int(not self._unary())
+        if t.text == "~":
+            return ~self._unary()
+        if t.text == "(":
+            value = self._ternary()
+            self._expect(")")
+            return value
+        if t.kind == "num":
+            return _int_value(t.text)
+        if t.kind == "chr":
+            return _char_value(t.text)
+        if t.kind == "id":
+            return 1 if t.text == "true" else 0
+        raise ValueError(f"unexpected {t.text!r}")
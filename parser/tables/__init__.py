@@ -0,0 +1,5 @@
+"""
+Lexer/LALR tables generated by `python -m parser.build_tables`; do not edit.
+They are only used with the pycparser version below.
+"""
+PYCPARSER_VERSION = "2.21"
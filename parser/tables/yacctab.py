@@ -0,0 +1,366 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'translation_unit_or_emptyleftLORleftLANDleftORleftXORleftANDleftEQNEleftGTGELTLEleftRSHIFTLSHIFTleftPLUSMINUSleftTIMESDIVIDEMODAUTO BREAK CASE CHAR CONST CONTINUE DEFAULT DO DOUBLE ELSE ENUM EXTERN FLOAT FOR GOTO IF INLINE INT LONG REGISTER OFFSETOF RESTRICT RETURN SHORT SIGNED SIZEOF STATIC STRUCT SWITCH TYPEDEF UNION UNSIGNED VOID VOLATILE WHILE __INT128 _BOOL _COMPLEX _NORETURN _THREAD_LOCAL _STATIC_ASSERT _ATOMIC _ALIGNOF _ALIGNAS ID TYPEID INT_CONST_DEC INT_CONST_OCT INT_CONST_HEX INT_CONST_BIN INT_CONST_CHAR FLOAT_CONST HEX_FLOAT_CONST CHAR_CONST WCHAR_CONST U8CHAR_CONST U16CHAR_CONST U32CHAR_CONST STRING_LITERAL WSTRING_LITERAL U8STRING_LITERAL U16STRING_LITERAL U32STRING_LITERAL PLUS MINUS TIMES DIVIDE MOD OR AND NOT XOR LSHIFT RSHIFT LOR LAND LNOT LT LE GT GE EQ NE EQUALS TIMESEQUAL DIVEQUAL MODEQUAL PLUSEQUAL MINUSEQUAL LSHIFTEQUAL RSHIFTEQUAL ANDEQUAL XOREQUAL OREQUAL PLUSPLUS MINUSMINUS ARROW CONDOP LPAREN RPAREN LBRACKET RBRACKET LBRACE RBRACE COMMA PERIOD SEMI COLON ELLIPSIS PPHASH PPPRAGMA PPPRAGMASTRabstract_declarator_opt : empty\n| abstract_declaratorassignment_expression_opt : empty\n| assignment_expressionblock_item_list_opt : empty\n| block_item_listdeclaration_list_opt : empty\n| declaration_listdeclaration_specifiers_no_type_opt : empty\n| declaration_specifiers_no_typedesignation_opt : empty\n| designationexpression_opt : empty\n| expressionid_init_declarator_list_opt : empty\n| id_init_declarator_listidentifier_list_opt : empty\n| identifier_listinit_declarator_list_opt : empty\n| init_declarator_listinitializer_list_opt : empty\n| initializer_listparameter_type_list_opt : empty\n| parameter_type_liststruct_declarator_list_opt : empty\n| struct_declarator_listtype_qualifier_list_opt : empty\n| type_qualifier_listdirect_id_declarator   : ID\n        direct_id_declarator   : LPAREN id_declarator RPAREN\n        direct_id_declarator   : direct_id_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n        direct_id_declarator   : direct_id_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n| direct_id_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\ndirect_id_declarator   : direct_id_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n        direct_id_declarator   : direct_id_declarator LPAREN parameter_type_list RPAREN\n| direct_id_declarator LPAREN identifier_list_opt RPAREN\ndirect_typeid_declarator   : TYPEID\n        direct_typeid_declarator   : LPAREN typeid_declarator RPAREN\n        direct_typeid_declarator   : direct_typeid_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n        direct_typeid_declarator   : direct_typeid_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n| direct_typeid_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\ndirect_typeid_declarator   : direct_typeid_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n        direct_typeid_declarator   : direct_typeid_declarator LPAREN parameter_type_list RPAREN\n| direct_typeid_declarator LPAREN identifier_list_opt RPAREN\ndirect_typeid_noparen_declarator   : TYPEID\n        direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n        direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET\n| direct_typeid_noparen_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET\ndirect_typeid_noparen_declarator   : direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET\n        direct_typeid_noparen_declarator   : direct_typeid_noparen_declarator LPAREN parameter_type_list RPAREN\n| direct_typeid_noparen_declarator LPAREN identifier_list_opt RPAREN\nid_declarator  : direct_id_declarator\n        id_declarator  : pointer direct_id_declarator\n        typeid_declarator  : direct_typeid_declarator\n        typeid_declarator  : pointer direct_typeid_declarator\n        typeid_noparen_declarator  : direct_typeid_noparen_declarator\n        typeid_noparen_declarator  : pointer direct_typeid_noparen_declarator\n        translation_unit_or_empty   : translation_unit\n| empty\ntranslation_unit    : external_declaration\n        translation_unit    : translation_unit external_declaration\n        external_declaration    : function_definition\n        external_declaration    : declaration\n        external_declaration    : pp_directive\n| pppragma_directive\nexternal_declaration    : SEMI\n        external_declaration    : static_assert\n        static_assert           : _STATIC_ASSERT LPAREN constant_expression COMMA unified_string_literal RPAREN\n| _STATIC_ASSERT LPAREN constant_expression RPAREN\npp_directive  : PPHASH\n        pppragma_directive      : PPPRAGMA\n| PPPRAGMA PPPRAGMASTR\nfunction_definition : id_declarator declaration_list_opt compound_statement\n        function_definition : declaration_specifiers id_declarator declaration_list_opt compound_statement\n        statement   : labeled_statement\n| expression_statement\n| compound_statement\n| selection_statement\n| iteration_statement\n| jump_statement\n| pppragma_directive\n| static_assert\npragmacomp_or_statement     : pppragma_directive statement\n| statement\ndecl_body : declaration_specifiers init_declarator_list_opt\n| declaration_specifiers_no_type id_init_declarator_list_opt\ndeclaration : decl_body SEMI\n        declaration_list    : declaration\n| declaration_list declaration\ndeclaration_specifiers_no_type  : type_qualifier declaration_specifiers_no_type_opt\n        declaration_specifiers_no_type  : storage_class_specifier declaration_specifiers_no_type_opt\n        declaration_specifiers_no_type  : function_specifier declaration_specifiers_no_type_opt\n        declaration_specifiers_no_type  : atomic_specifier declaration_specifiers_no_type_opt\n        declaration_specifiers_no_type  : alignment_specifier declaration_specifiers_no_type_opt\n        declaration_specifiers  : declaration_specifiers type_qualifier\n        declaration_specifiers  : declaration_specifiers storage_class_specifier\n        declaration_specifiers  : declaration_specifiers function_specifier\n        declaration_specifiers  : declaration_specifiers type_specifier_no_typeid\n        declaration_specifiers  : type_specifier\n        declaration_specifiers  : declaration_specifiers_no_type type_specifier\n        declaration_specifiers  : declaration_specifiers alignment_specifier\n        storage_class_specifier : AUTO\n| REGISTER\n| STATIC\n| EXTERN\n| TYPEDEF\n| _THREAD_LOCAL\nfunction_specifier  : INLINE\n| _NORETURN\ntype_specifier_no_typeid  : VOID\n| _BOOL\n| CHAR\n| SHORT\n| INT\n| LONG\n| FLOAT\n| DOUBLE\n| _COMPLEX\n| SIGNED\n| UNSIGNED\n| __INT128\ntype_specifier  : typedef_name\n| enum_specifier\n| struct_or_union_specifier\n| type_specifier_no_typeid\n| atomic_specifier\natomic_specifier  : _ATOMIC LPAREN type_name RPAREN\n        type_qualifier  : CONST\n| RESTRICT\n| VOLATILE\n| _ATOMIC\ninit_declarator_list    : init_declarator\n| init_declarator_list COMMA init_declarator\ninit_declarator : declarator\n| declarator EQUALS initializer\nid_init_declarator_list    : id_init_declarator\n| id_init_declarator_list COMMA init_declarator\nid_init_declarator : id_declarator\n| id_declarator EQUALS initializer\nspecifier_qualifier_list    : specifier_qualifier_list type_specifier_no_typeid\n        specifier_qualifier_list    : specifier_qualifier_list type_qualifier\n        specifier_qualifier_list  : type_specifier\n        specifier_qualifier_list  : type_qualifier_list type_specifier\n        specifier_qualifier_list  : alignment_specifier\n        specifier_qualifier_list  : specifier_qualifier_list alignment_specifier\n        struct_or_union_specifier   : struct_or_union ID\n| struct_or_union TYPEID\nstruct_or_union_specifier : struct_or_union brace_open struct_declaration_list brace_close\n| struct_or_union brace_open brace_close\nstruct_or_union_specifier   : struct_or_union ID brace_open struct_declaration_list brace_close\n| struct_or_union ID brace_open brace_close\n| struct_or_union TYPEID brace_open struct_declaration_list brace_close\n| struct_or_union TYPEID brace_open brace_close\nstruct_or_union : STRUCT\n| UNION\nstruct_declaration_list     : struct_declaration\n| struct_declaration_list struct_declaration\nstruct_declaration : specifier_qualifier_list struct_declarator_list_opt SEMI\n        struct_declaration : SEMI\n        struct_declaration : pppragma_directive\n        struct_declarator_list  : struct_declarator\n| struct_declarator_list COMMA struct_declarator\nstruct_declarator : declarator\n        struct_declarator   : declarator COLON constant_expression\n| COLON constant_expression\nenum_specifier  : ENUM ID\n| ENUM TYPEID\nenum_specifier  : ENUM brace_open enumerator_list brace_close\n        enum_specifier  : ENUM ID brace_open enumerator_list brace_close\n| ENUM TYPEID brace_open enumerator_list brace_close\nenumerator_list : enumerator\n| enumerator_list COMMA\n| enumerator_list COMMA enumerator\nalignment_specifier  : _ALIGNAS LPAREN type_name RPAREN\n| _ALIGNAS LPAREN constant_expression RPAREN\nenumerator  : ID\n| ID EQUALS constant_expression\ndeclarator  : id_declarator\n| typeid_declarator\npointer : TIMES type_qualifier_list_opt\n| TIMES type_qualifier_list_opt pointer\ntype_qualifier_list : type_qualifier\n| type_qualifier_list type_qualifier\nparameter_type_list : parameter_list\n| parameter_list COMMA ELLIPSIS\nparameter_list  : parameter_declaration\n| parameter_list COMMA parameter_declaration\nparameter_declaration   : declaration_specifiers id_declarator\n| declaration_specifiers typeid_noparen_declarator\nparameter_declaration   : declaration_specifiers abstract_declarator_opt\n        identifier_list : identifier\n| identifier_list COMMA identifier\ninitializer : assignment_expression\n        initializer : brace_open initializer_list_opt brace_close\n| brace_open initializer_list COMMA brace_close\ninitializer_list    : designation_opt initializer\n| initializer_list COMMA designation_opt initializer\ndesignation : designator_list EQUALS\n        designator_list : designator\n| designator_list designator\ndesignator  : LBRACKET constant_expression RBRACKET\n| PERIOD identifier\ntype_name   : specifier_qualifier_list abstract_declarator_opt\n        abstract_declarator     : pointer\n        abstract_declarator     : pointer direct_abstract_declarator\n        abstract_declarator     : direct_abstract_declarator\n        direct_abstract_declarator  : LPAREN abstract_declarator RPAREN direct_abstract_declarator  : direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET\n        direct_abstract_declarator  : LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET\n        direct_abstract_declarator  : direct_abstract_declarator LBRACKET TIMES RBRACKET\n        direct_abstract_declarator  : LBRACKET TIMES RBRACKET\n        direct_abstract_declarator  : direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN\n        direct_abstract_declarator  : LPAREN parameter_type_list_opt RPAREN\n        block_item  : declaration\n| statement\nblock_item_list : block_item\n| block_item_list block_item\ncompound_statement : brace_open block_item_list_opt brace_close labeled_statement : ID COLON pragmacomp_or_statement labeled_statement : CASE constant_expression COLON pragmacomp_or_statement labeled_statement : DEFAULT COLON pragmacomp_or_statement selection_statement : IF LPAREN expression RPAREN pragmacomp_or_statement selection_statement : IF LPAREN expression RPAREN statement ELSE pragmacomp_or_statement selection_statement : SWITCH LPAREN expression RPAREN pragmacomp_or_statement iteration_statement : WHILE LPAREN expression RPAREN pragmacomp_or_statement iteration_statement : DO pragmacomp_or_statement WHILE LPAREN expression RPAREN SEMI iteration_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement iteration_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement jump_statement  : GOTO ID SEMI jump_statement  : BREAK SEMI jump_statement  : CONTINUE SEMI jump_statement  : RETURN expression SEMI\n| RETURN SEMI\nexpression_statement : expression_opt SEMI expression  : assignment_expression\n| expression COMMA assignment_expression\nassignment_expression : LPAREN compound_statement RPAREN typedef_name : TYPEID assignment_expression   : conditional_expression\n| unary_expression assignment_operator assignment_expression\nassignment_operator : EQUALS\n| XOREQUAL\n| TIMESEQUAL\n| DIVEQUAL\n| MODEQUAL\n| PLUSEQUAL\n| MINUSEQUAL\n| LSHIFTEQUAL\n| RSHIFTEQUAL\n| ANDEQUAL\n| OREQUAL\nconstant_expression : conditional_expression conditional_expression  : binary_expression\n| binary_expression CONDOP expression COLON conditional_expression\nbinary_expression   : cast_expression\n| binary_expression TIMES binary_expression\n| binary_expression DIVIDE binary_expression\n| binary_expression MOD binary_expression\n| binary_expression PLUS binary_expression\n| binary_expression MINUS binary_expression\n| binary_expression RSHIFT binary_expression\n| binary_expression LSHIFT binary_expression\n| binary_expression LT binary_expression\n| binary_expression LE binary_expression\n| binary_expression GE binary_expression\n| binary_expression GT binary_expression\n| binary_expression EQ binary_expression\n| binary_expression NE binary_expression\n| binary_expression AND binary_expression\n| binary_expression OR binary_expression\n| binary_expression XOR binary_expression\n| binary_expression LAND binary_expression\n| binary_expression LOR binary_expression\ncast_expression : unary_expression cast_expression : LPAREN type_name RPAREN cast_expression unary_expression    : postfix_expression unary_expression    : PLUSPLUS unary_expression\n| MINUSMINUS unary_expression\n| unary_operator cast_expression\nunary_expression    : SIZEOF unary_expression\n| SIZEOF LPAREN type_name RPAREN\n| _ALIGNOF LPAREN type_name RPAREN\nunary_operator  : AND\n| TIMES\n| PLUS\n| MINUS\n| NOT\n| LNOT\npostfix_expression  : primary_expression postfix_expression  : postfix_expression LBRACKET expression RBRACKET postfix_expression  : postfix_expression LPAREN argument_expression_list RPAREN\n| postfix_expression LPAREN RPAREN\npostfix_expression  : postfix_expression PERIOD ID\n| postfix_expression PERIOD TYPEID\n| postfix_expression ARROW ID\n| postfix_expression ARROW TYPEID\npostfix_expression  : postfix_expression PLUSPLUS\n| postfix_expression MINUSMINUS\npostfix_expression  : LPAREN type_name RPAREN brace_open initializer_list brace_close\n| LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close\nprimary_expression  : identifier primary_expression  : constant primary_expression  : unified_string_literal\n| unified_wstring_literal\nprimary_expression  : LPAREN expression RPAREN primary_expression  : OFFSETOF LPAREN type_name COMMA offsetof_member_designator RPAREN\n        offsetof_member_designator : identifier\n| offsetof_member_designator PERIOD identifier\n| offsetof_member_designator LBRACKET expression RBRACKET\nargument_expression_list    : assignment_expression\n| argument_expression_list COMMA assignment_expression\nidentifier  : ID constant    : INT_CONST_DEC\n| INT_CONST_OCT\n| INT_CONST_HEX\n| INT_CONST_BIN\n| INT_CONST_CHAR\nconstant    : FLOAT_CONST\n| HEX_FLOAT_CONST\nconstant    : CHAR_CONST\n| WCHAR_CONST\n| U8CHAR_CONST\n| U16CHAR_CONST\n| U32CHAR_CONST\nunified_string_literal  : STRING_LITERAL\n| unified_string_literal STRING_LITERAL\nunified_wstring_literal : WSTRING_LITERAL\n| U8STRING_LITERAL\n| U16STRING_LITERAL\n| U32STRING_LITERAL\n| unified_wstring_literal WSTRING_LITERAL\n| unified_wstring_literal U8STRING_LITERAL\n| unified_wstring_literal U16STRING_LITERAL\n| unified_wstring_literal U32STRING_LITERAL\nbrace_open  :   LBRACE\n        brace_close :   RBRACE\n        empty : '
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,14,15,63,89,90,125,205,248,262,351,493,],[-337,0,-58,-59,-60,-62,-63,-64,-65,-66,-67,-70,-71,-61,-87,-72,-73,-336,-74,-69,-218,-68,]),'SEMI':([0,2,4,5,6,7,8,9,10,12,13,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,68,69,70,71,72,73,74,75,76,77,78,80,82,83,84,85,86,87,88,89,90,95,96,97,98,99,100,101,102,103,104,105,106,108,109,110,115,116,117,119,120,121,122,125,126,128,130,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,200,201,202,203,204,205,206,207,208,209,211,217,218,219,220,221,222,223,224,225,226,227,228,229,230,233,236,239,242,243,244,245,246,247,248,249,250,251,252,262,263,287,288,289,291,292,293,296,297,298,299,307,308,322,323,326,329,330,331,332,333,334,335,336,337,338,339,340,341,342,344,345,349,350,351,352,353,354,356,357,365,366,367,368,369,370,371,372,398,399,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,434,435,454,455,458,459,460,463,464,465,466,468,470,474,475,476,477,478,479,480,487,488,491,493,495,496,499,500,502,503,516,517,518,519,520,521,523,524,525,529,530,532,546,547,548,549,551,554,556,563,564,567,572,573,575,577,578,579,],[9,9,-60,-62,-63,-64,-65,-66,-67,-337,89,-70,-71,-52,-337,-337,-337,-125,-99,-337,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,-337,-337,-126,-131,-178,-95,-96,-97,-98,-101,-85,-131,-19,-20,-132,-134,-179,-54,-37,-87,-72,-53,-90,-9,-10,-337,-91,-92,-100,-86,-126,-15,-16,-136,-138,-94,-93,-166,-167,-335,-146,-147,207,-73,-337,-178,-55,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,207,207,207,-149,-156,-336,-337,-159,-160,-142,-144,-13,-337,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,357,-14,-337,369,370,372,-235,-239,-274,-74,-38,-133,-135,-193,-69,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-35,-36,-137,-139,-168,207,-151,207,-153,-148,-157,460,-140,-141,-145,-25,-26,-161,-163,-143,-127,-174,-175,-218,-217,-13,-337,-337,-234,-81,-84,-337,477,-230,-231,478,-233,-43,-44,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-292,-293,-294,-295,-296,-31,-34,-169,-170,-150,-152,-158,-165,-219,-337,-221,-237,-236,-83,523,-337,-229,-232,-240,-194,-39,-42,-275,-68,-290,-291,-281,-282,-32,-33,-162,-164,-220,-337,-337,-337,-337,552,-195,-40,-41,-254,-222,-84,-224,-225,565,-299,-306,-337,573,-300,-223,-226,-337,-337,-228,-227,]),'PPHASH':([0,2,4,5,6,7,8,9,10,14,15,63,89,90,125,205,248,262,351,493,],[14,14,-60,-62,-63,-64,-65,-66,-67,-70,-71,-61,-87,-72,-73,-336,-74,-69,-218,-68,]),'PPPRAGMA':([0,2,4,5,6,7,8,9,10,14,15,63,89,90,119,122,125,126,200,201,202,204,205,207,208,218,219,220,221,222,223,224,225,226,227,228,229,239,248,262,329,331,334,351,352,354,356,357,365,366,369,370,372,460,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[15,15,-60,-62,-63,-64,-65,-66,-67,-70,-71,-61,-87,-72,-335,15,-73,15,15,15,15,-156,-336,-159,-160,15,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,15,-74,-69,15,15,-157,-218,-217,15,15,-234,15,-84,-230,-231,-233,-158,-219,15,-221,-83,-229,-232,-68,-220,15,15,15,-222,-84,-224,-225,15,-223,-226,15,15,-228,-227,]),'_STATIC_ASSERT':([0,2,4,5,6,7,8,9,10,14,15,63,89,90,119,125,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,248,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[16,16,-60,-62,-63,-64,-65,-66,-67,-70,-71,-61,-87,-72,-335,-73,16,-336,16,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,16,-74,-69,-218,-217,16,16,-234,16,-84,-230,-231,-233,-219,16,-221,-83,-229,-232,-68,-220,16,16,16,-222,-84,-224,-225,16,-223,-226,16,16,-228,-227,]),'ID':([0,2,4,5,6,7,8,9,10,12,14,15,17,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,63,68,69,70,71,73,74,75,76,77,79,80,81,89,90,91,93,94,96,97,98,99,100,101,102,104,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,132,133,134,135,136,142,143,144,145,148,149,150,151,155,156,179,180,181,189,191,192,193,194,195,196,203,205,206,209,211,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,241,244,248,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,290,294,302,305,306,310,314,318,319,326,327,328,330,332,333,336,337,338,343,344,345,349,350,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,393,395,396,397,400,443,444,447,450,452,454,455,458,459,461,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,501,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,557,558,563,565,572,573,575,577,578,579,],[27,27,-60,-62,-63,-64,-65,-66,-67,27,-70,-71,27,27,-337,-337,-337,-125,-99,27,-337,-104,-337,-122,-123,-124,-126,-238,116,120,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-154,-155,-61,27,27,-126,-131,-95,-96,-97,-98,-101,27,-131,27,-87,-72,154,-337,154,-90,-9,-10,-337,-91,-92,-100,-126,-94,-180,-27,-28,-182,-93,-166,-167,199,-335,-146,-147,154,-73,230,27,154,-337,154,154,-284,-285,-286,-283,154,154,154,154,-287,-288,154,-337,-28,27,27,154,-181,-183,199,199,-149,-336,27,-142,-144,230,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,154,154,230,368,154,-74,-337,154,-337,-28,-69,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,426,428,154,154,-284,154,154,154,27,27,-337,-168,199,154,-151,-153,-148,-140,-141,-145,154,-143,-127,-174,-175,-218,-217,230,230,-234,154,154,154,154,230,-84,154,-230,-231,-233,154,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,154,-12,154,154,-284,154,154,154,-337,154,27,154,154,-169,-170,-150,-152,27,154,-219,230,-221,154,-83,154,-229,-232,-337,-198,-337,-68,154,154,154,154,-337,-28,-284,-220,230,230,230,154,154,154,-11,-284,154,154,-222,-84,-224,-225,154,-337,154,154,230,154,-223,-226,230,230,-228,-227,]),'LPAREN':([0,2,4,5,6,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,63,68,69,70,71,73,74,75,76,77,79,80,81,87,88,89,90,91,93,95,96,97,98,99,100,101,102,104,107,110,111,112,113,114,115,116,117,119,120,121,124,125,126,130,132,133,134,136,138,142,143,144,145,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,189,191,192,193,194,203,205,206,209,211,213,218,219,220,221,222,223,224,225,226,227,228,229,230,231,234,235,237,238,239,240,244,248,249,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,290,294,296,297,298,299,302,305,306,307,308,314,315,318,319,320,321,326,328,330,332,333,336,337,338,343,344,345,347,348,349,350,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,398,399,400,401,424,426,427,428,429,434,435,441,442,443,447,450,452,454,455,458,459,461,462,464,465,466,469,473,474,476,477,478,481,483,487,488,492,493,494,495,496,497,502,503,504,505,506,509,510,512,514,518,519,520,521,522,523,526,527,529,530,537,538,539,540,541,542,543,544,545,546,547,548,549,552,554,555,556,558,559,560,563,565,567,570,571,572,573,575,577,578,579,],[17,17,-60,-62,-63,-64,-65,-66,-67,81,-70,-71,91,17,94,17,-337,-337,-337,-125,-99,17,-337,-29,-104,-337,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,123,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,124,-61,81,17,-126,123,-95,-96,-97,-98,-101,81,-131,81,135,-37,-87,-72,136,-337,94,-90,-9,-10,-337,-91,-92,-100,-126,123,-94,-180,-27,-28,-182,-93,-166,-167,-335,-146,-147,136,-73,235,135,81,235,-337,235,-303,-284,-285,-286,-283,284,290,290,136,294,295,-289,-312,-287,-288,-301,-302,-304,300,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,235,-337,-28,318,81,235,-181,-183,-149,-336,81,-142,-144,347,235,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,136,358,235,362,363,235,367,235,-74,-38,-337,235,-337,-28,-69,-326,235,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,235,235,-297,-298,235,235,-331,-332,-333,-334,-284,235,235,-35,-36,318,444,318,-337,-45,453,-168,136,-151,-153,-148,-140,-141,-145,136,-143,-127,347,347,-174,-175,-218,-217,235,235,-234,235,235,235,235,235,-84,235,-230,-231,-233,235,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,235,-12,136,-284,235,235,-43,-44,136,-305,-292,-293,-294,-295,-296,-31,-34,444,453,-337,318,235,235,-169,-170,-150,-152,81,136,-219,235,-221,136,522,-83,235,-229,-232,-337,-198,-39,-42,-337,-68,136,-290,-291,235,-32,-33,235,-337,-28,-207,-213,-211,-284,-220,235,235,235,235,235,235,-11,-40,-41,-284,235,235,-50,-51,-209,-208,-210,-212,-222,-84,-224,-225,235,-299,-337,-306,235,-46,-49,235,235,-300,-47,-48,-223,-226,235,235,-228,-227,]),'TIMES':([0,2,4,5,6,7,8,9,10,12,14,15,17,20,21,22,23,24,25,26,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,68,69,70,71,73,74,75,76,77,80,81,89,90,91,93,96,97,98,99,100,101,102,104,110,111,112,113,114,115,116,117,119,120,121,124,125,126,132,133,134,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,189,191,192,194,203,205,206,209,211,213,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,247,248,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,296,297,298,299,302,305,306,318,319,326,328,330,332,333,336,337,338,343,344,345,347,349,350,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,443,450,452,454,455,458,459,461,462,464,465,466,469,474,476,477,478,481,483,491,492,493,494,495,496,497,499,500,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[29,29,-60,-62,-63,-64,-65,-66,-67,29,-70,-71,29,-337,-337,-337,-125,-99,29,-337,-104,-337,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,29,29,-126,-131,-95,-96,-97,-98,-101,-131,29,-87,-72,142,-337,-90,-9,-10,-337,-91,-92,-100,-126,-94,29,-27,-28,-182,-93,-166,-167,-335,-146,-147,142,-73,142,29,142,-337,142,-303,265,-255,-284,-285,-286,-283,-274,-276,142,142,142,142,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,302,-337,-28,29,29,142,-183,-149,-336,29,-142,-144,29,142,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,142,142,142,142,-274,-74,-337,395,-337,-28,-69,-326,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,-297,-298,-277,142,-278,-279,-280,142,-331,-332,-333,-334,-284,142,142,29,451,-168,142,-151,-153,-148,-140,-141,-145,142,-143,-127,29,-174,-175,-218,-217,142,142,-234,142,142,142,142,142,-84,142,-230,-231,-233,142,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,142,-12,142,-284,142,142,142,-305,-256,-257,-258,265,265,265,265,265,265,265,265,265,265,265,265,265,265,265,-292,-293,-294,-295,-296,-337,142,514,-169,-170,-150,-152,29,142,-219,142,-221,142,-83,142,-229,-232,-337,-198,-275,-337,-68,142,-290,-291,142,-281,-282,537,-337,-28,-284,-220,142,142,142,142,142,142,-11,-284,142,142,-222,-84,-224,-225,142,-299,-337,-306,142,142,142,-300,-223,-226,142,142,-228,-227,]),'TYPEID':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,63,66,67,68,69,70,71,72,73,74,75,76,77,79,80,81,89,90,94,95,96,97,98,99,100,101,102,104,110,111,112,113,114,115,116,117,119,120,121,122,123,124,125,126,127,132,135,136,178,189,190,191,193,194,200,201,202,203,204,205,206,207,208,209,210,211,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,285,286,290,294,295,300,307,308,309,314,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,461,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[34,34,-60,-62,-63,-64,-65,-66,-67,34,88,-70,-71,-52,-337,-337,-337,-125,-99,34,-337,-29,-104,-337,-122,-123,-124,-126,-238,117,121,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-154,-155,-61,34,-88,88,34,-126,-131,34,-95,-96,-97,-98,-101,88,-131,88,-87,-72,34,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-180,-27,-28,-182,-93,-166,-167,-335,-146,-147,34,34,34,-73,34,-89,88,34,34,-30,320,34,88,-181,-183,34,34,34,-149,-156,-336,88,-159,-160,-142,34,-144,34,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,34,-74,-69,427,429,34,34,34,34,-35,-36,34,320,34,-168,34,-151,34,-153,-148,-157,-140,-141,-145,-143,-127,34,-174,-175,-218,-217,-234,-81,-84,34,-230,-231,-233,-31,-34,34,34,-169,-170,-150,-152,-158,88,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'ENUM':([0,2,4,5,6,7,8,9,10,11,14,15,18,20,21,22,25,26,27,28,33,49,50,51,52,53,54,55,56,57,58,59,63,66,67,69,70,71,72,89,90,94,95,96,97,98,99,100,101,110,114,115,119,122,123,124,125,126,127,135,136,178,190,194,200,201,202,204,205,207,208,210,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,329,331,334,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[35,35,-60,-62,-63,-64,-65,-66,-67,35,-70,-71,-52,-337,-337,-337,35,-337,-29,-104,-337,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,35,-88,35,-337,-131,35,-87,-72,35,-53,-90,-9,-10,-337,-91,-92,-94,-182,-93,-335,35,35,35,-73,35,-89,35,35,-30,35,-183,35,35,35,-156,-336,-159,-160,35,35,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,35,-74,-69,35,35,35,35,-35,-36,35,35,35,35,-157,-127,35,-174,-175,-218,-217,-234,-81,-84,35,-230,-231,-233,-31,-34,35,35,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'VOID':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[37,37,-60,-62,-63,-64,-65,-66,-67,37,37,-70,-71,-52,-337,-337,-337,-125,-99,37,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,37,-88,37,37,-126,-131,37,-95,-96,-97,-98,-101,-131,-87,-72,37,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,37,37,37,-73,37,-89,37,37,-30,37,37,-183,37,37,37,-149,-156,-336,37,-159,-160,-142,37,-144,37,37,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,37,-74,-69,37,37,37,37,-35,-36,37,37,-168,37,-151,37,-153,-148,-157,-140,-141,-145,-143,-127,37,-174,-175,-218,-217,-234,-81,-84,37,-230,-231,-233,-31,-34,37,37,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_BOOL':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[38,38,-60,-62,-63,-64,-65,-66,-67,38,38,-70,-71,-52,-337,-337,-337,-125,-99,38,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,38,-88,38,38,-126,-131,38,-95,-96,-97,-98,-101,-131,-87,-72,38,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,38,38,38,-73,38,-89,38,38,-30,38,38,-183,38,38,38,-149,-156,-336,38,-159,-160,-142,38,-144,38,38,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,38,-74,-69,38,38,38,38,-35,-36,38,38,-168,38,-151,38,-153,-148,-157,-140,-141,-145,-143,-127,38,-174,-175,-218,-217,-234,-81,-84,38,-230,-231,-233,-31,-34,38,38,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'CHAR':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[39,39,-60,-62,-63,-64,-65,-66,-67,39,39,-70,-71,-52,-337,-337,-337,-125,-99,39,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,39,-88,39,39,-126,-131,39,-95,-96,-97,-98,-101,-131,-87,-72,39,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,39,39,39,-73,39,-89,39,39,-30,39,39,-183,39,39,39,-149,-156,-336,39,-159,-160,-142,39,-144,39,39,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,39,-74,-69,39,39,39,39,-35,-36,39,39,-168,39,-151,39,-153,-148,-157,-140,-141,-145,-143,-127,39,-174,-175,-218,-217,-234,-81,-84,39,-230,-231,-233,-31,-34,39,39,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'SHORT':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[40,40,-60,-62,-63,-64,-65,-66,-67,40,40,-70,-71,-52,-337,-337,-337,-125,-99,40,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,40,-88,40,40,-126,-131,40,-95,-96,-97,-98,-101,-131,-87,-72,40,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,40,40,40,-73,40,-89,40,40,-30,40,40,-183,40,40,40,-149,-156,-336,40,-159,-160,-142,40,-144,40,40,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,40,-74,-69,40,40,40,40,-35,-36,40,40,-168,40,-151,40,-153,-148,-157,-140,-141,-145,-143,-127,40,-174,-175,-218,-217,-234,-81,-84,40,-230,-231,-233,-31,-34,40,40,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'INT':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[41,41,-60,-62,-63,-64,-65,-66,-67,41,41,-70,-71,-52,-337,-337,-337,-125,-99,41,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,41,-88,41,41,-126,-131,41,-95,-96,-97,-98,-101,-131,-87,-72,41,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,41,41,41,-73,41,-89,41,41,-30,41,41,-183,41,41,41,-149,-156,-336,41,-159,-160,-142,41,-144,41,41,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,41,-74,-69,41,41,41,41,-35,-36,41,41,-168,41,-151,41,-153,-148,-157,-140,-141,-145,-143,-127,41,-174,-175,-218,-217,-234,-81,-84,41,-230,-231,-233,-31,-34,41,41,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'LONG':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[42,42,-60,-62,-63,-64,-65,-66,-67,42,42,-70,-71,-52,-337,-337,-337,-125,-99,42,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,42,-88,42,42,-126,-131,42,-95,-96,-97,-98,-101,-131,-87,-72,42,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,42,42,42,-73,42,-89,42,42,-30,42,42,-183,42,42,42,-149,-156,-336,42,-159,-160,-142,42,-144,42,42,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,42,-74,-69,42,42,42,42,-35,-36,42,42,-168,42,-151,42,-153,-148,-157,-140,-141,-145,-143,-127,42,-174,-175,-218,-217,-234,-81,-84,42,-230,-231,-233,-31,-34,42,42,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'FLOAT':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[43,43,-60,-62,-63,-64,-65,-66,-67,43,43,-70,-71,-52,-337,-337,-337,-125,-99,43,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,43,-88,43,43,-126,-131,43,-95,-96,-97,-98,-101,-131,-87,-72,43,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,43,43,43,-73,43,-89,43,43,-30,43,43,-183,43,43,43,-149,-156,-336,43,-159,-160,-142,43,-144,43,43,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,43,-74,-69,43,43,43,43,-35,-36,43,43,-168,43,-151,43,-153,-148,-157,-140,-141,-145,-143,-127,43,-174,-175,-218,-217,-234,-81,-84,43,-230,-231,-233,-31,-34,43,43,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'DOUBLE':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[44,44,-60,-62,-63,-64,-65,-66,-67,44,44,-70,-71,-52,-337,-337,-337,-125,-99,44,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,44,-88,44,44,-126,-131,44,-95,-96,-97,-98,-101,-131,-87,-72,44,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,44,44,44,-73,44,-89,44,44,-30,44,44,-183,44,44,44,-149,-156,-336,44,-159,-160,-142,44,-144,44,44,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,44,-74,-69,44,44,44,44,-35,-36,44,44,-168,44,-151,44,-153,-148,-157,-140,-141,-145,-143,-127,44,-174,-175,-218,-217,-234,-81,-84,44,-230,-231,-233,-31,-34,44,44,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_COMPLEX':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[45,45,-60,-62,-63,-64,-65,-66,-67,45,45,-70,-71,-52,-337,-337,-337,-125,-99,45,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,45,-88,45,45,-126,-131,45,-95,-96,-97,-98,-101,-131,-87,-72,45,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,45,45,45,-73,45,-89,45,45,-30,45,45,-183,45,45,45,-149,-156,-336,45,-159,-160,-142,45,-144,45,45,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,45,-74,-69,45,45,45,45,-35,-36,45,45,-168,45,-151,45,-153,-148,-157,-140,-141,-145,-143,-127,45,-174,-175,-218,-217,-234,-81,-84,45,-230,-231,-233,-31,-34,45,45,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'SIGNED':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[46,46,-60,-62,-63,-64,-65,-66,-67,46,46,-70,-71,-52,-337,-337,-337,-125,-99,46,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,46,-88,46,46,-126,-131,46,-95,-96,-97,-98,-101,-131,-87,-72,46,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,46,46,46,-73,46,-89,46,46,-30,46,46,-183,46,46,46,-149,-156,-336,46,-159,-160,-142,46,-144,46,46,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,46,-74,-69,46,46,46,46,-35,-36,46,46,-168,46,-151,46,-153,-148,-157,-140,-141,-145,-143,-127,46,-174,-175,-218,-217,-234,-81,-84,46,-230,-231,-233,-31,-34,46,46,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'UNSIGNED':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[47,47,-60,-62,-63,-64,-65,-66,-67,47,47,-70,-71,-52,-337,-337,-337,-125,-99,47,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,47,-88,47,47,-126,-131,47,-95,-96,-97,-98,-101,-131,-87,-72,47,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,47,47,47,-73,47,-89,47,47,-30,47,47,-183,47,47,47,-149,-156,-336,47,-159,-160,-142,47,-144,47,47,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,47,-74,-69,47,47,47,47,-35,-36,47,47,-168,47,-151,47,-153,-148,-157,-140,-141,-145,-143,-127,47,-174,-175,-218,-217,-234,-81,-84,47,-230,-231,-233,-31,-34,47,47,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'__INT128':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,94,95,96,97,98,99,100,101,102,104,110,114,115,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[48,48,-60,-62,-63,-64,-65,-66,-67,48,48,-70,-71,-52,-337,-337,-337,-125,-99,48,-337,-29,-104,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,48,-88,48,48,-126,-131,48,-95,-96,-97,-98,-101,-131,-87,-72,48,-53,-90,-9,-10,-337,-91,-92,-100,-126,-94,-182,-93,-166,-167,-335,-146,-147,48,48,48,-73,48,-89,48,48,-30,48,48,-183,48,48,48,-149,-156,-336,48,-159,-160,-142,48,-144,48,48,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,48,-74,-69,48,48,48,48,-35,-36,48,48,-168,48,-151,48,-153,-148,-157,-140,-141,-145,-143,-127,48,-174,-175,-218,-217,-234,-81,-84,48,-230,-231,-233,-31,-34,48,48,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_ATOMIC':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,69,70,71,72,73,74,75,76,77,80,89,90,93,94,95,96,97,98,99,100,101,102,104,110,113,114,115,116,117,119,120,121,122,123,124,125,126,127,134,135,136,178,180,181,189,190,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,255,256,262,290,294,295,300,307,308,309,318,319,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,443,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,505,506,518,546,547,548,549,572,573,578,579,],[49,49,-60,-62,-63,-64,-65,-66,-67,71,80,-70,-71,-52,71,71,71,-125,-99,107,71,-29,-104,80,-122,-123,-124,71,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,71,-88,80,107,71,-131,71,-95,-96,-97,-98,-101,-131,-87,-72,80,49,-53,-90,-9,-10,71,-91,-92,-100,-126,-94,80,-182,-93,-166,-167,-335,-146,-147,49,49,49,-73,71,-89,80,49,49,-30,80,80,80,107,-183,49,49,49,-149,-156,-336,80,-159,-160,-142,71,-144,80,71,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,49,-74,80,80,-69,49,49,49,49,-35,-36,49,49,80,-168,49,-151,49,-153,-148,-157,-140,-141,-145,-143,-127,49,-174,-175,-218,-217,-234,-81,-84,71,-230,-231,-233,-31,-34,80,49,49,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,80,80,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'CONST':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,93,94,95,99,102,104,113,114,116,117,119,120,121,122,123,124,125,126,127,134,135,136,178,180,181,189,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,255,256,262,290,294,295,300,307,308,309,318,319,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,443,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,505,506,518,546,547,548,549,572,573,578,579,],[50,50,-60,-62,-63,-64,-65,-66,-67,50,50,-70,-71,-52,50,50,50,-125,-99,50,-29,-104,50,-122,-123,-124,50,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,50,-88,50,50,-131,50,-95,-96,-97,-98,-101,-131,-87,-72,50,50,-53,50,-100,-126,50,-182,-166,-167,-335,-146,-147,50,50,50,-73,50,-89,50,50,50,-30,50,50,50,-183,50,50,50,-149,-156,-336,50,-159,-160,-142,50,-144,50,50,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,50,-74,50,50,-69,50,50,50,50,-35,-36,50,50,50,-168,50,-151,50,-153,-148,-157,-140,-141,-145,-143,-127,50,-174,-175,-218,-217,-234,-81,-84,50,-230,-231,-233,-31,-34,50,50,50,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,50,50,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'RESTRICT':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,93,94,95,99,102,104,113,114,116,117,119,120,121,122,123,124,125,126,127,134,135,136,178,180,181,189,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,255,256,262,290,294,295,300,307,308,309,318,319,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,443,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,505,506,518,546,547,548,549,572,573,578,579,],[51,51,-60,-62,-63,-64,-65,-66,-67,51,51,-70,-71,-52,51,51,51,-125,-99,51,-29,-104,51,-122,-123,-124,51,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,51,-88,51,51,-131,51,-95,-96,-97,-98,-101,-131,-87,-72,51,51,-53,51,-100,-126,51,-182,-166,-167,-335,-146,-147,51,51,51,-73,51,-89,51,51,51,-30,51,51,51,-183,51,51,51,-149,-156,-336,51,-159,-160,-142,51,-144,51,51,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,51,-74,51,51,-69,51,51,51,51,-35,-36,51,51,51,-168,51,-151,51,-153,-148,-157,-140,-141,-145,-143,-127,51,-174,-175,-218,-217,-234,-81,-84,51,-230,-231,-233,-31,-34,51,51,51,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,51,51,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'VOLATILE':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,93,94,95,99,102,104,113,114,116,117,119,120,121,122,123,124,125,126,127,134,135,136,178,180,181,189,194,200,201,202,203,204,205,206,207,208,209,210,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,255,256,262,290,294,295,300,307,308,309,318,319,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,443,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,505,506,518,546,547,548,549,572,573,578,579,],[52,52,-60,-62,-63,-64,-65,-66,-67,52,52,-70,-71,-52,52,52,52,-125,-99,52,-29,-104,52,-122,-123,-124,52,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,52,-88,52,52,-131,52,-95,-96,-97,-98,-101,-131,-87,-72,52,52,-53,52,-100,-126,52,-182,-166,-167,-335,-146,-147,52,52,52,-73,52,-89,52,52,52,-30,52,52,52,-183,52,52,52,-149,-156,-336,52,-159,-160,-142,52,-144,52,52,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,52,-74,52,52,-69,52,52,52,52,-35,-36,52,52,52,-168,52,-151,52,-153,-148,-157,-140,-141,-145,-143,-127,52,-174,-175,-218,-217,-234,-81,-84,52,-230,-231,-233,-31,-34,52,52,52,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,52,52,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'AUTO':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[53,53,-60,-62,-63,-64,-65,-66,-67,53,53,-70,-71,-52,53,53,53,-125,-99,53,-29,-104,-122,-123,-124,53,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,53,-88,53,53,-131,53,-95,-96,-97,-98,-101,-131,-87,-72,53,-53,53,-100,-126,-166,-167,-335,-146,-147,-73,53,-89,53,-30,53,-149,-336,53,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,53,53,-168,-151,-153,-148,-127,53,-174,-175,-218,-217,-234,-81,-84,53,-230,-231,-233,-31,-34,53,53,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'REGISTER':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[54,54,-60,-62,-63,-64,-65,-66,-67,54,54,-70,-71,-52,54,54,54,-125,-99,54,-29,-104,-122,-123,-124,54,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,54,-88,54,54,-131,54,-95,-96,-97,-98,-101,-131,-87,-72,54,-53,54,-100,-126,-166,-167,-335,-146,-147,-73,54,-89,54,-30,54,-149,-336,54,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,54,54,-168,-151,-153,-148,-127,54,-174,-175,-218,-217,-234,-81,-84,54,-230,-231,-233,-31,-34,54,54,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'STATIC':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,93,94,95,99,102,104,114,116,117,119,120,121,125,126,127,134,135,178,181,189,194,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,256,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,443,444,453,454,455,458,459,464,466,474,477,478,493,502,503,506,518,546,547,548,549,572,573,578,579,],[28,28,-60,-62,-63,-64,-65,-66,-67,28,28,-70,-71,-52,28,28,28,-125,-99,28,-29,-104,-122,-123,-124,28,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,28,-88,28,28,-131,28,-95,-96,-97,-98,-101,-131,-87,-72,180,28,-53,28,-100,-126,-182,-166,-167,-335,-146,-147,-73,28,-89,255,28,-30,306,28,-183,-149,-336,28,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,397,-69,-35,-36,28,28,-168,-151,-153,-148,-127,28,-174,-175,-218,-217,-234,-81,-84,28,-230,-231,-233,-31,-34,505,28,28,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,539,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'EXTERN':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[55,55,-60,-62,-63,-64,-65,-66,-67,55,55,-70,-71,-52,55,55,55,-125,-99,55,-29,-104,-122,-123,-124,55,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,55,-88,55,55,-131,55,-95,-96,-97,-98,-101,-131,-87,-72,55,-53,55,-100,-126,-166,-167,-335,-146,-147,-73,55,-89,55,-30,55,-149,-336,55,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,55,55,-168,-151,-153,-148,-127,55,-174,-175,-218,-217,-234,-81,-84,55,-230,-231,-233,-31,-34,55,55,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'TYPEDEF':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[56,56,-60,-62,-63,-64,-65,-66,-67,56,56,-70,-71,-52,56,56,56,-125,-99,56,-29,-104,-122,-123,-124,56,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,56,-88,56,56,-131,56,-95,-96,-97,-98,-101,-131,-87,-72,56,-53,56,-100,-126,-166,-167,-335,-146,-147,-73,56,-89,56,-30,56,-149,-336,56,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,56,56,-168,-151,-153,-148,-127,56,-174,-175,-218,-217,-234,-81,-84,56,-230,-231,-233,-31,-34,56,56,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_THREAD_LOCAL':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[57,57,-60,-62,-63,-64,-65,-66,-67,57,57,-70,-71,-52,57,57,57,-125,-99,57,-29,-104,-122,-123,-124,57,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,57,-88,57,57,-131,57,-95,-96,-97,-98,-101,-131,-87,-72,57,-53,57,-100,-126,-166,-167,-335,-146,-147,-73,57,-89,57,-30,57,-149,-336,57,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,57,57,-168,-151,-153,-148,-127,57,-174,-175,-218,-217,-234,-81,-84,57,-230,-231,-233,-31,-34,57,57,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'INLINE':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[58,58,-60,-62,-63,-64,-65,-66,-67,58,58,-70,-71,-52,58,58,58,-125,-99,58,-29,-104,-122,-123,-124,58,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,58,-88,58,58,-131,58,-95,-96,-97,-98,-101,-131,-87,-72,58,-53,58,-100,-126,-166,-167,-335,-146,-147,-73,58,-89,58,-30,58,-149,-336,58,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,58,58,-168,-151,-153,-148,-127,58,-174,-175,-218,-217,-234,-81,-84,58,-230,-231,-233,-31,-34,58,58,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_NORETURN':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,125,126,127,135,178,189,203,205,218,219,220,221,222,223,224,225,226,227,228,229,248,262,307,308,309,318,326,330,332,333,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[59,59,-60,-62,-63,-64,-65,-66,-67,59,59,-70,-71,-52,59,59,59,-125,-99,59,-29,-104,-122,-123,-124,59,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,59,-88,59,59,-131,59,-95,-96,-97,-98,-101,-131,-87,-72,59,-53,59,-100,-126,-166,-167,-335,-146,-147,-73,59,-89,59,-30,59,-149,-336,59,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-74,-69,-35,-36,59,59,-168,-151,-153,-148,-127,59,-174,-175,-218,-217,-234,-81,-84,59,-230,-231,-233,-31,-34,59,59,-169,-170,-150,-152,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'_ALIGNAS':([0,2,4,5,6,7,8,9,10,11,12,14,15,18,20,21,22,23,24,26,27,28,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,63,66,67,68,70,71,72,73,74,75,76,77,80,89,90,94,95,99,102,104,116,117,119,120,121,122,123,124,125,126,127,135,136,178,189,200,201,202,203,204,205,206,207,208,209,211,213,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,326,329,330,331,332,333,334,336,337,338,344,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,454,455,458,459,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[60,60,-60,-62,-63,-64,-65,-66,-67,60,60,-70,-71,-52,60,60,60,-125,-99,60,-29,-104,-122,-123,-124,60,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,60,-88,60,60,-131,60,-95,-96,-97,-98,-101,-131,-87,-72,60,-53,60,-100,-126,-166,-167,-335,-146,-147,60,60,60,-73,60,-89,60,60,-30,60,60,60,60,-149,-156,-336,60,-159,-160,-142,-144,60,60,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,60,-74,-69,60,60,60,60,-35,-36,60,60,-168,60,-151,60,-153,-148,-157,-140,-141,-145,-143,-127,60,-174,-175,-218,-217,-234,-81,-84,60,-230,-231,-233,-31,-34,60,60,-169,-170,-150,-152,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'STRUCT':([0,2,4,5,6,7,8,9,10,11,14,15,18,20,21,22,25,26,27,28,33,49,50,51,52,53,54,55,56,57,58,59,63,66,67,69,70,71,72,89,90,94,95,96,97,98,99,100,101,110,114,115,119,122,123,124,125,126,127,135,136,178,190,194,200,201,202,204,205,207,208,210,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,329,331,334,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[61,61,-60,-62,-63,-64,-65,-66,-67,61,-70,-71,-52,-337,-337,-337,61,-337,-29,-104,-337,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,61,-88,61,-337,-131,61,-87,-72,61,-53,-90,-9,-10,-337,-91,-92,-94,-182,-93,-335,61,61,61,-73,61,-89,61,61,-30,61,-183,61,61,61,-156,-336,-159,-160,61,61,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,61,-74,-69,61,61,61,61,-35,-36,61,61,61,61,-157,-127,61,-174,-175,-218,-217,-234,-81,-84,61,-230,-231,-233,-31,-34,61,61,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'UNION':([0,2,4,5,6,7,8,9,10,11,14,15,18,20,21,22,25,26,27,28,33,49,50,51,52,53,54,55,56,57,58,59,63,66,67,69,70,71,72,89,90,94,95,96,97,98,99,100,101,110,114,115,119,122,123,124,125,126,127,135,136,178,190,194,200,201,202,204,205,207,208,210,218,219,220,221,222,223,224,225,226,227,228,229,235,248,262,290,294,295,300,307,308,309,318,329,331,334,345,347,349,350,351,352,357,365,366,367,369,370,372,434,435,444,453,460,464,466,474,477,478,493,502,503,518,546,547,548,549,572,573,578,579,],[62,62,-60,-62,-63,-64,-65,-66,-67,62,-70,-71,-52,-337,-337,-337,62,-337,-29,-104,-337,-131,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-61,62,-88,62,-337,-131,62,-87,-72,62,-53,-90,-9,-10,-337,-91,-92,-94,-182,-93,-335,62,62,62,-73,62,-89,62,62,-30,62,-183,62,62,62,-156,-336,-159,-160,62,62,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,62,-74,-69,62,62,62,62,-35,-36,62,62,62,62,-157,-127,62,-174,-175,-218,-217,-234,-81,-84,62,-230,-231,-233,-31,-34,62,62,-158,-219,-221,-83,-229,-232,-68,-32,-33,-220,-222,-84,-224,-225,-223,-226,-228,-227,]),'LBRACE':([11,15,18,27,35,36,61,62,64,65,66,67,72,89,90,95,116,117,119,120,121,126,127,129,133,178,192,205,218,219,220,221,222,223,224,225,226,227,228,229,235,239,253,262,307,308,351,352,354,356,357,365,366,369,370,372,387,388,389,400,434,435,464,465,466,469,474,477,478,481,483,492,493,498,499,502,503,518,519,520,521,526,527,546,547,548,549,555,563,572,573,575,577,578,579,],[-337,-71,-52,-29,119,119,-154,-155,119,-7,-8,-88,-337,-87,-72,-53,119,119,-335,119,119,119,-89,119,119,-30,119,-336,119,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,119,119,-337,-69,-35,-36,-218,-217,119,119,-234,119,-84,-230,-231,-233,-11,119,-12,119,-31,-34,-219,119,-221,119,-83,-229,-232,-337,-198,-337,-68,119,119,-32,-33,-220,119,119,119,119,-11,-222,-84,-224,-225,-337,119,-223,-226,119,119,-228,-227,]),'RBRACE':([15,89,90,119,122,126,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,197,198,199,200,201,202,204,205,207,208,216,217,218,219,220,221,222,223,224,225,226,227,228,229,246,247,252,253,262,263,287,288,289,291,292,293,296,297,298,299,324,325,327,329,331,334,351,352,357,365,366,369,370,372,385,386,387,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,456,457,460,464,466,468,474,477,478,479,480,481,482,491,493,495,496,499,500,518,525,531,532,546,547,548,549,553,554,555,556,567,572,573,578,579,],[-71,-87,-72,-335,205,-337,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,205,-171,-176,205,205,205,-156,-336,-159,-160,205,-5,-6,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-239,-274,-193,-337,-69,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,205,205,-172,205,205,-157,-218,-217,-234,-81,-84,-230,-231,-233,205,-22,-21,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-292,-293,-294,-295,-296,-173,-177,-158,-219,-221,-237,-83,-229,-232,-240,-194,205,-196,-275,-68,-290,-291,-281,-282,-220,-195,205,-254,-222,-84,-224,-225,-197,-299,205,-306,-300,-223,-226,-228,-227,]),'CASE':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,231,-336,231,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,231,-69,-218,-217,231,231,-234,231,-84,-230,-231,-233,-219,231,-221,-83,-229,-232,-68,-220,231,231,231,-222,-84,-224,-225,231,-223,-226,231,231,-228,-227,]),'DEFAULT':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,232,-336,232,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,232,-69,-218,-217,232,232,-234,232,-84,-230,-231,-233,-219,232,-221,-83,-229,-232,-68,-220,232,232,232,-222,-84,-224,-225,232,-223,-226,232,232,-228,-227,]),'IF':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,234,-336,234,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,234,-69,-218,-217,234,234,-234,234,-84,-230,-231,-233,-219,234,-221,-83,-229,-232,-68,-220,234,234,234,-222,-84,-224,-225,234,-223,-226,234,234,-228,-227,]),'SWITCH':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,237,-336,237,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,237,-69,-218,-217,237,237,-234,237,-84,-230,-231,-233,-219,237,-221,-83,-229,-232,-68,-220,237,237,237,-222,-84,-224,-225,237,-223,-226,237,237,-228,-227,]),'WHILE':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,364,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,238,-336,238,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,238,-69,-218,-217,238,238,-234,473,238,-84,-230,-231,-233,-219,238,-221,-83,-229,-232,-68,-220,238,238,238,-222,-84,-224,-225,238,-223,-226,238,238,-228,-227,]),'DO':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,239,-336,239,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,239,-69,-218,-217,239,239,-234,239,-84,-230,-231,-233,-219,239,-221,-83,-229,-232,-68,-220,239,239,239,-222,-84,-224,-225,239,-223,-226,239,239,-228,-227,]),'FOR':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,240,-336,240,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,240,-69,-218,-217,240,240,-234,240,-84,-230,-231,-233,-219,240,-221,-83,-229,-232,-68,-220,240,240,240,-222,-84,-224,-225,240,-223,-226,240,240,-228,-227,]),'GOTO':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,241,-336,241,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,241,-69,-218,-217,241,241,-234,241,-84,-230,-231,-233,-219,241,-221,-83,-229,-232,-68,-220,241,241,241,-222,-84,-224,-225,241,-223,-226,241,241,-228,-227,]),'BREAK':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,242,-336,242,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,242,-69,-218,-217,242,242,-234,242,-84,-230,-231,-233,-219,242,-221,-83,-229,-232,-68,-220,242,242,242,-222,-84,-224,-225,242,-223,-226,242,242,-228,-227,]),'CONTINUE':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,243,-336,243,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,243,-69,-218,-217,243,243,-234,243,-84,-230,-231,-233,-219,243,-221,-83,-229,-232,-68,-220,243,243,243,-222,-84,-224,-225,243,-223,-226,243,243,-228,-227,]),'RETURN':([15,89,90,119,126,205,218,219,220,221,222,223,224,225,226,227,228,229,239,262,351,352,354,356,357,365,366,369,370,372,464,465,466,474,477,478,493,518,519,520,521,546,547,548,549,563,572,573,575,577,578,579,],[-71,-87,-72,-335,244,-336,244,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,244,-69,-218,-217,244,244,-234,244,-84,-230,-231,-233,-219,244,-221,-83,-229,-232,-68,-220,244,244,244,-222,-84,-224,-225,244,-223,-226,244,244,-228,-227,]),'PLUSPLUS':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,142,143,144,145,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,424,426,427,428,429,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,495,496,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,148,-337,-27,-28,-182,-335,148,148,148,-337,148,-303,-284,-285,-286,-283,287,148,148,148,148,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,148,-337,-28,148,-183,-336,148,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,148,148,148,148,-337,148,-337,-28,-69,-326,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,-297,-298,148,148,-331,-332,-333,-334,-284,148,148,-337,148,148,-218,-217,148,148,-234,148,148,148,148,148,-84,148,-230,-231,-233,148,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,148,-12,148,-284,148,148,148,-305,-292,-293,-294,-295,-296,-337,148,148,148,-219,148,-221,148,-83,148,-229,-232,-337,-198,-337,-68,148,-290,-291,148,148,-337,-28,-284,-220,148,148,148,148,148,148,-11,-284,148,148,-222,-84,-224,-225,148,-299,-337,-306,148,148,148,-300,-223,-226,148,148,-228,-227,]),'MINUSMINUS':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,142,143,144,145,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,424,426,427,428,429,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,495,496,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,149,-337,-27,-28,-182,-335,149,149,149,-337,149,-303,-284,-285,-286,-283,288,149,149,149,149,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,149,-337,-28,149,-183,-336,149,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,149,149,149,149,-337,149,-337,-28,-69,-326,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,-297,-298,149,149,-331,-332,-333,-334,-284,149,149,-337,149,149,-218,-217,149,149,-234,149,149,149,149,149,-84,149,-230,-231,-233,149,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,149,-12,149,-284,149,149,149,-305,-292,-293,-294,-295,-296,-337,149,149,149,-219,149,-221,149,-83,149,-229,-232,-337,-198,-337,-68,149,-290,-291,149,149,-337,-28,-284,-220,149,149,149,149,149,149,-11,-284,149,149,-222,-84,-224,-225,149,-299,-337,-306,149,149,149,-300,-223,-226,149,149,-228,-227,]),'SIZEOF':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,151,-337,-27,-28,-182,-335,151,151,151,-337,151,-284,-285,-286,-283,151,151,151,151,-287,-288,151,-337,-28,151,-183,-336,151,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,151,151,151,151,-337,151,-337,-28,-69,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,-284,151,151,-337,151,151,-218,-217,151,151,-234,151,151,151,151,151,-84,151,-230,-231,-233,151,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,151,-12,151,-284,151,151,151,-337,151,151,151,-219,151,-221,151,-83,151,-229,-232,-337,-198,-337,-68,151,151,151,-337,-28,-284,-220,151,151,151,151,151,151,-11,-284,151,151,-222,-84,-224,-225,151,-337,151,151,151,-223,-226,151,151,-228,-227,]),'_ALIGNOF':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,152,-337,-27,-28,-182,-335,152,152,152,-337,152,-284,-285,-286,-283,152,152,152,152,-287,-288,152,-337,-28,152,-183,-336,152,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,152,152,152,152,-337,152,-337,-28,-69,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,-284,152,152,-337,152,152,-218,-217,152,152,-234,152,152,152,152,152,-84,152,-230,-231,-233,152,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,152,-12,152,-284,152,152,152,-337,152,152,152,-219,152,-221,152,-83,152,-229,-232,-337,-198,-337,-68,152,152,152,-337,-28,-284,-220,152,152,152,152,152,152,-11,-284,152,152,-222,-84,-224,-225,152,-337,152,152,152,-223,-226,152,152,-228,-227,]),'AND':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,247,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,443,450,452,462,464,465,466,469,474,476,477,478,481,483,491,492,493,494,495,496,497,499,500,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,145,-337,-27,-28,-182,-335,145,145,145,-337,145,-303,278,-255,-284,-285,-286,-283,-274,-276,145,145,145,145,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,145,-337,-28,145,-183,-336,145,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,145,145,145,145,-274,-337,145,-337,-28,-69,-326,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,-297,-298,-277,145,-278,-279,-280,145,-331,-332,-333,-334,-284,145,145,-337,145,145,-218,-217,145,145,-234,145,145,145,145,145,-84,145,-230,-231,-233,145,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,145,-12,145,-284,145,145,145,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,278,278,278,278,-292,-293,-294,-295,-296,-337,145,145,145,-219,145,-221,145,-83,145,-229,-232,-337,-198,-275,-337,-68,145,-290,-291,145,-281,-282,145,-337,-28,-284,-220,145,145,145,145,145,145,-11,-284,145,145,-222,-84,-224,-225,145,-299,-337,-306,145,145,145,-300,-223,-226,145,145,-228,-227,]),'PLUS':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,247,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,443,450,452,462,464,465,466,469,474,476,477,478,481,483,491,492,493,494,495,496,497,499,500,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,143,-337,-27,-28,-182,-335,143,143,143,-337,143,-303,268,-255,-284,-285,-286,-283,-274,-276,143,143,143,143,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,143,-337,-28,143,-183,-336,143,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,143,143,143,143,-274,-337,143,-337,-28,-69,-326,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,-297,-298,-277,143,-278,-279,-280,143,-331,-332,-333,-334,-284,143,143,-337,143,143,-218,-217,143,143,-234,143,143,143,143,143,-84,143,-230,-231,-233,143,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,143,-12,143,-284,143,143,143,-305,-256,-257,-258,-259,-260,268,268,268,268,268,268,268,268,268,268,268,268,268,-292,-293,-294,-295,-296,-337,143,143,143,-219,143,-221,143,-83,143,-229,-232,-337,-198,-275,-337,-68,143,-290,-291,143,-281,-282,143,-337,-28,-284,-220,143,143,143,143,143,143,-11,-284,143,143,-222,-84,-224,-225,143,-299,-337,-306,143,143,143,-300,-223,-226,143,143,-228,-227,]),'MINUS':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,140,141,142,143,144,145,146,147,148,149,150,151,153,154,155,156,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,230,231,235,239,244,247,253,254,255,256,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,287,288,289,290,291,292,293,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,443,450,452,462,464,465,466,469,474,476,477,478,481,483,491,492,493,494,495,496,497,499,500,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,554,555,556,558,563,565,567,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,144,-337,-27,-28,-182,-335,144,144,144,-337,144,-303,269,-255,-284,-285,-286,-283,-274,-276,144,144,144,144,-289,-312,-287,-288,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,144,-337,-28,144,-183,-336,144,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,-312,144,144,144,144,-274,-337,144,-337,-28,-69,-326,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,-297,-298,-277,144,-278,-279,-280,144,-331,-332,-333,-334,-284,144,144,-337,144,144,-218,-217,144,144,-234,144,144,144,144,144,-84,144,-230,-231,-233,144,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,144,-12,144,-284,144,144,144,-305,-256,-257,-258,-259,-260,269,269,269,269,269,269,269,269,269,269,269,269,269,-292,-293,-294,-295,-296,-337,144,144,144,-219,144,-221,144,-83,144,-229,-232,-337,-198,-275,-337,-68,144,-290,-291,144,-281,-282,144,-337,-28,-284,-220,144,144,144,144,144,144,-11,-284,144,144,-222,-84,-224,-225,144,-299,-337,-306,144,144,144,-300,-223,-226,144,144,-228,-227,]),'NOT':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,155,-337,-27,-28,-182,-335,155,155,155,-337,155,-284,-285,-286,-283,155,155,155,155,-287,-288,155,-337,-28,155,-183,-336,155,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,155,155,155,155,-337,155,-337,-28,-69,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,-284,155,155,-337,155,155,-218,-217,155,155,-234,155,155,155,155,155,-84,155,-230,-231,-233,155,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,155,-12,155,-284,155,155,155,-337,155,155,155,-219,155,-221,155,-83,155,-229,-232,-337,-198,-337,-68,155,155,155,-337,-28,-284,-220,155,155,155,155,155,155,-11,-284,155,155,-222,-84,-224,-225,155,-337,155,155,155,-223,-226,155,155,-228,-227,]),'LNOT':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,156,-337,-27,-28,-182,-335,156,156,156,-337,156,-284,-285,-286,-283,156,156,156,156,-287,-288,156,-337,-28,156,-183,-336,156,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,156,156,156,156,-337,156,-337,-28,-69,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,-284,156,156,-337,156,156,-218,-217,156,156,-234,156,156,156,156,156,-84,156,-230,-231,-233,156,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,156,-12,156,-284,156,156,156,-337,156,156,156,-219,156,-221,156,-83,156,-229,-232,-337,-198,-337,-68,156,156,156,-337,-28,-284,-220,156,156,156,156,156,156,-11,-284,156,156,-222,-84,-224,-225,156,-337,156,156,156,-223,-226,156,156,-228,-227,]),'OFFSETOF':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,160,-337,-27,-28,-182,-335,160,160,160,-337,160,-284,-285,-286,-283,160,160,160,160,-287,-288,160,-337,-28,160,-183,-336,160,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,160,160,160,160,-337,160,-337,-28,-69,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,160,-284,160,160,-337,160,160,-218,-217,160,160,-234,160,160,160,160,160,-84,160,-230,-231,-233,160,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,160,-12,160,-284,160,160,160,-337,160,160,160,-219,160,-221,160,-83,160,-229,-232,-337,-198,-337,-68,160,160,160,-337,-28,-284,-220,160,160,160,160,160,160,-11,-284,160,160,-222,-84,-224,-225,160,-337,160,160,160,-223,-226,160,160,-228,-227,]),'INT_CONST_DEC':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,161,-337,-27,-28,-182,-335,161,161,161,-337,161,-284,-285,-286,-283,161,161,161,161,-287,-288,161,-337,-28,161,-183,-336,161,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,161,161,161,161,-337,161,-337,-28,-69,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,-284,161,161,-337,161,161,-218,-217,161,161,-234,161,161,161,161,161,-84,161,-230,-231,-233,161,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,161,-12,161,-284,161,161,161,-337,161,161,161,-219,161,-221,161,-83,161,-229,-232,-337,-198,-337,-68,161,161,161,-337,-28,-284,-220,161,161,161,161,161,161,-11,-284,161,161,-222,-84,-224,-225,161,-337,161,161,161,-223,-226,161,161,-228,-227,]),'INT_CONST_OCT':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,162,-337,-27,-28,-182,-335,162,162,162,-337,162,-284,-285,-286,-283,162,162,162,162,-287,-288,162,-337,-28,162,-183,-336,162,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,162,162,162,162,-337,162,-337,-28,-69,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,-284,162,162,-337,162,162,-218,-217,162,162,-234,162,162,162,162,162,-84,162,-230,-231,-233,162,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,162,-12,162,-284,162,162,162,-337,162,162,162,-219,162,-221,162,-83,162,-229,-232,-337,-198,-337,-68,162,162,162,-337,-28,-284,-220,162,162,162,162,162,162,-11,-284,162,162,-222,-84,-224,-225,162,-337,162,162,162,-223,-226,162,162,-228,-227,]),'INT_CONST_HEX':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,163,-337,-27,-28,-182,-335,163,163,163,-337,163,-284,-285,-286,-283,163,163,163,163,-287,-288,163,-337,-28,163,-183,-336,163,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,163,163,163,163,-337,163,-337,-28,-69,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,-284,163,163,-337,163,163,-218,-217,163,163,-234,163,163,163,163,163,-84,163,-230,-231,-233,163,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,163,-12,163,-284,163,163,163,-337,163,163,163,-219,163,-221,163,-83,163,-229,-232,-337,-198,-337,-68,163,163,163,-337,-28,-284,-220,163,163,163,163,163,163,-11,-284,163,163,-222,-84,-224,-225,163,-337,163,163,163,-223,-226,163,163,-228,-227,]),'INT_CONST_BIN':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,164,-337,-27,-28,-182,-335,164,164,164,-337,164,-284,-285,-286,-283,164,164,164,164,-287,-288,164,-337,-28,164,-183,-336,164,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,164,164,164,164,-337,164,-337,-28,-69,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,-284,164,164,-337,164,164,-218,-217,164,164,-234,164,164,164,164,164,-84,164,-230,-231,-233,164,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,164,-12,164,-284,164,164,164,-337,164,164,164,-219,164,-221,164,-83,164,-229,-232,-337,-198,-337,-68,164,164,164,-337,-28,-284,-220,164,164,164,164,164,164,-11,-284,164,164,-222,-84,-224,-225,164,-337,164,164,164,-223,-226,164,164,-228,-227,]),'INT_CONST_CHAR':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,165,-337,-27,-28,-182,-335,165,165,165,-337,165,-284,-285,-286,-283,165,165,165,165,-287,-288,165,-337,-28,165,-183,-336,165,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,165,165,165,165,-337,165,-337,-28,-69,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,-284,165,165,-337,165,165,-218,-217,165,165,-234,165,165,165,165,165,-84,165,-230,-231,-233,165,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,165,-12,165,-284,165,165,165,-337,165,165,165,-219,165,-221,165,-83,165,-229,-232,-337,-198,-337,-68,165,165,165,-337,-28,-284,-220,165,165,165,165,165,165,-11,-284,165,165,-222,-84,-224,-225,165,-337,165,165,165,-223,-226,165,165,-228,-227,]),'FLOAT_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,166,-337,-27,-28,-182,-335,166,166,166,-337,166,-284,-285,-286,-283,166,166,166,166,-287,-288,166,-337,-28,166,-183,-336,166,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,166,166,166,166,-337,166,-337,-28,-69,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,-284,166,166,-337,166,166,-218,-217,166,166,-234,166,166,166,166,166,-84,166,-230,-231,-233,166,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,166,-12,166,-284,166,166,166,-337,166,166,166,-219,166,-221,166,-83,166,-229,-232,-337,-198,-337,-68,166,166,166,-337,-28,-284,-220,166,166,166,166,166,166,-11,-284,166,166,-222,-84,-224,-225,166,-337,166,166,166,-223,-226,166,166,-228,-227,]),'HEX_FLOAT_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,167,-337,-27,-28,-182,-335,167,167,167,-337,167,-284,-285,-286,-283,167,167,167,167,-287,-288,167,-337,-28,167,-183,-336,167,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,167,167,167,167,-337,167,-337,-28,-69,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,167,-284,167,167,-337,167,167,-218,-217,167,167,-234,167,167,167,167,167,-84,167,-230,-231,-233,167,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,167,-12,167,-284,167,167,167,-337,167,167,167,-219,167,-221,167,-83,167,-229,-232,-337,-198,-337,-68,167,167,167,-337,-28,-284,-220,167,167,167,167,167,167,-11,-284,167,167,-222,-84,-224,-225,167,-337,167,167,167,-223,-226,167,167,-228,-227,]),'CHAR_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,168,-337,-27,-28,-182,-335,168,168,168,-337,168,-284,-285,-286,-283,168,168,168,168,-287,-288,168,-337,-28,168,-183,-336,168,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,168,168,168,168,-337,168,-337,-28,-69,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,-284,168,168,-337,168,168,-218,-217,168,168,-234,168,168,168,168,168,-84,168,-230,-231,-233,168,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,168,-12,168,-284,168,168,168,-337,168,168,168,-219,168,-221,168,-83,168,-229,-232,-337,-198,-337,-68,168,168,168,-337,-28,-284,-220,168,168,168,168,168,168,-11,-284,168,168,-222,-84,-224,-225,168,-337,168,168,168,-223,-226,168,168,-228,-227,]),'WCHAR_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,169,-337,-27,-28,-182,-335,169,169,169,-337,169,-284,-285,-286,-283,169,169,169,169,-287,-288,169,-337,-28,169,-183,-336,169,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,169,169,169,169,-337,169,-337,-28,-69,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,-284,169,169,-337,169,169,-218,-217,169,169,-234,169,169,169,169,169,-84,169,-230,-231,-233,169,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,169,-12,169,-284,169,169,169,-337,169,169,169,-219,169,-221,169,-83,169,-229,-232,-337,-198,-337,-68,169,169,169,-337,-28,-284,-220,169,169,169,169,169,169,-11,-284,169,169,-222,-84,-224,-225,169,-337,169,169,169,-223,-226,169,169,-228,-227,]),'U8CHAR_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,170,-337,-27,-28,-182,-335,170,170,170,-337,170,-284,-285,-286,-283,170,170,170,170,-287,-288,170,-337,-28,170,-183,-336,170,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,170,170,170,170,-337,170,-337,-28,-69,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,-284,170,170,-337,170,170,-218,-217,170,170,-234,170,170,170,170,170,-84,170,-230,-231,-233,170,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,170,-12,170,-284,170,170,170,-337,170,170,170,-219,170,-221,170,-83,170,-229,-232,-337,-198,-337,-68,170,170,170,-337,-28,-284,-220,170,170,170,170,170,170,-11,-284,170,170,-222,-84,-224,-225,170,-337,170,170,170,-223,-226,170,170,-228,-227,]),'U16CHAR_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,171,-337,-27,-28,-182,-335,171,171,171,-337,171,-284,-285,-286,-283,171,171,171,171,-287,-288,171,-337,-28,171,-183,-336,171,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,171,171,171,171,-337,171,-337,-28,-69,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,-284,171,171,-337,171,171,-218,-217,171,171,-234,171,171,171,171,171,-84,171,-230,-231,-233,171,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,171,-12,171,-284,171,171,171,-337,171,171,171,-219,171,-221,171,-83,171,-229,-232,-337,-198,-337,-68,171,171,171,-337,-28,-284,-220,171,171,171,171,171,171,-11,-284,171,171,-222,-84,-224,-225,171,-337,171,171,171,-223,-226,171,171,-228,-227,]),'U32CHAR_CONST':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,172,-337,-27,-28,-182,-335,172,172,172,-337,172,-284,-285,-286,-283,172,172,172,172,-287,-288,172,-337,-28,172,-183,-336,172,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,172,172,172,172,-337,172,-337,-28,-69,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,-284,172,172,-337,172,172,-218,-217,172,172,-234,172,172,172,172,172,-84,172,-230,-231,-233,172,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,172,-12,172,-284,172,172,172,-337,172,172,172,-219,172,-221,172,-83,172,-229,-232,-337,-198,-337,-68,172,172,172,-337,-28,-284,-220,172,172,172,172,172,172,-11,-284,172,172,-222,-84,-224,-225,172,-337,172,172,172,-223,-226,172,172,-228,-227,]),'STRING_LITERAL':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,138,142,143,144,145,148,149,150,151,155,156,173,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,402,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,173,-337,-27,-28,-182,-335,173,173,173,-337,173,263,-284,-285,-286,-283,173,173,173,173,-287,-288,-325,173,-337,-28,173,-183,-336,173,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,173,173,173,173,-337,173,-337,-28,173,-69,-326,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,-284,173,173,-337,173,173,-218,-217,173,173,-234,173,173,173,173,173,-84,173,-230,-231,-233,173,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,173,-12,173,-284,173,173,173,263,-337,173,173,173,-219,173,-221,173,-83,173,-229,-232,-337,-198,-337,-68,173,173,173,-337,-28,-284,-220,173,173,173,173,173,173,-11,-284,173,173,-222,-84,-224,-225,173,-337,173,173,173,-223,-226,173,173,-228,-227,]),'WSTRING_LITERAL':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,159,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,174,-337,-27,-28,-182,-335,174,174,174,-337,174,-284,-285,-286,-283,174,174,174,174,-287,-288,296,-327,-328,-329,-330,174,-337,-28,174,-183,-336,174,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,174,174,174,174,-337,174,-337,-28,-69,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,-331,-332,-333,-334,-284,174,174,-337,174,174,-218,-217,174,174,-234,174,174,174,174,174,-84,174,-230,-231,-233,174,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,174,-12,174,-284,174,174,174,-337,174,174,174,-219,174,-221,174,-83,174,-229,-232,-337,-198,-337,-68,174,174,174,-337,-28,-284,-220,174,174,174,174,174,174,-11,-284,174,174,-222,-84,-224,-225,174,-337,174,174,174,-223,-226,174,174,-228,-227,]),'U8STRING_LITERAL':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,159,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,175,-337,-27,-28,-182,-335,175,175,175,-337,175,-284,-285,-286,-283,175,175,175,175,-287,-288,297,-327,-328,-329,-330,175,-337,-28,175,-183,-336,175,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,175,175,175,175,-337,175,-337,-28,-69,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,-331,-332,-333,-334,-284,175,175,-337,175,175,-218,-217,175,175,-234,175,175,175,175,175,-84,175,-230,-231,-233,175,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,175,-12,175,-284,175,175,175,-337,175,175,175,-219,175,-221,175,-83,175,-229,-232,-337,-198,-337,-68,175,175,175,-337,-28,-284,-220,175,175,175,175,175,175,-11,-284,175,175,-222,-84,-224,-225,175,-337,175,175,175,-223,-226,175,175,-228,-227,]),'U16STRING_LITERAL':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,159,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,176,-337,-27,-28,-182,-335,176,176,176,-337,176,-284,-285,-286,-283,176,176,176,176,-287,-288,298,-327,-328,-329,-330,176,-337,-28,176,-183,-336,176,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,176,176,176,176,-337,176,-337,-28,-69,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,-331,-332,-333,-334,-284,176,176,-337,176,176,-218,-217,176,176,-234,176,176,176,176,176,-84,176,-230,-231,-233,176,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,176,-12,176,-284,176,176,176,-337,176,176,176,-219,176,-221,176,-83,176,-229,-232,-337,-198,-337,-68,176,176,176,-337,-28,-284,-220,176,176,176,176,176,176,-11,-284,176,176,-222,-84,-224,-225,176,-337,176,176,176,-223,-226,176,176,-228,-227,]),'U32STRING_LITERAL':([15,50,51,52,80,89,90,91,93,112,113,114,119,124,126,133,134,136,142,143,144,145,148,149,150,151,155,156,159,174,175,176,177,179,180,181,192,194,205,218,219,220,221,222,223,224,225,226,227,228,229,231,235,239,244,253,254,255,256,262,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,296,297,298,299,302,305,306,319,328,343,351,352,354,356,357,358,361,362,363,365,366,367,369,370,372,373,374,375,376,377,378,379,380,381,382,383,384,387,388,389,392,395,396,397,400,443,450,452,462,464,465,466,469,474,476,477,478,481,483,492,493,494,497,504,505,506,514,518,519,520,521,522,523,526,527,537,538,539,546,547,548,549,552,555,558,563,565,572,573,575,577,578,579,],[-71,-128,-129,-130,-131,-87,-72,177,-337,-27,-28,-182,-335,177,177,177,-337,177,-284,-285,-286,-283,177,177,177,177,-287,-288,299,-327,-328,-329,-330,177,-337,-28,177,-183,-336,177,-216,-214,-215,-75,-76,-77,-78,-79,-80,-81,-82,177,177,177,177,-337,177,-337,-28,-69,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,-331,-332,-333,-334,-284,177,177,-337,177,177,-218,-217,177,177,-234,177,177,177,177,177,-84,177,-230,-231,-233,177,-241,-242,-243,-244,-245,-246,-247,-248,-249,-250,-251,-11,177,-12,177,-284,177,177,177,-337,177,177,177,-219,177,-221,177,-83,177,-229,-232,-337,-198,-337,-68,177,177,177,-337,-28,-284,-220,177,177,177,177,177,177,-11,-284,177,177,-222,-84,-224,-225,177,-337,177,177,177,-223,-226,177,177,-228,-227,]),'ELSE':([15,90,205,222,223,224,225,226,227,228,229,262,351,357,365,366,369,370,372,464,466,474,477,478,493,518,546,547,548,549,572,573,578,579,],[-71,-72,-336,-75,-76,-77,-78,-79,-80,-81,-82,-69,-218,-234,-81,-84,-230,-231,-233,-219,-221,-83,-229,-232,-68,-220,-222,563,-224,-225,-223,-226,-228,-227,]),'PPPRAGMASTR':([15,],[90,]),'EQUALS':([18,27,72,85,86,87,88,95,109,128,130,138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,199,205,230,247,249,263,287,288,289,291,292,293,296,297,298,299,307,308,390,391,398,399,401,424,426,427,428,429,434,435,484,486,487,488,491,495,496,499,500,502,503,528,529,530,554,556,567,],[-52,-29,-178,133,-179,-54,-37,-53,192,-178,-55,-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,328,-336,-312,374,-38,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-35,-36,483,-199,-43,-44,-305,-292,-293,-294,-295,-296,-31,-34,-200,-202,-39,-42,-275,-290,-291,-281,-282,-32,-33,-201,-40,-41,-299,-306,-300,]),'COMMA':([18,23,24,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,72,73,74,75,76,77,80,83,84,85,86,87,88,95,102,104,106,108,109,111,112,113,114,116,117,120,121,128,130,137,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,184,186,187,188,189,193,194,197,198,199,203,205,209,211,213,230,236,245,246,247,249,250,251,252,260,263,287,288,289,291,292,293,296,297,298,299,307,308,311,312,313,314,315,316,317,320,321,322,323,324,325,326,327,330,332,333,336,337,338,340,341,342,344,345,346,348,349,350,371,386,398,399,401,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,433,434,435,439,440,441,442,454,455,456,457,458,459,463,467,468,470,471,472,479,480,482,487,488,491,495,496,499,500,502,503,509,510,512,516,517,525,529,530,531,532,533,540,541,542,543,544,545,550,553,554,556,559,560,567,569,570,571,],[-52,-125,-99,-29,-104,-337,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-178,-95,-96,-97,-98,-101,-131,132,-132,-134,-179,-54,-37,-53,-100,-126,191,-136,-138,-180,-27,-28,-182,-166,-167,-146,-147,-178,-55,261,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,309,310,-186,-191,-337,-181,-183,327,-171,-176,-149,-336,-142,-144,-337,-312,361,-235,-239,-274,-38,-133,-135,-193,361,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-35,-36,-188,-189,-190,-204,-56,-1,-2,-45,-206,-137,-139,327,327,-168,-172,-151,-153,-148,-140,-141,-145,461,-161,-163,-143,-127,-203,-204,-174,-175,361,481,-43,-44,-305,361,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,361,497,-292,-310,-293,-294,-295,-296,501,-31,-34,-187,-192,-57,-205,-169,-170,-173,-177,-150,-152,-165,361,-237,-236,361,361,-240,-194,-196,-39,-42,-275,-290,-291,-281,-282,-32,-33,-207,-213,-211,-162,-164,-195,-40,-41,555,-254,-311,-50,-51,-209,-208,-210,-212,361,-197,-299,-306,-46,-49,-300,361,-47,-48,]),'RPAREN':([18,23,24,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,73,74,75,76,77,80,87,88,92,94,95,102,104,111,112,113,114,116,117,120,121,130,131,135,137,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,182,183,184,185,186,187,188,189,193,194,203,205,209,211,212,213,214,215,236,245,246,247,249,257,258,259,260,263,284,287,288,289,291,292,293,296,297,298,299,307,308,311,312,313,314,315,316,317,318,320,321,326,330,332,333,336,337,338,344,345,346,347,348,349,350,351,353,359,360,398,399,401,402,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,423,424,425,426,427,428,429,430,431,432,434,435,438,439,440,441,442,444,445,446,447,448,449,453,454,455,458,459,467,468,470,471,472,479,487,488,491,495,496,499,500,502,503,507,508,509,510,512,515,529,530,532,533,534,535,540,541,542,543,544,545,550,552,554,556,559,560,565,566,567,568,570,571,574,576,],[-52,-125,-99,-29,-104,-337,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-95,-96,-97,-98,-101,-131,-54,-37,178,-337,-53,-100,-126,-180,-27,-28,-182,-166,-167,-146,-147,-55,249,-337,262,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,307,308,-184,-17,-18,-186,-191,-337,-181,-183,-149,-336,-142,-144,345,-337,349,350,-14,-235,-239,-274,-38,398,399,400,401,-326,424,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-35,-36,-188,-189,-190,-204,-56,-1,-2,-337,-45,-206,-168,-151,-153,-148,-140,-141,-145,-143,-127,-203,-337,-204,-174,-175,-218,-13,468,469,-43,-44,-305,493,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,496,-292,-310,-293,-294,-295,-296,498,499,500,-31,-34,-185,-187,-192,-57,-205,-337,509,510,-204,-23,-24,-337,-169,-170,-150,-152,519,-237,-236,520,521,-240,-39,-42,-275,-290,-291,-281,-282,-32,-33,540,541,-207,-213,-211,545,-40,-41,-254,-311,556,-307,-50,-51,-209,-208,-210,-212,564,-337,-299,-306,-46,-49,-337,575,-300,-308,-47,-48,577,-309,]),'COLON':([18,23,27,30,31,32,34,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,80,86,87,88,95,104,116,117,120,121,128,130,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,203,205,206,209,211,230,232,245,246,247,249,263,287,288,289,291,292,293,296,297,298,299,307,308,326,330,332,333,336,337,338,342,344,345,349,350,355,398,399,401,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,434,435,454,455,458,459,461,468,470,479,487,488,491,495,496,499,500,502,503,529,530,532,554,556,567,],[-52,-125,-29,-122,-123,-124,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-128,-129,-130,-131,-179,-54,-37,-53,-126,-166,-167,-146,-147,-178,-55,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,-149,-336,343,-142,-144,354,356,-235,-239,-274,-38,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-35,-36,-168,-151,-153,-148,-140,-141,-145,462,-143,-127,-174,-175,465,-43,-44,-305,494,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-292,-293,-294,-295,-296,-31,-34,-169,-170,-150,-152,343,-237,-236,-240,-39,-42,-275,-290,-291,-281,-282,-32,-33,-40,-41,-254,-299,-306,-300,]),'LBRACKET':([18,23,24,27,28,29,30,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,73,74,75,76,77,80,87,88,95,102,104,111,112,113,114,116,117,119,120,121,130,138,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,189,193,194,203,205,209,211,213,230,249,253,263,287,288,296,297,298,299,307,308,314,315,318,320,321,326,330,332,333,336,337,338,344,345,347,348,349,350,390,391,398,399,401,424,426,427,428,429,434,435,441,442,447,454,455,458,459,481,484,486,487,488,492,495,496,502,503,509,510,512,528,529,530,534,535,540,541,542,543,544,545,554,555,556,559,560,567,568,570,571,576,],[93,-125,-99,-29,-104,-337,-122,-123,-124,-126,-238,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-128,-129,-130,-102,-103,-105,-106,-107,-108,-109,-95,-96,-97,-98,-101,-131,134,-37,93,-100,-126,-180,-27,-28,-182,-166,-167,-335,-146,-147,134,-303,283,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-30,319,-181,-183,-149,-336,-142,-144,319,-312,-38,392,-326,-297,-298,-331,-332,-333,-334,-35,-36,319,443,319,-45,452,-168,-151,-153,-148,-140,-141,-145,-143,-127,319,319,-174,-175,392,-199,-43,-44,-305,-292,-293,-294,-295,-296,-31,-34,443,452,319,-169,-170,-150,-152,392,-200,-202,-39,-42,392,-290,-291,-32,-33,-207,-213,-211,-201,-40,-41,558,-307,-50,-51,-209,-208,-210,-212,-299,392,-306,-46,-49,-300,-308,-47,-48,-309,]),'RBRACKET':([50,51,52,80,93,112,113,114,134,138,139,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,179,181,194,205,245,246,247,254,256,263,287,288,289,291,292,293,296,297,298,299,301,302,303,304,319,394,395,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,424,426,427,428,429,436,437,443,450,451,452,468,470,479,485,489,490,491,495,496,499,500,504,506,511,513,514,532,536,537,554,556,561,562,567,569,],[-128,-129,-130,-131,-337,-27,-28,-182,-337,-303,-252,-253,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-337,-28,-183,-336,-235,-239,-274,-337,-28,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,434,435,-3,-4,-337,487,488,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,495,-292,-293,-294,-295,-296,502,503,-337,-337,512,-337,-237,-236,-240,528,529,530,-275,-290,-291,-281,-282,-337,-28,542,543,544,-254,559,560,-299,-306,570,571,-300,576,]),'PERIOD':([119,138,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,253,263,287,288,296,297,298,299,390,391,401,424,426,427,428,429,481,484,486,492,495,496,528,534,535,554,555,556,567,568,576,],[-335,-303,285,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,393,-326,-297,-298,-331,-332,-333,-334,393,-199,-305,-292,-293,-294,-295,-296,393,-200,-202,393,-290,-291,-201,557,-307,-299,393,-306,-300,-308,-309,]),'ARROW':([138,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,263,287,288,296,297,298,299,401,424,426,427,428,429,495,496,554,556,567,],[-303,286,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-326,-297,-298,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-290,-291,-299,-306,-300,]),'CONDOP':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,264,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'DIVIDE':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,266,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,266,266,266,266,266,266,266,266,266,266,266,266,266,266,266,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'MOD':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,267,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,267,267,267,267,267,267,267,267,267,267,267,267,267,267,267,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'RSHIFT':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,270,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,270,270,270,270,270,270,270,270,270,270,270,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LSHIFT':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,271,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,271,271,271,271,271,271,271,271,271,271,271,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LT':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,272,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,272,272,272,272,272,272,272,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LE':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,273,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,273,273,273,273,273,273,273,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'GE':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,274,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,274,274,274,274,274,274,274,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'GT':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,275,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,275,275,275,275,275,275,275,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'EQ':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,276,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,276,276,276,276,276,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'NE':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,277,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,277,277,277,277,277,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'OR':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,279,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,279,279,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'XOR':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,280,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,280,-271,280,280,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LAND':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,281,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,281,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LOR':([138,140,141,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,282,-255,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,-274,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-256,-257,-258,-259,-260,-261,-262,-263,-264,-265,-266,-267,-268,-269,-270,-271,-272,-273,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'XOREQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,375,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'TIMESEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,376,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'DIVEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,377,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'MODEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,378,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'PLUSEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,379,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'MINUSEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,380,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'LSHIFTEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,381,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'RSHIFTEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,382,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'ANDEQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,383,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'OREQUAL':([138,146,147,153,154,157,158,159,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,205,230,247,263,287,288,289,291,292,293,296,297,298,299,401,424,426,427,428,429,491,495,496,499,500,554,556,567,],[-303,-274,-276,-289,-312,-301,-302,-304,-313,-314,-315,-316,-317,-318,-319,-320,-321,-322,-323,-324,-325,-327,-328,-329,-330,-336,-312,384,-326,-297,-298,-277,-278,-279,-280,-331,-332,-333,-334,-305,-292,-293,-294,-295,-296,-275,-290,-291,-281,-282,-299,-306,-300,]),'ELLIPSIS':([309,],[438,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'translation_unit_or_empty':([0,],[1,]),'translation_unit':([0,],[2,]),'empty':([0,11,12,20,21,22,25,26,29,33,68,69,70,72,93,94,99,126,134,135,179,180,189,206,213,218,239,253,254,255,318,319,347,354,356,365,367,443,444,450,452,453,465,476,481,492,504,505,519,520,521,523,552,555,563,565,575,577,],[3,65,82,97,97,97,105,97,112,97,82,105,97,65,112,185,97,217,112,185,303,112,316,339,316,353,353,387,303,112,448,112,448,353,353,353,353,112,185,303,303,448,353,353,527,527,303,112,353,353,353,353,353,527,353,353,353,353,]),'external_declaration':([0,2,],[4,63,]),'function_definition':([0,2,],[5,5,]),'declaration':([0,2,11,66,72,126,218,367,],[6,6,67,127,67,220,220,476,]),'pp_directive':([0,2,],[7,7,]),'pppragma_directive':([0,2,122,126,200,201,202,218,239,329,331,354,356,365,465,519,520,521,563,575,577,],[8,8,208,228,208,208,208,228,365,208,208,365,365,228,365,365,365,365,365,365,365,]),'static_assert':([0,2,126,218,239,354,356,365,465,519,520,521,563,575,577,],[10,10,229,229,229,229,229,229,229,229,229,229,229,229,229,]),'id_declarator':([0,2,12,17,25,68,69,81,132,189,191,206,318,461,],[11,11,72,92,109,128,109,92,128,311,128,128,92,128,]),'declaration_specifiers':([0,2,11,66,72,94,126,135,218,309,318,347,367,444,453,],[12,12,68,68,68,189,68,189,68,189,189,189,68,189,189,]),'decl_body':([0,2,11,66,72,126,218,367,],[13,13,13,13,13,13,13,13,]),'direct_id_declarator':([0,2,12,17,19,25,68,69,79,81,132,189,191,206,314,318,447,461,],[18,18,18,18,95,18,18,18,95,18,18,18,18,18,95,18,95,18,]),'pointer':([0,2,12,17,25,68,69,81,111,132,189,191,206,213,318,347,461,],[19,19,79,19,19,79,19,79,193,79,314,79,79,348,447,348,79,]),'type_qualifier':([0,2,11,12,20,21,22,26,29,33,66,68,70,72,93,94,99,113,122,123,124,126,134,135,136,180,181,189,200,201,202,206,210,213,218,235,255,256,290,294,295,300,309,318,319,329,331,347,367,443,444,453,505,506,],[20,20,20,73,20,20,20,20,114,20,20,73,20,20,114,20,20,194,114,114,114,20,114,20,114,114,194,73,114,114,114,337,194,337,20,114,114,194,114,114,114,114,20,20,114,114,114,20,20,114,20,20,114,194,]),'storage_class_specifier':([0,2,11,12,20,21,22,26,33,66,68,70,72,94,99,126,135,189,218,309,318,347,367,444,453,],[21,21,21,74,21,21,21,21,21,21,74,21,21,21,21,21,21,74,21,21,21,21,21,21,21,]),'function_specifier':([0,2,11,12,20,21,22,26,33,66,68,70,72,94,99,126,135,189,218,309,318,347,367,444,453,],[22,22,22,75,22,22,22,22,22,22,75,22,22,22,22,22,22,75,22,22,22,22,22,22,22,]),'type_specifier_no_typeid':([0,2,11,12,25,66,68,69,72,94,122,123,124,126,135,136,189,190,200,201,202,206,210,213,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[23,23,23,76,23,23,76,23,23,23,23,23,23,23,23,23,76,23,23,23,23,336,23,336,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'type_specifier':([0,2,11,25,66,69,72,94,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[24,24,24,102,24,102,24,24,209,209,209,24,24,209,102,209,209,209,344,24,209,209,209,209,209,24,24,209,209,24,24,24,24,]),'declaration_specifiers_no_type':([0,2,11,20,21,22,26,33,66,70,72,94,99,126,135,218,309,318,347,367,444,453,],[25,25,69,98,98,98,98,98,69,98,69,190,98,69,190,69,190,190,190,69,190,190,]),'alignment_specifier':([0,2,11,12,20,21,22,26,33,66,68,70,72,94,99,122,123,124,126,135,136,189,200,201,202,206,213,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[26,26,26,77,26,26,26,26,26,26,77,26,26,26,26,211,211,211,26,26,211,77,211,211,211,338,338,26,211,211,211,211,211,26,26,211,211,26,26,26,26,]),'typedef_name':([0,2,11,25,66,69,72,94,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'enum_specifier':([0,2,11,25,66,69,72,94,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'struct_or_union_specifier':([0,2,11,25,66,69,72,94,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'atomic_specifier':([0,2,11,20,21,22,25,26,33,66,69,70,72,94,99,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[33,33,70,99,99,99,104,99,99,70,104,99,70,33,99,104,104,104,70,33,104,104,104,104,104,104,70,104,104,104,104,104,33,33,104,104,33,70,33,33,]),'struct_or_union':([0,2,11,25,66,69,72,94,122,123,124,126,135,136,190,200,201,202,210,218,235,290,294,295,300,309,318,329,331,347,367,444,453,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'declaration_list_opt':([11,72,],[64,129,]),'declaration_list':([11,72,],[66,66,]),'init_declarator_list_opt':([12,68,],[78,78,]),'init_declarator_list':([12,68,],[83,83,]),'init_declarator':([12,68,132,191,],[84,84,250,322,]),'declarator':([12,68,132,191,206,461,],[85,85,85,85,342,342,]),'typeid_declarator':([12,68,81,132,191,206,461,],[86,86,131,86,86,86,86,]),'direct_typeid_declarator':([12,68,79,81,132,191,206,461,],[87,87,130,87,87,87,87,87,]),'declaration_specifiers_no_type_opt':([20,21,22,26,33,70,99,],[96,100,101,110,115,115,115,]),'id_init_declarator_list_opt':([25,69,],[103,103,]),'id_init_declarator_list':([25,69,],[106,106,]),'id_init_declarator':([25,69,],[108,108,]),'type_qualifier_list_opt':([29,93,134,180,255,319,443,505,],[111,179,254,305,396,450,504,538,]),'type_qualifier_list':([29,93,122,123,124,134,136,180,200,201,202,235,255,290,294,295,300,319,329,331,443,505,],[113,181,210,210,210,256,210,113,210,210,210,210,113,210,210,210,210,113,210,210,506,113,]),'brace_open':([35,36,64,116,117,120,121,126,129,133,192,218,235,239,354,356,365,388,400,465,469,498,499,519,520,521,526,563,575,577,],[118,122,126,195,196,200,201,126,126,253,253,126,126,126,126,126,126,253,492,126,492,492,492,126,126,126,253,126,126,126,]),'compound_statement':([64,126,129,218,235,239,354,356,365,465,519,520,521,563,575,577,],[125,224,248,224,359,224,224,224,224,224,224,224,224,224,224,224,]),'constant_expression':([91,124,231,328,343,392,462,],[137,215,355,457,463,485,517,]),'unified_string_literal':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,261,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,402,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'conditional_expression':([91,124,126,133,136,179,192,218,231,235,239,244,254,264,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,450,452,462,465,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[139,139,246,246,246,246,246,246,139,246,246,246,246,246,246,246,246,246,246,246,139,139,246,246,246,246,246,246,246,246,246,246,139,246,246,246,246,139,246,246,532,246,246,246,246,246,246,246,246,246,246,246,246,246,246,246,246,]),'binary_expression':([91,124,126,133,136,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,450,452,462,465,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'cast_expression':([91,124,126,133,136,150,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[141,141,141,141,141,292,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,491,141,141,141,141,491,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'unary_expression':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[146,146,247,247,247,289,291,146,293,247,247,247,146,247,247,247,247,247,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,247,247,247,247,247,247,146,146,247,247,247,247,247,247,247,247,247,247,146,247,247,146,247,247,146,247,146,247,146,247,247,247,247,247,247,247,247,247,247,247,247,247,247,247,247,]),'postfix_expression':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'unary_operator':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,]),'primary_expression':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'identifier':([91,94,124,126,133,135,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,310,328,343,354,356,358,361,362,363,365,367,373,388,392,393,396,397,400,444,450,452,462,465,469,476,494,497,501,504,519,520,521,522,523,526,538,539,552,557,558,563,565,575,577,],[157,188,157,157,157,188,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,440,157,157,157,157,157,157,157,157,157,157,157,157,157,486,157,157,157,188,157,157,157,157,157,157,157,157,535,157,157,157,157,157,157,157,157,157,157,568,157,157,157,157,157,]),'constant':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,]),'unified_wstring_literal':([91,124,126,133,136,148,149,150,151,179,192,218,231,235,239,244,254,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,290,294,305,306,328,343,354,356,358,361,362,363,365,367,373,388,392,396,397,400,450,452,462,465,469,476,494,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,]),'parameter_type_list':([94,135,318,347,444,453,],[182,257,449,449,507,449,]),'identifier_list_opt':([94,135,444,],[183,258,508,]),'parameter_list':([94,135,318,347,444,453,],[184,184,184,184,184,184,]),'identifier_list':([94,135,444,],[186,186,186,]),'parameter_declaration':([94,135,309,318,347,444,453,],[187,187,439,187,187,187,187,]),'enumerator_list':([118,195,196,],[197,324,325,]),'enumerator':([118,195,196,327,],[198,198,198,456,]),'struct_declaration_list':([122,200,201,],[202,329,331,]),'brace_close':([122,197,200,201,202,216,324,325,329,331,385,481,531,555,],[203,326,330,332,333,351,454,455,458,459,480,525,554,567,]),'struct_declaration':([122,200,201,202,329,331,],[204,204,204,334,334,334,]),'specifier_qualifier_list':([122,123,124,136,200,201,202,235,290,294,295,300,329,331,],[206,213,213,213,206,206,206,213,213,213,213,213,206,206,]),'type_name':([123,124,136,235,290,294,295,300,],[212,214,259,360,430,431,432,433,]),'block_item_list_opt':([126,],[216,]),'block_item_list':([126,],[218,]),'block_item':([126,218,],[219,352,]),'statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[221,221,366,366,366,474,366,547,366,366,366,366,366,]),'labeled_statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[222,222,222,222,222,222,222,222,222,222,222,222,222,]),'expression_statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[223,223,223,223,223,223,223,223,223,223,223,223,223,]),'selection_statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[225,225,225,225,225,225,225,225,225,225,225,225,225,]),'iteration_statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[226,226,226,226,226,226,226,226,226,226,226,226,226,]),'jump_statement':([126,218,239,354,356,365,465,519,520,521,563,575,577,],[227,227,227,227,227,227,227,227,227,227,227,227,227,]),'expression_opt':([126,218,239,354,356,365,367,465,476,519,520,521,523,552,563,565,575,577,],[233,233,233,233,233,233,475,233,524,233,233,233,551,566,233,574,233,233,]),'expression':([126,136,218,235,239,244,264,283,290,294,354,356,358,362,363,365,367,465,476,519,520,521,522,523,552,558,563,565,575,577,],[236,260,236,260,236,371,403,422,260,260,236,236,467,471,472,236,236,236,236,236,236,236,550,236,236,569,236,236,236,236,]),'assignment_expression':([126,133,136,179,192,218,235,239,244,254,264,283,284,290,294,305,306,354,356,358,361,362,363,365,367,373,388,396,397,450,452,465,476,497,504,519,520,521,522,523,526,538,539,552,558,563,565,575,577,],[245,252,245,304,252,245,245,245,245,304,245,245,425,245,245,436,437,245,245,245,470,245,245,245,245,479,252,489,490,304,304,245,245,533,304,245,245,245,245,245,252,561,562,245,245,245,245,245,245,]),'initializer':([133,192,388,526,],[251,323,482,553,]),'assignment_expression_opt':([179,254,450,452,504,],[301,394,511,513,536,]),'typeid_noparen_declarator':([189,],[312,]),'abstract_declarator_opt':([189,213,],[313,346,]),'direct_typeid_noparen_declarator':([189,314,],[315,441,]),'abstract_declarator':([189,213,318,347,],[317,317,445,445,]),'direct_abstract_declarator':([189,213,314,318,347,348,447,],[321,321,442,321,321,442,442,]),'struct_declarator_list_opt':([206,],[335,]),'struct_declarator_list':([206,],[340,]),'struct_declarator':([206,461,],[341,516,]),'pragmacomp_or_statement':([239,354,356,465,519,520,521,563,575,577,],[364,464,466,518,546,548,549,572,578,579,]),'assignment_operator':([247,],[373,]),'initializer_list_opt':([253,],[385,]),'initializer_list':([253,492,],[386,531,]),'designation_opt':([253,481,492,555,],[388,526,388,526,]),'designation':([253,481,492,555,],[389,389,389,389,]),'designator_list':([253,481,492,555,],[390,390,390,390,]),'designator':([253,390,481,492,555,],[391,484,391,391,391,]),'argument_expression_list':([284,],[423,]),'parameter_type_list_opt':([318,347,453,],[446,446,515,]),'offsetof_member_designator':([501,],[534,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit_or_empty","S'",1,None,None,None),
+  ('abstract_declarator_opt -> empty','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',43),
+  ('abstract_declarator_opt -> abstract_declarator','abstract_declarator_opt',1,'p_abstract_declarator_opt','plyparser.py',44),
+  ('assignment_expression_opt -> empty','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',43),
+  ('assignment_expression_opt -> assignment_expression','assignment_expression_opt',1,'p_assignment_expression_opt','plyparser.py',44),
+  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',43),
+  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','plyparser.py',44),
+  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',43),
+  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','plyparser.py',44),
+  ('declaration_specifiers_no_type_opt -> empty','declaration_specifiers_no_type_opt',1,'p_declaration_specifiers_no_type_opt','plyparser.py',43),
+  ('declaration_specifiers_no_type_opt -> declaration_specifiers_no_type','declaration_specifiers_no_type_opt',1,'p_declaration_specifiers_no_type_opt','plyparser.py',44),
+  ('designation_opt -> empty','designation_opt',1,'p_designation_opt','plyparser.py',43),
+  ('designation_opt -> designation','designation_opt',1,'p_designation_opt','plyparser.py',44),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','plyparser.py',43),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','plyparser.py',44),
+  ('id_init_declarator_list_opt -> empty','id_init_declarator_list_opt',1,'p_id_init_declarator_list_opt','plyparser.py',43),
+  ('id_init_declarator_list_opt -> id_init_declarator_list','id_init_declarator_list_opt',1,'p_id_init_declarator_list_opt','plyparser.py',44),
+  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',43),
+  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','plyparser.py',44),
+  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',43),
+  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','plyparser.py',44),
+  ('initializer_list_opt -> empty','initializer_list_opt',1,'p_initializer_list_opt','plyparser.py',43),
+  ('initializer_list_opt -> initializer_list','initializer_list_opt',1,'p_initializer_list_opt','plyparser.py',44),
+  ('parameter_type_list_opt -> empty','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',43),
+  ('parameter_type_list_opt -> parameter_type_list','parameter_type_list_opt',1,'p_parameter_type_list_opt','plyparser.py',44),
+  ('struct_declarator_list_opt -> empty','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',43),
+  ('struct_declarator_list_opt -> struct_declarator_list','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','plyparser.py',44),
+  ('type_qualifier_list_opt -> empty','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',43),
+  ('type_qualifier_list_opt -> type_qualifier_list','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','plyparser.py',44),
+  ('direct_id_declarator -> ID','direct_id_declarator',1,'p_direct_id_declarator_1','plyparser.py',126),
+  ('direct_id_declarator -> LPAREN id_declarator RPAREN','direct_id_declarator',3,'p_direct_id_declarator_2','plyparser.py',126),
+  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_id_declarator',5,'p_direct_id_declarator_3','plyparser.py',126),
+  ('direct_id_declarator -> direct_id_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_id_declarator',6,'p_direct_id_declarator_4','plyparser.py',126),
+  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_id_declarator',6,'p_direct_id_declarator_4','plyparser.py',127),
+  ('direct_id_declarator -> direct_id_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_id_declarator',5,'p_direct_id_declarator_5','plyparser.py',126),
+  ('direct_id_declarator -> direct_id_declarator LPAREN parameter_type_list RPAREN','direct_id_declarator',4,'p_direct_id_declarator_6','plyparser.py',126),
+  ('direct_id_declarator -> direct_id_declarator LPAREN identifier_list_opt RPAREN','direct_id_declarator',4,'p_direct_id_declarator_6','plyparser.py',127),
+  ('direct_typeid_declarator -> TYPEID','direct_typeid_declarator',1,'p_direct_typeid_declarator_1','plyparser.py',126),
+  ('direct_typeid_declarator -> LPAREN typeid_declarator RPAREN','direct_typeid_declarator',3,'p_direct_typeid_declarator_2','plyparser.py',126),
+  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_typeid_declarator',5,'p_direct_typeid_declarator_3','plyparser.py',126),
+  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_typeid_declarator',6,'p_direct_typeid_declarator_4','plyparser.py',126),
+  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_typeid_declarator',6,'p_direct_typeid_declarator_4','plyparser.py',127),
+  ('direct_typeid_declarator -> direct_typeid_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_typeid_declarator',5,'p_direct_typeid_declarator_5','plyparser.py',126),
+  ('direct_typeid_declarator -> direct_typeid_declarator LPAREN parameter_type_list RPAREN','direct_typeid_declarator',4,'p_direct_typeid_declarator_6','plyparser.py',126),
+  ('direct_typeid_declarator -> direct_typeid_declarator LPAREN identifier_list_opt RPAREN','direct_typeid_declarator',4,'p_direct_typeid_declarator_6','plyparser.py',127),
+  ('direct_typeid_noparen_declarator -> TYPEID','direct_typeid_noparen_declarator',1,'p_direct_typeid_noparen_declarator_1','plyparser.py',126),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_typeid_noparen_declarator',5,'p_direct_typeid_noparen_declarator_3','plyparser.py',126),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET STATIC type_qualifier_list_opt assignment_expression RBRACKET','direct_typeid_noparen_declarator',6,'p_direct_typeid_noparen_declarator_4','plyparser.py',126),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list STATIC assignment_expression RBRACKET','direct_typeid_noparen_declarator',6,'p_direct_typeid_noparen_declarator_4','plyparser.py',127),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LBRACKET type_qualifier_list_opt TIMES RBRACKET','direct_typeid_noparen_declarator',5,'p_direct_typeid_noparen_declarator_5','plyparser.py',126),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LPAREN parameter_type_list RPAREN','direct_typeid_noparen_declarator',4,'p_direct_typeid_noparen_declarator_6','plyparser.py',126),
+  ('direct_typeid_noparen_declarator -> direct_typeid_noparen_declarator LPAREN identifier_list_opt RPAREN','direct_typeid_noparen_declarator',4,'p_direct_typeid_noparen_declarator_6','plyparser.py',127),
+  ('id_declarator -> direct_id_declarator','id_declarator',1,'p_id_declarator_1','plyparser.py',126),
+  ('id_declarator -> pointer direct_id_declarator','id_declarator',2,'p_id_declarator_2','plyparser.py',126),
+  ('typeid_declarator -> direct_typeid_declarator','typeid_declarator',1,'p_typeid_declarator_1','plyparser.py',126),
+  ('typeid_declarator -> pointer direct_typeid_declarator','typeid_declarator',2,'p_typeid_declarator_2','plyparser.py',126),
+  ('typeid_noparen_declarator -> direct_typeid_noparen_declarator','typeid_noparen_declarator',1,'p_typeid_noparen_declarator_1','plyparser.py',126),
+  ('typeid_noparen_declarator -> pointer direct_typeid_noparen_declarator','typeid_noparen_declarator',2,'p_typeid_noparen_declarator_2','plyparser.py',126),
+  ('translation_unit_or_empty -> translation_unit','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',509),
+  ('translation_unit_or_empty -> empty','translation_unit_or_empty',1,'p_translation_unit_or_empty','c_parser.py',510),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit_1','c_parser.py',518),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit_2','c_parser.py',524),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration_1','c_parser.py',534),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration_2','c_parser.py',539),
+  ('external_declaration -> pp_directive','external_declaration',1,'p_external_declaration_3','c_parser.py',544),
+  ('external_declaration -> pppragma_directive','external_declaration',1,'p_external_declaration_3','c_parser.py',545),
+  ('external_declaration -> SEMI','external_declaration',1,'p_external_declaration_4','c_parser.py',550),
+  ('external_declaration -> static_assert','external_declaration',1,'p_external_declaration_5','c_parser.py',555),
+  ('static_assert -> _STATIC_ASSERT LPAREN constant_expression COMMA unified_string_literal RPAREN','static_assert',6,'p_static_assert_declaration','c_parser.py',560),
+  ('static_assert -> _STATIC_ASSERT LPAREN constant_expression RPAREN','static_assert',4,'p_static_assert_declaration','c_parser.py',561),
+  ('pp_directive -> PPHASH','pp_directive',1,'p_pp_directive','c_parser.py',569),
+  ('pppragma_directive -> PPPRAGMA','pppragma_directive',1,'p_pppragma_directive','c_parser.py',575),
+  ('pppragma_directive -> PPPRAGMA PPPRAGMASTR','pppragma_directive',2,'p_pppragma_directive','c_parser.py',576),
+  ('function_definition -> id_declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_1','c_parser.py',586),
+  ('function_definition -> declaration_specifiers id_declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_2','c_parser.py',604),
+  ('statement -> labeled_statement','statement',1,'p_statement','c_parser.py',619),
+  ('statement -> expression_statement','statement',1,'p_statement','c_parser.py',620),
+  ('statement -> compound_statement','statement',1,'p_statement','c_parser.py',621),
+  ('statement -> selection_statement','statement',1,'p_statement','c_parser.py',622),
+  ('statement -> iteration_statement','statement',1,'p_statement','c_parser.py',623),
+  ('statement -> jump_statement','statement',1,'p_statement','c_parser.py',624),
+  ('statement -> pppragma_directive','statement',1,'p_statement','c_parser.py',625),
+  ('statement -> static_assert','statement',1,'p_statement','c_parser.py',626),
+  ('pragmacomp_or_statement -> pppragma_directive statement','pragmacomp_or_statement',2,'p_pragmacomp_or_statement','c_parser.py',674),
+  ('pragmacomp_or_statement -> statement','pragmacomp_or_statement',1,'p_pragmacomp_or_statement','c_parser.py',675),
+  ('decl_body -> declaration_specifiers init_declarator_list_opt','decl_body',2,'p_decl_body','c_parser.py',694),
+  ('decl_body -> declaration_specifiers_no_type id_init_declarator_list_opt','decl_body',2,'p_decl_body','c_parser.py',695),
+  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','c_parser.py',755),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','c_parser.py',764),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','c_parser.py',765),
+  ('declaration_specifiers_no_type -> type_qualifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_1','c_parser.py',775),
+  ('declaration_specifiers_no_type -> storage_class_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_2','c_parser.py',780),
+  ('declaration_specifiers_no_type -> function_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_3','c_parser.py',785),
+  ('declaration_specifiers_no_type -> atomic_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_4','c_parser.py',792),
+  ('declaration_specifiers_no_type -> alignment_specifier declaration_specifiers_no_type_opt','declaration_specifiers_no_type',2,'p_declaration_specifiers_no_type_5','c_parser.py',797),
+  ('declaration_specifiers -> declaration_specifiers type_qualifier','declaration_specifiers',2,'p_declaration_specifiers_1','c_parser.py',802),
+  ('declaration_specifiers -> declaration_specifiers storage_class_specifier','declaration_specifiers',2,'p_declaration_specifiers_2','c_parser.py',807),
+  ('declaration_specifiers -> declaration_specifiers function_specifier','declaration_specifiers',2,'p_declaration_specifiers_3','c_parser.py',812),
+  ('declaration_specifiers -> declaration_specifiers type_specifier_no_typeid','declaration_specifiers',2,'p_declaration_specifiers_4','c_parser.py',817),
+  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers_5','c_parser.py',822),
+  ('declaration_specifiers -> declaration_specifiers_no_type type_specifier','declaration_specifiers',2,'p_declaration_specifiers_6','c_parser.py',827),
+  ('declaration_specifiers -> declaration_specifiers alignment_specifier','declaration_specifiers',2,'p_declaration_specifiers_7','c_parser.py',832),
+  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',837),
+  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',838),
+  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',839),
+  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',840),
+  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',841),
+  ('storage_class_specifier -> _THREAD_LOCAL','storage_class_specifier',1,'p_storage_class_specifier','c_parser.py',842),
+  ('function_specifier -> INLINE','function_specifier',1,'p_function_specifier','c_parser.py',847),
+  ('function_specifier -> _NORETURN','function_specifier',1,'p_function_specifier','c_parser.py',848),
+  ('type_specifier_no_typeid -> VOID','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',853),
+  ('type_specifier_no_typeid -> _BOOL','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',854),
+  ('type_specifier_no_typeid -> CHAR','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',855),
+  ('type_specifier_no_typeid -> SHORT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',856),
+  ('type_specifier_no_typeid -> INT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',857),
+  ('type_specifier_no_typeid -> LONG','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',858),
+  ('type_specifier_no_typeid -> FLOAT','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',859),
+  ('type_specifier_no_typeid -> DOUBLE','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',860),
+  ('type_specifier_no_typeid -> _COMPLEX','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',861),
+  ('type_specifier_no_typeid -> SIGNED','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',862),
+  ('type_specifier_no_typeid -> UNSIGNED','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',863),
+  ('type_specifier_no_typeid -> __INT128','type_specifier_no_typeid',1,'p_type_specifier_no_typeid','c_parser.py',864),
+  ('type_specifier -> typedef_name','type_specifier',1,'p_type_specifier','c_parser.py',869),
+  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier','c_parser.py',870),
+  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier','c_parser.py',871),
+  ('type_specifier -> type_specifier_no_typeid','type_specifier',1,'p_type_specifier','c_parser.py',872),
+  ('type_specifier -> atomic_specifier','type_specifier',1,'p_type_specifier','c_parser.py',873),
+  ('atomic_specifier -> _ATOMIC LPAREN type_name RPAREN','atomic_specifier',4,'p_atomic_specifier','c_parser.py',879),
+  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','c_parser.py',886),
+  ('type_qualifier -> RESTRICT','type_qualifier',1,'p_type_qualifier','c_parser.py',887),
+  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','c_parser.py',888),
+  ('type_qualifier -> _ATOMIC','type_qualifier',1,'p_type_qualifier','c_parser.py',889),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','c_parser.py',894),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','c_parser.py',895),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','c_parser.py',903),
+  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','c_parser.py',904),
+  ('id_init_declarator_list -> id_init_declarator','id_init_declarator_list',1,'p_id_init_declarator_list','c_parser.py',909),
+  ('id_init_declarator_list -> id_init_declarator_list COMMA init_declarator','id_init_declarator_list',3,'p_id_init_declarator_list','c_parser.py',910),
+  ('id_init_declarator -> id_declarator','id_init_declarator',1,'p_id_init_declarator','c_parser.py',915),
+  ('id_init_declarator -> id_declarator EQUALS initializer','id_init_declarator',3,'p_id_init_declarator','c_parser.py',916),
+  ('specifier_qualifier_list -> specifier_qualifier_list type_specifier_no_typeid','specifier_qualifier_list',2,'p_specifier_qualifier_list_1','c_parser.py',923),
+  ('specifier_qualifier_list -> specifier_qualifier_list type_qualifier','specifier_qualifier_list',2,'p_specifier_qualifier_list_2','c_parser.py',928),
+  ('specifier_qualifier_list -> type_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list_3','c_parser.py',933),
+  ('specifier_qualifier_list -> type_qualifier_list type_specifier','specifier_qualifier_list',2,'p_specifier_qualifier_list_4','c_parser.py',938),
+  ('specifier_qualifier_list -> alignment_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list_5','c_parser.py',943),
+  ('specifier_qualifier_list -> specifier_qualifier_list alignment_specifier','specifier_qualifier_list',2,'p_specifier_qualifier_list_6','c_parser.py',948),
+  ('struct_or_union_specifier -> struct_or_union ID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',956),
+  ('struct_or_union_specifier -> struct_or_union TYPEID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','c_parser.py',957),
+  ('struct_or_union_specifier -> struct_or_union brace_open struct_declaration_list brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_2','c_parser.py',967),
+  ('struct_or_union_specifier -> struct_or_union brace_open brace_close','struct_or_union_specifier',3,'p_struct_or_union_specifier_2','c_parser.py',968),
+  ('struct_or_union_specifier -> struct_or_union ID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',985),
+  ('struct_or_union_specifier -> struct_or_union ID brace_open brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_3','c_parser.py',986),
+  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','c_parser.py',987),
+  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_3','c_parser.py',988),
+  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','c_parser.py',1004),
+  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','c_parser.py',1005),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','c_parser.py',1012),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','c_parser.py',1013),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list_opt SEMI','struct_declaration',3,'p_struct_declaration_1','c_parser.py',1021),
+  ('struct_declaration -> SEMI','struct_declaration',1,'p_struct_declaration_2','c_parser.py',1059),
+  ('struct_declaration -> pppragma_directive','struct_declaration',1,'p_struct_declaration_3','c_parser.py',1064),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','c_parser.py',1069),
+  ('struct_declarator_list -> struct_declarator_list COMMA struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','c_parser.py',1070),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator_1','c_parser.py',1078),
+  ('struct_declarator -> declarator COLON constant_expression','struct_declarator',3,'p_struct_declarator_2','c_parser.py',1083),
+  ('struct_declarator -> COLON constant_expression','struct_declarator',2,'p_struct_declarator_2','c_parser.py',1084),
+  ('enum_specifier -> ENUM ID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',1092),
+  ('enum_specifier -> ENUM TYPEID','enum_specifier',2,'p_enum_specifier_1','c_parser.py',1093),
+  ('enum_specifier -> ENUM brace_open enumerator_list brace_close','enum_specifier',4,'p_enum_specifier_2','c_parser.py',1098),
+  ('enum_specifier -> ENUM ID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',1103),
+  ('enum_specifier -> ENUM TYPEID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','c_parser.py',1104),
+  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','c_parser.py',1109),
+  ('enumerator_list -> enumerator_list COMMA','enumerator_list',2,'p_enumerator_list','c_parser.py',1110),
+  ('enumerator_list -> enumerator_list COMMA enumerator','enumerator_list',3,'p_enumerator_list','c_parser.py',1111),
+  ('alignment_specifier -> _ALIGNAS LPAREN type_name RPAREN','alignment_specifier',4,'p_alignment_specifier','c_parser.py',1122),
+  ('alignment_specifier -> _ALIGNAS LPAREN constant_expression RPAREN','alignment_specifier',4,'p_alignment_specifier','c_parser.py',1123),
+  ('enumerator -> ID','enumerator',1,'p_enumerator','c_parser.py',1128),
+  ('enumerator -> ID EQUALS constant_expression','enumerator',3,'p_enumerator','c_parser.py',1129),
+  ('declarator -> id_declarator','declarator',1,'p_declarator','c_parser.py',1144),
+  ('declarator -> typeid_declarator','declarator',1,'p_declarator','c_parser.py',1145),
+  ('pointer -> TIMES type_qualifier_list_opt','pointer',2,'p_pointer','c_parser.py',1257),
+  ('pointer -> TIMES type_qualifier_list_opt pointer','pointer',3,'p_pointer','c_parser.py',1258),
+  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','c_parser.py',1287),
+  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','c_parser.py',1288),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','c_parser.py',1293),
+  ('parameter_type_list -> parameter_list COMMA ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','c_parser.py',1294),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','c_parser.py',1302),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','c_parser.py',1303),
+  ('parameter_declaration -> declaration_specifiers id_declarator','parameter_declaration',2,'p_parameter_declaration_1','c_parser.py',1322),
+  ('parameter_declaration -> declaration_specifiers typeid_noparen_declarator','parameter_declaration',2,'p_parameter_declaration_1','c_parser.py',1323),
+  ('parameter_declaration -> declaration_specifiers abstract_declarator_opt','parameter_declaration',2,'p_parameter_declaration_2','c_parser.py',1334),
+  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','c_parser.py',1366),
+  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','c_parser.py',1367),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','c_parser.py',1376),
+  ('initializer -> brace_open initializer_list_opt brace_close','initializer',3,'p_initializer_2','c_parser.py',1381),
+  ('initializer -> brace_open initializer_list COMMA brace_close','initializer',4,'p_initializer_2','c_parser.py',1382),
+  ('initializer_list -> designation_opt initializer','initializer_list',2,'p_initializer_list','c_parser.py',1390),
+  ('initializer_list -> initializer_list COMMA designation_opt initializer','initializer_list',4,'p_initializer_list','c_parser.py',1391),
+  ('designation -> designator_list EQUALS','designation',2,'p_designation','c_parser.py',1402),
+  ('designator_list -> designator','designator_list',1,'p_designator_list','c_parser.py',1410),
+  ('designator_list -> designator_list designator','designator_list',2,'p_designator_list','c_parser.py',1411),
+  ('designator -> LBRACKET constant_expression RBRACKET','designator',3,'p_designator','c_parser.py',1416),
+  ('designator -> PERIOD identifier','designator',2,'p_designator','c_parser.py',1417),
+  ('type_name -> specifier_qualifier_list abstract_declarator_opt','type_name',2,'p_type_name','c_parser.py',1422),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator_1','c_parser.py',1434),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator_2','c_parser.py',1442),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator_3','c_parser.py',1447),
+  ('direct_abstract_declarator -> LPAREN abstract_declarator RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_1','c_parser.py',1457),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_2','c_parser.py',1461),
+  ('direct_abstract_declarator -> LBRACKET type_qualifier_list_opt assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_3','c_parser.py',1472),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET TIMES RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_4','c_parser.py',1482),
+  ('direct_abstract_declarator -> LBRACKET TIMES RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_5','c_parser.py',1493),
+  ('direct_abstract_declarator -> direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',4,'p_direct_abstract_declarator_6','c_parser.py',1502),
+  ('direct_abstract_declarator -> LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_7','c_parser.py',1512),
+  ('block_item -> declaration','block_item',1,'p_block_item','c_parser.py',1523),
+  ('block_item -> statement','block_item',1,'p_block_item','c_parser.py',1524),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','c_parser.py',1531),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','c_parser.py',1532),
+  ('compound_statement -> brace_open block_item_list_opt brace_close','compound_statement',3,'p_compound_statement_1','c_parser.py',1538),
+  ('labeled_statement -> ID COLON pragmacomp_or_statement','labeled_statement',3,'p_labeled_statement_1','c_parser.py',1544),
+  ('labeled_statement -> CASE constant_expression COLON pragmacomp_or_statement','labeled_statement',4,'p_labeled_statement_2','c_parser.py',1548),
+  ('labeled_statement -> DEFAULT COLON pragmacomp_or_statement','labeled_statement',3,'p_labeled_statement_3','c_parser.py',1552),
+  ('selection_statement -> IF LPAREN expression RPAREN pragmacomp_or_statement','selection_statement',5,'p_selection_statement_1','c_parser.py',1556),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE pragmacomp_or_statement','selection_statement',7,'p_selection_statement_2','c_parser.py',1560),
+  ('selection_statement -> SWITCH LPAREN expression RPAREN pragmacomp_or_statement','selection_statement',5,'p_selection_statement_3','c_parser.py',1564),
+  ('iteration_statement -> WHILE LPAREN expression RPAREN pragmacomp_or_statement','iteration_statement',5,'p_iteration_statement_1','c_parser.py',1569),
+  ('iteration_statement -> DO pragmacomp_or_statement WHILE LPAREN expression RPAREN SEMI','iteration_statement',7,'p_iteration_statement_2','c_parser.py',1573),
+  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement','iteration_statement',9,'p_iteration_statement_3','c_parser.py',1577),
+  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN pragmacomp_or_statement','iteration_statement',8,'p_iteration_statement_4','c_parser.py',1581),
+  ('jump_statement -> GOTO ID SEMI','jump_statement',3,'p_jump_statement_1','c_parser.py',1586),
+  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_2','c_parser.py',1590),
+  ('jump_statement -> CONTINUE SEMI','jump_statement',2,'p_jump_statement_3','c_parser.py',1594),
+  ('jump_statement -> RETURN expression SEMI','jump_statement',3,'p_jump_statement_4','c_parser.py',1598),
+  ('jump_statement -> RETURN SEMI','jump_statement',2,'p_jump_statement_4','c_parser.py',1599),
+  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','c_parser.py',1604),
+  ('expression -> assignment_expression','expression',1,'p_expression','c_parser.py',1611),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','c_parser.py',1612),
+  ('assignment_expression -> LPAREN compound_statement RPAREN','assignment_expression',3,'p_parenthesized_compound_expression','c_parser.py',1624),
+  ('typedef_name -> TYPEID','typedef_name',1,'p_typedef_name','c_parser.py',1628),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','c_parser.py',1632),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','c_parser.py',1633),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','c_parser.py',1646),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1647),
+  ('assignment_operator -> TIMESEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1648),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1649),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1650),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1651),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1652),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1653),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1654),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1655),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','c_parser.py',1656),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','c_parser.py',1661),
+  ('conditional_expression -> binary_expression','conditional_expression',1,'p_conditional_expression','c_parser.py',1665),
+  ('conditional_expression -> binary_expression CONDOP expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','c_parser.py',1666),
+  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','c_parser.py',1674),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1675),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1676),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1677),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1678),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1679),
+  ('binary_expression -> binary_expression RSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1680),
+  ('binary_expression -> binary_expression LSHIFT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1681),
+  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1682),
+  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1683),
+  ('binary_expression -> binary_expression GE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1684),
+  ('binary_expression -> binary_expression GT binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1685),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1686),
+  ('binary_expression -> binary_expression NE binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1687),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1688),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1689),
+  ('binary_expression -> binary_expression XOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1690),
+  ('binary_expression -> binary_expression LAND binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1691),
+  ('binary_expression -> binary_expression LOR binary_expression','binary_expression',3,'p_binary_expression','c_parser.py',1692),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','c_parser.py',1700),
+  ('cast_expression -> LPAREN type_name RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','c_parser.py',1704),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','c_parser.py',1708),
+  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1712),
+  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1713),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','c_parser.py',1714),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression_3','c_parser.py',1719),
+  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_3','c_parser.py',1720),
+  ('unary_expression -> _ALIGNOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_3','c_parser.py',1721),
+  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','c_parser.py',1729),
+  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','c_parser.py',1730),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','c_parser.py',1731),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','c_parser.py',1732),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','c_parser.py',1733),
+  ('unary_operator -> LNOT','unary_operator',1,'p_unary_operator','c_parser.py',1734),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','c_parser.py',1739),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','c_parser.py',1743),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression_3','c_parser.py',1747),
+  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','c_parser.py',1748),
+  ('postfix_expression -> postfix_expression PERIOD ID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1753),
+  ('postfix_expression -> postfix_expression PERIOD TYPEID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1754),
+  ('postfix_expression -> postfix_expression ARROW ID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1755),
+  ('postfix_expression -> postfix_expression ARROW TYPEID','postfix_expression',3,'p_postfix_expression_4','c_parser.py',1756),
+  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1762),
+  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_5','c_parser.py',1763),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list brace_close','postfix_expression',6,'p_postfix_expression_6','c_parser.py',1768),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close','postfix_expression',7,'p_postfix_expression_6','c_parser.py',1769),
+  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','c_parser.py',1774),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_2','c_parser.py',1778),
+  ('primary_expression -> unified_string_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1782),
+  ('primary_expression -> unified_wstring_literal','primary_expression',1,'p_primary_expression_3','c_parser.py',1783),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_4','c_parser.py',1788),
+  ('primary_expression -> OFFSETOF LPAREN type_name COMMA offsetof_member_designator RPAREN','primary_expression',6,'p_primary_expression_5','c_parser.py',1792),
+  ('offsetof_member_designator -> identifier','offsetof_member_designator',1,'p_offsetof_member_designator','c_parser.py',1800),
+  ('offsetof_member_designator -> offsetof_member_designator PERIOD identifier','offsetof_member_designator',3,'p_offsetof_member_designator','c_parser.py',1801),
+  ('offsetof_member_designator -> offsetof_member_designator LBRACKET expression RBRACKET','offsetof_member_designator',4,'p_offsetof_member_designator','c_parser.py',1802),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','c_parser.py',1814),
+  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','c_parser.py',1815),
+  ('identifier -> ID','identifier',1,'p_identifier','c_parser.py',1824),
+  ('constant -> INT_CONST_DEC','constant',1,'p_constant_1','c_parser.py',1828),
+  ('constant -> INT_CONST_OCT','constant',1,'p_constant_1','c_parser.py',1829),
+  ('constant -> INT_CONST_HEX','constant',1,'p_constant_1','c_parser.py',1830),
+  ('constant -> INT_CONST_BIN','constant',1,'p_constant_1','c_parser.py',1831),
+  ('constant -> INT_CONST_CHAR','constant',1,'p_constant_1','c_parser.py',1832),
+  ('constant -> FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1851),
+  ('constant -> HEX_FLOAT_CONST','constant',1,'p_constant_2','c_parser.py',1852),
+  ('constant -> CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1868),
+  ('constant -> WCHAR_CONST','constant',1,'p_constant_3','c_parser.py',1869),
+  ('constant -> U8CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1870),
+  ('constant -> U16CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1871),
+  ('constant -> U32CHAR_CONST','constant',1,'p_constant_3','c_parser.py',1872),
+  ('unified_string_literal -> STRING_LITERAL','unified_string_literal',1,'p_unified_string_literal','c_parser.py',1883),
+  ('unified_string_literal -> unified_string_literal STRING_LITERAL','unified_string_literal',2,'p_unified_string_literal','c_parser.py',1884),
+  ('unified_wstring_literal -> WSTRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1894),
+  ('unified_wstring_literal -> U8STRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1895),
+  ('unified_wstring_literal -> U16STRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1896),
+  ('unified_wstring_literal -> U32STRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','c_parser.py',1897),
+  ('unified_wstring_literal -> unified_wstring_literal WSTRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1898),
+  ('unified_wstring_literal -> unified_wstring_literal U8STRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1899),
+  ('unified_wstring_literal -> unified_wstring_literal U16STRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1900),
+  ('unified_wstring_literal -> unified_wstring_literal U32STRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','c_parser.py',1901),
+  ('brace_open -> LBRACE','brace_open',1,'p_brace_open','c_parser.py',1911),
+  ('brace_close -> RBRACE','brace_close',1,'p_brace_close','c_parser.py',1917),
+  ('empty -> <empty>','empty',0,'p_empty','c_parser.py',1923),
+]
@@ -2,14 +2,36 @@
 Console Reporting Module:
 Responsible for outputting the results of a violation to the console in readable text.
 """
-class ConsoleReporter:
-    """Output the results of the check to the console in text format"""
-    def output(self, violations):
-        if not violations:
-            print("No violations found.")
-            return
-        for issue in violations:
-            line = issue.get("line")
-            rule = issue.get("rule")
-            description = issue.get("description") or issue.get("message")
-            print(f"Line {line}: [{rule}] {description}")
+import sys
+
+from report.stream_report import StreamReporter
+
+
+def print_diagnostics(diagnostics, stream=None):
+    """Print preprocessor/parser diagnostics (stderr by default) as file:line[:column]: severity: message."""
+    for d in diagnostics:
+        where = f"{d['file']}:{d['line']}" if d["line"] is not None else d["file"]
+        if d["column"] is not None:
+            where += f":{d['column']}"
+        print(f"{where}: {d['severity']}: {d['message']}", file=stream or sys.stderr)
+
+
+class ConsoleReporter(StreamReporter):
+    """
+    Output the results of the check to the console in text format, under a
+    "path:" header for each file in turn. `file` is a file whose header
+    has already been written.
+    """
+    def __init__(self, stream=None, file=None):
+        super().__init__(stream)
+        self.file = file
+
+    def write_one(self, issue):
+        if issue.file != self.file:
+            self.file = issue.file
+            print(f"{issue.file}:", file=self.stream)
+        print(f"Line {issue.line}: [{issue.rule}] {issue.description}", file=self.stream)
+
+    def finish(self):
+        if not self.count:
+            print("No violations found.", file=self.stream)
@@ -4,6 +4,21 @@ Responsible for outputting the violation results in JSON format for easy machine
 """
 import json
 
-class JSONReporter:
-    def output(self, violations):
-        print(json.dumps(violations, ensure_ascii=False, indent=4))
+from report.stream_report import StreamReporter
+
+
+class JSONReporter(StreamReporter):
+    """
+    One JSON array of all violations, indented as json.dumps(indent=4)
+    would, but written element by element.
+    """
+    def start(self):
+        self.stream.write("[")
+
+    def write_one(self, violation):
+        text = json.dumps(violation.to_dict(), ensure_ascii=False, indent=4)
+        # JSON strings escape newlines, so every raw newline starts a line to indent
+        self.stream.write(("," if self.count else "") + "\n    " + text.replace("\n", "\n    "))
+
+    def finish(self):
+        self.stream.write("\n]\n" if self.count else "]\n")
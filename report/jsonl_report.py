@@ -0,0 +1,13 @@
+"""
+JSON Lines Reporting Module:
+Outputs one JSON object per violation and line, for tools that consume
+results while the run is still going.
+"""
+import json
+
+from report.stream_report import StreamReporter
+
+
+class JSONLinesReporter(StreamReporter):
+    def write_one(self, violation):
+        self.stream.write(json.dumps(violation.to_dict(), ensure_ascii=False) + "\n")
@@ -0,0 +1,69 @@
+"""
+SARIF Reporting Module:
+Outputs the violations as a SARIF 2.1.0 log, the format code scanning
+services and IDEs import. The log is written result by result, so it
+streams like the other reporters; only its closing brackets wait for the
+end of the run.
+"""
+import json
+import os
+from urllib.request import pathname2url
+
+from core.violation import Severity
+from report.stream_report import StreamReporter
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# SARIF result level by violation severity
+_LEVELS = {Severity.HIGH: "error", Severity.MEDIUM: "warning", Severity.LOW: "note"}
+
+
+def _uri(path):
+    return "file://" + pathname2url(path) if os.path.isabs(path) else pathname2url(path)
+
+
+class SARIFReporter(StreamReporter):
+    """`rules` are the rule instances of the run, listed as the tool's rules."""
+    def __init__(self, rules=(), stream=None):
+        super().__init__(stream)
+        self.rules = list(rules)
+
+    def start(self):
+        driver = {"name": "c_analyzer", "rules": [
+            {"id": rule.id, "name": type(rule).__name__,
+             "shortDescription": {"text": rule.name or rule.id},
+             "fullDescription": {"text": rule.description or rule.name or rule.id}}
+            for rule in self.rules]}
+        header = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0",
+                             "runs": [{"tool": {"driver": driver}, "results": []}]},
+                            ensure_ascii=False)
+        # everything up to the results array; finish() closes what it opened
+        self.stream.write(header[:-len("]}]}")])
+
+    def write_one(self, violation):
+        self.stream.write(("," if self.count else "") + "\n"
+                          + json.dumps(self._result(violation), ensure_ascii=False))
+
+    def finish(self):
+        self.stream.write("\n]}]}\n")
+
+    @staticmethod
+    def _result(violation):
+        result = {
+            "ruleId": violation.rule,
+            "level": _LEVELS.get(violation.severity, "warning"),
+            "message": {"text": violation.description},
+        }
+        if violation.file:
+            physical = {"artifactLocation": {"uri": _uri(violation.file)}}
+            if violation.line:
+                physical["region"] = {"startLine": violation.line}
+                if violation.column:
+                    physical["region"]["startColumn"] = violation.column
+            result["locations"] = [{"physicalLocation": physical}]
+        properties = dict(violation.extra or {})
+        if violation.severity is not None:
+            properties["severity"] = violation.severity.value
+        if properties:
+            result["properties"] = properties
+        return result
@@ -0,0 +1,96 @@
+"""
+Streaming Reporting Module:
+Base for reporters that write each file's violations as soon as the file
+is checked, so a run over many files shows output early and never holds
+every violation in memory.
+"""
+import json
+import sys
+import time
+
+REPORT_FORMATS = ("console", "json", "jsonl", "sarif")
+
+# seconds between two flushes of the output while findings keep coming
+FLUSH_INTERVAL = 0.5
+
+
+class StreamReporter:
+    """
+    Call write() with the violations of each checked file (any iterable)
+    and close() once at the end; output() does both for a single batch.
+    """
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.count = 0
+        self._started = False
+        self._flushed = time.monotonic()
+
+    def output(self, violations):
+        self.write(violations)
+        self.close()
+
+    def write(self, violations):
+        for violation in violations:
+            if not self._started:
+                self._started = True
+                self.start()
+            self.write_one(violation)
+            self.count += 1
+        if time.monotonic() - self._flushed >= FLUSH_INTERVAL:
+            self.stream.flush()
+            self._flushed = time.monotonic()
+
+    def close(self):
+        if not self._started:
+            self._started = True
+            self.start()
+        self.finish()
+        self.stream.flush()
+
+    def start(self):
+        """Write whatever precedes the first violation."""
+
+    def write_one(self, violation):
+        raise NotImplementedError
+
+    def finish(self):
+        """Write whatever follows the last violation."""
+
+
+def make_reporter(fmt, rules=(), stream=None):
+    """Reporter for one of REPORT_FORMATS; `rules` (instances) describe the run for SARIF."""
+    if fmt == "console":
+        from report.console_report import ConsoleReporter
+        return ConsoleReporter(stream)
+    if fmt == "json":
+        from report.json_report import JSONReporter
+        return JSONReporter(stream)
+    if fmt == "jsonl":
+        from report.jsonl_report import JSONLinesReporter
+        return JSONLinesReporter(stream)
+    if fmt == "sarif":
+        from report.sarif_report import SARIFReporter
+        return SARIFReporter(rules, stream)
+    raise ValueError(f"unknown report format {fmt!r}")
+
+
+def write_file_result(result, fmt, stream=None):
+    """
+    Write one file's {"file", "violations", "diagnostics"} result (or
+    {"file", "removed": True}) on its own, as watch mode reports changes:
+    console output under a "path:" header, otherwise one JSON object
+    (indented for "json", on one line for "jsonl").
+    """
+    stream = stream or sys.stdout
+    if fmt == "console":
+        if result.get("removed"):
+            print(f"{result['file']}: removed", file=stream)
+        else:
+            from report.console_report import ConsoleReporter
+            print(f"{result['file']}:", file=stream)
+            ConsoleReporter(stream, file=result["file"]).output(result["violations"])
+    else:
+        if "violations" in result:
+            result = dict(result, violations=[v.to_dict() for v in result["violations"]])
+        print(json.dumps(result, ensure_ascii=False, indent=4 if fmt == "json" else None),
+              file=stream)
@@ -17,4 +17,45 @@ void ok_cases(void)
     int b[3];
     b[2] = 7;
     int *q = b + 3;
-}
\ No newline at end of file
+}
+
+int table[4];
+
+void shadowed_array(void)
+{
+    int *table = 0;
+    table[6] = 1;
+}
+
+enum { SLOTS = 4 };
+static const int NAME_LEN = 6;
+
+void folded_bounds(void)
+{
+    int slots[SLOTS];
+    char name[NAME_LEN + 2];
+    slots[SLOTS] = 0;
+    name[sizeof(name)] = 0;
+    slots[SLOTS - 1] = 0;
+    name[sizeof(int) * 2 - 1] = 0;
+}
+
+typedef struct {
+    int id;
+    char name[16];
+} record_t;
+
+struct pair {
+    char tag;
+    double value;
+};
+
+void struct_sizes(void)
+{
+    char raw[sizeof(record_t)];
+    char pairs[sizeof(struct pair) * 2];
+    raw[sizeof(record_t)] = 0;
+    pairs[sizeof(struct pair) * 2] = 0;
+    raw[sizeof(record_t) - 1] = 0;
+    pairs[31] = 0;
+}
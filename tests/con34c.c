@@ -0,0 +1,49 @@
+#include <pthread.h>
+#include <threads.h>
+#include <stdlib.h>
+
+struct job {
+    int id;
+    int result;
+};
+
+int shared_counter;
+
+void *worker(void *arg) {
+    int *value = arg;
+    *value += 1;
+    return NULL;
+}
+
+int thrd_worker(void *arg) {
+    return *(int *)arg;
+}
+
+void bad_cases(void) {
+    pthread_t t;
+    thrd_t th;
+    int local = 0;
+    int slots[4] = {0};
+    struct job job = {1, 0};
+    char buffer[32];
+
+    pthread_create(&t, NULL, worker, &local);
+    pthread_create(&t, NULL, worker, &slots[2]);
+    pthread_create(&t, NULL, worker, &job.result);
+    pthread_create(&t, NULL, worker, buffer);
+    thrd_create(&th, thrd_worker, &local);
+    pthread_join(t, NULL);
+}
+
+void good_cases(void) {
+    pthread_t t;
+    static int counter = 0;
+    int *heap = malloc(sizeof *heap);
+
+    pthread_create(&t, NULL, worker, &counter);
+    pthread_create(&t, NULL, worker, &shared_counter);
+    pthread_create(&t, NULL, worker, (void *)heap);
+    pthread_create(&t, NULL, worker, NULL);
+    pthread_join(t, NULL);
+    free(heap);
+}
@@ -15,4 +15,16 @@ int main(int argc, char *argv[])
     execvp("./foo", args2);
     system(user_cmd);
     system(path);
-}
\ No newline at end of file
+}
+void run_in(const char *dir)
+{
+    char cmd[256];
+    sprintf(cmd, "ls %s", dir);
+    system(cmd);
+    {
+        char *tool = getenv("TOOL");
+        system(tool);
+    }
+    char *tool = "/bin/true";
+    system(tool);
+}
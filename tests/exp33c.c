@@ -47,3 +47,42 @@ int main(void) {
     test_uninit(1);
     return 0;
 }
+
+int shadowed_local(void)
+{
+    int x = 1;
+    {
+        int x;
+        (void)sizeof x;
+    }
+    return x;
+}
+
+struct record {
+    int id;
+    char name[16];
+};
+
+void fill_records(const char *src, FILE *f)
+{
+    struct record r;
+    r.name[3] = 0;
+
+    struct record p;
+    strcpy(p.name, src);
+
+    struct record q;
+    fgets(q.name, sizeof q.name, f);
+
+    struct record s;
+    memset(&s.name, 0, sizeof s.name);
+
+    int i;
+    struct record t;
+    t.name[i] = 0;
+
+    struct record u;
+    int id = u.id;
+
+    printf("%s %s %s %s %d\n", r.name, p.name, q.name, s.name, id);
+}
@@ -14,3 +14,30 @@ int main(void) {
     free(data);
     return 0;
 }
+
+char *retry_alloc(size_t n)
+{
+    char *p;
+    while ((p = malloc(n)) == NULL) {
+    }
+    p[0] = '\0';
+    return p;
+}
+
+char *checked_alloc(size_t n)
+{
+    char *p;
+    if (!(p = malloc(n)))
+        return NULL;
+    p[0] = '\0';
+    return p;
+}
+
+void drain(size_t n)
+{
+    char *p;
+    while ((p = malloc(n)) != NULL) {
+        free(p);
+    }
+    p[0] = '\0';
+}
@@ -6,4 +6,12 @@ int main(void) {
     printf("%d\n", r);
     srand(time(NULL));
     printf("%d\n", rand());
-}
\ No newline at end of file
+}
+enum { DEFAULT_SEED = 7 };
+static const unsigned int fixed_seed = DEFAULT_SEED * 3;
+
+void seed_from_constants(void) {
+    srand(fixed_seed);
+    srand(DEFAULT_SEED);
+    printf("%d\n", rand());
+}
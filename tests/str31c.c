@@ -20,3 +20,14 @@ void ok_cases(void) {
     char name[128];
     scanf("%127s", name);
 }
+
+void bad_strcpy(const char *name) {
+    char greeting[32];
+    strcpy(greeting, name);
+    strcat(greeting, getenv("USER"));
+}
+
+void bad_sized_copy(void) {
+    char small[sizeof(int)];
+    strcpy(small, "overflow");
+}